@@ -5,11 +5,11 @@ import json
 from pathlib import Path
 
 from loralink_mllc.codecs import create_codec
-from loralink_mllc.config import ArtifactsManifest, load_runspec, verify_manifest
+from loralink_mllc.config import ArtifactsManifest, RunSpec, load_runspec, verify_manifest
 from loralink_mllc.experiments.metrics import compute_metrics, load_events
 from loralink_mllc.experiments.phase0_c50 import find_c50
 from loralink_mllc.experiments.phase1_ab import run_ab
-from loralink_mllc.radio.mock import create_mock_link
+from loralink_mllc.radio.mock import MockLink, create_mock_link
 from loralink_mllc.radio.uart_e22 import UartE22Radio
 from loralink_mllc.runtime.logging import JsonlLogger
 from loralink_mllc.runtime.rx_node import RxNode
@@ -19,6 +19,37 @@ from loralink_mllc.sensing import CsvSensorSampler, DatasetLogger, JsonlSensorSa
 from loralink_mllc.sensing.schema import SENSOR_ORDER, SENSOR_UNITS
 
 
+def _mock_link(args: argparse.Namespace, runspec: RunSpec) -> MockLink:
+    """MockLink for `--radio mock`, with the `--mock-loss-model` applied in both directions."""
+    model = args.mock_loss_model
+    if model == "bernoulli":
+        spec = {"loss_rate": args.mock_loss_rate}
+    elif model == "gilbert_elliott":
+        if args.mock_ge_p_gb is None or args.mock_ge_p_bg is None:
+            raise ValueError("--mock-ge-p-gb and --mock-ge-p-bg are required for gilbert_elliott")
+        spec = {
+            "p_gb": args.mock_ge_p_gb,
+            "p_bg": args.mock_ge_p_bg,
+            "loss_good": args.mock_ge_loss_good,
+            "loss_bad": args.mock_ge_loss_bad,
+        }
+    elif model == "trace":
+        if not args.mock_trace:
+            raise ValueError("--mock-trace is required for the trace loss model")
+        spec = {"path": args.mock_trace}
+    else:
+        if args.mock_snr_db is None:
+            raise ValueError("--mock-snr-db is required for the snr loss model")
+        spec = {"snr_db": args.mock_snr_db, "fading_db": args.mock_fading_db}
+    spec["model"] = model
+    return create_mock_link(
+        latency_ms=args.mock_latency_ms,
+        seed=args.mock_seed,
+        loss_model=spec,
+        phy=runspec.phy,
+    )
+
+
 def _load_manifest(path: str | None, runspec_path: str) -> ArtifactsManifest:
     if path:
         return ArtifactsManifest.load(path)
@@ -59,8 +90,7 @@ def _run_tx(args: argparse.Namespace) -> int:
 
     radio = None
     if args.radio == "mock":
-        link = create_mock_link(loss_rate=args.mock_loss_rate, latency_ms=args.mock_latency_ms)
-        radio = link.a
+        radio = _mock_link(args, runspec).a
     else:
         if not args.uart_port:
             raise ValueError("--uart-port is required for --radio uart")
@@ -69,6 +99,9 @@ def _run_tx(args: argparse.Namespace) -> int:
             baudrate=args.uart_baud,
             max_payload_bytes=runspec.max_payload_bytes,
             rssi_byte_enabled=args.uart_rssi_byte,
+            reader_thread=args.uart_reader_thread,
+            framing_version=args.uart_framing,
+            writer_thread=args.uart_writer_thread,
         )
 
     logger = JsonlLogger(
@@ -87,7 +120,7 @@ def _run_tx(args: argparse.Namespace) -> int:
     logger.log_run_start(runspec, manifest)
     try:
         node = TxNode(runspec, radio, codec, logger, sampler, dataset_logger, clock=clock)
-        node.run(step_ms=args.step_ms)
+        node.run(step_ms=args.step_ms, event_driven=args.event_loop)
     except KeyboardInterrupt:
         return 0
     finally:
@@ -108,8 +141,7 @@ def _run_rx(args: argparse.Namespace) -> int:
 
     radio = None
     if args.radio == "mock":
-        link = create_mock_link(loss_rate=args.mock_loss_rate, latency_ms=args.mock_latency_ms)
-        radio = link.b
+        radio = _mock_link(args, runspec).b
     else:
         if not args.uart_port:
             raise ValueError("--uart-port is required for --radio uart")
@@ -118,6 +150,9 @@ def _run_rx(args: argparse.Namespace) -> int:
             baudrate=args.uart_baud,
             max_payload_bytes=runspec.max_payload_bytes,
             rssi_byte_enabled=args.uart_rssi_byte,
+            reader_thread=args.uart_reader_thread,
+            framing_version=args.uart_framing,
+            writer_thread=args.uart_writer_thread,
         )
 
     logger = JsonlLogger(
@@ -133,7 +168,12 @@ def _run_rx(args: argparse.Namespace) -> int:
     max_seconds = float(args.max_seconds) if float(args.max_seconds) > 0 else None
     try:
         node = RxNode(runspec, radio, codec, logger, clock=clock)
-        node.run(step_ms=args.step_ms, max_rx_ok=max_rx_ok, max_seconds=max_seconds)
+        node.run(
+            step_ms=args.step_ms,
+            max_rx_ok=max_rx_ok,
+            max_seconds=max_seconds,
+            event_driven=args.event_loop,
+        )
     except KeyboardInterrupt:
         return 0
     finally:
@@ -170,6 +210,25 @@ def _run_metrics(args: argparse.Namespace) -> int:
     return 0
 
 
+def _add_mock_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--mock-loss-rate", type=float, default=0.0)
+    parser.add_argument("--mock-latency-ms", type=int, default=0)
+    parser.add_argument("--mock-seed", type=int, default=0)
+    parser.add_argument(
+        "--mock-loss-model",
+        choices=["bernoulli", "gilbert_elliott", "trace", "snr"],
+        default="bernoulli",
+        help="mock loss: i.i.d. --mock-loss-rate, bursty Gilbert-Elliott, rx log replay, SF SNR",
+    )
+    parser.add_argument("--mock-ge-p-gb", type=float, help="Gilbert-Elliott P(good -> bad)")
+    parser.add_argument("--mock-ge-p-bg", type=float, help="Gilbert-Elliott P(bad -> good)")
+    parser.add_argument("--mock-ge-loss-good", type=float, default=0.0)
+    parser.add_argument("--mock-ge-loss-bad", type=float, default=1.0)
+    parser.add_argument("--mock-trace", help="RX JSONL log whose rx_ok SEQ gaps/RSSI are replayed")
+    parser.add_argument("--mock-snr-db", type=float, help="mean link SNR for the snr model")
+    parser.add_argument("--mock-fading-db", type=float, default=0.0)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="loralink_mllc")
     sub = parser.add_subparsers(dest="cmd", required=True)
@@ -185,8 +244,24 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="expect 1 trailing RSSI byte after each received UART frame (E22 RSSI byte output)",
     )
-    tx.add_argument("--mock-loss-rate", type=float, default=0.0)
-    tx.add_argument("--mock-latency-ms", type=int, default=0)
+    tx.add_argument(
+        "--uart-reader-thread",
+        action="store_true",
+        help="read the UART in a background thread that timestamps arrivals (precise rtt_ms)",
+    )
+    tx.add_argument(
+        "--uart-writer-thread",
+        action="store_true",
+        help="queue UART writes for a background thread instead of flushing in the loop",
+    )
+    tx.add_argument(
+        "--uart-framing",
+        type=int,
+        choices=[1, 2],
+        default=1,
+        help="UART framing: 1 = LEN|SEQ|PAYLOAD, 2 = adds MAGIC + CRC16 (both ends must match)",
+    )
+    _add_mock_args(tx)
     tx.add_argument("--sampler", choices=["dummy", "jsonl", "csv"], default="dummy")
     tx.add_argument("--sensor-path")
     tx.add_argument("--sensor-loop", action="store_true")
@@ -197,6 +272,11 @@ def main(argv: list[str] | None = None) -> int:
     )
     tx.add_argument("--dataset-out")
     tx.add_argument("--step-ms", type=int, default=5)
+    tx.add_argument(
+        "--event-loop",
+        action="store_true",
+        help="sleep until the next timer or radio frame instead of polling every --step-ms",
+    )
     tx.set_defaults(func=_run_tx)
 
     rx = sub.add_parser("rx", help="run RX node")
@@ -210,9 +290,30 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="expect 1 trailing RSSI byte after each received UART frame (E22 RSSI byte output)",
     )
-    rx.add_argument("--mock-loss-rate", type=float, default=0.0)
-    rx.add_argument("--mock-latency-ms", type=int, default=0)
+    rx.add_argument(
+        "--uart-reader-thread",
+        action="store_true",
+        help="read the UART in a background thread that timestamps arrivals (precise rtt_ms)",
+    )
+    rx.add_argument(
+        "--uart-writer-thread",
+        action="store_true",
+        help="queue UART writes for a background thread instead of flushing in the loop",
+    )
+    rx.add_argument(
+        "--uart-framing",
+        type=int,
+        choices=[1, 2],
+        default=1,
+        help="UART framing: 1 = LEN|SEQ|PAYLOAD, 2 = adds MAGIC + CRC16 (both ends must match)",
+    )
+    _add_mock_args(rx)
     rx.add_argument("--step-ms", type=int, default=5)
+    rx.add_argument(
+        "--event-loop",
+        action="store_true",
+        help="sleep until the next timer or radio frame instead of polling every --step-ms",
+    )
     rx.add_argument(
         "--max-rx-ok",
         type=int,
@@ -7,10 +7,12 @@ from pathlib import Path
 from typing import Any, Sequence
 
 from loralink_mllc.codecs.bam_artifacts import BamArtifacts
+from loralink_mllc.codecs.bam_cache import BamModelCache, default_model_cache
 from loralink_mllc.codecs.base import CodecError
 
 
-def _require_numpy() -> Any:
+def require_numpy() -> Any:
+    """The numpy module; raises CodecError with the install hint when it is missing."""
     try:
         import numpy as np
     except ImportError as exc:
@@ -20,6 +22,18 @@ def _require_numpy() -> Any:
     return np
 
 
+@dataclass(frozen=True)
+class BamQ8Weight:
+    """int8 weight matrix with one float32 scale per output row (`W ~= q * scale[:, None]`)."""
+
+    q: Any
+    scale: Any
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(self.q.shape)
+
+
 @dataclass(frozen=True)
 class BamLayer:
     W: Any
@@ -32,8 +46,78 @@ class BamNorm:
     std: Any
 
 
-def _parse_layer_index(path: Path) -> int:
-    match = re.match(r"layer_(\d+)\.npz$", path.name)
+@dataclass(frozen=True)
+class BamAffine:
+    A: Any
+    b: Any
+
+
+@dataclass(frozen=True)
+class BamModel:
+    """Loaded, validated and read-only weights shared by every codec built from one model."""
+
+    layers: tuple[BamLayer, ...]
+    norm: BamNorm | None
+    fused_encoder: BamAffine | None
+    fused_decoder: BamAffine | None
+
+    def arrays(self) -> list[Any]:
+        out: list[Any] = []
+        for layer in self.layers:
+            for weights in (layer.W, layer.V):
+                if isinstance(weights, BamQ8Weight):
+                    out.extend([weights.q, weights.scale])
+                else:
+                    out.append(weights)
+        if self.norm is not None:
+            out.extend([self.norm.mean, self.norm.std])
+        for fused in (self.fused_encoder, self.fused_decoder):
+            if fused is not None:
+                out.extend([fused.A, fused.b])
+        return out
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Heap bytes held by the model, the size `BamModelCache` charges against its bound.
+
+        Memory-mapped weights (`layer_npy_mmap_v1`) count as 0: their pages belong to the shared,
+        reclaimable page cache, not to the cached model.
+        """
+        np = require_numpy()
+        return sum(int(a.nbytes) for a in self.arrays() if not isinstance(a, np.memmap))
+
+
+def quantize_rows_int8(weights: Any) -> BamQ8Weight:
+    """Symmetric per-row int8 quantization used by `layer_npz_q8`."""
+    np = require_numpy()
+    w = np.asarray(weights, dtype=np.float32)
+    if w.ndim != 2:
+        raise CodecError("weights must be 2D for int8 quantization")
+    amax = np.abs(w).max(axis=1) if w.shape[1] else np.zeros(w.shape[0], dtype=np.float32)
+    scale = np.where(amax == 0, 1.0, amax / 127.0).astype(np.float32)
+    q = np.clip(np.rint(w / scale[:, None]), -127, 127).astype(np.int8)
+    return BamQ8Weight(q=q, scale=scale)
+
+
+def resolve_path(base_dir: Path, path: str) -> Path:
+    """`path` as-is when absolute, else resolved against the manifest directory `base_dir`."""
+    candidate = Path(path)
+    if candidate.is_absolute():
+        return candidate
+    return (base_dir / candidate).resolve()
+
+
+_LAYER_GLOBS = {
+    "layer_npz_v1": "layer_*.npz",
+    "layer_npz_q8": "layer_*.npz",
+    "layer_npy_mmap_v1": "layer_*_W.npy",
+}
+
+
+def parse_layer_index(path: Path) -> int:
+    """Layer index of `layer_<i>.npz` / `layer_<i>_W.npy`; also the sort key for layer files."""
+    match = re.match(r"layer_(\d+)(?:\.npz|_W\.npy)$", path.name)
     if not match:
         raise CodecError(f"invalid layer filename: {path.name}")
     return int(match.group(1))
@@ -43,14 +127,39 @@ class BamCodec:
     codec_id = "bam"
     codec_version = "0"
 
-    def __init__(self, artifacts: BamArtifacts, base_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        artifacts: BamArtifacts,
+        base_dir: Path | None = None,
+        model: BamModel | None = None,
+    ) -> None:
         self._artifacts = artifacts
         self._base_dir = base_dir or Path(".")
         self._layers: list[BamLayer] = []
         self._norm: BamNorm | None = None
+        self._fused_encoder: BamAffine | None = None
+        self._fused_decoder: BamAffine | None = None
+        self.last_encode_cycles: list[int] = []
+        self.last_decode_cycles: list[int] = []
         self._validate_dynamics()
-        self._load_layers()
-        self._load_norm()
+        if model is None:
+            self._load_layers()
+            self._load_norm()
+            self._fuse_linear()
+            model = BamModel(
+                layers=tuple(self._layers),
+                norm=self._norm,
+                fused_encoder=self._fused_encoder,
+                fused_decoder=self._fused_decoder,
+            )
+            for array in model.arrays():
+                array.setflags(write=False)
+        else:
+            self._layers = list(model.layers)
+            self._norm = model.norm
+            self._fused_encoder = model.fused_encoder
+            self._fused_decoder = model.fused_decoder
+        self.model = model
 
     def _validate_dynamics(self) -> None:
         if self._artifacts.encode_cycles < 0 or self._artifacts.decode_cycles < 0:
@@ -61,58 +170,149 @@ class BamCodec:
                 raise CodecError(
                     "bam delta must be < 0.5 when encode_cycles/decode_cycles are enabled"
                 )
+        cycle_tol = self._artifacts.cycle_tol
+        if cycle_tol is not None and cycle_tol <= 0:
+            raise CodecError("bam cycle_tol must be > 0")
+        max_cycles = self._artifacts.max_cycles
+        if max_cycles is not None and max_cycles < 0:
+            raise CodecError("bam max_cycles must be >= 0")
 
     @classmethod
-    def from_manifest(cls, manifest_path: str) -> "BamCodec":
+    def from_manifest(
+        cls,
+        manifest_path: str,
+        *,
+        cache: BamModelCache | None = None,
+        use_cache: bool = True,
+    ) -> "BamCodec":
+        """
+        Build a codec from `bam_manifest.json`.
+
+        Weights come from `cache` (default: the process-wide `default_model_cache()`), keyed by
+        the content hash of the manifest, layer files and norm file, so loading the same model
+        again skips disk reads and validation and shares the read-only arrays.
+        """
         path = Path(manifest_path)
         artifacts = BamArtifacts.load(path)
-        return cls(artifacts, base_dir=path.parent)
+        base_dir = path.parent
+        if not use_cache:
+            return cls(artifacts, base_dir=base_dir)
+        cache = cache if cache is not None else default_model_cache()
+        try:
+            files = cls._model_files(artifacts, base_dir)
+            if artifacts.model_format == "layer_npy_mmap_v1":
+                # Mapped weights are identified by file identity; hashing them would read the
+                # whole model at start-up.
+                mapped = [f for f in files if f.suffix == ".npy"]
+                content = [path, *(f for f in files if f.suffix != ".npy")]
+                key = cache.fingerprint(content, stat_paths=mapped)
+            else:
+                key = cache.fingerprint([path, *files])
+        except OSError:
+            return cls(artifacts, base_dir=base_dir)
+
+        def _load() -> tuple[BamModel, int]:
+            model = cls(artifacts, base_dir=base_dir).model
+            return model, model.nbytes
+
+        return cls(artifacts, base_dir=base_dir, model=cache.get_or_load(key, _load))
+
+    @staticmethod
+    def _model_files(artifacts: BamArtifacts, base_dir: Path) -> list[Path]:
+        model_path = resolve_path(base_dir, artifacts.model_path)
+        pattern = _LAYER_GLOBS.get(artifacts.model_format, "layer_*.npz")
+        files = sorted(model_path.glob(pattern), key=parse_layer_index)
+        if artifacts.model_format == "layer_npy_mmap_v1":
+            files.extend(f.with_name(f.name[: -len("_W.npy")] + "_V.npy") for f in list(files))
+        if artifacts.norm_path:
+            files.append(resolve_path(base_dir, artifacts.norm_path))
+        return files
 
     def _resolve_path(self, path: str) -> Path:
-        candidate = Path(path)
-        if candidate.is_absolute():
-            return candidate
-        return (self._base_dir / candidate).resolve()
+        return resolve_path(self._base_dir, path)
+
+    def _read_layer_npz(self, layer_path: Path) -> BamLayer:
+        np = require_numpy()
+        if self._artifacts.model_format == "layer_npz_q8":
+            keys = ("W_q", "W_scale", "V_q", "V_scale")
+            with np.load(layer_path) as data:
+                if any(key not in data for key in keys):
+                    raise CodecError(f"layer file missing W_q/W_scale/V_q/V_scale: {layer_path}")
+                arrays = {key: np.asarray(data[key]) for key in keys}
+            for name in ("W", "V"):
+                q = arrays[f"{name}_q"]
+                scale = arrays[f"{name}_scale"]
+                if q.dtype != np.int8:
+                    raise CodecError(f"layer {name}_q must be int8: {layer_path}")
+                if q.ndim != 2:
+                    raise CodecError(f"layer weights must be 2D: {layer_path}")
+                if scale.shape != (q.shape[0],):
+                    raise CodecError(f"layer {name}_scale shape mismatch: {layer_path}")
+            return BamLayer(
+                W=BamQ8Weight(q=arrays["W_q"], scale=arrays["W_scale"].astype(np.float32)),
+                V=BamQ8Weight(q=arrays["V_q"], scale=arrays["V_scale"].astype(np.float32)),
+            )
+        with np.load(layer_path) as data:
+            if "W" not in data or "V" not in data:
+                raise CodecError(f"layer file missing W/V: {layer_path}")
+            W = np.asarray(data["W"], dtype=np.float32)
+            V = np.asarray(data["V"], dtype=np.float32)
+        if W.ndim != 2 or V.ndim != 2:
+            raise CodecError(f"layer weights must be 2D: {layer_path}")
+        return BamLayer(W=W, V=V)
+
+    def _read_layer_npy(self, W_path: Path) -> BamLayer:
+        # Read-only memory maps: no copy, pages are shared with every process mapping the file.
+        np = require_numpy()
+        V_path = W_path.with_name(W_path.name[: -len("_W.npy")] + "_V.npy")
+        if not V_path.exists():
+            raise CodecError(f"layer file missing V: {V_path}")
+        W = np.load(W_path, mmap_mode="r")
+        V = np.load(V_path, mmap_mode="r")
+        if W.dtype != np.float32 or V.dtype != np.float32:
+            raise CodecError(f"mmap layer weights must be float32: {W_path}")
+        if W.ndim != 2 or V.ndim != 2:
+            raise CodecError(f"layer weights must be 2D: {W_path}")
+        return BamLayer(W=W, V=V)
 
     def _load_layers(self) -> None:
-        if self._artifacts.model_format != "layer_npz_v1":
-            raise CodecError(f"unsupported bam model_format: {self._artifacts.model_format}")
+        model_format = self._artifacts.model_format
+        if model_format not in _LAYER_GLOBS:
+            raise CodecError(f"unsupported bam model_format: {model_format}")
         model_path = self._resolve_path(self._artifacts.model_path)
         if not model_path.exists():
             raise CodecError(f"bam model_path does not exist: {model_path}")
         if not model_path.is_dir():
-            raise CodecError("layer_npz_v1 requires model_path to be a directory")
+            raise CodecError(f"{model_format} requires model_path to be a directory")
 
-        layer_files = sorted(model_path.glob("layer_*.npz"), key=_parse_layer_index)
+        pattern = _LAYER_GLOBS[model_format]
+        layer_files = sorted(model_path.glob(pattern), key=parse_layer_index)
         if not layer_files:
-            raise CodecError(f"no layer_*.npz files found in {model_path}")
+            raise CodecError(f"no {pattern} files found in {model_path}")
 
-        np = _require_numpy()
         expected_input = self._artifacts.expected_input_len()
         prev_out = None
         layers: list[BamLayer] = []
         for layer_path in layer_files:
-            with np.load(layer_path) as data:
-                if "W" not in data or "V" not in data:
-                    raise CodecError(f"layer file missing W/V: {layer_path}")
-                W = np.asarray(data["W"], dtype=np.float32)
-                V = np.asarray(data["V"], dtype=np.float32)
-            if W.ndim != 2 or V.ndim != 2:
-                raise CodecError(f"layer weights must be 2D: {layer_path}")
-            if V.shape != (W.shape[1], W.shape[0]):
+            if model_format == "layer_npy_mmap_v1":
+                layer = self._read_layer_npy(layer_path)
+            else:
+                layer = self._read_layer_npz(layer_path)
+            W_shape = layer.W.shape
+            if layer.V.shape != (W_shape[1], W_shape[0]):
                 raise CodecError(f"layer V shape mismatch with W: {layer_path}")
             if prev_out is None:
-                if W.shape[1] != expected_input:
+                if W_shape[1] != expected_input:
                     raise CodecError(
-                        f"layer input dim {W.shape[1]} does not match expected {expected_input}"
+                        f"layer input dim {W_shape[1]} does not match expected {expected_input}"
                     )
             else:
-                if W.shape[1] != prev_out:
+                if W_shape[1] != prev_out:
                     raise CodecError(
-                        f"layer input dim {W.shape[1]} does not match previous {prev_out}"
+                        f"layer input dim {W_shape[1]} does not match previous {prev_out}"
                     )
-            prev_out = int(W.shape[0])
-            layers.append(BamLayer(W=W, V=V))
+            prev_out = int(W_shape[0])
+            layers.append(layer)
 
         if prev_out != self._artifacts.latent_dim:
             raise CodecError(
@@ -136,20 +336,79 @@ class BamCodec:
         expected = self._artifacts.expected_input_len()
         if len(mean) != expected or len(std) != expected:
             raise CodecError("norm mean/std length does not match expected input length")
-        np = _require_numpy()
+        np = require_numpy()
         mean_arr = np.asarray(mean, dtype=np.float32)
         std_arr = np.asarray(std, dtype=np.float32)
         if (std_arr < 0).any():
             raise CodecError("norm std must be non-negative")
         self._norm = BamNorm(mean=mean_arr, std=std_arr)
 
+    def _fusion_scale(self) -> float | None:
+        packing = self._artifacts.packing.lower()
+        if packing in ("float16", "float32"):
+            return 1.0
+        if packing not in ("int8", "int16"):
+            return None
+        scale = self._artifacts.scale
+        if scale is None or scale <= 0:
+            return None
+        return float(scale)
+
+    def _fuse_linear(self) -> None:
+        """
+        Fold norm -> layer chain -> scale into one affine map per direction.
+
+        Opt-in with the manifest's `fuse_linear`: the fused map rounds differently from the layer
+        chain, so it would change the on-air payloads of existing models. Only valid when the
+        transmission is linear (`delta` None/0) and the direction runs no recurrent cycles;
+        otherwise the layer-by-layer path is kept. Quantized (`layer_npz_q8`) models always keep
+        their integer layer path, and memory-mapped (`layer_npy_mmap_v1`) models keep theirs so
+        loading never reads the mapped weights.
+        """
+        if not self._artifacts.fuse_linear:
+            return
+        if self._artifacts.model_format in ("layer_npz_q8", "layer_npy_mmap_v1"):
+            return
+        delta = self._artifacts.delta
+        if delta is not None and float(delta) != 0.0:
+            return
+        scale = self._fusion_scale()
+        if scale is None:
+            return
+        np = require_numpy()
+        input_len = self._artifacts.expected_input_len()
+        latent_dim = self._artifacts.latent_dim
+        if self._norm is not None:
+            mean = self._norm.mean.astype(np.float64)
+            std = self._norm.std.astype(np.float64)
+            inv_std = np.where(std == 0, 0.0, 1.0 / np.where(std == 0, 1.0, std))
+        else:
+            mean = np.zeros(input_len, dtype=np.float64)
+            std = np.ones(input_len, dtype=np.float64)
+            inv_std = std
+
+        if int(self._artifacts.encode_cycles) <= 0:
+            chain = np.eye(input_len, dtype=np.float64)
+            for layer in self._layers:
+                chain = layer.W.astype(np.float64) @ chain
+            A = chain * inv_std[None, :] * scale
+            b = -(A @ mean)
+            self._fused_encoder = BamAffine(A=A.astype(np.float32), b=b.astype(np.float32))
+
+        if int(self._artifacts.decode_cycles) <= 0:
+            chain = np.eye(latent_dim, dtype=np.float64)
+            for layer in reversed(self._layers):
+                chain = layer.V.astype(np.float64) @ chain
+            A = std[:, None] * chain / scale
+            self._fused_decoder = BamAffine(A=A.astype(np.float32), b=mean.astype(np.float32))
+
     def _apply_norm(self, vector: Any) -> Any:
         if self._norm is None:
             return vector
-        np = _require_numpy()
+        np = require_numpy()
         mean = self._norm.mean
         std = self._norm.std
-        if vector.shape[0] != mean.shape[0]:
+        if vector.shape[-1] != mean.shape[0]:
             raise CodecError("norm input length mismatch")
         safe_std = np.where(std == 0, 1.0, std)
         out = (vector - mean) / safe_std
@@ -158,10 +417,10 @@ class BamCodec:
     def _invert_norm(self, vector: Any) -> Any:
         if self._norm is None:
             return vector
-        np = _require_numpy()
+        np = require_numpy()
         mean = self._norm.mean
         std = self._norm.std
-        if vector.shape[0] != mean.shape[0]:
+        if vector.shape[-1] != mean.shape[0]:
             raise CodecError("norm input length mismatch")
         out = vector * std + mean
         return np.where(std == 0, mean, out)
@@ -170,9 +429,29 @@ class BamCodec:
         delta = self._artifacts.delta
         if delta is None or float(delta) == 0.0:
             return vector
-        np = _require_numpy()
+        np = require_numpy()
         out = (delta + 1.0) * vector - delta * (vector**3)
-        return np.clip(out, -1.0, 1.0)
+        # Same values as np.clip(out, -1.0, 1.0) at half the per-call overhead.
+        return np.minimum(np.maximum(out, -1.0), 1.0)
+
+    @staticmethod
+    def _project(weights: Any, rows: Any) -> Any:
+        # `weights @ row` for a 1-D row or every row of an [N, in] block. Each row runs the same
+        # BLAS GEMV (a stacked matmul loops it in C), the product single-window encode/decode has
+        # always computed, so batching never changes a row's bits.
+        np = require_numpy()
+        if isinstance(weights, BamQ8Weight):
+            if rows.ndim == 1:
+                return BamCodec._project(weights, rows[None, :])[0]
+            # Dynamic per-row int8 activations, exact int32 accumulation, float rescale.
+            amax = np.abs(rows).max(axis=1)
+            x_scale = np.where(amax == 0, 1.0, amax / 127.0).astype(np.float32)
+            x_q = np.rint(rows / x_scale[:, None]).astype(np.int8)
+            acc = np.einsum("ni,oi->no", x_q, weights.q, dtype=np.int32)
+            return acc.astype(np.float32) * x_scale[:, None] * weights.scale[None, :]
+        if rows.ndim == 1:
+            return weights @ rows
+        return np.matmul(weights, rows[:, :, None])[:, :, 0]
 
     def _require_scale(self) -> float:
         scale = self._artifacts.scale
@@ -182,56 +461,161 @@ class BamCodec:
             raise CodecError("bam scale must be positive")
         return float(scale)
 
+    def _packing_dtype(self) -> Any:
+        np = require_numpy()
+        dtype = {
+            "int8": np.int8,
+            "int16": np.int16,
+            "float16": np.float16,
+            "float32": np.float32,
+        }.get(self._artifacts.packing.lower())
+        if dtype is None:
+            raise CodecError(f"unsupported bam packing: {self._artifacts.packing}")
+        return np.dtype(dtype)
+
+    def _quantize(self, latent: Any, dtype: Any, prescaled: bool) -> Any:
+        np = require_numpy()
+        if dtype.kind != "i":
+            return latent.astype(dtype)
+        info = np.iinfo(dtype)
+        scaled = np.rint(latent if prescaled else latent * self._require_scale())
+        return np.clip(scaled, info.min, info.max).astype(dtype)
+
+    def _pack_rows(self, matrix: Any, *, prescaled: bool = False) -> list[bytes]:
+        np = require_numpy()
+        dtype = self._packing_dtype()
+        # Rows come from the layer stack, whose output width is checked against latent_dim at load.
+        matrix = np.asarray(matrix, dtype=np.float32)
+        data = self._quantize(matrix, dtype, prescaled).tobytes()
+        width = self._artifacts.latent_dim * dtype.itemsize
+        return [data[i : i + width] for i in range(0, len(data), width)]
+
     def _pack(self, vector: Any) -> bytes:
-        np = _require_numpy()
-        packing = self._artifacts.packing.lower()
+        np = require_numpy()
+        dtype = self._packing_dtype()
         vector = np.asarray(vector, dtype=np.float32).reshape(-1)
         if vector.shape[0] != self._artifacts.latent_dim:
             raise CodecError("latent vector length does not match latent_dim")
-        if packing == "int8":
-            scale = self._require_scale()
-            info = np.iinfo(np.int8)
-            scaled = np.rint(vector * scale)
-            scaled = np.clip(scaled, info.min, info.max).astype(np.int8)
-            return scaled.tobytes()
-        if packing == "int16":
-            scale = self._require_scale()
-            info = np.iinfo(np.int16)
-            scaled = np.rint(vector * scale)
-            scaled = np.clip(scaled, info.min, info.max).astype(np.int16)
-            return scaled.tobytes()
-        if packing == "float16":
-            return vector.astype(np.float16).tobytes()
-        if packing == "float32":
-            return vector.astype(np.float32).tobytes()
-        raise CodecError(f"unsupported bam packing: {self._artifacts.packing}")
+        return self._quantize(vector, dtype, False).tobytes()
 
-    def _unpack(self, payload: bytes) -> Any:
-        np = _require_numpy()
-        packing = self._artifacts.packing.lower()
-        if packing == "int8":
-            scale = self._require_scale()
-            vector = np.frombuffer(payload, dtype=np.int8).astype(np.float32)
-            if vector.shape[0] != self._artifacts.latent_dim:
+    def _unpack_rows(self, payloads: Sequence[bytes], *, unscaled: bool = False) -> Any:
+        np = require_numpy()
+        dtype = self._packing_dtype()
+        scale = self._require_scale() if dtype.kind == "i" and not unscaled else None
+        width = self._artifacts.latent_dim * dtype.itemsize
+        for payload in payloads:
+            if len(payload) != width:
                 raise CodecError("payload latent length mismatch")
-            return vector / scale
-        if packing == "int16":
-            scale = self._require_scale()
-            vector = np.frombuffer(payload, dtype=np.int16).astype(np.float32)
-            if vector.shape[0] != self._artifacts.latent_dim:
-                raise CodecError("payload latent length mismatch")
-            return vector / scale
-        if packing == "float16":
-            vector = np.frombuffer(payload, dtype=np.float16).astype(np.float32)
-            if vector.shape[0] != self._artifacts.latent_dim:
-                raise CodecError("payload latent length mismatch")
-            return vector
-        if packing == "float32":
-            vector = np.frombuffer(payload, dtype=np.float32).astype(np.float32)
-            if vector.shape[0] != self._artifacts.latent_dim:
-                raise CodecError("payload latent length mismatch")
-            return vector
-        raise CodecError(f"unsupported bam packing: {self._artifacts.packing}")
+        matrix = np.frombuffer(b"".join(payloads), dtype=dtype).astype(np.float32)
+        matrix = matrix.reshape(len(payloads), self._artifacts.latent_dim)
+        if scale is not None:
+            return matrix / scale
+        return matrix
+
+    def _unpack(self, payload: bytes) -> Any:
+        return self._unpack_rows([payload])[0]
+
+    def _cycle(self, state: Any, first: Any, second: Any, budget: int) -> tuple[Any, Any]:
+        """
+        Run up to `budget` recurrent cycles `state <- f(second @ f(first @ state))`.
+
+        With `cycle_tol`, a row stops once its largest per-element change drops below the
+        tolerance. Returns the final state and the cycles each row actually ran.
+        """
+        np = require_numpy()
+        ran = np.zeros(state.shape[0], dtype=np.int64)
+        tol = self._artifacts.cycle_tol
+        if tol is None:
+            for _ in range(budget):
+                state = self._transmission(self._project(first, state))
+                state = self._transmission(self._project(second, state))
+            ran += budget
+            return state, ran
+        state = np.array(state, copy=True)
+        active = np.arange(state.shape[0])
+        for _ in range(budget):
+            if active.size == 0:
+                break
+            prev = state[active]
+            new = self._transmission(self._project(first, prev))
+            new = self._transmission(self._project(second, new))
+            state[active] = new
+            ran[active] += 1
+            change = np.abs(new - prev).max(axis=1)
+            active = active[change >= tol]
+        return state, ran
+
+    def _encode_rows(self, matrix: Any) -> Any:
+        np = require_numpy()
+        matrix = self._apply_norm(matrix)
+        budget = self._artifacts.cycle_budget(int(self._artifacts.encode_cycles))
+        cycles = np.zeros(matrix.shape[0], dtype=np.int64)
+        for layer in self._layers:
+            y0 = self._project(layer.W, matrix)
+            y0 = self._transmission(y0)
+            if budget <= 0:
+                matrix = y0
+                continue
+            matrix, ran = self._cycle(y0, layer.V, layer.W, budget)
+            cycles += ran
+        self.last_encode_cycles = cycles.tolist()
+        return matrix
+
+    def _decode_rows(self, matrix: Any) -> Any:
+        np = require_numpy()
+        budget = self._artifacts.cycle_budget(int(self._artifacts.decode_cycles))
+        cycles = np.zeros(matrix.shape[0], dtype=np.int64)
+        for layer in reversed(self._layers):
+            x0 = self._project(layer.V, matrix)
+            x0 = self._transmission(x0)
+            if budget <= 0:
+                matrix = x0
+                continue
+            matrix, ran = self._cycle(x0, layer.W, layer.V, budget)
+            cycles += ran
+        self.last_decode_cycles = cycles.tolist()
+        return self._invert_norm(matrix)
+
+    def _encode_vector(self, vector: Any) -> Any:
+        """`_encode_rows` for one 1-D window, without the per-row cycle bookkeeping."""
+        budget = self._artifacts.cycle_budget(int(self._artifacts.encode_cycles))
+        if budget > 0 and self._artifacts.cycle_tol is not None:
+            return self._encode_rows(vector[None, :])[0]
+        vector = self._apply_norm(vector)
+        for layer in self._layers:
+            vector = self._transmission(self._project(layer.W, vector))
+            for _ in range(budget):
+                x_c = self._transmission(self._project(layer.V, vector))
+                vector = self._transmission(self._project(layer.W, x_c))
+        self.last_encode_cycles = [budget * len(self._layers)]
+        return vector
+
+    def _decode_vector(self, vector: Any) -> Any:
+        """`_decode_rows` for one 1-D latent, without the per-row cycle bookkeeping."""
+        budget = self._artifacts.cycle_budget(int(self._artifacts.decode_cycles))
+        if budget > 0 and self._artifacts.cycle_tol is not None:
+            return self._decode_rows(vector[None, :])[0]
+        for layer in reversed(self._layers):
+            vector = self._transmission(self._project(layer.V, vector))
+            for _ in range(budget):
+                y_c = self._transmission(self._project(layer.W, vector))
+                vector = self._transmission(self._project(layer.V, y_c))
+        self.last_decode_cycles = [budget * len(self._layers)]
+        return self._invert_norm(vector)
+
+    def _encode_payloads(self, matrix: Any) -> list[bytes]:
+        fused = self._fused_encoder
+        if fused is not None:
+            self.last_encode_cycles = [0] * int(matrix.shape[0])
+            return self._pack_rows(self._project(fused.A, matrix) + fused.b, prescaled=True)
+        return self._pack_rows(self._encode_rows(matrix))
+
+    def _decode_payloads(self, payloads: Sequence[bytes]) -> Any:
+        fused = self._fused_decoder
+        if fused is not None:
+            self.last_decode_cycles = [0] * len(payloads)
+            return self._project(fused.A, self._unpack_rows(payloads, unscaled=True)) + fused.b
+        return self._decode_rows(self._unpack_rows(payloads))
 
     def encode(self, window: Sequence[float]) -> bytes:
         expected_len = self._artifacts.expected_input_len()
@@ -239,56 +623,63 @@ class BamCodec:
             raise ValueError(
                 f"bam window length {len(window)} does not match expected {expected_len}"
             )
-        np = _require_numpy()
+        np = require_numpy()
         vector = np.asarray(window, dtype=np.float32).reshape(-1)
-        vector = self._apply_norm(vector)
-        encode_cycles = int(self._artifacts.encode_cycles)
-        for layer in self._layers:
-            y0 = layer.W @ vector
-            y0 = self._transmission(y0)
-            if encode_cycles <= 0:
-                vector = y0
-                continue
-            y_c = y0
-            x_c = vector
-            for _ in range(encode_cycles):
-                x_c = layer.V @ y_c
-                x_c = self._transmission(x_c)
-                y_c = layer.W @ x_c
-                y_c = self._transmission(y_c)
-            vector = y_c
-        return self._pack(vector)
+        if self._fused_encoder is not None:
+            return self._encode_payloads(vector[None, :])[0]
+        return self._pack(self._encode_vector(vector))
+
+    def encode_batch(self, windows: Any) -> list[bytes]:
+        """
+        Encode an `[N, input_dims * window_W]` block of windows into N payloads.
+
+        Every layer runs as one stacked BLAS call over the block, with the same per-window GEMV as
+        `encode`, so each payload is byte-identical to `encode` on that window.
+        """
+        np = require_numpy()
+        expected_len = self._artifacts.expected_input_len()
+        matrix = np.asarray(windows, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != expected_len:
+            raise ValueError(
+                f"bam windows shape {matrix.shape} does not match (N, {expected_len})"
+            )
+        return self._encode_payloads(matrix)
 
     def decode(self, payload: bytes) -> Sequence[float]:
+        if self._fused_decoder is not None:
+            return self.decode_batch([payload])[0].tolist()
         expected_bytes = self._artifacts.expected_payload_bytes()
         if expected_bytes is not None and len(payload) != expected_bytes:
             raise CodecError(
                 f"bam payload length {len(payload)} does not match expected {expected_bytes}"
             )
-        vector = self._unpack(payload)
-        decode_cycles = int(self._artifacts.decode_cycles)
-        for layer in reversed(self._layers):
-            x0 = layer.V @ vector
-            x0 = self._transmission(x0)
-            if decode_cycles <= 0:
-                vector = x0
-                continue
-            x_c = x0
-            y_c = vector
-            for _ in range(decode_cycles):
-                y_c = layer.W @ x_c
-                y_c = self._transmission(y_c)
-                x_c = layer.V @ y_c
-                x_c = self._transmission(x_c)
-            vector = x_c
-        vector = self._invert_norm(vector)
-        return vector.tolist()
+        return self._decode_vector(self._unpack(payload)).tolist()
+
+    def decode_batch(self, payloads: Sequence[bytes]) -> Any:
+        """
+        Decode N payloads into an `[N, input_dims * window_W]` float array.
+
+        Each row is bit-identical to `decode` on that payload.
+        """
+        expected_bytes = self._artifacts.expected_payload_bytes()
+        if expected_bytes is not None:
+            for payload in payloads:
+                if len(payload) != expected_bytes:
+                    raise CodecError(
+                        f"bam payload length {len(payload)} does not match expected "
+                        f"{expected_bytes}"
+                    )
+        return self._decode_payloads(payloads)
 
     def payload_schema(self) -> str:
         scale = self._artifacts.scale if self._artifacts.scale is not None else "none"
-        return (
+        schema = (
             "bam:"
             f"latent_dim={self._artifacts.latent_dim}:"
             f"packing={self._artifacts.packing}:"
             f"scale={scale}"
         )
+        if self._fused_encoder is not None or self._fused_decoder is not None:
+            # Fused payloads differ from the layer chain's; peers must agree on fusion.
+            schema += ":fused=1"
+        return schema
@@ -29,6 +29,9 @@ class BamArtifacts:
     window_stride: int
     norm_path: str | None
     notes: str | None = None
+    cycle_tol: float | None = None
+    max_cycles: int | None = None
+    fuse_linear: bool = False
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BamArtifacts":
@@ -51,6 +54,15 @@ class BamArtifacts:
         decode_cycles = int(data.get("decode_cycles", 0) or 0)
         if encode_cycles < 0 or decode_cycles < 0:
             raise ValueError("encode_cycles and decode_cycles must be >= 0")
+        cycle_tol = float(data["cycle_tol"]) if data.get("cycle_tol") is not None else None
+        max_cycles = int(data["max_cycles"]) if data.get("max_cycles") is not None else None
+        if cycle_tol is not None and cycle_tol <= 0:
+            raise ValueError("cycle_tol must be > 0")
+        if max_cycles is not None:
+            if cycle_tol is None:
+                raise ValueError("max_cycles requires cycle_tol")
+            if max_cycles < 0:
+                raise ValueError("max_cycles must be >= 0")
         return cls(
             manifest_version=str(data["manifest_version"]),
             model_format=str(data["model_format"]),
@@ -66,6 +78,9 @@ class BamArtifacts:
             window_stride=int(data["window_stride"]),
             norm_path=(str(data["norm_path"]) if data.get("norm_path") else None),
             notes=(str(data["notes"]) if data.get("notes") else None),
+            cycle_tol=cycle_tol,
+            max_cycles=max_cycles,
+            fuse_linear=bool(data.get("fuse_linear", False)),
         )
 
     @classmethod
@@ -90,8 +105,24 @@ class BamArtifacts:
             "window_stride": self.window_stride,
             "norm_path": self.norm_path,
             "notes": self.notes,
+            "cycle_tol": self.cycle_tol,
+            "max_cycles": self.max_cycles,
+            "fuse_linear": self.fuse_linear,
         }
 
+    def cycle_budget(self, configured: int) -> int:
+        """
+        Upper bound on recurrent cycles for a direction configured with `configured` cycles.
+
+        `max_cycles` only applies with `cycle_tol` and never enables cycles for a direction
+        configured with 0.
+        """
+        if configured <= 0:
+            return 0
+        if self.cycle_tol is not None and self.max_cycles is not None:
+            return int(self.max_cycles)
+        return int(configured)
+
     def expected_input_len(self) -> int:
         return self.input_dims * self.window_W
 
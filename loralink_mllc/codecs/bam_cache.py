@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Files modified this recently are re-hashed on every lookup instead of trusting their stat
+# signature, since a rewrite within the filesystem timestamp granularity keeps mtime/size.
+_RACY_WINDOW_S = 2.0
+_MAX_STAT_MEMO = 256
+
+
+@dataclass(frozen=True)
+class BamCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+
+class BamModelCache:
+    """
+    Thread-safe LRU of loaded BAM models, bounded by total weight bytes.
+
+    Entries are keyed by a content fingerprint (see `fingerprint`) and must be immutable; every
+    codec built from the same fingerprint shares the cached object.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self._max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._stat_memo: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        with self._lock:
+            self._max_bytes = int(max_bytes)
+            self._evict_locked()
+
+    def fingerprint(self, paths: Sequence[Path], *, stat_paths: Sequence[Path] = ()) -> str:
+        """
+        sha256 over the names and contents of `paths` (in order).
+
+        `stat_paths` contribute only their (path, size, mtime_ns, inode) signature, for files
+        too large to read up front. Repeated calls for unchanged files only stat them: the digest
+        is memoized by the stat signatures unless a file was modified within the racy window.
+        """
+        identity = []
+        for path in stat_paths:
+            st = os.stat(path)
+            identity.append((str(path), st.st_size, st.st_mtime_ns, st.st_ino))
+        signature = list(identity)
+        racy = False
+        now = time.time()
+        for path in paths:
+            st = os.stat(path)
+            signature.append((str(path), st.st_size, st.st_mtime_ns, st.st_ino))
+            if now - st.st_mtime_ns / 1e9 < _RACY_WINDOW_S:
+                racy = True
+        key = tuple(signature)
+        if not racy:
+            with self._lock:
+                digest = self._stat_memo.get(key)
+                if digest is not None:
+                    self._stat_memo.move_to_end(key)
+                    return digest
+        h = hashlib.sha256()
+        for path in paths:
+            data = Path(path).read_bytes()
+            h.update(Path(path).name.encode("utf-8"))
+            h.update(len(data).to_bytes(8, "little"))
+            h.update(data)
+        h.update(repr(identity).encode("utf-8"))
+        digest = h.hexdigest()
+        if not racy:
+            with self._lock:
+                self._stat_memo[key] = digest
+                while len(self._stat_memo) > _MAX_STAT_MEMO:
+                    self._stat_memo.popitem(last=False)
+        return digest
+
+    def get_or_load(self, key: str, loader: Callable[[], tuple[Any, int]]) -> Any:
+        """
+        Return the model cached under `key`, or call `loader() -> (model, nbytes)` and cache it.
+
+        The loader runs outside the lock; if two threads miss on the same key concurrently the
+        first inserted model wins and both callers receive it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        model, nbytes = loader()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+            if nbytes <= self._max_bytes:
+                self._entries[key] = (model, int(nbytes))
+                self._bytes += int(nbytes)
+                self._evict_locked()
+        return model
+
+    def _evict_locked(self) -> None:
+        while self._bytes > self._max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+            self._evictions += 1
+
+    def stats(self) -> BamCacheStats:
+        with self._lock:
+            return BamCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stat_memo.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+_DEFAULT_CACHE = BamModelCache()
+
+
+def default_model_cache() -> BamModelCache:
+    """Process-wide cache used by `BamCodec.from_manifest`."""
+    return _DEFAULT_CACHE
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from loralink_mllc.codecs.bam import BamCodec
 from loralink_mllc.codecs.bam_placeholder import BamPlaceholderCodec
 from loralink_mllc.codecs.base import ICodec
@@ -43,7 +45,9 @@ def create_codec(spec: CodecSpec) -> ICodec:
     if codec_id == "zlib":
         level = int(params.get("level", 6))
         inner_scale = float(params.get("scale", 32767.0))
-        return ZlibCodec(inner=RawCodec(scale=inner_scale), level=level)
+        zdict_path = params.get("zdict_path")
+        zdict = Path(zdict_path).read_bytes() if zdict_path else None
+        return ZlibCodec(inner=RawCodec(scale=inner_scale), level=level, zdict=zdict)
     if codec_id == "bam_placeholder":
         reason = params.get("reason") or "BAM codec artifacts not configured"
         return BamPlaceholderCodec(reason=reason)
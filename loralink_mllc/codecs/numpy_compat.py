@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def optional_numpy() -> Any:
+    """The numpy module, or None when it is not installed (callers keep a pure-Python path)."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def as_float64_matrix(np: Any, windows: Any) -> Any:
+    """float64 view of `windows`, or None when only the scalar path reproduces `float()`."""
+    try:
+        matrix = np.asarray(windows, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    # asarray maps None to NaN where float(None) raises; defer any NaN from non-numeric input.
+    numeric = isinstance(windows, np.ndarray) and windows.dtype.kind in "biuf"
+    if not numeric and np.isnan(matrix).any():
+        return None
+    return matrix
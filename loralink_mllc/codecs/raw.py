@@ -1,42 +1,99 @@
 from __future__ import annotations
 
 import struct
-from typing import Sequence
+from functools import lru_cache
+from typing import Any, Sequence
 
 from loralink_mllc.codecs.base import CodecError
+from loralink_mllc.codecs.numpy_compat import as_float64_matrix, optional_numpy
+
+
+@lru_cache(maxsize=256)
+def _int16_struct(count: int) -> struct.Struct:
+    return struct.Struct(f"<{count}h")
 
 
 class RawCodec:
+    """
+    int16 little-endian fixed-point codec: each value is clamped to [-1, 1], scaled and rounded.
+
+    With numpy installed longer windows (and `encode_batch`/`decode_batch`) are processed as
+    arrays; short windows and installs without numpy use a cached `struct.Struct` per length.
+    Both paths produce identical bytes and values.
+    """
+
     codec_id = "raw"
     codec_version = "1"
 
+    # Below these many values per call the fixed numpy overhead outweighs the Python loop.
+    _NUMPY_MIN_ENCODE = 12
+    _NUMPY_MIN_DECODE = 32
+
     def __init__(self, scale: float = 32767.0) -> None:
         if scale <= 0:
             raise ValueError("scale must be > 0")
         self._scale = float(scale)
+        self._np = optional_numpy()
+
+    def _encode_numpy(self, matrix: Any) -> bytes:
+        np = self._np
+        # fmin/fmax ignore NaN like the Python min/max clamp in `encode` (NaN -> 1.0).
+        clamped = np.fmax(-1.0, np.fmin(1.0, matrix))
+        q = np.rint(clamped * self._scale)
+        q = np.minimum(np.maximum(q, -32768.0), 32767.0)
+        return q.astype("<i2").tobytes()
 
     def encode(self, window: Sequence[float]) -> bytes:
+        if self._np is not None and len(window) >= self._NUMPY_MIN_ENCODE:
+            matrix = as_float64_matrix(self._np, window)
+            if matrix is not None and matrix.ndim == 1:
+                return self._encode_numpy(matrix)
+        scale = self._scale
         values = []
         for value in window:
-            clamped = max(-1.0, min(1.0, float(value)))
-            q = int(round(clamped * self._scale))
-            if q < -32768:
-                q = -32768
-            if q > 32767:
-                q = 32767
-            values.append(q)
-        fmt = "<" + "h" * len(values)
-        return struct.pack(fmt, *values)
+            q = round(max(-1.0, min(1.0, float(value))) * scale)
+            values.append(-32768 if q < -32768 else 32767 if q > 32767 else q)
+        return _int16_struct(len(values)).pack(*values)
+
+    def encode_batch(self, windows: Any) -> list[bytes]:
+        """Encode an `[N, D]` block into N payloads; bytes are identical to `encode`."""
+        if self._np is None:
+            return [self.encode(window) for window in windows]
+        matrix = as_float64_matrix(self._np, windows)
+        if matrix is None or matrix.ndim != 2:
+            return [self.encode(window) for window in windows]
+        width = matrix.shape[1] * 2
+        if not width:
+            return [b""] * matrix.shape[0]
+        data = self._encode_numpy(matrix)
+        return [data[i : i + width] for i in range(0, len(data), width)]
+
+    def _decode_flat(self, payload: bytes) -> list[float]:
+        count = len(payload) // 2
+        if self._np is not None and count >= self._NUMPY_MIN_DECODE:
+            np = self._np
+            return (np.frombuffer(payload, dtype="<i2") / self._scale).tolist()
+        scale = self._scale
+        return [val / scale for val in _int16_struct(count).unpack(payload)]
 
     def decode(self, payload: bytes) -> Sequence[float]:
         if len(payload) % 2 != 0:
             raise CodecError("raw payload length must be even")
-        count = len(payload) // 2
-        fmt = "<" + "h" * count
-        ints = struct.unpack(fmt, payload)
-        return [val / self._scale for val in ints]
+        return self._decode_flat(payload)
+
+    def decode_batch(self, payloads: Sequence[bytes]) -> list[list[float]]:
+        """Decode N payloads in one pass; each entry equals `decode(payload)`."""
+        for payload in payloads:
+            if len(payload) % 2 != 0:
+                raise CodecError("raw payload length must be even")
+        flat = self._decode_flat(b"".join(payloads))
+        out: list[list[float]] = []
+        offset = 0
+        for payload in payloads:
+            n = len(payload) // 2
+            out.append(flat[offset : offset + n])
+            offset += n
+        return out
 
     def payload_schema(self) -> str:
         return f"raw:int16:le:scale={self._scale}"
-
-
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import struct
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Any, Sequence
 
 from loralink_mllc.codecs.base import CodecError
+from loralink_mllc.codecs.numpy_compat import as_float64_matrix, optional_numpy
 
 
 def _clamp_int16(value: int) -> int:
@@ -15,6 +16,11 @@ def _clamp_int16(value: int) -> int:
     return int(value)
 
 
+# Smallest magnitude that rounds to inf as float32 (FLT_MAX plus half an ulp); `struct` raises
+# OverflowError for finite values at or above it.
+_F32_OVERFLOW = 2.0**128 - 2.0**103
+
+
 @dataclass(frozen=True)
 class _Scales:
     accel: float
@@ -34,6 +40,10 @@ class Sensor12PackedCodec:
       - roll..yaw: int16 (scaled)
 
     Total per step: 30 bytes. For a window with W steps, payload is 30 * W bytes.
+
+    With numpy installed a whole window (or batch) is quantized and serialized through the
+    structured dtype `<f4,f4,f4,i2 x9`; otherwise a precompiled `struct.Struct` is used. Both
+    paths produce identical bytes and values.
     """
 
     codec_id = "sensor12_packed"
@@ -41,6 +51,9 @@ class Sensor12PackedCodec:
 
     _STEP_FMT = "<fff" + ("h" * 9)
     _STEP_SIZE = struct.calcsize(_STEP_FMT)
+    _STEP = struct.Struct(_STEP_FMT)
+    # Below this many steps per call the fixed numpy overhead outweighs the per-step struct loop.
+    _NUMPY_MIN_STEPS = 4
 
     def __init__(
         self,
@@ -56,88 +69,138 @@ class Sensor12PackedCodec:
             gyro=float(gyro_scale),
             rpy=float(rpy_scale),
         )
+        self._np = optional_numpy()
+        if self._np is not None:
+            np = self._np
+            scale = self._scale
+            self._dtype = np.dtype([("gps", "<f4", (3,)), ("imu", "<i2", (9,))])
+            self._np_scales = np.asarray(
+                [scale.accel] * 3 + [scale.gyro] * 3 + [scale.rpy] * 3, dtype=np.float64
+            )
+
+    def _encode_struct(self, window: Sequence[float]) -> bytes:
+        pack = self._STEP.pack
+        accel, gyro, rpy = self._scale.accel, self._scale.gyro, self._scale.rpy
+        out = []
+        for i in range(0, len(window), 12):
+            out.append(
+                pack(
+                    float(window[i + 0]),
+                    float(window[i + 1]),
+                    float(window[i + 2]),
+                    _clamp_int16(round(float(window[i + 3]) * accel)),
+                    _clamp_int16(round(float(window[i + 4]) * accel)),
+                    _clamp_int16(round(float(window[i + 5]) * accel)),
+                    _clamp_int16(round(float(window[i + 6]) * gyro)),
+                    _clamp_int16(round(float(window[i + 7]) * gyro)),
+                    _clamp_int16(round(float(window[i + 8]) * gyro)),
+                    _clamp_int16(round(float(window[i + 9]) * rpy)),
+                    _clamp_int16(round(float(window[i + 10]) * rpy)),
+                    _clamp_int16(round(float(window[i + 11]) * rpy)),
+                )
+            )
+        return b"".join(out)
+
+    def _encode_numpy(self, matrix: Any) -> bytes | None:
+        """
+        Pack a float64 `[..., 12 * W]` block; returns None when a value needs the scalar path
+        (non-finite IMU values or float32 overflow, which `struct`/`round` reject).
+        """
+        np = self._np
+        steps = matrix.reshape(-1, 12)
+        gps = steps[:, :3]
+        scaled = np.rint(steps[:, 3:] * self._np_scales)
+        if not np.isfinite(scaled).all():
+            return None
+        big = np.abs(gps) >= _F32_OVERFLOW
+        if big.any() and np.isfinite(gps[big]).any():
+            return None
+        out = np.empty(steps.shape[0], dtype=self._dtype)
+        out["gps"] = gps
+        out["imu"] = np.minimum(np.maximum(scaled, -32768.0), 32767.0)
+        return out.tobytes()
 
     def encode(self, window: Sequence[float]) -> bytes:
         if len(window) % 12 != 0:
             raise ValueError("sensor12_packed window length must be a multiple of 12")
-        if not window:
+        if not len(window):
             return b""
-
-        out = bytearray()
-        for i in range(0, len(window), 12):
-            lat = float(window[i + 0])
-            lon = float(window[i + 1])
-            alt = float(window[i + 2])
-
-            ax = _clamp_int16(round(float(window[i + 3]) * self._scale.accel))
-            ay = _clamp_int16(round(float(window[i + 4]) * self._scale.accel))
-            az = _clamp_int16(round(float(window[i + 5]) * self._scale.accel))
-
-            gx = _clamp_int16(round(float(window[i + 6]) * self._scale.gyro))
-            gy = _clamp_int16(round(float(window[i + 7]) * self._scale.gyro))
-            gz = _clamp_int16(round(float(window[i + 8]) * self._scale.gyro))
-
-            roll = _clamp_int16(round(float(window[i + 9]) * self._scale.rpy))
-            pitch = _clamp_int16(round(float(window[i + 10]) * self._scale.rpy))
-            yaw = _clamp_int16(round(float(window[i + 11]) * self._scale.rpy))
-
-            out.extend(
-                struct.pack(
-                    self._STEP_FMT,
-                    lat,
-                    lon,
-                    alt,
-                    ax,
-                    ay,
-                    az,
-                    gx,
-                    gy,
-                    gz,
-                    roll,
-                    pitch,
-                    yaw,
+        if self._np is not None and len(window) >= 12 * self._NUMPY_MIN_STEPS:
+            matrix = as_float64_matrix(self._np, window)
+            packed = self._encode_numpy(matrix) if matrix is not None else None
+            if packed is not None:
+                return packed
+        return self._encode_struct(window)
+
+    def encode_batch(self, windows: Any) -> list[bytes]:
+        """
+        Encode an `[N, 12 * W]` block of windows; bytes are identical to `encode` per window.
+        """
+        if self._np is None:
+            return [self.encode(window) for window in windows]
+        matrix = as_float64_matrix(self._np, windows)
+        if matrix is None or matrix.ndim != 2:
+            return [self.encode(window) for window in windows]
+        if matrix.shape[1] % 12 != 0:
+            raise ValueError("sensor12_packed window length must be a multiple of 12")
+        packed = self._encode_numpy(matrix)
+        if packed is None:
+            return [self.encode(window) for window in windows]
+        width = (matrix.shape[1] // 12) * self._STEP_SIZE
+        if not width:
+            return [b""] * matrix.shape[0]
+        return [packed[i : i + width] for i in range(0, len(packed), width)]
+
+    def _decode_flat(self, payload: bytes) -> list[float]:
+        if self._np is not None and len(payload) >= self._STEP_SIZE * self._NUMPY_MIN_STEPS:
+            np = self._np
+            steps = np.frombuffer(payload, dtype=self._dtype)
+            out = np.empty((steps.shape[0], 12), dtype=np.float64)
+            out[:, :3] = steps["gps"]
+            out[:, 3:] = steps["imu"] / self._np_scales
+            return out.reshape(-1).tolist()
+        accel, gyro, rpy = self._scale.accel, self._scale.gyro, self._scale.rpy
+        out_list: list[float] = []
+        for lat, lon, alt, ax, ay, az, gx, gy, gz, roll, pitch, yaw in self._STEP.iter_unpack(
+            payload
+        ):
+            out_list.extend(
+                (
+                    float(lat),
+                    float(lon),
+                    float(alt),
+                    ax / accel,
+                    ay / accel,
+                    az / accel,
+                    gx / gyro,
+                    gy / gyro,
+                    gz / gyro,
+                    roll / rpy,
+                    pitch / rpy,
+                    yaw / rpy,
                 )
             )
-        return bytes(out)
+        return out_list
 
     def decode(self, payload: bytes) -> Sequence[float]:
         if len(payload) % self._STEP_SIZE != 0:
             raise CodecError("sensor12_packed payload length mismatch")
         if not payload:
             return []
-
-        out: list[float] = []
-        for i in range(0, len(payload), self._STEP_SIZE):
-            (
-                lat,
-                lon,
-                alt,
-                ax,
-                ay,
-                az,
-                gx,
-                gy,
-                gz,
-                roll,
-                pitch,
-                yaw,
-            ) = struct.unpack_from(self._STEP_FMT, payload, i)
-            out.extend(
-                [
-                    float(lat),
-                    float(lon),
-                    float(alt),
-                    float(ax) / self._scale.accel,
-                    float(ay) / self._scale.accel,
-                    float(az) / self._scale.accel,
-                    float(gx) / self._scale.gyro,
-                    float(gy) / self._scale.gyro,
-                    float(gz) / self._scale.gyro,
-                    float(roll) / self._scale.rpy,
-                    float(pitch) / self._scale.rpy,
-                    float(yaw) / self._scale.rpy,
-                ]
-            )
+        return self._decode_flat(payload)
+
+    def decode_batch(self, payloads: Sequence[bytes]) -> list[list[float]]:
+        """Decode N payloads in one pass; each entry equals `decode(payload)`."""
+        for payload in payloads:
+            if len(payload) % self._STEP_SIZE != 0:
+                raise CodecError("sensor12_packed payload length mismatch")
+        flat = self._decode_flat(b"".join(payloads))
+        out: list[list[float]] = []
+        offset = 0
+        for payload in payloads:
+            n = (len(payload) // self._STEP_SIZE) * 12
+            out.append(flat[offset : offset + n])
+            offset += n
         return out
 
     def payload_schema(self) -> str:
@@ -1,34 +1,109 @@
 from __future__ import annotations
 
+import hashlib
 import zlib
-from typing import Sequence
+from collections import Counter
+from typing import Iterable, Sequence
 
 from loralink_mllc.codecs.base import CodecError
 from loralink_mllc.codecs.raw import RawCodec
 
+# zlib caps preset dictionaries at the 32 KiB window.
+MAX_ZDICT_BYTES = 32768
+
+
+def train_zdict(samples: Iterable[bytes], size: int = 1024, *, segment: int = 4) -> bytes:
+    """
+    Build a deflate preset dictionary from sample payloads.
+
+    Picks the `segment`-byte substrings that occur in the most samples (at least two) until
+    `size` bytes are filled, placing the most common last so matches use the shortest distances.
+    """
+    if size <= 0 or size > MAX_ZDICT_BYTES:
+        raise ValueError(f"zdict size must be 1..{MAX_ZDICT_BYTES}")
+    if segment <= 0:
+        raise ValueError("zdict segment must be > 0")
+    counts: Counter[bytes] = Counter()
+    for sample in samples:
+        # dict.fromkeys dedupes in first-seen order so ties rank the same under any hash seed.
+        chunks = (sample[i : i + segment] for i in range(len(sample) - segment + 1))
+        counts.update(dict.fromkeys(chunks, 1))
+    picked: list[bytes] = []
+    total = 0
+    for chunk, count in counts.most_common():
+        if count < 2 or total + segment > size:
+            break
+        picked.append(chunk)
+        total += segment
+    return b"".join(reversed(picked))
+
 
 class ZlibCodec:
+    """
+    Deflate wrapper around an inner codec (default `RawCodec`).
+
+    Without `zdict` payloads are standard zlib streams (`zlib.compress`). With a preset
+    dictionary payloads are raw deflate (no header/checksum) primed with `zdict`; the schema then
+    carries the dictionary's sha256 so both ends must load the same artifact. Compressor state is
+    built once and `copy()`-ed per window.
+    """
+
     codec_id = "zlib"
     codec_version = "1"
 
-    def __init__(self, inner: RawCodec | None = None, level: int = 6) -> None:
+    def __init__(
+        self,
+        inner: RawCodec | None = None,
+        level: int = 6,
+        zdict: bytes | None = None,
+    ) -> None:
         if level < 0 or level > 9:
             raise ValueError("zlib level must be 0..9")
+        if zdict is not None and not (0 < len(zdict) <= MAX_ZDICT_BYTES):
+            raise ValueError(f"zlib zdict must be 1..{MAX_ZDICT_BYTES} bytes")
         self._inner = inner or RawCodec()
         self._level = level
+        self._zdict = bytes(zdict) if zdict is not None else None
+        if self._zdict is None:
+            self._zdict_hash = None
+            self._compressor = zlib.compressobj(level)
+            self._decompressor = None
+        else:
+            self._zdict_hash = hashlib.sha256(self._zdict).hexdigest()
+            self._compressor = zlib.compressobj(
+                level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=self._zdict
+            )
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=self._zdict)
+
+    @property
+    def zdict_hash(self) -> str | None:
+        return self._zdict_hash
 
     def encode(self, window: Sequence[float]) -> bytes:
         raw = self._inner.encode(window)
-        return zlib.compress(raw, level=self._level)
+        compressor = self._compressor.copy()
+        return compressor.compress(raw) + compressor.flush()
 
     def decode(self, payload: bytes) -> Sequence[float]:
+        if self._decompressor is None:
+            try:
+                raw = zlib.decompress(payload)
+            except zlib.error as exc:
+                raise CodecError("zlib payload could not be decompressed") from exc
+            return self._inner.decode(raw)
+        decompressor = self._decompressor.copy()
         try:
-            raw = zlib.decompress(payload)
+            raw = decompressor.decompress(payload)
         except zlib.error as exc:
             raise CodecError("zlib payload could not be decompressed") from exc
+        if not decompressor.eof or decompressor.unused_data:
+            raise CodecError("zlib payload could not be decompressed")
         return self._inner.decode(raw)
 
     def payload_schema(self) -> str:
-        return f"zlib(level={self._level})+{self._inner.payload_schema()}"
-
-
+        if self._zdict_hash is None:
+            return f"zlib(level={self._level})+{self._inner.payload_schema()}"
+        return (
+            f"zlib(level={self._level},raw_deflate,zdict={self._zdict_hash})"
+            f"+{self._inner.payload_schema()}"
+        )
@@ -4,6 +4,7 @@ from loralink_mllc.config.runspec import (
     LoggingSpec,
     PhySpec,
     RunSpec,
+    RxSpec,
     TxSpec,
     WindowSpec,
     load_runspec,
@@ -16,6 +17,7 @@ __all__ = [
     "WindowSpec",
     "CodecSpec",
     "TxSpec",
+    "RxSpec",
     "LoggingSpec",
     "load_runspec",
     "save_runspec",
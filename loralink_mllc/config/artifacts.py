@@ -43,6 +43,7 @@ class ArtifactsManifest:
     norm_params_hash: str | None
     payload_schema_hash: str
     created_at: str
+    zdict_hash: str | None = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ArtifactsManifest":
@@ -53,10 +54,11 @@ class ArtifactsManifest:
             norm_params_hash=data.get("norm_params_hash"),
             payload_schema_hash=str(data["payload_schema_hash"]),
             created_at=str(data["created_at"]),
+            zdict_hash=data.get("zdict_hash"),
         )
 
     def as_dict(self) -> Dict[str, Any]:
-        return {
+        data: Dict[str, Any] = {
             "codec_id": self.codec_id,
             "codec_version": self.codec_version,
             "git_commit": self.git_commit,
@@ -64,6 +66,10 @@ class ArtifactsManifest:
             "payload_schema_hash": self.payload_schema_hash,
             "created_at": self.created_at,
         }
+        # Only emitted when set so existing manifests keep their fingerprint.
+        if self.zdict_hash is not None:
+            data["zdict_hash"] = self.zdict_hash
+        return data
 
     def fingerprint(self) -> str:
         payload = json.dumps(self.as_dict(), sort_keys=True).encode("utf-8")
@@ -77,6 +83,7 @@ class ArtifactsManifest:
         payload_schema_hash: str,
         norm_params_hash: str | None = None,
         git_commit: str | None = None,
+        zdict_hash: str | None = None,
     ) -> "ArtifactsManifest":
         if git_commit is None:
             git_commit = current_git_commit()
@@ -88,6 +95,7 @@ class ArtifactsManifest:
             norm_params_hash=norm_params_hash,
             payload_schema_hash=payload_schema_hash,
             created_at=created_at,
+            zdict_hash=zdict_hash,
         )
 
     @classmethod
@@ -109,6 +117,12 @@ def verify_manifest(runspec: RunSpec, manifest: ArtifactsManifest, codec: ICodec
     schema_hash = payload_schema_hash(codec.payload_schema())
     if manifest.payload_schema_hash != schema_hash:
         raise ValueError("manifest payload_schema_hash does not match codec schema")
+    if manifest.zdict_hash:
+        zdict_path = runspec.codec.params.get("zdict_path")
+        if not zdict_path:
+            raise ValueError("manifest includes zdict_hash but runspec has no zdict_path")
+        if hash_file(zdict_path) != manifest.zdict_hash:
+            raise ValueError("zdict_hash does not match zdict file")
     if not manifest.norm_params_hash:
         return
 
@@ -7,6 +7,9 @@ from typing import Any, Dict, Iterable, Literal
 
 Role = Literal["tx", "rx"]
 Mode = Literal["RAW", "LATENT"]
+AckMode = Literal["single", "bitmap"]
+DutyCyclePriority = Literal["retries", "fresh"]
+PendingPolicy = Literal["drop_oldest", "drop_newest", "keep_latest"]
 
 
 def _require_keys(data: Dict[str, Any], keys: Iterable[str], context: str) -> None:
@@ -125,18 +128,99 @@ class TxSpec:
     max_retries: int
     max_inflight: int = 1
     max_windows: int | None = None
+    # Multi-window frames: >1 packs up to this many pending windows into one frame.
+    aggregate_max_windows: int = 1
+    aggregate_delay_ms: int = 0
+    aggregate_max_bytes: int | None = None
+    # Selective repeat: "bitmap" ACKs carry a base SEQ plus a bitmap of recently received SEQs.
+    ack_mode: AckMode = "single"
+    ack_bitmap_bits: int = 16
+    ack_every: int = 1
+    ack_delay_ms: int = 0
+    # Fragmentation: >1 splits windows larger than one frame into up to this many fragments.
+    max_fragments: int = 1
+    # Packet-level FEC: one XOR parity frame after every `fec_group` data frames (extended to the
+    # end of a fragmented window); 0 disables.
+    fec_group: int = 0
+    # `ack_timeout_ms: adaptive`: learn the timeout from measured RTTs (ack_timeout_ms is None).
+    ack_timeout_adaptive: bool = False
+    # Duty-cycle limit: airtime within any `duty_cycle_window_ms` stays below this fraction.
+    # `duty_cycle_priority` decides whether retransmissions or fresh windows use it first.
+    duty_cycle: float | None = None
+    duty_cycle_window_ms: int = 3_600_000
+    duty_cycle_priority: DutyCyclePriority = "retries"
+    # Pending queue bound in windows (None: unbounded) and which window an overflow drops;
+    # `keep_latest` keeps only the newest window. Windows older than `pending_max_age_ms` are
+    # dropped instead of sent.
+    max_pending: int | None = None
+    pending_policy: PendingPolicy = "drop_oldest"
+    pending_max_age_ms: int | None = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TxSpec":
         _require_keys(data, ["guard_ms", "ack_timeout_ms", "max_retries"], "tx")
         ack_timeout_raw = data.get("ack_timeout_ms")
+        adaptive = isinstance(ack_timeout_raw, str) and (
+            ack_timeout_raw.strip().lower() == "adaptive"
+        )
         max_windows_raw = data.get("max_windows")
+        duty_cycle_raw = data.get("duty_cycle")
         return cls(
             guard_ms=int(data["guard_ms"]),
-            ack_timeout_ms=_optional_int(ack_timeout_raw),
+            ack_timeout_ms=None if adaptive else _optional_int(ack_timeout_raw),
             max_retries=int(data["max_retries"]),
             max_inflight=int(data.get("max_inflight", 1)),
             max_windows=(int(max_windows_raw) if max_windows_raw is not None else None),
+            aggregate_max_windows=int(data.get("aggregate_max_windows", 1)),
+            aggregate_delay_ms=int(data.get("aggregate_delay_ms", 0)),
+            aggregate_max_bytes=_optional_int(data.get("aggregate_max_bytes")),
+            ack_mode=data.get("ack_mode", "single"),
+            ack_bitmap_bits=int(data.get("ack_bitmap_bits", 16)),
+            ack_every=int(data.get("ack_every", 1)),
+            ack_delay_ms=int(data.get("ack_delay_ms", 0)),
+            max_fragments=int(data.get("max_fragments", 1)),
+            fec_group=int(data.get("fec_group", 0)),
+            ack_timeout_adaptive=adaptive,
+            duty_cycle=(float(duty_cycle_raw) if duty_cycle_raw is not None else None),
+            duty_cycle_window_ms=int(data.get("duty_cycle_window_ms", 3_600_000)),
+            duty_cycle_priority=data.get("duty_cycle_priority", "retries"),
+            max_pending=_optional_int(data.get("max_pending")),
+            pending_policy=data.get("pending_policy", "drop_oldest"),
+            pending_max_age_ms=_optional_int(data.get("pending_max_age_ms")),
+        )
+
+    def aggregates(self) -> bool:
+        return self.aggregate_max_windows > 1
+
+    def selective_repeat(self) -> bool:
+        return self.ack_mode == "bitmap"
+
+    def fragments(self) -> bool:
+        return self.max_fragments > 1
+
+    def fec(self) -> bool:
+        return self.fec_group > 0
+
+
+@dataclass(frozen=True)
+class RxSpec:
+    # Duplicate suppression: 0 disables the (seq, payload hash) cache.
+    dedup_entries: int = 0
+    dedup_window_ms: int = 60000
+    # Fragment reassembly: partial windows expire after the timeout; oldest dropped over the cap.
+    reassembly_timeout_ms: int = 30000
+    reassembly_max_bytes: int = 8192
+    # FEC: parity groups kept while waiting for a parity frame or the last missing data frame.
+    fec_max_groups: int = 16
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RxSpec":
+        return cls(
+            dedup_entries=int(data.get("dedup_entries", 0)),
+            dedup_window_ms=int(data.get("dedup_window_ms", 60000)),
+            reassembly_timeout_ms=int(data.get("reassembly_timeout_ms", 30000)),
+            reassembly_max_bytes=int(data.get("reassembly_max_bytes", 8192)),
+            fec_max_groups=int(data.get("fec_max_groups", 16)),
         )
 
 
@@ -162,6 +246,7 @@ class RunSpec:
     logging: LoggingSpec
     max_payload_bytes: int = 238
     artifacts_manifest: str | None = None
+    rx: RxSpec = RxSpec()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RunSpec":
@@ -181,6 +266,7 @@ class RunSpec:
             logging=LoggingSpec.from_dict(data["logging"]),
             max_payload_bytes=int(data.get("max_payload_bytes", 238)),
             artifacts_manifest=data.get("artifacts_manifest"),
+            rx=RxSpec.from_dict(data.get("rx") or {}),
         )
 
     def validate(self) -> None:
@@ -202,10 +288,52 @@ class RunSpec:
             raise ValueError("tx guard_ms must be >=0")
         if self.tx.ack_timeout_ms is not None and self.tx.ack_timeout_ms <= 0:
             raise ValueError("tx ack_timeout_ms must be > 0 (or null/auto)")
+        if self.tx.ack_timeout_adaptive and self.tx.ack_timeout_ms is not None:
+            raise ValueError("tx ack_timeout_ms must be null when adaptive")
         if self.tx.max_retries < 0 or self.tx.max_inflight <= 0:
             raise ValueError("tx retries/inflight must be >= 0")
         if self.max_payload_bytes <= 0 or self.max_payload_bytes > 255:
             raise ValueError("max_payload_bytes must be 1..255")
+        if not (1 <= self.tx.aggregate_max_windows <= 255):
+            raise ValueError("tx aggregate_max_windows must be 1..255")
+        if self.tx.aggregate_delay_ms < 0:
+            raise ValueError("tx aggregate_delay_ms must be >= 0")
+        if self.tx.aggregate_max_bytes is not None and not (
+            2 <= self.tx.aggregate_max_bytes <= self.max_payload_bytes
+        ):
+            raise ValueError("tx aggregate_max_bytes must be 2..max_payload_bytes (or null)")
+        if self.tx.ack_mode not in ("single", "bitmap"):
+            raise ValueError(f"invalid tx ack_mode: {self.tx.ack_mode}")
+        if self.tx.ack_bitmap_bits not in (8, 16, 24, 32, 40, 48, 56, 64):
+            raise ValueError("tx ack_bitmap_bits must be a multiple of 8 in 8..64")
+        if self.tx.ack_every <= 0 or self.tx.ack_delay_ms < 0:
+            raise ValueError("tx ack_every must be > 0 and ack_delay_ms >= 0")
+        if not (1 <= self.tx.max_fragments <= 16):
+            raise ValueError("tx max_fragments must be 1..16")
+        if self.tx.fragments() and self.tx.aggregates():
+            raise ValueError("tx fragmentation and aggregation cannot be combined")
+        if not (self.tx.fec_group == 0 or 2 <= self.tx.fec_group <= 16):
+            raise ValueError("tx fec_group must be 0 (off) or 2..16")
+        if self.max_payload_bytes <= int(self.tx.fragments()) + 2 * int(self.tx.fec()):
+            raise ValueError("max_payload_bytes must exceed the fragment/FEC header bytes")
+        if self.tx.duty_cycle is not None and not (0 < self.tx.duty_cycle <= 1):
+            raise ValueError("tx duty_cycle must be in (0, 1] (or null)")
+        if self.tx.duty_cycle_window_ms <= 0:
+            raise ValueError("tx duty_cycle_window_ms must be > 0")
+        if self.tx.duty_cycle_priority not in ("retries", "fresh"):
+            raise ValueError(f"invalid tx duty_cycle_priority: {self.tx.duty_cycle_priority}")
+        if self.tx.max_pending is not None and self.tx.max_pending <= 0:
+            raise ValueError("tx max_pending must be > 0 (or null)")
+        if self.tx.pending_policy not in ("drop_oldest", "drop_newest", "keep_latest"):
+            raise ValueError(f"invalid tx pending_policy: {self.tx.pending_policy}")
+        if self.tx.pending_max_age_ms is not None and self.tx.pending_max_age_ms <= 0:
+            raise ValueError("tx pending_max_age_ms must be > 0 (or null)")
+        if self.rx.dedup_entries < 0 or self.rx.dedup_window_ms <= 0:
+            raise ValueError("rx dedup_entries must be >= 0 and dedup_window_ms > 0")
+        if self.rx.reassembly_timeout_ms <= 0 or self.rx.reassembly_max_bytes <= 0:
+            raise ValueError("rx reassembly_timeout_ms and reassembly_max_bytes must be > 0")
+        if self.rx.fec_max_groups <= 0:
+            raise ValueError("rx fec_max_groups must be > 0")
 
     def phy_profile_id(self) -> str:
         return self.phy.profile_id()
@@ -241,10 +369,34 @@ class RunSpec:
             },
             "tx": {
                 "guard_ms": self.tx.guard_ms,
-                "ack_timeout_ms": self.tx.ack_timeout_ms,
+                "ack_timeout_ms": (
+                    "adaptive" if self.tx.ack_timeout_adaptive else self.tx.ack_timeout_ms
+                ),
                 "max_retries": self.tx.max_retries,
                 "max_inflight": self.tx.max_inflight,
                 "max_windows": self.tx.max_windows,
+                "aggregate_max_windows": self.tx.aggregate_max_windows,
+                "aggregate_delay_ms": self.tx.aggregate_delay_ms,
+                "aggregate_max_bytes": self.tx.aggregate_max_bytes,
+                "ack_mode": self.tx.ack_mode,
+                "ack_bitmap_bits": self.tx.ack_bitmap_bits,
+                "ack_every": self.tx.ack_every,
+                "ack_delay_ms": self.tx.ack_delay_ms,
+                "max_fragments": self.tx.max_fragments,
+                "fec_group": self.tx.fec_group,
+                "duty_cycle": self.tx.duty_cycle,
+                "duty_cycle_window_ms": self.tx.duty_cycle_window_ms,
+                "duty_cycle_priority": self.tx.duty_cycle_priority,
+                "max_pending": self.tx.max_pending,
+                "pending_policy": self.tx.pending_policy,
+                "pending_max_age_ms": self.tx.pending_max_age_ms,
+            },
+            "rx": {
+                "dedup_entries": self.rx.dedup_entries,
+                "dedup_window_ms": self.rx.dedup_window_ms,
+                "reassembly_timeout_ms": self.rx.reassembly_timeout_ms,
+                "reassembly_max_bytes": self.rx.reassembly_max_bytes,
+                "fec_max_groups": self.rx.fec_max_groups,
             },
             "logging": {"out_dir": self.logging.out_dir},
             "max_payload_bytes": self.max_payload_bytes,
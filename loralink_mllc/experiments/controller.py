@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from loralink_mllc.radio.channel import SharedChannel
+from loralink_mllc.radio.mock import MockLink
+from loralink_mllc.runtime.loop import DEFAULT_MAX_IDLE_MS
 from loralink_mllc.runtime.rx_node import RxNode
 from loralink_mllc.runtime.scheduler import Clock
 from loralink_mllc.runtime.tx_node import TxNode
@@ -11,12 +14,33 @@ def run_pair(
     clock: Clock,
     step_ms: int = 5,
     max_steps: int = 100000,
+    *,
+    link: MockLink | SharedChannel | None = None,
+    max_idle_ms: int = DEFAULT_MAX_IDLE_MS,
 ) -> None:
+    """
+    Step a TX/RX pair that shares `clock`.
+
+    Without `link` the clock advances `step_ms` per step. With the pair's `link` (`MockLink` or
+    `SharedChannel`) the run is event-driven: TX samples at `sample_hz` and the clock jumps
+    straight to the next node timer or frame delivery (at most `max_idle_ms`), so a FakeClock run
+    stays deterministic while skipping idle steps.
+    """
+    if link is not None:
+        tx_node.pace_samples()
     for _ in range(max_steps):
         tx_node.process_once()
         rx_node.process_once()
         if tx_node.is_done():
             break
-        clock.sleep_ms(step_ms)
-
-
+        if link is None:
+            clock.sleep_ms(step_ms)
+            continue
+        now_ms = clock.now_ms()
+        wakes = [
+            w
+            for w in (tx_node.next_wakeup_ms(), rx_node.next_wakeup_ms(), link.next_delivery_ms())
+            if w is not None
+        ]
+        wake_ms = min(wakes) if wakes else now_ms + max_idle_ms
+        clock.sleep_ms(min(max(0, wake_ms - now_ms), max_idle_ms))
@@ -52,6 +52,83 @@ def _summary_stats(values: List[float]) -> Dict[str, Any] | None:
     }
 
 
+def _window_ids(event: Dict[str, Any]) -> List[int]:
+    """Window ids carried by an event: `window_ids` for aggregated frames, else `window_id`."""
+    window_ids = event.get("window_ids")
+    if isinstance(window_ids, list):
+        return [wid for wid in (_to_int(v) for v in window_ids) if wid is not None]
+    window_id = _to_int(event.get("window_id"))
+    return [] if window_id is None else [window_id]
+
+
+def _delivered_window_ids(ack_recv: Sequence[Dict[str, Any]]) -> set[int]:
+    """Windows with every frame ACKed: a fragmented window needs all `frag_count` fragments."""
+    delivered: set[int] = set()
+    fragments_acked: Dict[int, set[int | None]] = {}
+    for event in ack_recv:
+        frag_count = _to_int(event.get("frag_count"))
+        window_id = _to_int(event.get("window_id"))
+        if frag_count is None or window_id is None:
+            delivered.update(_window_ids(event))
+            continue
+        acked = fragments_acked.setdefault(window_id, set())
+        acked.add(_to_int(event.get("frag_index")))
+        if len(acked) >= frag_count:
+            delivered.add(window_id)
+    return delivered
+
+
+def _unwrap_seq(seq: int, prev: int) -> int:
+    """Unwrapped value of 8-bit `seq` nearest to `prev` (SEQs logged in order move < 128)."""
+    step = (seq - prev) % 256
+    return prev + (step - 256 if step >= 128 else step)
+
+
+def _e2e_ms_by_recovery(events: Sequence[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """
+    Split `ack_received.e2e_ms` by how the frame reached RX: on its first attempt, rebuilt by FEC
+    parity, or only after a retransmission.
+
+    TX and RX logs are joined on unwrapped SEQs (each side unwraps the 8-bit SEQs in its own log
+    order), so the split needs no shared clock.
+    """
+    first_delivery: Dict[int, str] = {}
+    prev = 0
+    for event in events:
+        kind = event.get("event")
+        if kind not in ("rx_ok", "rx_dup", "rx_fec_parity", "rx_fec_recovered"):
+            continue
+        seq = _to_int(event.get("seq"))
+        if seq is None:
+            continue
+        prev = _unwrap_seq(seq, prev)
+        first_delivery.setdefault(prev, str(kind))
+
+    split: Dict[str, List[float]] = {"first_attempt": [], "fec_recovered": [], "retransmitted": []}
+    sent_as: Dict[int, int] = {}
+    prev = 0
+    for event in events:
+        kind = event.get("event")
+        if kind == "tx_sent" and _to_int(event.get("attempt")) == 1:
+            seq = _to_int(event.get("seq"))
+            if seq is not None:
+                prev = _unwrap_seq(seq, prev)
+                sent_as[seq] = prev
+            continue
+        if kind != "ack_received":
+            continue
+        e2e_ms = _to_float(event.get("e2e_ms"))
+        ack_seq = _to_int(event.get("ack_seq"))
+        if e2e_ms is None or ack_seq is None:
+            continue
+        attempts = _to_int(event.get("attempts"))
+        if first_delivery.get(sent_as.get(ack_seq, -1)) == "rx_fec_recovered":
+            split["fec_recovered"].append(e2e_ms)
+        elif attempts is not None:
+            split["retransmitted" if attempts > 1 else "first_attempt"].append(e2e_ms)
+    return split
+
+
 def load_events(path: str | Path) -> List[Dict[str, Any]]:
     path = Path(path)
     events = []
@@ -63,34 +140,46 @@ def load_events(path: str | Path) -> List[Dict[str, Any]]:
 
 
 def compute_metrics(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    events = list(events)
     tx_sent = [e for e in events if e.get("event") == "tx_sent"]
     rx_ok = [e for e in events if e.get("event") == "rx_ok"]
     ack_recv = [e for e in events if e.get("event") == "ack_received"]
     tx_failed = [e for e in events if e.get("event") == "tx_failed"]
+    tx_dropped = [e for e in events if e.get("event") == "tx_dropped"]
     rx_parse_fail = [e for e in events if e.get("event") == "rx_parse_fail"]
     ack_sent = [e for e in events if e.get("event") == "ack_sent"]
     recon_done = [e for e in events if e.get("event") == "recon_done"]
+    rx_dup = [e for e in events if e.get("event") == "rx_dup"]
+    rx_reassembled = [e for e in events if e.get("event") == "rx_reassembled"]
+    rx_reassembly_fail = [e for e in events if e.get("event") == "rx_reassembly_fail"]
+    rx_fec_parity = [e for e in events if e.get("event") == "rx_fec_parity"]
+    rx_fec_recovered = [e for e in events if e.get("event") == "rx_fec_recovered"]
+    uart_tx_drain = [e for e in events if e.get("event") == "uart_tx_drain"]
 
     sent_count = len(tx_sent)
     rx_ok_count = len(rx_ok)
+    # Aggregated frames log one rx_ok per window; count each frame once for the per-frame PDR.
+    rx_frame_count = sum(1 for e in rx_ok if (_to_int(e.get("sub_index")) or 0) == 0)
     acked_count = len(ack_recv)
     unique_windows_sent: int | None = None
     delivered_windows: int | None = None
     first_attempt_window_ids = {
-        e.get("window_id")
-        for e in tx_sent
-        if _to_int(e.get("attempt")) == 1 and _to_int(e.get("window_id")) is not None
+        wid for e in tx_sent if _to_int(e.get("attempt")) == 1 for wid in _window_ids(e)
     }
     if first_attempt_window_ids:
         unique_windows_sent = len(first_attempt_window_ids)
-    delivered_window_ids = {
-        e.get("window_id") for e in ack_recv if _to_int(e.get("window_id")) is not None
-    }
+    delivered_window_ids = _delivered_window_ids(ack_recv)
     if delivered_window_ids:
         delivered_windows = len(delivered_window_ids)
 
-    if sent_count and rx_ok_count:
-        pdr = rx_ok_count / sent_count
+    # FEC-rebuilt frames never arrived: counted apart from rx_ok and left out of the PDR.
+    fec_recovered_count = sum(
+        1 for e in rx_fec_recovered if (_to_int(e.get("sub_index")) or 0) == 0
+    )
+    # Duplicates and parity frames did arrive: they count for the link-level PDR only.
+    rx_frames_total = rx_frame_count + len(rx_dup) + len(rx_fec_parity)
+    if sent_count and rx_frames_total:
+        pdr = rx_frames_total / sent_count
     else:
         pdr = acked_count / sent_count if sent_count else 0.0
     etx = sent_count / max(acked_count, 1)
@@ -100,6 +189,13 @@ def compute_metrics(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
     frame_bytes_values: List[float] = []
     age_ms_values: List[float] = []
     codec_encode_ms_values: List[float] = []
+    codec_cycles_values: List[float] = []
+    windows_per_frame_values: List[float] = []
+    fragments_per_window_values: List[float] = []
+    ack_timeout_ms_values: List[float] = []
+    airtime_headroom_ms_values: List[float] = []
+    fec_parity_toa_ms = 0.0
+    fec_parity_sent = 0
     retries = 0
     for event in tx_sent:
         toa = _to_float(event.get("toa_ms_est"))
@@ -117,11 +213,32 @@ def compute_metrics(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         encode_ms = _to_float(event.get("codec_encode_ms"))
         if encode_ms is not None:
             codec_encode_ms_values.append(encode_ms)
+        codec_cycles = _to_float(event.get("codec_cycles"))
+        if codec_cycles is not None:
+            codec_cycles_values.append(codec_cycles)
+        airtime_headroom_ms = _to_float(event.get("airtime_headroom_ms"))
+        if airtime_headroom_ms is not None:
+            airtime_headroom_ms_values.append(airtime_headroom_ms)
+        if event.get("fec_parity") is True:
+            fec_parity_sent += 1
+            fec_parity_toa_ms += toa or 0.0
+            continue
+        window_count = _to_float(event.get("window_count"))
+        windows_per_frame_values.append(window_count if window_count is not None else 1.0)
         attempt = _to_int(event.get("attempt")) or 1
         if attempt > 1:
             retries += 1
+        ack_timeout_ms = _to_float(event.get("ack_timeout_ms"))
+        if ack_timeout_ms is not None:
+            ack_timeout_ms_values.append(ack_timeout_ms)
+        frag_count = _to_float(event.get("frag_count"))
+        if frag_count is not None and attempt == 1 and not _to_int(event.get("frag_index")):
+            fragments_per_window_values.append(frag_count)
 
     total_toa_ms = float(sum(toa_ms_values))
+    # ETX of data frames alone: FEC parity is airtime overhead, not a transmission attempt.
+    etx_data = (sent_count - fec_parity_sent) / max(acked_count, 1)
+    e2e_by_recovery = _e2e_ms_by_recovery(events)
 
     rtt_ms_values: List[float] = []
     for event in ack_recv:
@@ -145,6 +262,22 @@ def compute_metrics(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         if rssi is not None:
             rssi_dbm_values.append(rssi)
 
+    dropped_by_reason: Dict[str, int] = {}
+    dropped_age_ms_values: List[float] = []
+    for event in tx_dropped:
+        reason = str(event.get("reason"))
+        dropped_by_reason[reason] = dropped_by_reason.get(reason, 0) + 1
+        age_ms = _to_float(event.get("age_ms"))
+        if age_ms is not None:
+            dropped_age_ms_values.append(age_ms)
+
+    # Background UART writer: send() to bytes left the host, apart from the tx_sent timing.
+    uart_drain_ms_values: List[float] = []
+    for event in uart_tx_drain:
+        drain_ms = _to_float(event.get("drain_ms"))
+        if drain_ms is not None:
+            uart_drain_ms_values.append(drain_ms)
+
     recon_mae_values: List[float] = []
     recon_mse_values: List[float] = []
     for event in recon_done:
@@ -159,10 +292,30 @@ def compute_metrics(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         "sent_count": sent_count,
         "acked_count": acked_count,
         "failed_count": len(tx_failed),
+        # Bounded pending queue: windows dropped before their first send, by reason.
+        "dropped_count": len(tx_dropped),
+        "dropped_by_reason": dropped_by_reason,
         "rx_ok_count": rx_ok_count,
+        "rx_frame_count": rx_frame_count,
+        "rx_dup_count": len(rx_dup),
+        "rx_reassembled_count": len(rx_reassembled),
+        "rx_reassembly_fail_count": len(rx_reassembly_fail),
+        # Packet-level FEC: parity overhead and windows rebuilt at RX instead of retransmitted.
+        "fec_parity_sent": fec_parity_sent,
+        "fec_parity_received": len(rx_fec_parity),
+        "fec_parity_toa_ms": fec_parity_toa_ms,
+        "fec_recovered_count": fec_recovered_count,
+        "fec_parity_toa_ms_per_delivered_window": (
+            (fec_parity_toa_ms / delivered_windows) if delivered_windows else None
+        ),
         "rx_parse_fail_count": len(rx_parse_fail),
         "ack_sent_count": len(ack_sent),
         "ack_recv_event_count": len(ack_recv),
+        # Selective repeat: entries cleared only by a bitmap bit, and ACK frames per data frame.
+        "acked_via_bitmap": sum(1 for e in ack_recv if e.get("ack_bitmap") is True),
+        "ack_frames_per_rx_frame": (
+            (len(ack_sent) / rx_frames_total) if rx_frames_total else None
+        ),
         "unique_windows_sent": unique_windows_sent,
         "delivered_windows": delivered_windows,
         "delivery_ratio": (
@@ -170,18 +323,33 @@ def compute_metrics(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
             if (delivered_windows is not None and unique_windows_sent)
             else None
         ),
+        "toa_ms_per_delivered_window": (
+            (total_toa_ms / delivered_windows) if delivered_windows else None
+        ),
         "retries": retries,
         "pdr": pdr,
         "etx": etx,
+        "etx_data": etx_data,
         "total_toa_ms": total_toa_ms,
         "toa_ms_est": _summary_stats(toa_ms_values),
         "payload_bytes": _summary_stats(payload_bytes_values),
         "frame_bytes": _summary_stats(frame_bytes_values),
+        "windows_per_frame": _summary_stats(windows_per_frame_values),
+        "fragments_per_window": _summary_stats(fragments_per_window_values),
         "tx_age_ms": _summary_stats(age_ms_values),
+        "dropped_age_ms": _summary_stats(dropped_age_ms_values),
         "codec_encode_ms": _summary_stats(codec_encode_ms_values),
+        "codec_cycles": _summary_stats(codec_cycles_values),
         "ack_rtt_ms": _summary_stats(rtt_ms_values),
+        "ack_timeout_ms": _summary_stats(ack_timeout_ms_values),
+        "airtime_headroom_ms": _summary_stats(airtime_headroom_ms_values),
         "queue_ms": _summary_stats(queue_ms_values),
         "e2e_ms": _summary_stats(e2e_ms_values),
+        # Delivery latency by recovery path: FEC rebuild vs ACK timeout + retransmission.
+        "e2e_ms_first_attempt": _summary_stats(e2e_by_recovery["first_attempt"]),
+        "e2e_ms_fec_recovered": _summary_stats(e2e_by_recovery["fec_recovered"]),
+        "e2e_ms_retransmitted": _summary_stats(e2e_by_recovery["retransmitted"]),
+        "uart_drain_ms": _summary_stats(uart_drain_ms_values),
         "rssi_dbm": _summary_stats(rssi_dbm_values),
         "recon_mae": _summary_stats(recon_mae_values),
         "recon_mse": _summary_stats(recon_mse_values),
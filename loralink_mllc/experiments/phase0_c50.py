@@ -8,6 +8,8 @@ from loralink_mllc.codecs import create_codec, payload_schema_hash
 from loralink_mllc.config.artifacts import ArtifactsManifest, verify_manifest
 from loralink_mllc.config.runspec import RunSpec
 from loralink_mllc.experiments.controller import run_pair
+from loralink_mllc.radio.base import IRadio
+from loralink_mllc.radio.channel import SharedChannel, create_channel_pair
 from loralink_mllc.radio.mock import create_mock_link
 from loralink_mllc.runtime.logging import JsonlLogger
 from loralink_mllc.runtime.rx_node import RxNode
@@ -53,6 +55,9 @@ def find_c50(sweep_path: str | Path, out_path: str | Path | None = None) -> Dict
         drop_pattern = profile.get("drop_pattern")
         drop_pattern_ab = profile.get("drop_pattern_ab")
         drop_pattern_ba = profile.get("drop_pattern_ba")
+        loss_model = profile.get("loss_model")
+        loss_model_ab = profile.get("loss_model_ab")
+        loss_model_ba = profile.get("loss_model_ba")
         base_dict = base_runspec.as_dict()
         base_dict["phy"] = phy
         base_dict["tx"]["max_windows"] = packets_per_profile
@@ -69,17 +74,31 @@ def find_c50(sweep_path: str | Path, out_path: str | Path | None = None) -> Dict
         rx_spec.validate()
 
         clock = FakeClock()
-        link = create_mock_link(
-            loss_rate=loss_rate,
-            latency_ms=int(profile.get("latency_ms", 0)),
-            seed=int(profile.get("seed", 0)),
-            drop_pattern=drop_pattern,
-            clock=clock,
-            loss_rate_ab=loss_rate_ab,
-            loss_rate_ba=loss_rate_ba,
-            drop_pattern_ab=drop_pattern_ab,
-            drop_pattern_ba=drop_pattern_ba,
-        )
+        channel_spec = profile.get("channel")
+        channel: SharedChannel | None = None
+        if channel_spec is not None:
+            channel = create_channel_pair(
+                tx_spec.phy, channel_spec, clock=clock, seed=int(profile.get("seed", 0))
+            )
+            tx_radio: IRadio = channel.radio("a")
+            rx_radio: IRadio = channel.radio("b")
+        else:
+            link = create_mock_link(
+                loss_rate=loss_rate,
+                latency_ms=int(profile.get("latency_ms", 0)),
+                seed=int(profile.get("seed", 0)),
+                drop_pattern=drop_pattern,
+                clock=clock,
+                loss_rate_ab=loss_rate_ab,
+                loss_rate_ba=loss_rate_ba,
+                drop_pattern_ab=drop_pattern_ab,
+                drop_pattern_ba=drop_pattern_ba,
+                loss_model=loss_model,
+                loss_model_ab=loss_model_ab,
+                loss_model_ba=loss_model_ba,
+                phy=tx_spec.phy,
+            )
+            tx_radio, rx_radio = link.a, link.b
         tx_codec = create_codec(tx_spec.codec)
         rx_codec = create_codec(rx_spec.codec)
         schema_hash = payload_schema_hash(tx_codec.payload_schema())
@@ -111,10 +130,14 @@ def find_c50(sweep_path: str | Path, out_path: str | Path | None = None) -> Dict
         rx_logger.log_run_start(rx_spec, manifest)
 
         sampler = DummySampler(tx_spec.window.dims)
-        tx_node = TxNode(tx_spec, link.a, tx_codec, tx_logger, sampler, clock=clock)
-        rx_node = RxNode(rx_spec, link.b, rx_codec, rx_logger, clock=clock)
-
-        run_pair(tx_node, rx_node, clock, step_ms=step_ms, max_steps=packets_per_profile * 10)
+        tx_node = TxNode(tx_spec, tx_radio, tx_codec, tx_logger, sampler, clock=clock)
+        rx_node = RxNode(rx_spec, rx_radio, rx_codec, rx_logger, clock=clock)
+
+        if channel is not None:
+            # Airtime and contention only mean something with TX paced at sample_hz.
+            run_pair(tx_node, rx_node, clock, max_steps=packets_per_profile * 100, link=channel)
+        else:
+            run_pair(tx_node, rx_node, clock, step_ms=step_ms, max_steps=packets_per_profile * 10)
         metrics = tx_node.metrics()
         result = {
             "profile_id": profile_id,
@@ -126,23 +149,19 @@ def find_c50(sweep_path: str | Path, out_path: str | Path | None = None) -> Dict
             "loss_rate_ba": loss_rate_ba,
             "drop_pattern_ab": drop_pattern_ab,
             "drop_pattern_ba": drop_pattern_ba,
+            "loss_model": loss_model,
+            "loss_model_ab": loss_model_ab,
+            "loss_model_ba": loss_model_ba,
         }
+        if channel is not None:
+            result["channel"] = channel_spec
+            result["channel_stats"] = channel.stats()
         results.append(result)
         tx_logger.close()
         rx_logger.close()
 
         if target_low <= metrics["pdr"] <= target_high:
-            selected = {
-                "profile_id": profile_id,
-                "phy": phy,
-                "metrics": metrics,
-                "loss_rate": loss_rate,
-                "drop_pattern": drop_pattern,
-                "loss_rate_ab": loss_rate_ab,
-                "loss_rate_ba": loss_rate_ba,
-                "drop_pattern_ab": drop_pattern_ab,
-                "drop_pattern_ba": drop_pattern_ba,
-            }
+            selected = dict(result)
             output = {"selected": selected, "results": results}
             if out_path is not None:
                 Path(out_path).write_text(json.dumps(output, indent=2), encoding="utf-8")
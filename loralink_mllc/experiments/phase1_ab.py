@@ -6,8 +6,10 @@ from typing import Any, Dict
 
 from loralink_mllc.codecs import create_codec, payload_schema_hash
 from loralink_mllc.config.artifacts import ArtifactsManifest, verify_manifest
-from loralink_mllc.config.runspec import RunSpec
+from loralink_mllc.config.runspec import PhySpec, RunSpec
 from loralink_mllc.experiments.controller import run_pair
+from loralink_mllc.radio.base import IRadio
+from loralink_mllc.radio.channel import SharedChannel, create_channel_pair
 from loralink_mllc.radio.mock import create_mock_link
 from loralink_mllc.runtime.logging import JsonlLogger
 from loralink_mllc.runtime.rx_node import RxNode
@@ -43,6 +45,10 @@ def run_ab(
     drop_pattern = selected.get("drop_pattern")
     drop_pattern_ab = selected.get("drop_pattern_ab")
     drop_pattern_ba = selected.get("drop_pattern_ba")
+    loss_model = selected.get("loss_model")
+    loss_model_ab = selected.get("loss_model_ab")
+    loss_model_ba = selected.get("loss_model_ba")
+    channel_spec = selected.get("channel")
 
     raw_spec = RunSpec.from_dict(_load_json_or_yaml(raw_runspec_path))
     latent_spec = RunSpec.from_dict(_load_json_or_yaml(latent_runspec_path))
@@ -65,17 +71,29 @@ def run_ab(
 
     def _run_once(spec: RunSpec, label: str) -> Dict[str, Any]:
         clock = FakeClock()
-        link = create_mock_link(
-            loss_rate=loss_rate,
-            latency_ms=0,
-            seed=0,
-            drop_pattern=drop_pattern,
-            clock=clock,
-            loss_rate_ab=loss_rate_ab,
-            loss_rate_ba=loss_rate_ba,
-            drop_pattern_ab=drop_pattern_ab,
-            drop_pattern_ba=drop_pattern_ba,
-        )
+        channel: SharedChannel | None = None
+        if channel_spec is not None:
+            # Same seed for both runs: RAW and LATENT see the same interference.
+            channel = create_channel_pair(PhySpec.from_dict(phy), channel_spec, clock=clock)
+            tx_radio: IRadio = channel.radio("a")
+            rx_radio: IRadio = channel.radio("b")
+        else:
+            link = create_mock_link(
+                loss_rate=loss_rate,
+                latency_ms=0,
+                seed=0,
+                drop_pattern=drop_pattern,
+                clock=clock,
+                loss_rate_ab=loss_rate_ab,
+                loss_rate_ba=loss_rate_ba,
+                drop_pattern_ab=drop_pattern_ab,
+                drop_pattern_ba=drop_pattern_ba,
+                loss_model=loss_model,
+                loss_model_ab=loss_model_ab,
+                loss_model_ba=loss_model_ba,
+                phy=PhySpec.from_dict(phy),
+            )
+            tx_radio, rx_radio = link.a, link.b
         codec = create_codec(spec.codec)
         schema_hash = payload_schema_hash(codec.payload_schema())
         manifest = ArtifactsManifest.create(
@@ -110,11 +128,16 @@ def run_ab(
         rx_logger.log_run_start(rx_spec, manifest)
 
         sampler = DummySampler(spec.window.dims)
-        tx_node = TxNode(tx_spec, link.a, codec, tx_logger, sampler, clock=clock)
-        rx_node = RxNode(rx_spec, link.b, codec, rx_logger, clock=clock)
+        tx_node = TxNode(tx_spec, tx_radio, codec, tx_logger, sampler, clock=clock)
+        rx_node = RxNode(rx_spec, rx_radio, codec, rx_logger, clock=clock)
         max_steps = (spec.tx.max_windows or 1000) * 10
-        run_pair(tx_node, rx_node, clock, step_ms=1, max_steps=max_steps)
+        if channel is not None:
+            run_pair(tx_node, rx_node, clock, max_steps=max_steps * 10, link=channel)
+        else:
+            run_pair(tx_node, rx_node, clock, step_ms=1, max_steps=max_steps)
         metrics = tx_node.metrics()
+        if channel is not None:
+            metrics["channel_stats"] = channel.stats()
         tx_logger.close()
         rx_logger.close()
         return metrics
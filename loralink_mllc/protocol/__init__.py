@@ -1,4 +1,26 @@
-from loralink_mllc.protocol.framing import make_ack_packet
+from loralink_mllc.protocol.aggregate import AggregateError, pack_windows, unpack_windows
+from loralink_mllc.protocol.fec import (
+    FEC_HEADER_BYTES,
+    FecError,
+    fec_data_payload,
+    parse_fec_payload,
+    recover_missing,
+    xor_parity,
+)
+from loralink_mllc.protocol.fragment import (
+    FRAGMENT_HEADER_BYTES,
+    MAX_FRAGMENTS,
+    FragmentError,
+    parse_fragment,
+    split_fragments,
+)
+from loralink_mllc.protocol.framing import (
+    ACK_VERSION_BITMAP,
+    AckWindow,
+    make_ack_packet,
+    make_bitmap_ack_packet,
+    parse_ack_payload,
+)
 from loralink_mllc.protocol.packet import (
     Packet,
     PacketError,
@@ -7,11 +29,27 @@ from loralink_mllc.protocol.packet import (
 )
 
 __all__ = [
+    "ACK_VERSION_BITMAP",
+    "FEC_HEADER_BYTES",
+    "FRAGMENT_HEADER_BYTES",
+    "MAX_FRAGMENTS",
+    "AckWindow",
+    "AggregateError",
+    "FecError",
+    "FragmentError",
     "Packet",
     "PacketError",
     "PacketLengthMismatch",
     "PacketTooShort",
+    "fec_data_payload",
     "make_ack_packet",
+    "make_bitmap_ack_packet",
+    "pack_windows",
+    "recover_missing",
+    "parse_ack_payload",
+    "parse_fec_payload",
+    "parse_fragment",
+    "split_fragments",
+    "unpack_windows",
+    "xor_parity",
 ]
-
-
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+from loralink_mllc.protocol.packet import PacketError
+
+# Aggregated PAYLOAD: COUNT (1B) | LEN_1 .. LEN_COUNT (1B each) | PAYLOAD_1 .. PAYLOAD_COUNT
+
+
+class AggregateError(PacketError):
+    pass
+
+
+def aggregate_overhead_bytes(count: int) -> int:
+    return 1 + count
+
+
+def pack_windows(payloads: Sequence[bytes]) -> bytes:
+    if not (1 <= len(payloads) <= 255):
+        raise AggregateError("aggregate window count must be 1..255")
+    lengths = []
+    for payload in payloads:
+        if len(payload) > 255:
+            raise AggregateError(f"window payload length {len(payload)} exceeds 255")
+        lengths.append(len(payload))
+    return bytes([len(payloads), *lengths]) + b"".join(payloads)
+
+
+def unpack_windows(payload: bytes) -> List[bytes]:
+    if not payload:
+        raise AggregateError("aggregate payload is empty")
+    count = payload[0]
+    if count == 0:
+        raise AggregateError("aggregate window count must be > 0")
+    header = aggregate_overhead_bytes(count)
+    if len(payload) < header:
+        raise AggregateError("aggregate header truncated")
+    lengths = payload[1:header]
+    if header + sum(lengths) != len(payload):
+        raise AggregateError(
+            f"aggregate length {len(payload)} does not match sub-header total "
+            f"{header + sum(lengths)}"
+        )
+    out = []
+    offset = header
+    for length in lengths:
+        out.append(bytes(payload[offset : offset + length]))
+        offset += length
+    return out
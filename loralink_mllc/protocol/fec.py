@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+from loralink_mllc.protocol.packet import PacketError
+
+# FEC PAYLOAD: HDR (1B) | BODY
+#   data:   HDR = INDEX (0..k-1) of the frame inside its parity group
+#   parity: HDR = 0x80 | COUNT, BODY = XOR over the group of (LEN (1B) | BODY zero-padded)
+# Data frames of a group use consecutive SEQs and the parity frame takes the next one, so RX finds
+# the group by SEQ - INDEX (data) or SEQ - COUNT (parity).
+FEC_HEADER_BYTES = 1
+FEC_PARITY_FLAG = 0x80
+MAX_FEC_GROUP = 16
+
+
+class FecError(PacketError):
+    pass
+
+
+def fec_max_body_bytes(max_payload_bytes: int) -> int:
+    """Largest data BODY whose parity frame (HDR + XORed LEN + BODY) still fits one frame."""
+    return max_payload_bytes - FEC_HEADER_BYTES - 1
+
+
+def fec_data_payload(index: int, body: bytes) -> bytes:
+    if not (0 <= index < MAX_FEC_GROUP):
+        raise FecError(f"fec index must be 0..{MAX_FEC_GROUP - 1}")
+    return bytes([index]) + body
+
+
+def _xor_into(acc: bytearray, body: bytes) -> None:
+    acc[0] ^= len(body)
+    for i, value in enumerate(body, start=1):
+        acc[i] ^= value
+
+
+def xor_parity(bodies: Sequence[bytes]) -> bytes:
+    if not (1 <= len(bodies) <= MAX_FEC_GROUP):
+        raise FecError(f"fec group must hold 1..{MAX_FEC_GROUP} frames")
+    acc = bytearray(1 + max(len(body) for body in bodies))
+    for body in bodies:
+        if len(body) > 255:
+            raise FecError(f"fec body length {len(body)} exceeds 255")
+        _xor_into(acc, body)
+    return bytes([FEC_PARITY_FLAG | len(bodies)]) + bytes(acc)
+
+
+def parse_fec_payload(payload: bytes) -> Tuple[bool, int, bytes]:
+    """Return `(is_parity, index or count, body)` of one FEC payload."""
+    if len(payload) < FEC_HEADER_BYTES:
+        raise FecError("fec header missing")
+    header = payload[0]
+    body = bytes(payload[FEC_HEADER_BYTES:])
+    if header & FEC_PARITY_FLAG:
+        count = header & ~FEC_PARITY_FLAG
+        if not (1 <= count <= MAX_FEC_GROUP) or not body:
+            raise FecError(f"invalid fec parity header: count {count}, {len(body)} bytes")
+        return True, count, body
+    if header >= MAX_FEC_GROUP:
+        raise FecError(f"fec index {header} out of range")
+    return False, header, body
+
+
+def recover_missing(parity_body: bytes, bodies: Sequence[bytes]) -> bytes:
+    """Rebuild the one missing BODY of a group from its parity and the other bodies."""
+    acc = bytearray(parity_body)
+    for body in bodies:
+        if len(body) >= len(acc):
+            raise FecError("fec body longer than parity")
+        _xor_into(acc, body)
+    length = acc[0]
+    if length >= len(acc):
+        raise FecError(f"recovered length {length} exceeds parity body")
+    return bytes(acc[1 : 1 + length])
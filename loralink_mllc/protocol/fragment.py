@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from loralink_mllc.protocol.packet import PacketError
+
+# Fragmented PAYLOAD: FRAG (1B: index << 4 | (count - 1)) | BODY
+# Fragments of one window use consecutive SEQs, so RX groups them by SEQ - index.
+FRAGMENT_HEADER_BYTES = 1
+MAX_FRAGMENTS = 16
+
+
+class FragmentError(PacketError):
+    pass
+
+
+def split_fragments(payload: bytes, max_body_bytes: int) -> List[bytes]:
+    if max_body_bytes <= 0:
+        raise FragmentError("max_body_bytes must be > 0")
+    count = max(1, -(-len(payload) // max_body_bytes))
+    if count > MAX_FRAGMENTS:
+        raise FragmentError(
+            f"payload length {len(payload)} needs {count} fragments (max {MAX_FRAGMENTS})"
+        )
+    out = []
+    for index in range(count):
+        body = payload[index * max_body_bytes : (index + 1) * max_body_bytes]
+        out.append(bytes([(index << 4) | (count - 1)]) + body)
+    return out
+
+
+def parse_fragment(payload: bytes) -> Tuple[int, int, bytes]:
+    """Return `(index, count, body)` of one fragment payload."""
+    if len(payload) < FRAGMENT_HEADER_BYTES:
+        raise FragmentError("fragment header missing")
+    index = payload[0] >> 4
+    count = (payload[0] & 0x0F) + 1
+    if index >= count:
+        raise FragmentError(f"fragment index {index} out of range for count {count}")
+    return index, count, bytes(payload[FRAGMENT_HEADER_BYTES:])
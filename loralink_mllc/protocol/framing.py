@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from loralink_mllc.protocol.packet import Packet
+from typing import List, Set
+
+from loralink_mllc.protocol.packet import Packet, PacketError
+
+# Selective-repeat ACK payload: VER (1B) | BASE_SEQ (1B) | BITMAP (little-endian, N bytes).
+# Bit i of BITMAP set means SEQ (BASE_SEQ - 1 - i) mod 256 was also received.
+ACK_VERSION_BITMAP = 1
 
 
 def make_ack_packet(ack_seq: int, seq: int) -> Packet:
@@ -11,3 +17,64 @@ def make_ack_packet(ack_seq: int, seq: int) -> Packet:
     return Packet(payload=bytes([ack_seq]), seq=seq)
 
 
+def make_bitmap_ack_packet(base_seq: int, bitmap: int, seq: int, bitmap_bits: int) -> Packet:
+    if not (0 <= base_seq <= 255):
+        raise ValueError("base_seq must be 0..255")
+    if not (0 <= seq <= 255):
+        raise ValueError("seq must be 0..255")
+    if bitmap_bits <= 0 or bitmap_bits % 8 != 0:
+        raise ValueError("bitmap_bits must be a positive multiple of 8")
+    if not (0 <= bitmap < (1 << bitmap_bits)):
+        raise ValueError(f"bitmap must fit {bitmap_bits} bits")
+    body = bitmap.to_bytes(bitmap_bits // 8, byteorder="little")
+    return Packet(payload=bytes([ACK_VERSION_BITMAP, base_seq]) + body, seq=seq)
+
+
+def parse_ack_payload(payload: bytes) -> List[int]:
+    """
+    SEQs acknowledged by an ACK payload: the echoed `ACK_SEQ` of a 1-byte ACK, or `BASE_SEQ`
+    followed by every SEQ flagged in a bitmap ACK.
+    """
+    if len(payload) == 1:
+        return [payload[0]]
+    if not payload or payload[0] != ACK_VERSION_BITMAP:
+        version = payload[0] if payload else None
+        raise PacketError(f"unsupported ack version: {version}")
+    if len(payload) < 3:
+        raise PacketError("bitmap ack must be at least 3 bytes")
+    base_seq = payload[1]
+    bitmap = int.from_bytes(payload[2:], byteorder="little")
+    seqs = [base_seq]
+    for i in range((len(payload) - 2) * 8):
+        if bitmap >> i & 1:
+            seqs.append((base_seq - 1 - i) % 256)
+    return seqs
+
+
+class AckWindow:
+    """
+    RX-side record of recently received SEQs for bitmap ACKs.
+
+    SEQ wraps at 256, so entries more than `bitmap_bits` behind the newest SEQ are dropped
+    before TX can reuse them.
+    """
+
+    def __init__(self, bitmap_bits: int) -> None:
+        if bitmap_bits <= 0:
+            raise ValueError("bitmap_bits must be > 0")
+        self._bits = bitmap_bits
+        self._newest: int | None = None
+        self._seen: Set[int] = set()
+
+    def record(self, seq: int) -> None:
+        if self._newest is None or 0 < (seq - self._newest) % 256 < 128:
+            self._newest = seq
+            self._seen = {s for s in self._seen if (seq - s) % 256 <= self._bits}
+        self._seen.add(seq)
+
+    def bitmap(self, base_seq: int) -> int:
+        out = 0
+        for i in range(self._bits):
+            if (base_seq - 1 - i) % 256 in self._seen:
+                out |= 1 << i
+        return out
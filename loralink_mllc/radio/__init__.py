@@ -1,7 +1,37 @@
 from loralink_mllc.radio.base import IRadio
+from loralink_mllc.radio.channel import (
+    ChannelRadio,
+    LogDistancePathLoss,
+    SharedChannel,
+    create_channel_pair,
+)
+from loralink_mllc.radio.loss import (
+    BernoulliLoss,
+    GilbertElliottLoss,
+    PatternLoss,
+    SnrThresholdLoss,
+    TraceReplayLoss,
+    create_loss_model,
+)
 from loralink_mllc.radio.mock import MockLink, MockRadio, create_mock_link
 from loralink_mllc.radio.uart_e22 import UartE22Radio
 
-__all__ = ["IRadio", "MockLink", "MockRadio", "create_mock_link", "UartE22Radio"]
+__all__ = [
+    "BernoulliLoss",
+    "ChannelRadio",
+    "GilbertElliottLoss",
+    "IRadio",
+    "LogDistancePathLoss",
+    "MockLink",
+    "MockRadio",
+    "PatternLoss",
+    "SharedChannel",
+    "SnrThresholdLoss",
+    "TraceReplayLoss",
+    "UartE22Radio",
+    "create_channel_pair",
+    "create_loss_model",
+    "create_mock_link",
+]
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Protocol, runtime_checkable
+from typing import Dict, List, Protocol, runtime_checkable
 
 
 class IRadio(ABC):
@@ -23,3 +23,23 @@ class IRxRssi(Protocol):
     def last_rx_rssi_dbm(self) -> int | None:
         ...
 
+
+@runtime_checkable
+class IRxTimestamp(Protocol):
+    def last_rx_arrival_ms(self) -> int | None:
+        """Monotonic ms (`RealClock` base) at which the last `recv()` frame reached the host."""
+        ...
+
+
+@runtime_checkable
+class ITxDrain(Protocol):
+    def pop_tx_drains(self) -> List[Dict[str, int]]:
+        """Frames a background writer finished since the last call (`seq`, `drain_ms`, ...)."""
+        ...
+
+
+@runtime_checkable
+class IRxWaitable(Protocol):
+    def wait_readable(self, timeout_ms: int) -> bool:
+        """Block up to `timeout_ms` until a frame may be readable; True if one is."""
+        ...
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+from pathlib import Path
+from typing import Any, List, Mapping, Protocol, Sequence
+
+from loralink_mllc.config.runspec import PhySpec
+from loralink_mllc.radio.channel import SF_SNR_LIMIT_DB
+
+LOSS_MODELS = ("bernoulli", "pattern", "gilbert_elliott", "trace", "snr")
+
+# On-air receptions in an RX log; `rx_fec_recovered` frames were rebuilt, not received.
+_TRACE_EVENTS = {"rx_ok", "rx_dup", "rx_fec_parity"}
+
+
+class LossModel(Protocol):
+    """Per-frame loss decision for one direction of a `MockLink`."""
+
+    def should_drop(self) -> bool:
+        ...
+
+    def rssi_dbm(self) -> int | None:
+        """RSSI of the last frame `should_drop()` let through (None: the model has none)."""
+        ...
+
+
+class BernoulliLoss:
+    """Independent losses with probability `loss_rate`."""
+
+    def __init__(self, loss_rate: float, seed: int = 0) -> None:
+        if not 0.0 <= loss_rate <= 1.0:
+            raise ValueError("loss_rate must be in [0, 1]")
+        self._rng = random.Random(seed)
+        self._loss_rate = loss_rate
+
+    def should_drop(self) -> bool:
+        return self._rng.random() < self._loss_rate
+
+    def rssi_dbm(self) -> int | None:
+        return None
+
+
+class PatternLoss:
+    """Cycles through a fixed drop pattern (True = drop)."""
+
+    def __init__(self, pattern: Sequence[bool]) -> None:
+        if not pattern:
+            raise ValueError("drop pattern must not be empty")
+        self._pattern = [bool(drop) for drop in pattern]
+        self._counter = 0
+
+    def should_drop(self) -> bool:
+        drop = self._pattern[self._counter % len(self._pattern)]
+        self._counter += 1
+        return drop
+
+    def rssi_dbm(self) -> int | None:
+        return None
+
+
+class GilbertElliottLoss:
+    """
+    Two-state Markov (Gilbert-Elliott) burst loss. A frame is lost with `loss_good` in the good
+    state and `loss_bad` in the bad state; after each frame the channel moves good -> bad with
+    `p_gb` and bad -> good with `p_bg`, so a fade lasts `1 / p_bg` frames on average. The first
+    state is drawn from the stationary distribution.
+    """
+
+    def __init__(
+        self,
+        p_gb: float,
+        p_bg: float,
+        loss_good: float = 0.0,
+        loss_bad: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        for name, value in (
+            ("p_gb", p_gb),
+            ("p_bg", p_bg),
+            ("loss_good", loss_good),
+            ("loss_bad", loss_bad),
+        ):
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be in [0, 1]")
+        if p_gb + p_bg <= 0.0:
+            raise ValueError("p_gb + p_bg must be > 0")
+        self._rng = random.Random(seed)
+        self._p_gb = p_gb
+        self._p_bg = p_bg
+        self._loss_good = loss_good
+        self._loss_bad = loss_bad
+        self._bad = self._rng.random() < self.bad_fraction
+
+    @property
+    def bad_fraction(self) -> float:
+        """Long-run share of frames sent in the bad state."""
+        return self._p_gb / (self._p_gb + self._p_bg)
+
+    @property
+    def stationary_loss_rate(self) -> float:
+        bad = self.bad_fraction
+        return (1.0 - bad) * self._loss_good + bad * self._loss_bad
+
+    def should_drop(self) -> bool:
+        rng = self._rng
+        drop = rng.random() < (self._loss_bad if self._bad else self._loss_good)
+        if self._bad:
+            self._bad = rng.random() >= self._p_bg
+        else:
+            self._bad = rng.random() < self._p_gb
+        return drop
+
+    def rssi_dbm(self) -> int | None:
+        return None
+
+
+class TraceReplayLoss:
+    """
+    Replays a captured per-frame outcome sequence (lost flag and RSSI), wrapping at the end.
+
+    The trace is indexed once into flat tuples, so a decision is two lookups and a counter
+    increment. `from_rx_log` rebuilds the sequence from an RX JSONL log.
+    """
+
+    def __init__(
+        self, lost: Sequence[bool], rssi_dbm: Sequence[int | None], offset: int = 0
+    ) -> None:
+        if not lost:
+            raise ValueError("loss trace is empty")
+        if len(lost) != len(rssi_dbm):
+            raise ValueError("loss trace and RSSI trace lengths differ")
+        self._lost = tuple(bool(flag) for flag in lost)
+        self._rssi = tuple(rssi_dbm)
+        self._size = len(self._lost)
+        self._pos = offset % self._size
+        self._last_rssi: int | None = None
+
+    @classmethod
+    def from_rx_log(cls, path: str | Path, offset: int = 0) -> "TraceReplayLoss":
+        """
+        Frames lost on air show up as SEQ gaps between consecutive receptions (`rx_ok`, `rx_dup`,
+        `rx_fec_parity`); each gap becomes that many lost frames before the next received one,
+        which keeps its logged `rssi_dbm`. A loss repaired by a retransmission of the same SEQ
+        leaves no gap and is not in the trace, nor is a gap of 256 frames or more.
+        """
+        lost: List[bool] = []
+        rssi: List[int | None] = []
+        prev_seq: int | None = None
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            if event.get("event") not in _TRACE_EVENTS or event.get("seq") is None:
+                continue
+            if event.get("sub_index"):
+                continue  # later windows of an aggregate frame were not separate receptions
+            seq = int(event["seq"])
+            if prev_seq is not None:
+                gap = (seq - prev_seq - 1) % 256
+                if gap < 255:  # 255 means the same SEQ again: a retransmission arrived
+                    lost.extend([True] * gap)
+                    rssi.extend([None] * gap)
+            lost.append(False)
+            value = event.get("rssi_dbm")
+            rssi.append(None if value is None else int(value))
+            prev_seq = seq
+        if not lost:
+            raise ValueError(f"no received frames in trace: {path}")
+        return cls(lost, rssi, offset=offset)
+
+    @property
+    def loss_rate(self) -> float:
+        return sum(self._lost) / self._size
+
+    def should_drop(self) -> bool:
+        pos = self._pos
+        self._pos = pos + 1 if pos + 1 < self._size else 0
+        self._last_rssi = self._rssi[pos]
+        return self._lost[pos]
+
+    def rssi_dbm(self) -> int | None:
+        return self._last_rssi
+
+
+class SnrThresholdLoss:
+    """
+    Drops a frame when its SNR falls under the demodulation floor of `phy.sf`. Each frame's SNR
+    is `snr_db` plus zero-mean Gaussian fading (`fading_db` sigma); its RSSI is that SNR over
+    the thermal noise floor of `phy.bw_hz` and `noise_figure_db`.
+    """
+
+    def __init__(
+        self,
+        phy: PhySpec,
+        snr_db: float,
+        fading_db: float = 0.0,
+        noise_figure_db: float = 6.0,
+        seed: int = 0,
+    ) -> None:
+        if phy.sf not in SF_SNR_LIMIT_DB:
+            raise ValueError("sf must be 5..12 for LoRa mode")
+        if fading_db < 0:
+            raise ValueError("fading_db must be >= 0")
+        self._rng = random.Random(seed)
+        self._snr_db = snr_db
+        self._fading_db = fading_db
+        self._limit_db = SF_SNR_LIMIT_DB[phy.sf]
+        self._noise_floor_dbm = -174.0 + 10.0 * math.log10(phy.bw_hz) + noise_figure_db
+        self._last_rssi: int | None = None
+
+    @property
+    def loss_rate(self) -> float:
+        """Expected loss rate: P(snr_db + fading < SF floor)."""
+        margin = self._snr_db - self._limit_db
+        if self._fading_db == 0:
+            return 0.0 if margin >= 0 else 1.0
+        return 0.5 * math.erfc(margin / (self._fading_db * math.sqrt(2.0)))
+
+    def should_drop(self) -> bool:
+        snr = self._snr_db
+        if self._fading_db:
+            snr += self._rng.gauss(0.0, self._fading_db)
+        if snr < self._limit_db:
+            return True
+        self._last_rssi = round(self._noise_floor_dbm + snr)
+        return False
+
+    def rssi_dbm(self) -> int | None:
+        return self._last_rssi
+
+
+def create_loss_model(
+    spec: Mapping[str, Any], *, seed: int = 0, phy: PhySpec | None = None
+) -> LossModel:
+    """
+    Build a loss model from a sweep-profile / CLI mapping. `model` picks the type (default
+    `bernoulli`); the other keys are its parameters:
+
+    - `bernoulli`: `loss_rate`
+    - `pattern`: `pattern` (list of drop flags)
+    - `gilbert_elliott`: `p_gb`, `p_bg`, `loss_good` (0), `loss_bad` (1)
+    - `trace`: `path` (RX JSONL log), `offset` (0)
+    - `snr`: `snr_db`, `fading_db` (0), `noise_figure_db` (6); needs `phy`
+
+    `seed` applies unless the spec sets its own.
+    """
+    kind = spec.get("model", "bernoulli")
+    seed = int(spec.get("seed", seed))
+    if kind == "bernoulli":
+        return BernoulliLoss(float(spec.get("loss_rate", 0.0)), seed=seed)
+    if kind == "pattern":
+        return PatternLoss(spec["pattern"])
+    if kind == "gilbert_elliott":
+        return GilbertElliottLoss(
+            float(spec["p_gb"]),
+            float(spec["p_bg"]),
+            loss_good=float(spec.get("loss_good", 0.0)),
+            loss_bad=float(spec.get("loss_bad", 1.0)),
+            seed=seed,
+        )
+    if kind == "trace":
+        return TraceReplayLoss.from_rx_log(spec["path"], offset=int(spec.get("offset", 0)))
+    if kind == "snr":
+        if phy is None:
+            raise ValueError("snr loss model needs the PHY profile")
+        return SnrThresholdLoss(
+            phy,
+            float(spec["snr_db"]),
+            fading_db=float(spec.get("fading_db", 0.0)),
+            noise_figure_db=float(spec.get("noise_figure_db", 6.0)),
+            seed=seed,
+        )
+    raise ValueError(f"unknown loss model: {kind} (expected one of {', '.join(LOSS_MODELS)})")
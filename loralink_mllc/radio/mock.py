@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import heapq
-import random
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping
 
+from loralink_mllc.config.runspec import PhySpec
 from loralink_mllc.radio.base import IRadio
+from loralink_mllc.radio.loss import BernoulliLoss, LossModel, PatternLoss, create_loss_model
 from loralink_mllc.runtime.scheduler import Clock, RealClock
 
 
@@ -13,21 +14,13 @@ from loralink_mllc.runtime.scheduler import Clock, RealClock
 class _Delivery:
     deliver_at_ms: int
     frame: bytes
+    rssi_dbm: int | None = field(default=None, compare=False)
 
 
-class _LossModel:
-    def __init__(self, loss_rate: float, seed: int, drop_pattern: List[bool] | None) -> None:
-        self._rng = random.Random(seed)
-        self._loss_rate = loss_rate
-        self._drop_pattern = drop_pattern
-        self._counter = 0
-
-    def should_drop(self) -> bool:
-        if self._drop_pattern:
-            drop = self._drop_pattern[self._counter % len(self._drop_pattern)]
-            self._counter += 1
-            return drop
-        return self._rng.random() < self._loss_rate
+def _basic_loss(loss_rate: float, seed: int, drop_pattern: List[bool] | None) -> LossModel:
+    if drop_pattern:
+        return PatternLoss(drop_pattern)
+    return BernoulliLoss(loss_rate, seed=seed)
 
 
 class MockLink:
@@ -42,14 +35,17 @@ class MockLink:
         loss_rate_ba: float | None = None,
         drop_pattern_ab: List[bool] | None = None,
         drop_pattern_ba: List[bool] | None = None,
+        loss_model_ab: LossModel | None = None,
+        loss_model_ba: LossModel | None = None,
     ) -> None:
+        """`loss_model_ab`/`loss_model_ba` replace the loss-rate and drop-pattern settings."""
         self._clock = clock or RealClock()
-        self._loss_ab = _LossModel(
+        self._loss_ab = loss_model_ab or _basic_loss(
             loss_rate if loss_rate_ab is None else loss_rate_ab,
             seed,
             drop_pattern if drop_pattern_ab is None else drop_pattern_ab,
         )
-        self._loss_ba = _LossModel(
+        self._loss_ba = loss_model_ba or _basic_loss(
             loss_rate if loss_rate_ba is None else loss_rate_ba,
             seed + 1,
             drop_pattern if drop_pattern_ba is None else drop_pattern_ba,
@@ -65,17 +61,16 @@ class MockLink:
             return
         peer = "b" if sender == "a" else "a"
         deliver_at = self._clock.now_ms() + self._latency_ms
-        heapq.heappush(self._queues[peer], _Delivery(deliver_at, frame))
+        heapq.heappush(self._queues[peer], _Delivery(deliver_at, frame, loss.rssi_dbm()))
 
-    def _recv(self, receiver: str, timeout_ms: int) -> bytes | None:
+    def _recv(self, receiver: str, timeout_ms: int) -> _Delivery | None:
         deadline = self._clock.now_ms() + max(0, timeout_ms)
         while True:
             if (
                 self._queues[receiver]
                 and self._queues[receiver][0].deliver_at_ms <= self._clock.now_ms()
             ):
-                delivery = heapq.heappop(self._queues[receiver])
-                return delivery.frame
+                return heapq.heappop(self._queues[receiver])
             if timeout_ms <= 0:
                 return None
             now = self._clock.now_ms()
@@ -83,17 +78,44 @@ class MockLink:
                 return None
             self._clock.sleep_ms(min(1, deadline - now))
 
+    def _wait(self, receiver: str, timeout_ms: int) -> bool:
+        queue = self._queues[receiver]
+        now = self._clock.now_ms()
+        wake_ms = now + max(0, timeout_ms)
+        if queue:
+            wake_ms = min(wake_ms, queue[0].deliver_at_ms)
+        if wake_ms > now:
+            self._clock.sleep_ms(wake_ms - now)
+        return bool(queue) and queue[0].deliver_at_ms <= self._clock.now_ms()
+
+    def next_delivery_ms(self) -> int | None:
+        """Earliest delivery time of a frame still in flight on either side of the link."""
+        heads = [queue[0].deliver_at_ms for queue in self._queues.values() if queue]
+        return min(heads) if heads else None
+
 
 class MockRadio(IRadio):
     def __init__(self, link: MockLink, label: str) -> None:
         self._link = link
         self._label = label
+        self._last_rssi_dbm: int | None = None
 
     def send(self, frame: bytes) -> None:
         self._link._send(self._label, frame)
 
     def recv(self, timeout_ms: int) -> bytes | None:
-        return self._link._recv(self._label, timeout_ms)
+        delivery = self._link._recv(self._label, timeout_ms)
+        if delivery is None:
+            return None
+        self._last_rssi_dbm = delivery.rssi_dbm
+        return delivery.frame
+
+    def last_rx_rssi_dbm(self) -> int | None:
+        """RSSI the loss model reported for the last received frame (trace and SNR models)."""
+        return self._last_rssi_dbm
+
+    def wait_readable(self, timeout_ms: int) -> bool:
+        return self._link._wait(self._label, timeout_ms)
 
     def close(self) -> None:
         return None
@@ -109,7 +131,17 @@ def create_mock_link(
     loss_rate_ba: float | None = None,
     drop_pattern_ab: List[bool] | None = None,
     drop_pattern_ba: List[bool] | None = None,
+    loss_model: Mapping[str, Any] | None = None,
+    loss_model_ab: Mapping[str, Any] | None = None,
+    loss_model_ba: Mapping[str, Any] | None = None,
+    phy: PhySpec | None = None,
 ) -> MockLink:
+    """
+    `loss_model` (both directions) and `loss_model_ab`/`loss_model_ba` are `create_loss_model`
+    specs; a direction with neither keeps `loss_rate`/`drop_pattern`. `phy` feeds the `snr` model.
+    """
+    spec_ab = loss_model if loss_model_ab is None else loss_model_ab
+    spec_ba = loss_model if loss_model_ba is None else loss_model_ba
     return MockLink(
         loss_rate=loss_rate,
         latency_ms=latency_ms,
@@ -120,6 +152,10 @@ def create_mock_link(
         loss_rate_ba=loss_rate_ba,
         drop_pattern_ab=drop_pattern_ab,
         drop_pattern_ba=drop_pattern_ba,
+        loss_model_ab=None if spec_ab is None else create_loss_model(spec_ab, seed=seed, phy=phy),
+        loss_model_ba=(
+            None if spec_ba is None else create_loss_model(spec_ba, seed=seed + 1, phy=phy)
+        ),
     )
 
 
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import select
+import threading
 import time
+from collections import deque
+from typing import Deque, Dict, List, Tuple
 
 from loralink_mllc.radio.base import IRadio
-from loralink_mllc.radio.uart_framing import UartFrameParser
+from loralink_mllc.radio.uart_framing import (
+    UART_FRAMING_VERSIONS,
+    UartFrameParser,
+    encode_uart_frame,
+)
+from loralink_mllc.radio.uart_ring import ChunkRing
+
+# How often the reader/writer threads re-check for `close()` while the port is idle.
+READER_IDLE_S = 0.05
+
+
+def _monotonic_ms() -> int:
+    """Same time base as `RealClock.now_ms()`."""
+    return int(time.monotonic() * 1000)
 
 
 class UartE22Radio(IRadio):
@@ -15,6 +32,22 @@ class UartE22Radio(IRadio):
     enable `rssi_byte_enabled` to keep framing aligned (the RSSI byte is consumed).
 
     This does not configure module parameters. It only reads and writes raw bytes.
+
+    `framing_version=2` wraps every frame as MAGIC | frame | CRC16 on the wire (both ends must
+    agree) so line noise is rejected by the parser; see `UartFrameParser`.
+
+    `wait_readable` lets event-driven loops block on the serial file descriptor (`select`)
+    instead of polling; ports without a selectable descriptor fall back to 1 ms polling.
+
+    With `reader_thread=True` a daemon thread blocks on the port instead, stamps every chunk with
+    its monotonic arrival time and queues it in a `ChunkRing`; `recv`/`wait_readable` then sleep
+    on the ring rather than polling the driver. Either way `last_rx_arrival_ms()` reports when the
+    bytes completing the last returned frame were read, so ACK RTTs exclude loop polling delay.
+
+    `send` writes and flushes (waits for the OS to drain the frame) in the caller by default. With
+    `writer_thread=True` it only queues the frame; a daemon thread writes everything queued in one
+    batch, flushes once, and records per frame how long it waited (`queue_ms`) and when it left
+    the host (`drain_ms`, both from `send`), returned by `pop_tx_drains()`.
     """
 
     def __init__(
@@ -24,6 +57,10 @@ class UartE22Radio(IRadio):
         timeout_ms: int = 1000,
         max_payload_bytes: int = 238,
         rssi_byte_enabled: bool = False,
+        reader_thread: bool = False,
+        ring_capacity_bytes: int = 65536,
+        framing_version: int = 1,
+        writer_thread: bool = False,
     ) -> None:
         try:
             import serial  # type: ignore
@@ -34,6 +71,8 @@ class UartE22Radio(IRadio):
 
         if max_payload_bytes <= 0 or max_payload_bytes > 255:
             raise ValueError("max_payload_bytes must be 1..255")
+        if framing_version not in UART_FRAMING_VERSIONS:
+            raise ValueError(f"framing_version must be one of {UART_FRAMING_VERSIONS}")
 
         self._serial = serial.Serial(
             port=port,
@@ -45,18 +84,138 @@ class UartE22Radio(IRadio):
         self._parser = UartFrameParser(
             max_payload_bytes=self._max_payload_bytes,
             rssi_byte_enabled=rssi_byte_enabled,
+            framing_version=framing_version,
         )
+        self._framing_version = framing_version
         self._last_rx_rssi_dbm: int | None = None
+        self._last_rx_arrival_ms: int | None = None
+        # (arrival_ms, frame, rssi_dbm) of parsed frames; arrival is when their last chunk came.
+        self._ready: Deque[Tuple[int, bytes, int | None]] = deque()
+        self._ring: ChunkRing | None = None
+        self._reader: threading.Thread | None = None
+        self._reader_error: BaseException | None = None
+        self._closing = False
+        self._tx_ring: ChunkRing | None = None
+        self._writer: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+        self._tx_drains: Deque[Dict[str, int]] = deque()
+        if writer_thread:
+            self._tx_ring = ChunkRing(ring_capacity_bytes)
+            self._writer = threading.Thread(
+                target=self._writer_loop, args=(self._tx_ring,), name="uart-e22-writer", daemon=True
+            )
+            self._writer.start()
+        if reader_thread:
+            self._ring = ChunkRing(ring_capacity_bytes)
+            self._reader = threading.Thread(
+                target=self._reader_loop, args=(self._ring,), name="uart-e22-reader", daemon=True
+            )
+            self._reader.start()
 
-    def _read_available(self) -> bytes:
+    def _in_waiting(self) -> int:
         try:
-            waiting = int(self._serial.in_waiting)
+            return int(self._serial.in_waiting)
         except Exception:
-            waiting = 0
+            return 0
+
+    def _read_available(self) -> bytes:
+        waiting = self._in_waiting()
         if waiting <= 0:
             return b""
         return self._serial.read(waiting)
 
+    def _reader_loop(self, ring: ChunkRing) -> None:
+        fd = self.fileno()
+        try:
+            while not self._closing:
+                if fd is not None:
+                    readable, _, _ = select.select([fd], [], [], READER_IDLE_S)
+                    if not readable:
+                        continue
+                chunk = self._read_available()
+                if chunk:
+                    ring.push(_monotonic_ms(), chunk)
+                elif fd is None:
+                    time.sleep(0.001)
+        except Exception as exc:
+            self._reader_error = exc
+        finally:
+            ring.close()
+
+    def _writer_loop(self, ring: ChunkRing) -> None:
+        seq_at = 2 if self._framing_version == 2 else 1
+        try:
+            while True:
+                batch = ring.drain()
+                if not batch:
+                    if self._closing:
+                        return
+                    ring.wait(READER_IDLE_S)
+                    continue
+                started_ms = _monotonic_ms()
+                self._write_all(b"".join(chunk for _, chunk in batch))
+                self._serial.flush()
+                drained_ms = _monotonic_ms()
+                for queued_ms, chunk in batch:
+                    self._tx_drains.append(
+                        {
+                            "seq": chunk[seq_at],
+                            "frame_bytes": len(chunk),
+                            "batch_frames": len(batch),
+                            "queue_ms": started_ms - queued_ms,
+                            "drain_ms": drained_ms - queued_ms,
+                        }
+                    )
+        except Exception as exc:
+            self._writer_error = exc
+
+    def _fill(self) -> bool:
+        """Move received bytes into the parser and queue complete frames; True if any arrived."""
+        if self._ring is not None:
+            chunks = self._ring.drain()
+        else:
+            chunk = self._read_available()
+            chunks = [(_monotonic_ms(), chunk)] if chunk else []
+        for arrival_ms, chunk in chunks:
+            self._parser.feed(chunk)
+            while (parsed := self._parser.pop()) is not None:
+                # The parser's view is only valid until the next feed.
+                self._ready.append((arrival_ms, bytes(parsed.frame), parsed.rssi_dbm))
+        return bool(chunks)
+
+    def _check_reader(self) -> None:
+        if self._reader_error is not None:
+            raise RuntimeError("UART reader thread failed") from self._reader_error
+
+    def uart_stats(self) -> Dict[str, int]:
+        """Parser and reader/writer queue counters (queue fields are 0 without the threads)."""
+        ring = self._ring
+        tx_ring = self._tx_ring
+        return {
+            "parse_errors": self._parser.parse_errors,
+            "resync_bytes": self._parser.resync_bytes,
+            "ring_overflow_bytes": ring.overflow_bytes if ring is not None else 0,
+            "tx_queued_bytes": tx_ring.buffered_bytes() if tx_ring is not None else 0,
+        }
+
+    def pop_tx_drains(self) -> List[Dict[str, int]]:
+        """Drain records of frames the writer thread finished since the last call."""
+        drains = []
+        while self._tx_drains:
+            drains.append(self._tx_drains.popleft())
+        return drains
+
+    def ring(self) -> ChunkRing | None:
+        """The reader thread's chunk ring (None without `reader_thread`)."""
+        return self._ring
+
+    def fileno(self) -> int | None:
+        """Selectable descriptor of the serial port, or None if the backend has none."""
+        try:
+            return int(self._serial.fileno())
+        except Exception:
+            return None
+
     def _write_all(self, frame: bytes) -> None:
         remaining = memoryview(frame)
         while remaining:
@@ -64,30 +223,72 @@ class UartE22Radio(IRadio):
             if written <= 0:
                 raise RuntimeError("UART write returned no bytes")
             remaining = remaining[written:]
-        self._serial.flush()
 
     def send(self, frame: bytes) -> None:
-        self._write_all(frame)
+        wire = encode_uart_frame(frame, self._framing_version)
+        if self._tx_ring is None:
+            self._write_all(wire)
+            self._serial.flush()
+            return
+        if self._writer_error is not None:
+            raise RuntimeError("UART writer thread failed") from self._writer_error
+        if not self._tx_ring.push(_monotonic_ms(), wire):
+            raise RuntimeError("UART write queue full")
 
     def recv(self, timeout_ms: int) -> bytes | None:
         deadline = time.monotonic() + max(0, timeout_ms) / 1000.0
         while True:
-            parsed = self._parser.pop()
-            if parsed is not None:
-                self._last_rx_rssi_dbm = parsed.rssi_dbm
-                return parsed.frame
-            chunk = self._read_available()
-            if chunk:
-                self._parser.feed(chunk)
+            if self._ready:
+                arrival_ms, frame, rssi_dbm = self._ready.popleft()
+                self._last_rx_rssi_dbm = rssi_dbm
+                self._last_rx_arrival_ms = arrival_ms
+                return frame
+            if self._fill():
                 continue
-            if timeout_ms <= 0 or time.monotonic() >= deadline:
+            self._check_reader()
+            if timeout_ms <= 0:
+                return None
+            remaining_s = deadline - time.monotonic()
+            if remaining_s <= 0:
                 return None
+            if self._ring is not None:
+                self._ring.wait(remaining_s)
+            else:
+                time.sleep(0.001)
+
+    def wait_readable(self, timeout_ms: int) -> bool:
+        if self._ring is not None:
+            self._fill()
+            if self._ready:
+                return True
+            self._check_reader()
+            return self._ring.wait(max(0, timeout_ms) / 1000.0)
+        if self._ready or self._in_waiting() > 0:
+            return True
+        fd = self.fileno()
+        if fd is not None:
+            readable, _, _ = select.select([fd], [], [], max(0, timeout_ms) / 1000.0)
+            return bool(readable)
+        deadline = time.monotonic() + max(0, timeout_ms) / 1000.0
+        while time.monotonic() < deadline:
             time.sleep(0.001)
+            if self._in_waiting() > 0:
+                return True
+        return False
 
     def last_rx_rssi_dbm(self) -> int | None:
         return self._last_rx_rssi_dbm
 
+    def last_rx_arrival_ms(self) -> int | None:
+        return self._last_rx_arrival_ms
+
     def close(self) -> None:
+        self._closing = True
+        if self._writer is not None and self._tx_ring is not None:
+            self._tx_ring.close()  # the writer sends what is queued, then exits
+            self._writer.join(timeout=1.0)
+        if self._reader is not None:
+            self._reader.join(timeout=1.0)
         try:
             self._serial.close()
         except Exception:
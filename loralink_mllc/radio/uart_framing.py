@@ -1,11 +1,34 @@
 from __future__ import annotations
 
+import binascii
+import re
 from dataclasses import dataclass
 
+# Framing version 2 wraps each frame as MAGIC | LEN | SEQ | PAYLOAD | CRC16 so that garbage on
+# the UART line (module boot text, noise) is rejected instead of parsed as a frame.
+UART_FRAMING_VERSIONS = (1, 2)
+UART_V2_MAGIC = 0xA5
+UART_V2_OVERHEAD_BYTES = 3
+
+
+def _crc16(data: bytes | memoryview) -> int:
+    """CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF)."""
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def encode_uart_frame(frame: bytes, framing_version: int = 1) -> bytes:
+    """Wire bytes for one `LEN | SEQ | PAYLOAD` frame in the given framing version."""
+    if framing_version == 1:
+        return frame
+    if framing_version != 2:
+        raise ValueError(f"framing_version must be one of {UART_FRAMING_VERSIONS}")
+    return bytes([UART_V2_MAGIC]) + frame + _crc16(frame).to_bytes(2, "big")
+
 
 @dataclass(frozen=True)
 class ParsedUartFrame:
-    frame: bytes
+    # A view into the parser's buffer, valid until the next `feed()`; copy with bytes() to keep.
+    frame: bytes | memoryview
     rssi_dbm: int | None = None
 
 
@@ -13,43 +36,133 @@ class UartFrameParser:
     """
     Extracts application frames from a byte stream.
 
-    Wire format:
+    Wire format (framing version 1):
       LEN(1B) | SEQ(1B) | PAYLOAD(LEN bytes) | [RSSI(1B, optional)]
+    Framing version 2:
+      MAGIC(0xA5) | LEN(1B) | SEQ(1B) | PAYLOAD(LEN bytes) | CRC16(2B) | [RSSI(1B, optional)]
+    (CRC-16/CCITT-FALSE over LEN..PAYLOAD). Both return `LEN | SEQ | PAYLOAD`.
 
     If `rssi_byte_enabled` is True, the parser consumes 1 trailing byte after each
     frame and converts it to dBm using the Ebyte convention: rssi_dbm = rssi_byte - 256.
+
+    Bytes live in one reusable buffer between a read and a write offset: `pop()` only advances
+    the read offset and returns a `memoryview` of the frame, and unread bytes are moved to the
+    front only when `feed()` runs out of room. On a bad candidate the parser jumps to the next
+    plausible start (a valid LEN byte, or the MAGIC byte in version 2) with one C-level scan
+    instead of dropping a byte at a time. `parse_errors` counts rejected candidates and
+    `resync_bytes` the bytes skipped to find the next one.
     """
 
-    def __init__(self, *, max_payload_bytes: int, rssi_byte_enabled: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        max_payload_bytes: int,
+        rssi_byte_enabled: bool = False,
+        framing_version: int = 1,
+        initial_capacity: int = 1024,
+    ) -> None:
         if max_payload_bytes <= 0 or max_payload_bytes > 255:
             raise ValueError("max_payload_bytes must be 1..255")
+        if framing_version not in UART_FRAMING_VERSIONS:
+            raise ValueError(f"framing_version must be one of {UART_FRAMING_VERSIONS}")
         self._max_payload_bytes = int(max_payload_bytes)
-        self._rssi_byte_enabled = bool(rssi_byte_enabled)
-        self._buf = bytearray()
+        self._rssi_len = 1 if rssi_byte_enabled else 0
+        self._v2 = framing_version == 2
+        # Offset of LEN in a wire frame, and bytes after PAYLOAD (CRC16 and/or RSSI).
+        self._len_at = 1 if self._v2 else 0
+        self._trailer = (2 if self._v2 else 0) + self._rssi_len
+        self._buf = bytearray(max(int(initial_capacity), 16))
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+        # Total wire length of the validated frame at `_start` (set by `_scan`, reset on pop).
+        self._ready_len: int | None = None
+        if self._v2:
+            self._candidate = re.compile(re.escape(bytes([UART_V2_MAGIC])))
+        else:
+            max_len = re.escape(bytes([self._max_payload_bytes]))
+            self._candidate = re.compile(b"[\\x00-" + max_len + b"]")
+        self.parse_errors = 0
+        self.resync_bytes = 0
 
-    def feed(self, data: bytes) -> None:
-        if data:
-            self._buf.extend(data)
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        n = len(data)
+        if not n:
+            return
+        if self._end + n > len(self._buf):
+            live = self._end - self._start
+            if live + n <= len(self._buf):
+                self._buf[:live] = self._buf[self._start : self._end]
+            else:
+                grown = bytearray(max(2 * len(self._buf), live + n))
+                grown[:live] = self._view[self._start : self._end]
+                self._buf = grown
+                self._view = memoryview(grown)
+            self._start, self._end = 0, live
+        self._view[self._end : self._end + n] = data
+        self._end += n
 
-    def pop(self) -> ParsedUartFrame | None:
+    def _resync(self, from_pos: int) -> None:
+        """Drop the rejected candidate at `_start` and jump to the next plausible frame start."""
+        self.parse_errors += 1
+        match = self._candidate.search(self._buf, from_pos, self._end)
+        new_start = match.start() if match is not None else self._end
+        self.resync_bytes += new_start - self._start
+        self._start = new_start
+
+    def _scan(self) -> int | None:
+        """Skip garbage and return the wire length of the complete frame at `_start`, if any."""
+        if self._ready_len is not None:
+            return self._ready_len
+        buf = self._buf
+        len_at = self._len_at
         while True:
-            if len(self._buf) < 2:
+            start = self._start
+            avail = self._end - start
+            if avail < len_at + 2:
+                if self._v2 and avail and buf[start] != UART_V2_MAGIC:
+                    self._resync(start + 1)
+                    continue
                 return None
-            length = self._buf[0]
-            if length > self._max_payload_bytes:
-                del self._buf[0]
+            length = buf[start + len_at]
+            if length > self._max_payload_bytes or (self._v2 and buf[start] != UART_V2_MAGIC):
+                self._resync(start + 1)
                 continue
-            total_len = 2 + length + (1 if self._rssi_byte_enabled else 0)
-            if len(self._buf) < total_len:
+            body_end = start + len_at + 2 + length
+            total = body_end - start + self._trailer
+            if avail < total:
+                return None
+            if self._v2:
+                crc = int.from_bytes(buf[body_end : body_end + 2], "big")
+                if crc != _crc16(self._view[start + 1 : body_end]):
+                    self._resync(start + 1)
+                    continue
+            self._ready_len = total
+            return total
+
+    def pop(self) -> ParsedUartFrame | None:
+        total = self._ready_len
+        if total is None:
+            total = self._scan()
+            if total is None:
                 return None
-            frame_end = 2 + length
-            frame = bytes(self._buf[:frame_end])
-            rssi_dbm = None
-            if self._rssi_byte_enabled:
-                rssi_byte = self._buf[frame_end]
-                rssi_dbm = int(rssi_byte) - 256
-            del self._buf[:total_len]
-            return ParsedUartFrame(frame=frame, rssi_dbm=rssi_dbm)
+        start = self._start
+        first = start + self._len_at
+        rssi_dbm = None
+        if self._rssi_len:
+            rssi_dbm = self._buf[start + total - 1] - 256
+        frame = self._view[first : first + 2 + self._buf[first]]
+        start += total
+        if start == self._end:
+            self._start = self._end = 0
+        else:
+            self._start = start
+        self._ready_len = None
+        return ParsedUartFrame(frame, rssi_dbm)
+
+    def has_frame(self) -> bool:
+        """True when `pop()` would return a frame; skips invalid input the same way."""
+        return self._scan() is not None
 
     def buffered_bytes(self) -> int:
-        return len(self._buf)
+        return self._end - self._start
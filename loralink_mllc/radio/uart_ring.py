@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Deque, List, Tuple
+
+
+class ChunkRing:
+    """
+    Bounded single-producer/single-consumer queue of timestamped UART chunks: `(arrival_ms, read)`
+    from the reader thread, or `(queued_ms, frame)` waiting for the writer thread.
+
+    The data path takes no lock: `deque.append`/`popleft` are atomic, and the byte counters are
+    each written by one side only (`pushed_bytes` by the reader thread, `popped_bytes` by the
+    consumer), so occupancy is their difference. The condition is only taken to sleep and to wake
+    a sleeping consumer. A chunk that does not fit is dropped and counted in `overflow_bytes`;
+    `UartFrameParser` resynchronizes after a dropped read, and a refused frame fails `send()`.
+    """
+
+    def __init__(self, capacity_bytes: int = 65536) -> None:
+        if capacity_bytes <= 0:
+            raise ValueError("capacity_bytes must be > 0")
+        self._capacity_bytes = int(capacity_bytes)
+        self._chunks: Deque[Tuple[int, bytes]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self.pushed_bytes = 0
+        self.popped_bytes = 0
+        self.overflow_bytes = 0
+
+    def buffered_bytes(self) -> int:
+        return self.pushed_bytes - self.popped_bytes
+
+    def push(self, arrival_ms: int, chunk: bytes) -> bool:
+        """Producer side; False if the chunk was dropped because the ring is full."""
+        if self.buffered_bytes() + len(chunk) > self._capacity_bytes:
+            self.overflow_bytes += len(chunk)
+            return False
+        self._chunks.append((arrival_ms, chunk))
+        self.pushed_bytes += len(chunk)
+        with self._cond:
+            self._cond.notify_all()
+        return True
+
+    def drain(self) -> List[Tuple[int, bytes]]:
+        """Consumer side: every queued chunk, oldest first."""
+        drained = []
+        while self._chunks:
+            arrival_ms, chunk = self._chunks.popleft()
+            self.popped_bytes += len(chunk)
+            drained.append((arrival_ms, chunk))
+        return drained
+
+    def wait(self, timeout_s: float) -> bool:
+        """Sleep until a chunk is queued, the ring is closed or `timeout_s` passes."""
+        with self._cond:
+            if not self._chunks and not self._closed:
+                self._cond.wait(max(0.0, timeout_s))
+            return bool(self._chunks)
+
+    def close(self) -> None:
+        """Wake any waiting consumer for good (the producer stopped)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -1,8 +1,16 @@
 from loralink_mllc.runtime.rx_node import RxNode
 from loralink_mllc.runtime.scheduler import FakeClock, RealClock, TxGate
-from loralink_mllc.runtime.toa import estimate_toa_ms
+from loralink_mllc.runtime.toa import estimate_toa_ms, estimate_toa_ms_array
 from loralink_mllc.runtime.tx_node import TxNode
 
-__all__ = ["estimate_toa_ms", "TxGate", "RealClock", "FakeClock", "TxNode", "RxNode"]
+__all__ = [
+    "estimate_toa_ms",
+    "estimate_toa_ms_array",
+    "TxGate",
+    "RealClock",
+    "FakeClock",
+    "TxNode",
+    "RxNode",
+]
 
 
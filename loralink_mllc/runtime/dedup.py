@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Tuple
+
+_Key = Tuple[int, bytes]
+
+
+def payload_digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+class RxDedupCache:
+    """
+    Recently received frames of the (single) peer, keyed by `(seq, payload hash)`.
+
+    Entries expire after `window_ms`, when they fall more than `seq_window` SEQs behind the
+    newest SEQ (so a wrapped SEQ carrying an identical payload is not mistaken for a duplicate),
+    or oldest-first once `max_entries` is exceeded.
+    """
+
+    def __init__(self, max_entries: int, window_ms: int, seq_window: int = 128) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        if window_ms <= 0:
+            raise ValueError("window_ms must be > 0")
+        if not (0 < seq_window < 256):
+            raise ValueError("seq_window must be 1..255")
+        self._max_entries = max_entries
+        self._window_ms = window_ms
+        self._seq_window = seq_window
+        self._entries: OrderedDict[_Key, int] = OrderedDict()
+        self._newest_seq: int | None = None
+        self.hits = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, seq: int, now_ms: int) -> None:
+        while self._entries:
+            key, first_ms = next(iter(self._entries.items()))
+            if now_ms - first_ms <= self._window_ms:
+                break
+            del self._entries[key]
+            self.evictions += 1
+        if self._newest_seq is None or 0 < (seq - self._newest_seq) % 256 < 128:
+            self._newest_seq = seq
+            stale = [k for k in self._entries if (seq - k[0]) % 256 > self._seq_window]
+            for key in stale:
+                del self._entries[key]
+            self.evictions += len(stale)
+
+    def check_and_add(self, seq: int, payload: bytes, now_ms: int) -> bool:
+        """True when `(seq, payload)` was already received inside the window; else records it."""
+        self._evict(seq, now_ms)
+        key = (seq, payload_digest(payload))
+        if key in self._entries:
+            self.hits += 1
+            return True
+        self._entries[key] = now_ms
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return False
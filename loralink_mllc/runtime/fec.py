@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from loralink_mllc.protocol.fec import recover_missing
+
+
+@dataclass
+class _Group:
+    count: int | None = None
+    parity: bytes | None = None
+    bodies: Dict[int, bytes] = field(default_factory=dict)
+
+
+class FecGroupBuffer:
+    """
+    RX-side parity groups, keyed by the SEQ of their first data frame.
+
+    Once the parity and all but one data frame of a group are known, the missing frame is rebuilt
+    and returned as `(seq, index, body)`. Groups are dropped when complete, oldest-first beyond
+    `max_groups`, and when they fall more than `seq_window` SEQs behind the newest one (so a
+    wrapped SEQ never joins a stale group).
+    """
+
+    def __init__(self, max_groups: int, seq_window: int = 128) -> None:
+        if max_groups <= 0:
+            raise ValueError("max_groups must be > 0")
+        if not (0 < seq_window < 256):
+            raise ValueError("seq_window must be 1..255")
+        self._max_groups = max_groups
+        self._seq_window = seq_window
+        self._groups: OrderedDict[int, _Group] = OrderedDict()
+        self._newest_seq: int | None = None
+        self.recovered = 0
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def _group(self, base_seq: int, seq: int) -> _Group:
+        if self._newest_seq is None or 0 < (seq - self._newest_seq) % 256 < 128:
+            self._newest_seq = seq
+            stale = [b for b in self._groups if (seq - b) % 256 > self._seq_window]
+            for key in stale:
+                del self._groups[key]
+        group = self._groups.get(base_seq)
+        if group is None:
+            group = _Group()
+            self._groups[base_seq] = group
+            while len(self._groups) > self._max_groups:
+                self._groups.popitem(last=False)
+        return group
+
+    def _try_recover(self, base_seq: int, group: _Group) -> List[Tuple[int, int, bytes]]:
+        if group.count is None or group.parity is None:
+            return []
+        missing = [i for i in range(group.count) if i not in group.bodies]
+        if len(missing) > 1:
+            return []
+        del self._groups[base_seq]
+        if not missing:
+            return []
+        index = missing[0]
+        bodies = [body for i, body in group.bodies.items() if i < group.count]
+        body = recover_missing(group.parity, bodies)
+        self.recovered += 1
+        return [((base_seq + index) % 256, index, body)]
+
+    def add_data(self, seq: int, index: int, body: bytes) -> List[Tuple[int, int, bytes]]:
+        base_seq = (seq - index) % 256
+        group = self._group(base_seq, seq)
+        group.bodies[index] = body
+        return self._try_recover(base_seq, group)
+
+    def add_parity(self, seq: int, count: int, parity: bytes) -> List[Tuple[int, int, bytes]]:
+        base_seq = (seq - count) % 256
+        group = self._group(base_seq, seq)
+        group.count = count
+        group.parity = parity
+        return self._try_recover(base_seq, group)
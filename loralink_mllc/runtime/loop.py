@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+from loralink_mllc.radio.base import IRadio, IRxWaitable, ITxDrain
+from loralink_mllc.runtime.logging import JsonlLogger
+from loralink_mllc.runtime.scheduler import Clock
+
+# Upper bound on one event-driven sleep, so `stop()` and run limits are still noticed when idle.
+DEFAULT_MAX_IDLE_MS = 1000
+
+
+def tx_drain_source(radio: IRadio) -> ITxDrain | None:
+    """The radio if it writes frames in the background and reports their drain times."""
+    return radio if isinstance(radio, ITxDrain) else None
+
+
+def log_tx_drains(source: ITxDrain | None, logger: JsonlLogger) -> None:
+    """Log one `uart_tx_drain` per frame the radio's writer finished since the last call."""
+    if source is None:
+        return
+    for fields in source.pop_tx_drains():
+        logger.log_event("uart_tx_drain", fields)
+
+
+@dataclass
+class LoopStats:
+    """
+    Wakeups and idle time of one node run loop, logged once as `run_loop` when the loop ends.
+
+    `poll` loops sleep a fixed `step_ms` after every `process_once()`. `event` loops sleep until
+    the node's next timer (`next_wakeup_ms()`) or until the radio reports a readable frame, so an
+    ACK or sample is handled as soon as it is due instead of up to one step later.
+    """
+
+    loop: str
+    started_ms: int
+    wakeups: int = 0
+    idle_ms: int = 0
+
+    def sleep(self, clock: Clock, step_ms: int) -> None:
+        before = clock.now_ms()
+        clock.sleep_ms(step_ms)
+        self.wakeups += 1
+        self.idle_ms += clock.now_ms() - before
+
+    def wait(self, clock: Clock, radio: IRadio, wake_ms: int | None, max_idle_ms: int) -> None:
+        """Sleep until `wake_ms` (None: no timer) or a readable frame, at most `max_idle_ms`."""
+        before = clock.now_ms()
+        timeout_ms = max_idle_ms if wake_ms is None else min(max(0, wake_ms - before), max_idle_ms)
+        if timeout_ms > 0:
+            if isinstance(radio, IRxWaitable):
+                radio.wait_readable(timeout_ms)
+            else:
+                clock.sleep_ms(timeout_ms)
+        self.wakeups += 1
+        self.idle_ms += clock.now_ms() - before
+
+    def fields(self, now_ms: int) -> Dict[str, object]:
+        elapsed_ms = now_ms - self.started_ms
+        return {
+            "loop": self.loop,
+            "wakeups": self.wakeups,
+            "idle_ms": self.idle_ms,
+            "elapsed_ms": elapsed_ms,
+            "idle_ratio": self.idle_ms / elapsed_ms if elapsed_ms > 0 else None,
+        }
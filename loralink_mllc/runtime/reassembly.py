@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass
+class PartialWindow:
+    base_seq: int
+    count: int
+    first_ms: int
+    parts: Dict[int, bytes] = field(default_factory=dict)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(part) for part in self.parts.values())
+
+
+class ReassemblyBuffer:
+    """
+    Fragments of partially received windows, keyed by the SEQ of fragment 0.
+
+    A partial window is dropped `timeout_ms` after its first fragment, when a fragment with the
+    same base SEQ announces a different count (SEQ reuse), or oldest-first while the buffered
+    bytes exceed `max_bytes`. Dropped partials are returned with a reason for logging.
+    """
+
+    def __init__(self, timeout_ms: int, max_bytes: int) -> None:
+        if timeout_ms <= 0:
+            raise ValueError("timeout_ms must be > 0")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self._timeout_ms = timeout_ms
+        self._max_bytes = max_bytes
+        self._partials: OrderedDict[int, PartialWindow] = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._partials)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def _drop(self, base_seq: int) -> PartialWindow:
+        partial = self._partials.pop(base_seq)
+        self._nbytes -= partial.nbytes
+        return partial
+
+    def expire(self, now_ms: int) -> List[PartialWindow]:
+        expired = [
+            base_seq
+            for base_seq, partial in self._partials.items()
+            if now_ms - partial.first_ms > self._timeout_ms
+        ]
+        return [self._drop(base_seq) for base_seq in expired]
+
+    def next_expiry_ms(self) -> int | None:
+        """First time `expire()` will drop a partial (partials are kept in arrival order)."""
+        if not self._partials:
+            return None
+        return next(iter(self._partials.values())).first_ms + self._timeout_ms + 1
+
+    def add(
+        self, seq: int, index: int, count: int, body: bytes, now_ms: int
+    ) -> Tuple[bytes | None, List[Tuple[PartialWindow, str]]]:
+        """
+        Store one fragment. Returns the reassembled window payload once all `count` fragments
+        are present (else None) and the partials dropped to make room.
+        """
+        dropped: List[Tuple[PartialWindow, str]] = []
+        base_seq = (seq - index) % 256
+        partial = self._partials.get(base_seq)
+        if partial is not None and partial.count != count:
+            dropped.append((self._drop(base_seq), "count_mismatch"))
+            partial = None
+        if partial is None:
+            partial = PartialWindow(base_seq=base_seq, count=count, first_ms=now_ms)
+            self._partials[base_seq] = partial
+        self._nbytes += len(body) - len(partial.parts.get(index, b""))
+        partial.parts[index] = body
+        if len(partial.parts) == count:
+            self._drop(base_seq)
+            return b"".join(partial.parts[i] for i in range(count)), dropped
+        while self._nbytes > self._max_bytes:
+            oldest = next(iter(self._partials))
+            dropped.append((self._drop(oldest), "memory_limit"))
+        return None, dropped
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import math
+from typing import Dict
+
+
+class RttEstimator:
+    """
+    Jacobson/Karels smoothed RTT estimator for adaptive ACK timeouts (RFC 6298 gains).
+
+    `observe()` must only be fed unambiguous samples (Karn's rule: never a frame that was
+    retransmitted). `on_timeout()` doubles the backoff applied on top of the RTO until the next
+    valid sample. Before the first sample the caller's static estimate is used as the RTO.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.125,
+        beta: float = 0.25,
+        k: int = 4,
+        granularity_ms: float = 1.0,
+        max_backoff: int = 64,
+    ) -> None:
+        if not (0 < alpha < 1 and 0 < beta < 1):
+            raise ValueError("alpha and beta must be in (0, 1)")
+        if k <= 0 or granularity_ms <= 0 or max_backoff < 1:
+            raise ValueError("k, granularity_ms and max_backoff must be positive")
+        self._alpha = alpha
+        self._beta = beta
+        self._k = k
+        self._granularity_ms = granularity_ms
+        self._max_backoff = max_backoff
+        self.srtt_ms: float | None = None
+        self.rttvar_ms: float | None = None
+        self.backoff = 1
+        self.samples = 0
+
+    def observe(self, rtt_ms: float) -> None:
+        if rtt_ms < 0:
+            raise ValueError("rtt_ms must be >= 0")
+        if self.srtt_ms is None or self.rttvar_ms is None:
+            self.srtt_ms = float(rtt_ms)
+            self.rttvar_ms = rtt_ms / 2.0
+        else:
+            self.rttvar_ms += self._beta * (abs(self.srtt_ms - rtt_ms) - self.rttvar_ms)
+            self.srtt_ms += self._alpha * (rtt_ms - self.srtt_ms)
+        self.backoff = 1
+        self.samples += 1
+
+    def on_timeout(self) -> None:
+        self.backoff = min(self.backoff * 2, self._max_backoff)
+
+    def rto_ms(self, initial_ms: float) -> float:
+        if self.srtt_ms is None or self.rttvar_ms is None:
+            return float(initial_ms)
+        return self.srtt_ms + max(self._granularity_ms, self._k * self.rttvar_ms)
+
+    def timeout_ms(self, initial_ms: float, min_ms: int, max_ms: int) -> int:
+        """Backed-off RTO clamped to `[min_ms, max_ms]`."""
+        timeout = math.ceil(self.rto_ms(initial_ms) * self.backoff)
+        return max(min_ms, min(max_ms, timeout))
+
+    def state(self, initial_ms: float) -> Dict[str, object]:
+        return {
+            "srtt_ms": self.srtt_ms,
+            "rttvar_ms": self.rttvar_ms,
+            "rto_ms": self.rto_ms(initial_ms),
+            "rto_backoff": self.backoff,
+            "rtt_samples": self.samples,
+        }
@@ -4,9 +4,22 @@ from typing import Callable, Sequence
 
 from loralink_mllc.codecs import CodecError, ICodec
 from loralink_mllc.config.runspec import RunSpec
+from loralink_mllc.protocol.aggregate import unpack_windows
+from loralink_mllc.protocol.fec import FEC_HEADER_BYTES, fec_data_payload, parse_fec_payload
+from loralink_mllc.protocol.fragment import parse_fragment
+from loralink_mllc.protocol.framing import AckWindow, make_bitmap_ack_packet
 from loralink_mllc.protocol.packet import Packet, PacketError
 from loralink_mllc.radio.base import IRadio, IRxRssi
+from loralink_mllc.runtime.dedup import RxDedupCache
+from loralink_mllc.runtime.fec import FecGroupBuffer
 from loralink_mllc.runtime.logging import JsonlLogger
+from loralink_mllc.runtime.loop import (
+    DEFAULT_MAX_IDLE_MS,
+    LoopStats,
+    log_tx_drains,
+    tx_drain_source,
+)
+from loralink_mllc.runtime.reassembly import PartialWindow, ReassemblyBuffer
 from loralink_mllc.runtime.scheduler import Clock, RealClock
 
 
@@ -19,9 +32,11 @@ class RxNode:
         logger: JsonlLogger,
         clock: Clock | None = None,
         truth_provider: Callable[[int], Sequence[float] | None] | None = None,
+        window_truth_provider: Callable[[int, int], Sequence[float] | None] | None = None,
     ) -> None:
         self._runspec = runspec
         self._radio = radio
+        self._tx_drains = tx_drain_source(radio)
         self._codec = codec
         self._logger = logger
         self._clock = clock or RealClock()
@@ -29,7 +44,26 @@ class RxNode:
         self._stop = False
         self._rx_ok_count = 0
         self._truth_provider = truth_provider
+        self._window_truth_provider = window_truth_provider
         self._max_payload_bytes = runspec.max_payload_bytes
+        self._aggregate = runspec.tx.aggregates()
+        self._selective_repeat = runspec.tx.selective_repeat()
+        self._ack_window = AckWindow(runspec.tx.ack_bitmap_bits)
+        self._ack_base_seq: int | None = None
+        self._ack_unsent = 0
+        self._ack_due_ms = 0
+        self._dedup: RxDedupCache | None = None
+        if runspec.rx.dedup_entries > 0:
+            self._dedup = RxDedupCache(runspec.rx.dedup_entries, runspec.rx.dedup_window_ms)
+        self._rx_dup_count = 0
+        self._reassembly: ReassemblyBuffer | None = None
+        if runspec.tx.fragments():
+            self._reassembly = ReassemblyBuffer(
+                runspec.rx.reassembly_timeout_ms, runspec.rx.reassembly_max_bytes
+            )
+        self._fec: FecGroupBuffer | None = None
+        if runspec.tx.fec():
+            self._fec = FecGroupBuffer(runspec.rx.fec_max_groups)
 
     def stop(self) -> None:
         self._stop = True
@@ -45,71 +79,280 @@ class RxNode:
         mse = sum((a - b) ** 2 for a, b in zip(truth, recon, strict=True)) / len(truth)
         return mae, mse
 
+    def _truth(self, seq: int, sub_index: int | None) -> Sequence[float] | None:
+        if sub_index is None:
+            return self._truth_provider(seq) if self._truth_provider else None
+        if self._window_truth_provider:
+            return self._window_truth_provider(seq, sub_index)
+        return None
+
+    def _reconstruct(self, seq: int, sub_index: int | None, payload: bytes) -> None:
+        ids: dict[str, object] = {"seq": seq}
+        if sub_index is not None:
+            ids["sub_index"] = sub_index
+        try:
+            recon = self._codec.decode(payload)
+            truth = self._truth(seq, sub_index)
+            if truth is not None:
+                mae, mse = self._compute_errors(truth, recon)
+                self._logger.log_event("recon_done", {**ids, "mae": mae, "mse": mse})
+        except NotImplementedError as exc:
+            self._logger.log_event("recon_not_implemented", {**ids, "reason": str(exc)})
+        except (CodecError, ValueError) as exc:
+            self._logger.log_event("recon_failed", {**ids, "reason": str(exc)})
+
     def process_once(self) -> None:
         if self._stop:
             return
+        log_tx_drains(self._tx_drains, self._logger)
         frame = self._radio.recv(timeout_ms=0)
-        if frame is None:
+        if frame is not None:
+            self._handle_frame(frame)
+        if self._reassembly is not None:
+            for partial in self._reassembly.expire(self._clock.now_ms()):
+                self._log_reassembly_fail(partial, "timeout")
+        if self._selective_repeat:
+            self._flush_bitmap_ack()
+
+    def next_wakeup_ms(self) -> int | None:
+        """Earliest timer of `process_once()` (delayed bitmap ACK, reassembly timeout), if any."""
+        wakes = []
+        if self._ack_base_seq is not None:
+            wakes.append(self._ack_due_ms)
+        if self._reassembly is not None:
+            expiry_ms = self._reassembly.next_expiry_ms()
+            if expiry_ms is not None:
+                wakes.append(expiry_ms)
+        return min(wakes) if wakes else None
+
+    def _flush_bitmap_ack(self, *, force: bool = False) -> None:
+        """Send one bitmap ACK after `ack_every` frames or `ack_delay_ms` since the first."""
+        if self._ack_base_seq is None:
             return
+        tx = self._runspec.tx
+        due = self._ack_unsent >= tx.ack_every or self._clock.now_ms() >= self._ack_due_ms
+        if not (force or due):
+            return
+        base_seq = self._ack_base_seq
+        bitmap = self._ack_window.bitmap(base_seq)
+        ack_packet = make_bitmap_ack_packet(
+            base_seq, bitmap, seq=self._ack_seq, bitmap_bits=tx.ack_bitmap_bits
+        )
+        frame = ack_packet.to_bytes(max_payload_bytes=self._max_payload_bytes)
+        self._radio.send(frame)
+        self._logger.log_event(
+            "ack_sent",
+            {
+                "ack_seq": base_seq,
+                "ack_bitmap": bitmap,
+                "acked_frames": self._ack_unsent,
+                "frame_bytes": len(frame),
+            },
+        )
+        self._ack_seq = (self._ack_seq + 1) % 256
+        self._ack_base_seq = None
+        self._ack_unsent = 0
+
+    def _handle_frame(self, frame: bytes) -> None:
         try:
             packet = Packet.from_bytes(frame, max_payload_bytes=self._max_payload_bytes)
         except PacketError as exc:
             self._logger.log_event("rx_parse_fail", {"reason": str(exc)})
             return
-        rx_payload: dict[str, object] = {
-            "seq": packet.seq,
-            "payload_bytes": len(packet.payload),
-            "frame_bytes": len(frame),
-        }
+        if self._dedup is not None and self._dedup.check_and_add(
+            packet.seq, packet.payload, self._clock.now_ms()
+        ):
+            # Retransmission after a lost ACK: re-ACK right away, skip decode and truth lookup.
+            self._rx_dup_count += 1
+            self._logger.log_event(
+                "rx_dup",
+                {
+                    "seq": packet.seq,
+                    "payload_bytes": len(packet.payload),
+                    "frame_bytes": len(frame),
+                },
+            )
+            self._acknowledge(packet.seq, immediate=True)
+            return
+        if self._fec is not None:
+            self._handle_fec(self._fec, packet, len(frame))
+            return
+        self._deliver(packet.seq, packet.payload, len(frame), "rx_ok")
+
+    def _handle_fec(self, fec: FecGroupBuffer, packet: Packet, frame_bytes: int) -> None:
+        """Strip the FEC header, then deliver the frame and any frame its group can rebuild."""
+        try:
+            is_parity, value, body = parse_fec_payload(packet.payload)
+        except PacketError as exc:
+            self._logger.log_event("rx_parse_fail", {"seq": packet.seq, "reason": str(exc)})
+            return
+        if is_parity:
+            self._logger.log_event(
+                "rx_fec_parity",
+                {
+                    "seq": packet.seq,
+                    "fec_group_count": value,
+                    "payload_bytes": len(packet.payload),
+                    "frame_bytes": frame_bytes,
+                },
+            )
+        else:
+            self._deliver(packet.seq, body, frame_bytes, "rx_ok")
+        try:
+            if is_parity:
+                recovered = fec.add_parity(packet.seq, value, body)
+            else:
+                recovered = fec.add_data(packet.seq, value, body)
+        except PacketError as exc:
+            self._logger.log_event("rx_parse_fail", {"seq": packet.seq, "reason": str(exc)})
+            return
+        for seq, index, recovered_body in recovered:
+            if self._dedup is not None:
+                # A late retransmission of the rebuilt frame is then treated as a duplicate.
+                payload = fec_data_payload(index, recovered_body)
+                self._dedup.check_and_add(seq, payload, self._clock.now_ms())
+            frame_len = 2 + FEC_HEADER_BYTES + len(recovered_body)
+            self._deliver(seq, recovered_body, frame_len, "rx_fec_recovered")
+
+    def _deliver(self, seq: int, payload: bytes, frame_bytes: int, event: str) -> None:
+        """Log, decode and acknowledge one received (`rx_ok`) or rebuilt data frame."""
+        if self._reassembly is not None:
+            self._handle_fragment(self._reassembly, seq, payload, frame_bytes, event)
+            return
+        if self._aggregate:
+            try:
+                payloads = unpack_windows(payload)
+            except PacketError as exc:
+                self._logger.log_event("rx_parse_fail", {"seq": seq, "reason": str(exc)})
+                return
+        else:
+            payloads = [payload]
+        for index, window_payload in enumerate(payloads):
+            sub_index = index if self._aggregate else None
+            rx_payload: dict[str, object] = {
+                "seq": seq,
+                "payload_bytes": len(window_payload),
+                "frame_bytes": frame_bytes,
+            }
+            if sub_index is not None:
+                rx_payload["sub_index"] = sub_index
+                rx_payload["sub_count"] = len(payloads)
+            self._log_rx_ok(event, rx_payload)
+            if self._runspec.mode == "LATENT":
+                self._reconstruct(seq, sub_index, window_payload)
+        self._acknowledge(seq, immediate=False)
+
+    def _log_rx_ok(self, event: str, rx_payload: dict[str, object]) -> None:
         if isinstance(self._radio, IRxRssi):
             rssi_dbm = self._radio.last_rx_rssi_dbm()
             if rssi_dbm is not None:
                 rx_payload["rssi_dbm"] = rssi_dbm
-        self._logger.log_event("rx_ok", rx_payload)
+        self._logger.log_event(event, rx_payload)
         self._rx_ok_count += 1
-        if self._runspec.mode == "LATENT":
-            try:
-                recon = self._codec.decode(packet.payload)
-                if self._truth_provider:
-                    truth = self._truth_provider(packet.seq)
-                else:
-                    truth = None
-                if truth is not None:
-                    mae, mse = self._compute_errors(truth, recon)
-                    self._logger.log_event(
-                        "recon_done",
-                        {"seq": packet.seq, "mae": mae, "mse": mse},
-                    )
-            except NotImplementedError as exc:
-                self._logger.log_event(
-                    "recon_not_implemented",
-                    {"seq": packet.seq, "reason": str(exc)},
-                )
-            except (CodecError, ValueError) as exc:
-                self._logger.log_event("recon_failed", {"seq": packet.seq, "reason": str(exc)})
-        ack_packet = Packet(payload=bytes([packet.seq]), seq=self._ack_seq)
+
+    def _handle_fragment(
+        self,
+        reassembly: ReassemblyBuffer,
+        seq: int,
+        payload: bytes,
+        frame_bytes: int,
+        event: str,
+    ) -> None:
+        """ACK every fragment on its own; decode once the whole window is reassembled."""
+        try:
+            index, count, body = parse_fragment(payload)
+        except PacketError as exc:
+            self._logger.log_event("rx_parse_fail", {"seq": seq, "reason": str(exc)})
+            return
+        self._log_rx_ok(
+            event,
+            {
+                "seq": seq,
+                "payload_bytes": len(payload),
+                "frame_bytes": frame_bytes,
+                "frag_index": index,
+                "frag_count": count,
+            },
+        )
+        now_ms = self._clock.now_ms()
+        window_payload, dropped = reassembly.add(seq, index, count, body, now_ms)
+        for partial, reason in dropped:
+            self._log_reassembly_fail(partial, reason)
+        if window_payload is not None:
+            base_seq = (seq - index) % 256
+            self._logger.log_event(
+                "rx_reassembled",
+                {"seq": base_seq, "frag_count": count, "payload_bytes": len(window_payload)},
+            )
+            if self._runspec.mode == "LATENT":
+                self._reconstruct(base_seq, None, window_payload)
+        self._acknowledge(seq, immediate=False)
+
+    def _log_reassembly_fail(self, partial: PartialWindow, reason: str) -> None:
+        self._logger.log_event(
+            "rx_reassembly_fail",
+            {
+                "seq": partial.base_seq,
+                "reason": reason,
+                "frag_count": partial.count,
+                "frags_received": len(partial.parts),
+                "buffered_bytes": partial.nbytes,
+            },
+        )
+
+    def _acknowledge(self, seq: int, *, immediate: bool) -> None:
+        if self._selective_repeat:
+            self._ack_window.record(seq)
+            if self._ack_base_seq is None:
+                self._ack_due_ms = self._clock.now_ms() + self._runspec.tx.ack_delay_ms
+            self._ack_base_seq = seq
+            self._ack_unsent += 1
+            if immediate:
+                self._flush_bitmap_ack(force=True)
+            return
+        ack_packet = Packet(payload=bytes([seq]), seq=self._ack_seq)
         self._radio.send(ack_packet.to_bytes(max_payload_bytes=self._max_payload_bytes))
-        self._logger.log_event("ack_sent", {"ack_seq": packet.seq})
+        self._logger.log_event("ack_sent", {"ack_seq": seq})
         self._ack_seq = (self._ack_seq + 1) % 256
 
+    def _run_finished(self, max_rx_ok: int | None, deadline_ms: int | None) -> bool:
+        if self._stop:
+            return True
+        if max_rx_ok is not None and self._rx_ok_count >= max_rx_ok:
+            return True
+        return deadline_ms is not None and self._clock.now_ms() >= deadline_ms
+
     def run(
         self,
         step_ms: int = 5,
         *,
         max_rx_ok: int | None = None,
         max_seconds: float | None = None,
+        event_driven: bool = False,
+        max_idle_ms: int = DEFAULT_MAX_IDLE_MS,
     ) -> None:
+        """
+        Receive until stopped or a limit is hit. Polled loops sleep `step_ms` per step;
+        event-driven loops sleep until the next ACK/reassembly timer, the run deadline or an
+        incoming frame.
+        """
+        stats = LoopStats("event" if event_driven else "poll", self._clock.now_ms())
         deadline_ms: int | None = None
         if max_seconds is not None:
             if max_seconds < 0:
                 raise ValueError("max_seconds must be >= 0")
             deadline_ms = self._clock.now_ms() + int(max_seconds * 1000.0)
-        while not self._stop:
-            if max_rx_ok is not None and self._rx_ok_count >= max_rx_ok:
-                break
-            if deadline_ms is not None and self._clock.now_ms() >= deadline_ms:
-                break
+        while not self._run_finished(max_rx_ok, deadline_ms):
             self.process_once()
-            self._clock.sleep_ms(step_ms)
+            if self._run_finished(max_rx_ok, deadline_ms):
+                break
+            if event_driven:
+                wakes = [w for w in (self.next_wakeup_ms(), deadline_ms) if w is not None]
+                wake_ms = min(wakes) if wakes else None
+                stats.wait(self._clock, self._radio, wake_ms, max_idle_ms)
+            else:
+                stats.sleep(self._clock, step_ms)
+        log_tx_drains(self._tx_drains, self._logger)
+        self._logger.log_event("run_loop", stats.fields(self._clock.now_ms()))
 
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import heapq
+import math
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Iterable, Protocol
+from typing import Deque, Dict, Iterable, List, Protocol, Tuple
 
 
 class Clock(Protocol):
@@ -43,6 +46,19 @@ class Inflight:
 
 
 class TxGate:
+    """
+    Airtime/guard gate plus the inflight table of unacknowledged frames.
+
+    ACK deadlines live in a min-heap of `(deadline_ms, token, seq)`. An ACK or a resend only
+    invalidates the SEQ's token; stale heap entries are discarded when they reach the top, so
+    finding expired frames costs O(log n) per deadline instead of a scan of every inflight entry
+    on each tick. Entries whose deadline passed stay in `_due` until resent, ACKed or failed.
+
+    With `duty_cycle` set, the airtime of every frame is also kept for `duty_cycle_window_ms`
+    after it ends; `airtime_allows()` tells whether one more frame stays within
+    `duty_cycle * duty_cycle_window_ms` and `airtime_free_ms()` when it would.
+    """
+
     def __init__(
         self,
         clock: Clock,
@@ -50,7 +66,13 @@ class TxGate:
         ack_timeout_ms: int,
         max_retries: int,
         max_inflight: int = 1,
+        duty_cycle: float | None = None,
+        duty_cycle_window_ms: int = 3_600_000,
     ) -> None:
+        if duty_cycle is not None and not (0 < duty_cycle <= 1):
+            raise ValueError("duty_cycle must be in (0, 1]")
+        if duty_cycle_window_ms <= 0:
+            raise ValueError("duty_cycle_window_ms must be > 0")
         self._clock = clock
         self._guard_ms = guard_ms
         self._ack_timeout_ms_default = ack_timeout_ms
@@ -59,18 +81,37 @@ class TxGate:
         self._last_tx_start_ms: int | None = None
         self._last_toa_ms: float = 0.0
         self._inflight: Dict[int, Inflight] = {}
+        self._deadlines: List[Tuple[int, int, int]] = []
+        self._tokens: Dict[int, int] = {}
+        self._next_token = 0
+        self._due: Dict[int, Inflight] = {}
+        self._duty_cycle = duty_cycle
+        self._airtime_window_ms = duty_cycle_window_ms
+        self._airtime: Deque[Tuple[float, float]] = deque()  # (end_ms, toa_ms)
+        self._airtime_used_ms = 0.0
         self.sent_count = 0
         self.acked_count = 0
         self.retries_total = 0
         self.total_toa_ms = 0.0
 
     def can_send(self) -> bool:
-        if len(self._inflight) >= self._max_inflight:
+        if not self.has_free_slot():
             return False
+        return self.channel_clear()
+
+    def has_free_slot(self) -> bool:
+        return len(self._inflight) < self._max_inflight
+
+    def channel_free_ms(self) -> int | None:
+        """End of the last frame's airtime + guard (None before the first send)."""
         if self._last_tx_start_ms is None:
-            return True
-        now = self._clock.now_ms()
-        return now >= int(self._last_tx_start_ms + self._last_toa_ms + self._guard_ms)
+            return None
+        return int(self._last_tx_start_ms + self._last_toa_ms + self._guard_ms)
+
+    def channel_clear(self) -> bool:
+        """Airtime + guard check only; retransmissions reuse their inflight slot."""
+        free_ms = self.channel_free_ms()
+        return free_ms is None or self._clock.now_ms() >= free_ms
 
     def record_send(self, seq: int, toa_ms_est: float, ack_timeout_ms: int | None = None) -> int:
         now = self._clock.now_ms()
@@ -96,39 +137,133 @@ class TxGate:
                 ack_timeout_ms=timeout_ms,
             )
             attempt = 1
+        self._schedule(seq, now + timeout_ms)
+        self._account_airtime(now, toa_ms_est)
+        return attempt
+
+    def _account_airtime(self, now: int, toa_ms_est: float) -> None:
         self.sent_count += 1
         self.total_toa_ms += toa_ms_est
         self._last_tx_start_ms = now
         self._last_toa_ms = toa_ms_est
-        return attempt
+        if self._duty_cycle is not None:
+            self._airtime.append((now + toa_ms_est, toa_ms_est))
+            self._airtime_used_ms += toa_ms_est
+
+    def _expire_airtime(self) -> None:
+        horizon = self._clock.now_ms() - self._airtime_window_ms
+        while self._airtime and self._airtime[0][0] <= horizon:
+            _, toa_ms = self._airtime.popleft()
+            self._airtime_used_ms -= toa_ms
+        if not self._airtime:
+            self._airtime_used_ms = 0.0  # drop float drift once the window is empty
+
+    def airtime_budget_ms(self) -> float | None:
+        if self._duty_cycle is None:
+            return None
+        return self._duty_cycle * self._airtime_window_ms
+
+    def airtime_used_ms(self) -> float:
+        """Estimated airtime of frames that ended less than one duty-cycle window ago."""
+        self._expire_airtime()
+        return self._airtime_used_ms
+
+    def airtime_headroom_ms(self) -> float | None:
+        budget = self.airtime_budget_ms()
+        if budget is None:
+            return None
+        return budget - self.airtime_used_ms()
+
+    def airtime_allows(self, toa_ms_est: float) -> bool:
+        headroom = self.airtime_headroom_ms()
+        return headroom is None or toa_ms_est <= headroom
+
+    def airtime_free_ms(self, toa_ms_est: float) -> int | None:
+        """Earliest time a frame of `toa_ms_est` fits the budget (None without a duty cycle)."""
+        budget = self.airtime_budget_ms()
+        if budget is None:
+            return None
+        used = self.airtime_used_ms()
+        if used + toa_ms_est <= budget:
+            return self._clock.now_ms()
+        for end_ms, toa_ms in self._airtime:
+            used -= toa_ms
+            if used + toa_ms_est <= budget:
+                return math.ceil(end_ms + self._airtime_window_ms)
+        raise ValueError(f"toa_ms {toa_ms_est} exceeds the duty-cycle budget {budget} ms")
+
+    def _schedule(self, seq: int, deadline_ms: int) -> None:
+        self._due.pop(seq, None)
+        token = self._next_token
+        self._next_token += 1
+        self._tokens[seq] = token
+        heapq.heappush(self._deadlines, (deadline_ms, token, seq))
+
+    def _forget(self, seq: int) -> Inflight | None:
+        self._tokens.pop(seq, None)
+        self._due.pop(seq, None)
+        return self._inflight.pop(seq, None)
+
+    def _drop_stale(self) -> None:
+        while self._deadlines:
+            _, token, seq = self._deadlines[0]
+            if self._tokens.get(seq) == token:
+                return
+            heapq.heappop(self._deadlines)
+
+    def _collect_due(self) -> None:
+        now = self._clock.now_ms()
+        while True:
+            self._drop_stale()
+            if not self._deadlines or self._deadlines[0][0] > now:
+                return
+            _, _, seq = heapq.heappop(self._deadlines)
+            self._due[seq] = self._inflight[seq]
+
+    def next_deadline_ms(self) -> int | None:
+        """Earliest ACK deadline among inflight frames (already passed if any are due)."""
+        if self._due:
+            return min(i.last_tx_ms + i.ack_timeout_ms for i in self._due.values())
+        self._drop_stale()
+        return self._deadlines[0][0] if self._deadlines else None
+
+    def record_unacked_send(self, toa_ms_est: float) -> None:
+        """Account airtime for a frame that expects no ACK (e.g. FEC parity); nothing inflight."""
+        self._account_airtime(self._clock.now_ms(), toa_ms_est)
 
     def mark_acked(self, ack_seq: int) -> Inflight | None:
-        inflight = self._inflight.pop(ack_seq, None)
+        inflight = self._forget(ack_seq)
         if inflight is None:
             return None
         self.acked_count += 1
         return inflight
 
+    def mark_acked_many(self, ack_seqs: Iterable[int]) -> List[Inflight]:
+        """Clear every inflight entry covered by one (bitmap) ACK; unknown SEQs are ignored."""
+        cleared = []
+        for ack_seq in ack_seqs:
+            inflight = self.mark_acked(ack_seq)
+            if inflight is not None:
+                cleared.append(inflight)
+        return cleared
+
     def expired_sequences(self) -> Iterable[int]:
-        now = self._clock.now_ms()
-        for seq, inflight in list(self._inflight.items()):
-            if inflight.attempts > self._max_retries:
-                continue
-            if now - inflight.last_tx_ms >= inflight.ack_timeout_ms:
-                yield seq
+        """SEQs past their ACK deadline that may still be retried, in deadline order."""
+        self._collect_due()
+        return [seq for seq, i in self._due.items() if i.attempts <= self._max_retries]
 
     def expired_failures(self) -> Iterable[Inflight]:
-        now = self._clock.now_ms()
-        for seq, inflight in list(self._inflight.items()):
-            if inflight.attempts <= self._max_retries:
-                continue
-            if now - inflight.last_tx_ms >= inflight.ack_timeout_ms:
-                yield self._inflight.pop(seq)
+        """Remove and return entries past their deadline with no retries left."""
+        self._collect_due()
+        failed = [i for i in self._due.values() if i.attempts > self._max_retries]
+        for inflight in failed:
+            self._forget(inflight.seq)
+        return failed
 
     def metrics(self) -> dict:
         pdr = self.acked_count / self.sent_count if self.sent_count else 0.0
         etx = self.sent_count / max(self.acked_count, 1)
-        return {
+        metrics = {
             "sent_count": self.sent_count,
             "acked_count": self.acked_count,
             "retries_total": self.retries_total,
@@ -136,6 +271,18 @@ class TxGate:
             "etx": etx,
             "total_toa_ms": self.total_toa_ms,
         }
+        budget = self.airtime_budget_ms()
+        if budget is not None:
+            used = self.airtime_used_ms()
+            metrics.update(
+                {
+                    "duty_cycle": self._duty_cycle,
+                    "airtime_window_ms": self._airtime_window_ms,
+                    "airtime_used_ms": used,
+                    "airtime_headroom_ms": budget - used,
+                }
+            )
+        return metrics
 
     def inflight(self) -> Dict[int, Inflight]:
         return dict(self._inflight)
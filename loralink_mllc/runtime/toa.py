@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+from typing import Any, Iterable, Tuple
 
+from loralink_mllc.codecs.numpy_compat import optional_numpy
 from loralink_mllc.config.runspec import PhySpec
 
+# LoRa payload lengths are one byte: every ToA a PhySpec can produce fits one 256-entry table.
+TOA_TABLE_SIZE = 256
+
 
 def _cr_index(cr: int) -> int:
     if cr in (1, 2, 3, 4):
@@ -13,9 +19,17 @@ def _cr_index(cr: int) -> int:
     raise ValueError("cr must be 1..4 (index) or 5..8 (denominator)")
 
 
-def estimate_toa_ms(phy: PhySpec, payload_len_bytes: int) -> float:
-    if payload_len_bytes < 0 or payload_len_bytes > 255:
+def _check_payload_len(payload_len_bytes: int) -> int:
+    if not 0 <= payload_len_bytes <= 255:  # also rejects NaN
         raise ValueError("payload_len_bytes must be 0..255")
+    # Table index: integral floats (10.0) and numpy integers still work as they did before.
+    length = int(payload_len_bytes)
+    if length != payload_len_bytes:
+        raise ValueError("payload_len_bytes must be a whole number of bytes")
+    return length
+
+
+def _toa_ms(phy: PhySpec, payload_len_bytes: int) -> float:
     sf = phy.sf
     if sf < 5 or sf > 12:
         raise ValueError("sf must be 5..12 for LoRa mode")
@@ -48,6 +62,43 @@ def estimate_toa_ms(phy: PhySpec, payload_len_bytes: int) -> float:
     return toa_s * 1000.0
 
 
+@lru_cache(maxsize=64)
+def toa_table_ms(phy: PhySpec) -> Tuple[float, ...]:
+    """ToA of every payload length 0..255 for `phy`, built once per PhySpec."""
+    return tuple(_toa_ms(phy, length) for length in range(TOA_TABLE_SIZE))
+
+
+def estimate_toa_ms(phy: PhySpec, payload_len_bytes: int) -> float:
+    return toa_table_ms(phy)[_check_payload_len(payload_len_bytes)]
+
+
+@lru_cache(maxsize=16)
+def _toa_table_array(phy: PhySpec) -> Any:
+    table = optional_numpy().asarray(toa_table_ms(phy), dtype="float64")
+    table.setflags(write=False)
+    return table
+
+
+def estimate_toa_ms_array(phy: PhySpec, lengths: Iterable[int]) -> Any:
+    """
+    Vectorized `estimate_toa_ms` for analysis scripts. With numpy installed this returns a
+    float64 array shaped like `lengths` (a table gather); otherwise a list of floats. Values are
+    identical to the scalar function.
+    """
+    np = optional_numpy()
+    if np is None:
+        table = toa_table_ms(phy)
+        return [table[_check_payload_len(int(length))] for length in lengths]
+    index = np.asarray(lengths)
+    if index.size == 0:
+        return np.zeros(index.shape, dtype="float64")
+    if index.dtype.kind not in "iu":
+        raise ValueError("lengths must be integers")
+    if int(index.min()) < 0 or int(index.max()) > 255:
+        raise ValueError("payload_len_bytes must be 0..255")
+    return _toa_table_array(phy)[index]
+
+
 def estimate_ack_timeout_ms(
     phy: PhySpec,
     data_frame_bytes: int,
@@ -61,8 +112,18 @@ def estimate_ack_timeout_ms(
     """
     if margin_ms < 0:
         raise ValueError("margin_ms must be >= 0")
-    data_toa_ms = estimate_toa_ms(phy, data_frame_bytes)
+    table = ack_timeout_table_ms(phy, ack_frame_bytes=ack_frame_bytes, margin_ms=margin_ms)
+    return table[_check_payload_len(data_frame_bytes)]
+
+
+@lru_cache(maxsize=64)
+def ack_timeout_table_ms(
+    phy: PhySpec, *, ack_frame_bytes: int = 3, margin_ms: int = 40
+) -> Tuple[int, ...]:
+    """`estimate_ack_timeout_ms` for every data frame length 0..255, built once per argument set."""
     ack_toa_ms = estimate_toa_ms(phy, ack_frame_bytes)
-    return int(math.ceil(data_toa_ms + ack_toa_ms + margin_ms))
+    return tuple(
+        int(math.ceil(data_toa_ms + ack_toa_ms + margin_ms)) for data_toa_ms in toa_table_ms(phy)
+    )
 
 
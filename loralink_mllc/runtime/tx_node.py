@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import math
 import time
 from collections import deque
-from dataclasses import dataclass
-from typing import Deque, Dict, List, Protocol, Sequence
+from dataclasses import dataclass, replace
+from typing import Deque, Dict, List, Protocol, Sequence, Tuple
 
 from loralink_mllc.codecs import ICodec
 from loralink_mllc.config.runspec import RunSpec
+from loralink_mllc.protocol.aggregate import aggregate_overhead_bytes, pack_windows
+from loralink_mllc.protocol.fec import (
+    MAX_FEC_GROUP,
+    fec_data_payload,
+    fec_max_body_bytes,
+    xor_parity,
+)
+from loralink_mllc.protocol.fragment import FRAGMENT_HEADER_BYTES, split_fragments
+from loralink_mllc.protocol.framing import parse_ack_payload
 from loralink_mllc.protocol.packet import Packet, PacketError
-from loralink_mllc.radio.base import IRadio, IRxRssi
+from loralink_mllc.radio.base import IRadio, IRxRssi, IRxTimestamp
 from loralink_mllc.runtime.logging import JsonlLogger
-from loralink_mllc.runtime.scheduler import Clock, RealClock, TxGate
+from loralink_mllc.runtime.loop import (
+    DEFAULT_MAX_IDLE_MS,
+    LoopStats,
+    log_tx_drains,
+    tx_drain_source,
+)
+from loralink_mllc.runtime.rtt import RttEstimator
+from loralink_mllc.runtime.scheduler import Clock, Inflight, RealClock, TxGate
 from loralink_mllc.runtime.toa import estimate_ack_timeout_ms, estimate_toa_ms
 from loralink_mllc.sensing.dataset import DatasetLogger
 from loralink_mllc.sensing.sampler import NoSampleAvailable
@@ -89,6 +106,31 @@ class PendingWindow:
     built_ms: int
     sensor_ts_ms: int | None
     codec_encode_ms: float
+    codec_cycles: int | None = None
+    # Set for aggregated frames: `payload` is the packed sub-header + payloads of these windows.
+    window_ids: Tuple[int, ...] | None = None
+    # Set for fragments: `payload` is the fragment header + slice `frag_index` of the window.
+    frag_index: int | None = None
+    frag_count: int | None = None
+
+
+def _frame_fields(window: PendingWindow) -> Dict[str, object]:
+    if window.frag_count is not None:
+        return {"frag_index": window.frag_index, "frag_count": window.frag_count}
+    if window.window_ids is None:
+        return {}
+    return {"window_ids": list(window.window_ids), "window_count": len(window.window_ids)}
+
+
+# Adaptive ACK timeouts never exceed this multiple of the static ToA-based estimate.
+ADAPTIVE_ACK_TIMEOUT_MAX_FACTOR = 4
+
+
+def _last_encode_cycles(codec: ICodec) -> int | None:
+    cycles = getattr(codec, "last_encode_cycles", None)
+    if not cycles:
+        return None
+    return int(cycles[-1])
 
 
 class TxNode:
@@ -104,26 +146,57 @@ class TxNode:
     ) -> None:
         self._runspec = runspec
         self._radio = radio
+        self._tx_drains = tx_drain_source(radio)
         self._codec = codec
         self._logger = logger
         self._sampler = sampler
         self._dataset_logger = dataset_logger
         self._clock = clock or RealClock()
-        default_ack_timeout_ms = runspec.tx.ack_timeout_ms
-        if default_ack_timeout_ms is None:
-            default_ack_timeout_ms = estimate_ack_timeout_ms(
-                runspec.phy, data_frame_bytes=2 + runspec.max_payload_bytes
-            )
+        self._selective_repeat = runspec.tx.selective_repeat()
+        self._rtt = RttEstimator() if runspec.tx.ack_timeout_adaptive else None
         self._gate = TxGate(
             clock=self._clock,
             guard_ms=runspec.tx.guard_ms,
-            ack_timeout_ms=default_ack_timeout_ms,
+            ack_timeout_ms=self._ack_timeout_ms(2 + runspec.max_payload_bytes),
             max_retries=runspec.tx.max_retries,
             max_inflight=runspec.tx.max_inflight,
+            duty_cycle=runspec.tx.duty_cycle,
+            duty_cycle_window_ms=runspec.tx.duty_cycle_window_ms,
         )
+        budget_ms = self._gate.airtime_budget_ms()
+        max_toa_ms = estimate_toa_ms(runspec.phy, 2 + runspec.max_payload_bytes)
+        if budget_ms is not None and max_toa_ms > budget_ms:
+            raise ValueError(
+                f"duty-cycle budget {budget_ms:.1f} ms is below the ToA of one max-size frame "
+                f"({max_toa_ms:.1f} ms)"
+            )
+        self._retries_first = runspec.tx.duty_cycle_priority == "retries"
+        # Set when the duty cycle denied a frame this pass: when it fits again.
+        self._airtime_wait_ms: int | None = None
         self._seq = 0
         self._max_payload_bytes = runspec.max_payload_bytes
+        self._fec_group = runspec.tx.fec_group
+        self._fec_bodies: List[bytes] = []
+        # Window payload budget per frame; FEC reserves room for its header and the parity frame.
+        self._frame_payload_bytes = (
+            fec_max_body_bytes(runspec.max_payload_bytes)
+            if runspec.tx.fec()
+            else runspec.max_payload_bytes
+        )
+        self._aggregate = runspec.tx.aggregates()
+        aggregate_max_bytes = runspec.tx.aggregate_max_bytes
+        self._aggregate_max_bytes = min(
+            aggregate_max_bytes if aggregate_max_bytes is not None else runspec.max_payload_bytes,
+            self._frame_payload_bytes,
+        )
+        self._fragment = runspec.tx.fragments()
+        self._fragment_body_bytes = self._frame_payload_bytes - FRAGMENT_HEADER_BYTES
         self._pending: Deque[PendingWindow] = deque()
+        # Queued windows over this bound are dropped per `pending_policy` (keep_latest: 1).
+        self._max_pending = (
+            1 if runspec.tx.pending_policy == "keep_latest" else runspec.tx.max_pending
+        )
+        self._windows_dropped = 0
         self._inflight_payloads: Dict[int, PendingWindow] = {}
         self._builder = WindowBuilder(runspec.window.dims, runspec.window.W, runspec.window.stride)
         self._sample_ts_ms: Deque[int] = deque(maxlen=runspec.window.W)
@@ -132,27 +205,81 @@ class TxNode:
         self._windows_sent = 0
         self._stop = False
         self._no_more_samples = False
+        # None: one sample per process_once() call (polled loops); else the sample_hz period.
+        self._sample_period_ms: float | None = None
+        self._next_sample_ms = 0.0
+        self._backed_off = False
 
     def stop(self) -> None:
         self._stop = True
 
+    def pace_samples(self) -> None:
+        """Draw samples at `window.sample_hz` instead of once per `process_once()` call."""
+        self._sample_period_ms = 1000.0 / self._runspec.window.sample_hz
+        self._next_sample_ms = float(self._clock.now_ms())
+
+    def _sample_due(self) -> bool:
+        if self._sample_period_ms is None:
+            return True
+        if self._clock.now_ms() < self._next_sample_ms:
+            return False
+        self._next_sample_ms += self._sample_period_ms
+        return True
+
+    def _estimated_ack_timeout_ms(self, frame_bytes: int, margin_ms: int = 40) -> int:
+        tx = self._runspec.tx
+        if not self._selective_repeat:
+            return estimate_ack_timeout_ms(
+                self._runspec.phy, data_frame_bytes=frame_bytes, margin_ms=margin_ms
+            )
+        # Bitmap ACKs are longer and RX may hold them for up to ack_delay_ms.
+        return estimate_ack_timeout_ms(
+            self._runspec.phy,
+            data_frame_bytes=frame_bytes,
+            ack_frame_bytes=4 + tx.ack_bitmap_bits // 8,
+            margin_ms=margin_ms + tx.ack_delay_ms,
+        )
+
+    def _ack_timeout_ms(self, frame_bytes: int) -> int:
+        tx = self._runspec.tx
+        if tx.ack_timeout_ms is not None:
+            return tx.ack_timeout_ms
+        estimate_ms = self._estimated_ack_timeout_ms(frame_bytes)
+        if self._rtt is None:
+            return estimate_ms
+        # No ACK can arrive before both frames are on air; the static estimate seeds the RTO.
+        return self._rtt.timeout_ms(
+            estimate_ms,
+            min_ms=self._estimated_ack_timeout_ms(frame_bytes, margin_ms=0),
+            max_ms=ADAPTIVE_ACK_TIMEOUT_MAX_FACTOR * estimate_ms,
+        )
+
+    def _rtt_fields(self, frame_bytes: int) -> Dict[str, object]:
+        if self._rtt is None:
+            return {}
+        return self._rtt.state(self._estimated_ack_timeout_ms(frame_bytes))
+
     def is_done(self) -> bool:
         max_windows = self._runspec.tx.max_windows
         if max_windows is None:
             if not self._no_more_samples:
                 return False
-            return not self._pending and not self._gate.inflight()
+            return not self._pending and not self._fec_bodies and not self._gate.inflight()
         return (
-            self._windows_sent >= max_windows
+            self._windows_sent + self._windows_dropped >= max_windows
             and not self._pending
+            and not self._fec_bodies
             and not self._gate.inflight()
         )
 
-    def _queue_window(self) -> None:
+    def _windows_exhausted(self) -> bool:
         if self._no_more_samples:
-            return
+            return True
         max_windows = self._runspec.tx.max_windows
-        if max_windows is not None and self._windows_generated >= max_windows:
+        return max_windows is not None and self._windows_generated >= max_windows
+
+    def _queue_window(self) -> None:
+        if self._windows_exhausted():
             return
         try:
             sample_with_ts = getattr(self._sampler, "sample_with_ts", None)
@@ -181,20 +308,101 @@ class TxNode:
         t0 = time.perf_counter()
         payload = self._codec.encode(processed)
         codec_encode_ms = (time.perf_counter() - t0) * 1000.0
-        if len(payload) > self._max_payload_bytes:
+        codec_cycles = _last_encode_cycles(self._codec)
+        if self._fragment:
+            capacity = self._runspec.tx.max_fragments * self._fragment_body_bytes
+            if len(payload) > capacity:
+                raise ValueError(
+                    f"payload_bytes {len(payload)} exceeds fragmented capacity {capacity} "
+                    f"(max_fragments {self._runspec.tx.max_fragments})"
+                )
+        elif len(payload) > self._frame_payload_bytes:
+            reserved = self._max_payload_bytes - self._frame_payload_bytes
             raise ValueError(
                 f"payload_bytes {len(payload)} exceeds max_payload_bytes {self._max_payload_bytes}"
+                + (f" less {reserved} B FEC overhead" if reserved else "")
             )
-        self._pending.append(
-            PendingWindow(
-                window_id=window_id,
-                payload=payload,
-                built_ms=built_ms,
-                sensor_ts_ms=sensor_ts_ms,
-                codec_encode_ms=codec_encode_ms,
+        if self._aggregate and (
+            len(payload) + aggregate_overhead_bytes(1) > self._aggregate_max_bytes
+        ):
+            raise ValueError(
+                f"payload_bytes {len(payload)} plus aggregate sub-header exceeds "
+                f"aggregate_max_bytes {self._aggregate_max_bytes}"
             )
-        )
+        if self._fragment:
+            # Queued back to back so the fragments of one window get consecutive SEQs.
+            fragments = split_fragments(payload, self._fragment_body_bytes)
+            entries = [
+                PendingWindow(
+                    window_id=window_id,
+                    payload=fragment,
+                    built_ms=built_ms,
+                    sensor_ts_ms=sensor_ts_ms,
+                    codec_encode_ms=codec_encode_ms,
+                    codec_cycles=codec_cycles,
+                    frag_index=index,
+                    frag_count=len(fragments),
+                )
+                for index, fragment in enumerate(fragments)
+            ]
+        else:
+            entries = [
+                PendingWindow(
+                    window_id=window_id,
+                    payload=payload,
+                    built_ms=built_ms,
+                    sensor_ts_ms=sensor_ts_ms,
+                    codec_encode_ms=codec_encode_ms,
+                    codec_cycles=codec_cycles,
+                )
+            ]
         self._windows_generated += 1
+        self._enqueue(entries)
+
+    def _queued_windows(self) -> List[PendingWindow]:
+        """Pending windows with no fragment sent yet, oldest first; only these may be dropped."""
+        return [w for w in self._pending if not w.frag_index]
+
+    def _enqueue(self, entries: List[PendingWindow]) -> None:
+        limit = self._max_pending
+        if limit is None:
+            self._pending.extend(entries)
+            return
+        if self._runspec.tx.pending_policy == "drop_newest":
+            if len(self._queued_windows()) >= limit:
+                self._drop_window(entries[0], "queue_full")
+                return
+            self._pending.extend(entries)
+            return
+        self._pending.extend(entries)
+        queued = self._queued_windows()
+        for window in queued[: len(queued) - limit]:
+            self._drop_window(window, "queue_full")
+
+    def _drop_stale(self) -> None:
+        max_age_ms = self._runspec.tx.pending_max_age_ms
+        if max_age_ms is None:
+            return
+        horizon_ms = self._clock.now_ms() - max_age_ms
+        for window in self._queued_windows():
+            if window.built_ms >= horizon_ms:
+                return  # queued in build order: the rest are fresher
+            self._drop_window(window, "stale")
+
+    def _drop_window(self, window: PendingWindow, reason: str) -> None:
+        self._drop_pending_fragments(window.window_id)
+        self._windows_dropped += 1
+        self._logger.log_event(
+            "tx_dropped",
+            {
+                "window_id": window.window_id,
+                "reason": reason,
+                "policy": self._runspec.tx.pending_policy,
+                "age_ms": self._clock.now_ms() - window.built_ms,
+                "sensor_ts_ms": window.sensor_ts_ms,
+                "pending_windows": len(self._queued_windows()),
+            },
+        )
 
     def _handle_incoming(self) -> None:
         while True:
@@ -206,45 +414,94 @@ class TxNode:
             except PacketError as exc:
                 self._logger.log_event("rx_parse_fail", {"reason": str(exc)})
                 continue
-            if len(packet.payload) != 1:
+            if self._selective_repeat:
+                try:
+                    ack_seqs = parse_ack_payload(packet.payload)
+                except PacketError as exc:
+                    self._logger.log_event("rx_parse_fail", {"reason": str(exc)})
+                    continue
+            elif len(packet.payload) != 1:
                 continue
-            ack_seq = packet.payload[0]
-            inflight = self._gate.mark_acked(ack_seq)
-            if inflight is None:
-                continue
-            now_ms = self._clock.now_ms()
-            rtt_ms = now_ms - inflight.first_tx_ms
-            ack_payload: dict[str, object] = {"ack_seq": ack_seq, "rtt_ms": rtt_ms}
-            window = self._inflight_payloads.get(ack_seq)
-            if window is not None:
-                ack_payload["window_id"] = window.window_id
-                ack_payload["queue_ms"] = inflight.first_tx_ms - window.built_ms
-                ack_payload["e2e_ms"] = now_ms - window.built_ms
-                ack_payload["codec_encode_ms"] = window.codec_encode_ms
-                if window.sensor_ts_ms is not None:
-                    ack_payload["sensor_ts_ms"] = window.sensor_ts_ms
-            if isinstance(self._radio, IRxRssi):
-                rssi_dbm = self._radio.last_rx_rssi_dbm()
-                if rssi_dbm is not None:
-                    ack_payload["rssi_dbm"] = rssi_dbm
-            self._logger.log_event("ack_received", ack_payload)
-            self._inflight_payloads.pop(ack_seq, None)
+            else:
+                ack_seqs = [packet.payload[0]]
+            for inflight in self._gate.mark_acked_many(ack_seqs):
+                self._log_ack(inflight, via_bitmap=inflight.seq != ack_seqs[0])
+
+    def _ack_arrival_ms(self, now_ms: int) -> int:
+        """When the ACK reached the host, if the radio stamps arrivals; else now."""
+        if not isinstance(self._radio, IRxTimestamp):
+            return now_ms
+        arrival_ms = self._radio.last_rx_arrival_ms()
+        return now_ms if arrival_ms is None else min(arrival_ms, now_ms)
+
+    def _log_ack(self, inflight: Inflight, *, via_bitmap: bool) -> None:
+        ack_seq = inflight.seq
+        now_ms = self._clock.now_ms()
+        ack_ms = self._ack_arrival_ms(now_ms)
+        rtt_ms = ack_ms - inflight.first_tx_ms
+        ack_payload: dict[str, object] = {
+            "ack_seq": ack_seq,
+            "rtt_ms": rtt_ms,
+            "attempts": inflight.attempts,
+        }
+        if ack_ms != now_ms:
+            ack_payload["ack_lag_ms"] = now_ms - ack_ms
+        if self._selective_repeat:
+            ack_payload["ack_bitmap"] = via_bitmap
+        window = self._inflight_payloads.get(ack_seq)
+        if window is not None:
+            ack_payload["window_id"] = window.window_id
+            ack_payload.update(_frame_fields(window))
+            ack_payload["queue_ms"] = inflight.first_tx_ms - window.built_ms
+            ack_payload["e2e_ms"] = ack_ms - window.built_ms
+            ack_payload["codec_encode_ms"] = window.codec_encode_ms
+            if window.sensor_ts_ms is not None:
+                ack_payload["sensor_ts_ms"] = window.sensor_ts_ms
+        if isinstance(self._radio, IRxRssi):
+            rssi_dbm = self._radio.last_rx_rssi_dbm()
+            if rssi_dbm is not None:
+                ack_payload["rssi_dbm"] = rssi_dbm
+        self._logger.log_event("ack_received", ack_payload)
+        self._inflight_payloads.pop(ack_seq, None)
+        if self._rtt is not None and inflight.attempts == 1 and not via_bitmap:
+            # Karn's rule: a retransmitted frame's ACK cannot be matched to one send.
+            self._rtt.observe(rtt_ms)
+
+    def _airtime_clear(self, toa_ms: float) -> bool:
+        """Duty-cycle check; once a frame is denied, lower-priority frames wait this pass too."""
+        if self._airtime_wait_ms is not None:
+            return False
+        if self._gate.airtime_allows(toa_ms):
+            return True
+        self._airtime_wait_ms = self._gate.airtime_free_ms(toa_ms)
+        return False
+
+    def _airtime_fields(self) -> Dict[str, object]:
+        headroom_ms = self._gate.airtime_headroom_ms()
+        if headroom_ms is None:
+            return {}
+        return {"airtime_used_ms": self._gate.airtime_used_ms(), "airtime_headroom_ms": headroom_ms}
+
+    def _back_off(self) -> None:
+        """Double the adaptive RTO once per retry pass, however many frames timed out."""
+        if self._rtt is not None and not self._backed_off:
+            self._rtt.on_timeout()
+            self._backed_off = True
 
     def _retry_expired(self) -> None:
+        self._backed_off = False
         for seq in list(self._gate.expired_sequences()):
             inflight_payload = self._inflight_payloads.get(seq)
             if inflight_payload is None:
                 continue
-            if not self._gate.can_send():
+            if not self._gate.channel_clear():
                 continue
             frame_bytes = 2 + len(inflight_payload.payload)
             toa_ms = estimate_toa_ms(self._runspec.phy, frame_bytes)
-            ack_timeout_ms = self._runspec.tx.ack_timeout_ms
-            if ack_timeout_ms is None:
-                ack_timeout_ms = estimate_ack_timeout_ms(
-                    self._runspec.phy,
-                    data_frame_bytes=frame_bytes,
-                )
+            if not self._airtime_clear(toa_ms):
+                continue
+            self._back_off()
+            ack_timeout_ms = self._ack_timeout_ms(frame_bytes)
             attempt = self._gate.record_send(seq, toa_ms, ack_timeout_ms=ack_timeout_ms)
             packet = Packet(payload=inflight_payload.payload, seq=seq)
             self._radio.send(packet.to_bytes(max_payload_bytes=self._max_payload_bytes))
@@ -262,10 +519,15 @@ class TxNode:
                     "attempt": attempt,
                     "age_ms": now_ms - inflight_payload.built_ms,
                     "codec_encode_ms": inflight_payload.codec_encode_ms,
+                    "codec_cycles": inflight_payload.codec_cycles,
                     "sensor_ts_ms": inflight_payload.sensor_ts_ms,
+                    **_frame_fields(inflight_payload),
+                    **self._rtt_fields(frame_bytes),
+                    **self._airtime_fields(),
                 },
             )
         for inflight in list(self._gate.expired_failures()):
+            self._back_off()
             window = self._inflight_payloads.get(inflight.seq)
             payload: Dict[str, object] = {
                 "seq": inflight.seq,
@@ -274,30 +536,142 @@ class TxNode:
             }
             if window is not None:
                 payload["window_id"] = window.window_id
+                payload.update(_frame_fields(window))
+                if window.frag_count is not None:
+                    # The window cannot be reassembled any more; skip its unsent fragments.
+                    payload["fragments_dropped"] = self._drop_pending_fragments(window.window_id)
             self._logger.log_event("tx_failed", payload)
             self._inflight_payloads.pop(inflight.seq, None)
 
+    def _drop_pending_fragments(self, window_id: int) -> int:
+        kept = deque(w for w in self._pending if w.window_id != window_id)
+        dropped = len(self._pending) - len(kept)
+        self._pending = kept
+        return dropped
+
+    def _aggregate_plan(self) -> Tuple[int, int]:
+        """
+        Number of pending windows that fit the next aggregated frame, and when it may be sent:
+        right away once full (or no more windows will come), else `aggregate_delay_ms` after
+        the oldest window was built.
+        """
+        max_windows = self._runspec.tx.aggregate_max_windows
+        count = 0
+        payload_bytes = 0
+        for window in self._pending:
+            if count >= max_windows:
+                break
+            needed = aggregate_overhead_bytes(count + 1) + payload_bytes + len(window.payload)
+            if needed > self._aggregate_max_bytes:
+                break
+            payload_bytes += len(window.payload)
+            count += 1
+        full = count >= max_windows or count < len(self._pending)
+        ready_ms = self._pending[0].built_ms
+        if not full and not self._windows_exhausted():
+            ready_ms += self._runspec.tx.aggregate_delay_ms
+        return count, ready_ms
+
+    def _peek_aggregate(self) -> Tuple[PendingWindow, int] | None:
+        """The next aggregated frame and how many pending windows it takes, once due."""
+        count, ready_ms = self._aggregate_plan()
+        if self._clock.now_ms() < ready_ms:
+            return None
+        batch = [self._pending[i] for i in range(count)]
+        cycles = [w.codec_cycles for w in batch if w.codec_cycles is not None]
+        return PendingWindow(
+            window_id=batch[0].window_id,
+            payload=pack_windows([w.payload for w in batch]),
+            built_ms=batch[0].built_ms,
+            sensor_ts_ms=batch[0].sensor_ts_ms,
+            codec_encode_ms=sum(w.codec_encode_ms for w in batch),
+            codec_cycles=max(cycles) if cycles else None,
+            window_ids=tuple(w.window_id for w in batch),
+        ), count
+
+    def _fec_parity_due(self) -> bool:
+        if not self._fec_bodies:
+            return False
+        # Groups only close between whole windows: a parity SEQ between two fragments would
+        # break their consecutive SEQs, and RX could never reassemble the window.
+        following = self._pending[0] if self._pending else None
+        if following is not None and following.frag_count is not None:
+            if following.frag_index:
+                return False
+            if len(self._fec_bodies) + following.frag_count > MAX_FEC_GROUP:
+                return True
+        if len(self._fec_bodies) >= self._fec_group:
+            return True
+        # Close a short last group once no more data frames will join it.
+        return not self._pending and self._windows_exhausted()
+
+    def _send_parity(self) -> None:
+        """Send the XOR parity of the current group; it is never ACKed or retried."""
+        payload = xor_parity(self._fec_bodies)
+        frame_bytes = 2 + len(payload)
+        toa_ms = estimate_toa_ms(self._runspec.phy, frame_bytes)
+        if not self._airtime_clear(toa_ms):
+            return
+        seq = self._seq
+        self._seq = (self._seq + 1) % 256
+        self._gate.record_unacked_send(toa_ms)
+        packet = Packet(payload=payload, seq=seq)
+        self._radio.send(packet.to_bytes(max_payload_bytes=self._max_payload_bytes))
+        self._logger.log_event(
+            "tx_sent",
+            {
+                "seq": seq,
+                "payload_bytes": len(payload),
+                "frame_bytes": frame_bytes,
+                "toa_ms_est": toa_ms,
+                "guard_ms": self._runspec.tx.guard_ms,
+                "attempt": 1,
+                "fec_parity": True,
+                "fec_group_count": len(self._fec_bodies),
+                **self._airtime_fields(),
+            },
+        )
+        self._fec_bodies = []
+
     def _send_pending(self) -> None:
+        if self._fec_parity_due():
+            # Data frames of a group and its parity must take consecutive SEQs.
+            if self._gate.channel_clear():
+                self._send_parity()
+            return
         if not self._pending:
             return
         if not self._gate.can_send():
             return
-        window = self._pending.popleft()
-        seq = self._seq
-        self._seq = (self._seq + 1) % 256
+        if self._aggregate:
+            peeked = self._peek_aggregate()
+            if peeked is None:
+                return
+            window, count = peeked
+        else:
+            window, count = self._pending[0], 1
+        if self._fec_group:
+            body = window.payload
+            window = replace(window, payload=fec_data_payload(len(self._fec_bodies), body))
         frame_bytes = 2 + len(window.payload)
         toa_ms = estimate_toa_ms(self._runspec.phy, frame_bytes)
-        ack_timeout_ms = self._runspec.tx.ack_timeout_ms
-        if ack_timeout_ms is None:
-            ack_timeout_ms = estimate_ack_timeout_ms(
-                self._runspec.phy,
-                data_frame_bytes=frame_bytes,
-            )
+        if not self._airtime_clear(toa_ms):
+            return
+        for _ in range(count):
+            self._pending.popleft()
+        if self._fec_group:
+            self._fec_bodies.append(body)
+        seq = self._seq
+        self._seq = (self._seq + 1) % 256
+        ack_timeout_ms = self._ack_timeout_ms(frame_bytes)
         attempt = self._gate.record_send(seq, toa_ms, ack_timeout_ms=ack_timeout_ms)
         packet = Packet(payload=window.payload, seq=seq)
         self._radio.send(packet.to_bytes(max_payload_bytes=self._max_payload_bytes))
         self._inflight_payloads[seq] = window
-        self._windows_sent += 1
+        if window.window_ids is not None:
+            self._windows_sent += len(window.window_ids)
+        elif not window.frag_index:
+            self._windows_sent += 1
         now_ms = self._clock.now_ms()
         self._logger.log_event(
             "tx_sent",
@@ -312,24 +686,82 @@ class TxNode:
                 "attempt": attempt,
                 "age_ms": now_ms - window.built_ms,
                 "codec_encode_ms": window.codec_encode_ms,
+                "codec_cycles": window.codec_cycles,
                 "sensor_ts_ms": window.sensor_ts_ms,
+                **_frame_fields(window),
+                **self._rtt_fields(frame_bytes),
+                **self._airtime_fields(),
             },
         )
 
     def process_once(self) -> None:
         if self._stop:
             return
-        self._queue_window()
+        log_tx_drains(self._tx_drains, self._logger)
+        if self._sample_due():
+            self._queue_window()
         self._handle_incoming()
-        self._retry_expired()
-        self._send_pending()
+        self._drop_stale()
+        self._airtime_wait_ms = None
+        if self._retries_first:
+            self._retry_expired()
+            self._send_pending()
+        else:
+            self._send_pending()
+            self._retry_expired()
 
-    def run(self, step_ms: int = 5) -> None:
+    def next_wakeup_ms(self) -> int | None:
+        """
+        Earliest time `process_once()` has timed work: the next paced sample, an ACK deadline,
+        or a queued frame (parity, window or aggregate) once the gate lets it go. None means
+        nothing is due until a frame arrives.
+        """
+        now_ms = self._clock.now_ms()
+        free_ms = self._gate.channel_free_ms()
+        channel_ms = now_ms if free_ms is None else free_ms
+        if self._airtime_wait_ms is not None:
+            channel_ms = max(channel_ms, self._airtime_wait_ms)
+        wakes: List[int] = []
+        if self._sample_period_ms is not None and not self._windows_exhausted():
+            wakes.append(math.ceil(self._next_sample_ms))
+        deadline_ms = self._gate.next_deadline_ms()
+        if deadline_ms is not None:
+            wakes.append(max(deadline_ms, channel_ms))
+        if self._fec_parity_due():
+            wakes.append(channel_ms)
+        elif self._pending and self._gate.has_free_slot():
+            send_ms = channel_ms
+            if self._aggregate:
+                send_ms = max(send_ms, self._aggregate_plan()[1])
+            wakes.append(send_ms)
+        return min(wakes) if wakes else None
+
+    def run(
+        self,
+        step_ms: int = 5,
+        *,
+        event_driven: bool = False,
+        max_idle_ms: int = DEFAULT_MAX_IDLE_MS,
+    ) -> None:
+        """
+        Run until done or stopped. Polled loops sleep `step_ms` per step; event-driven loops
+        pace samples at `sample_hz` and sleep until `next_wakeup_ms()` or an incoming frame.
+        """
+        stats = LoopStats("event" if event_driven else "poll", self._clock.now_ms())
+        if event_driven:
+            self.pace_samples()
         while not self._stop and not self.is_done():
             self.process_once()
-            self._clock.sleep_ms(step_ms)
+            if self._stop or self.is_done():
+                break
+            if event_driven:
+                stats.wait(self._clock, self._radio, self.next_wakeup_ms(), max_idle_ms)
+            else:
+                stats.sleep(self._clock, step_ms)
+        log_tx_drains(self._tx_drains, self._logger)
+        self._logger.log_event("run_loop", stats.fields(self._clock.now_ms()))
 
     def metrics(self) -> dict:
-        return self._gate.metrics()
+        return {**self._gate.metrics(), "windows_dropped": self._windows_dropped}
 
 
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from loralink_mllc.codecs.bam import BamCodec
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise SystemExit(
+            "numpy is required. Install with `python -m pip install -e .[bam]`."
+        ) from exc
+    return np
+
+
+def _parse_int_list_csv(value: str) -> list[int]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if not items:
+        raise argparse.ArgumentTypeError("expected a comma-separated list of ints")
+    try:
+        return [int(item) for item in items]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid int list: {value}") from exc
+
+
+def _write_synthetic_model(
+    out_dir: Path,
+    *,
+    input_len: int,
+    hidden_dims: list[int],
+    latent_dim: int,
+    packing: str,
+    delta: float | None,
+    cycles: int,
+    seed: int,
+) -> Path:
+    np = _require_numpy()
+    rng = np.random.default_rng(seed)
+    model_dir = out_dir / "model"
+    model_dir.mkdir(parents=True, exist_ok=True)
+    dims = [input_len, *hidden_dims, latent_dim]
+    for idx in range(len(dims) - 1):
+        in_dim, out_dim = dims[idx], dims[idx + 1]
+        W = (rng.standard_normal((out_dim, in_dim)) / np.sqrt(in_dim)).astype(np.float32)
+        np.savez(model_dir / f"layer_{idx}.npz", W=W, V=W.T.copy())
+    scale = {"int8": 127.0, "int16": 32767.0}.get(packing)
+    manifest = {
+        "manifest_version": "1",
+        "model_format": "layer_npz_v1",
+        "model_path": "model",
+        "latent_dim": latent_dim,
+        "packing": packing,
+        "scale": scale,
+        "delta": delta,
+        "encode_cycles": cycles,
+        "decode_cycles": cycles,
+        "input_dims": input_len,
+        "window_W": 1,
+        "window_stride": 1,
+        "notes": "synthetic benchmark model",
+    }
+    manifest_path = out_dir / "bam_manifest.json"
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest_path
+
+
+def _best_of(repeat: int, fn) -> float:  # type: ignore[no-untyped-def]
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _bench(codec: BamCodec, windows: Any, repeat: int) -> Dict[str, Any]:
+    n = int(windows.shape[0])
+    rows = [window.tolist() for window in windows]
+    np = _require_numpy()
+    payloads = codec.encode_batch(windows)
+    if payloads != [codec.encode(row) for row in rows]:
+        raise SystemExit(f"encode_batch mismatch vs encode at N={n}")
+    recon = codec.decode_batch(payloads)
+    single_recon = np.asarray([codec.decode(payload) for payload in payloads])
+    if not np.array_equal(recon, single_recon):
+        raise SystemExit(f"decode_batch mismatch vs decode at N={n}")
+
+    enc_loop_s = _best_of(repeat, lambda: [codec.encode(row) for row in rows])
+    enc_batch_s = _best_of(repeat, lambda: codec.encode_batch(windows))
+    dec_loop_s = _best_of(repeat, lambda: [codec.decode(payload) for payload in payloads])
+    dec_batch_s = _best_of(repeat, lambda: codec.decode_batch(payloads))
+    return {
+        "n": n,
+        "encode_us_per_window": {
+            "loop": enc_loop_s / n * 1e6,
+            "batch": enc_batch_s / n * 1e6,
+            "speedup": enc_loop_s / enc_batch_s if enc_batch_s else None,
+        },
+        "decode_us_per_window": {
+            "loop": dec_loop_s / n * 1e6,
+            "batch": dec_batch_s / n * 1e6,
+            "speedup": dec_loop_s / dec_batch_s if dec_batch_s else None,
+        },
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description="Benchmark BamCodec per-window encode/decode vs encode_batch/decode_batch."
+    )
+    p.add_argument(
+        "--bam-manifest",
+        default=None,
+        help="Benchmark an existing bam_manifest.json (default: synthetic random model)",
+    )
+    p.add_argument("--input-len", type=int, default=96, help="Synthetic input length (W*D)")
+    p.add_argument(
+        "--hidden-dims",
+        type=_parse_int_list_csv,
+        default=[64, 32],
+        help="Synthetic hidden layer dims, comma-separated (default: 64,32)",
+    )
+    p.add_argument("--latent-dim", type=int, default=16, help="Synthetic latent dim")
+    p.add_argument(
+        "--packing",
+        default="int8",
+        choices=["int8", "int16", "float16", "float32"],
+        help="Synthetic payload packing (default: int8)",
+    )
+    p.add_argument("--delta", type=float, default=0.1, help="Synthetic transmission delta")
+    p.add_argument("--cycles", type=int, default=0, help="Synthetic encode/decode cycles")
+    p.add_argument(
+        "--sizes",
+        type=_parse_int_list_csv,
+        default=[1, 64, 4096],
+        help="Batch sizes N, comma-separated (default: 1,64,4096)",
+    )
+    p.add_argument("--repeat", type=int, default=3, help="Best-of repeats per timing")
+    p.add_argument("--seed", type=int, default=0, help="RNG seed")
+    p.add_argument("--out", default=None, help="Write report JSON to this path (default: print)")
+    return p
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.repeat <= 0:
+        raise SystemExit("--repeat must be > 0")
+    if any(n <= 0 for n in args.sizes):
+        raise SystemExit("--sizes must be > 0")
+    np = _require_numpy()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.bam_manifest:
+            manifest_path = Path(args.bam_manifest)
+            if not manifest_path.exists():
+                raise SystemExit(f"bam manifest not found: {manifest_path}")
+        else:
+            manifest_path = _write_synthetic_model(
+                Path(tmp),
+                input_len=int(args.input_len),
+                hidden_dims=list(args.hidden_dims),
+                latent_dim=int(args.latent_dim),
+                packing=str(args.packing),
+                delta=float(args.delta),
+                cycles=int(args.cycles),
+                seed=int(args.seed),
+            )
+        codec = BamCodec.from_manifest(str(manifest_path))
+        input_len = codec._artifacts.expected_input_len()
+        rng = np.random.default_rng(int(args.seed))
+        results = []
+        for n in args.sizes:
+            windows = rng.uniform(-1.0, 1.0, size=(int(n), input_len)).astype(np.float32)
+            results.append(_bench(codec, windows, int(args.repeat)))
+
+    report = {
+        "bam_manifest": str(args.bam_manifest) if args.bam_manifest else None,
+        "payload_schema": codec.payload_schema(),
+        "input_len": input_len,
+        "results": results,
+    }
+    out = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(out, encoding="utf-8")
+    else:
+        print(out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
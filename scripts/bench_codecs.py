@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from loralink_mllc.codecs.raw import RawCodec
+from loralink_mllc.codecs.sensor12_packed import Sensor12PackedCodec
+from loralink_mllc.codecs.zlib_codec import ZlibCodec
+
+
+def _parse_int_list_csv(value: str) -> list[int]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if not items:
+        raise argparse.ArgumentTypeError("expected a comma-separated list of ints")
+    try:
+        return [int(item) for item in items]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid int list: {value}") from exc
+
+
+def _best_of(repeat: int, fn) -> float:  # type: ignore[no-untyped-def]
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _make_codecs(*, numpy: bool) -> Dict[str, Any]:
+    codecs: Dict[str, Any] = {
+        "raw": RawCodec(),
+        "zlib": ZlibCodec(inner=RawCodec()),
+        "sensor12_packed": Sensor12PackedCodec(),
+    }
+    if not numpy:
+        codecs["raw"]._np = None
+        codecs["sensor12_packed"]._np = None
+        codecs["zlib"]._inner._np = None
+    return codecs
+
+
+def _bench(name: str, codec: Any, windows: list[list[float]], repeat: int) -> Dict[str, Any]:
+    n = len(windows)
+    payloads = [codec.encode(window) for window in windows]
+    enc_s = _best_of(repeat, lambda: [codec.encode(window) for window in windows])
+    dec_s = _best_of(repeat, lambda: [codec.decode(payload) for payload in payloads])
+    result: Dict[str, Any] = {
+        "encode_us_per_window": enc_s / n * 1e6,
+        "decode_us_per_window": dec_s / n * 1e6,
+        "payload_bytes": len(payloads[0]),
+    }
+    if hasattr(codec, "encode_batch"):
+        if codec.encode_batch(windows) != payloads:
+            raise SystemExit(f"{name}: encode_batch mismatch vs encode")
+        if codec.decode_batch(payloads) != [list(codec.decode(p)) for p in payloads]:
+            raise SystemExit(f"{name}: decode_batch mismatch vs decode")
+        enc_b = _best_of(repeat, lambda: codec.encode_batch(windows))
+        dec_b = _best_of(repeat, lambda: codec.decode_batch(payloads))
+        result["encode_batch_us_per_window"] = enc_b / n * 1e6
+        result["decode_batch_us_per_window"] = dec_b / n * 1e6
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description=(
+            "Microbenchmark RAW-mode codecs (raw, zlib, sensor12_packed) per window and in batch, "
+            "with and without the numpy fast path."
+        )
+    )
+    p.add_argument(
+        "--dims",
+        type=_parse_int_list_csv,
+        default=[12, 96, 240],
+        help="Window lengths D (multiples of 12), comma-separated (default: 12,96,240)",
+    )
+    p.add_argument("--windows", type=int, default=2000, help="Windows per timing (default: 2000)")
+    p.add_argument("--repeat", type=int, default=3, help="Best-of repeats per timing")
+    p.add_argument("--seed", type=int, default=0, help="RNG seed")
+    p.add_argument("--out", default=None, help="Write report JSON to this path (default: print)")
+    return p
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.repeat <= 0 or args.windows <= 0:
+        raise SystemExit("--repeat and --windows must be > 0")
+    if any(d <= 0 or d % 12 for d in args.dims):
+        raise SystemExit("--dims must be positive multiples of 12")
+
+    rng = random.Random(int(args.seed))
+    results = []
+    for dim in args.dims:
+        windows = [[rng.uniform(-1.0, 1.0) for _ in range(dim)] for _ in range(args.windows)]
+        fast = _make_codecs(numpy=True)
+        slow = _make_codecs(numpy=False)
+        for name in fast:
+            if [fast[name].encode(w) for w in windows] != [slow[name].encode(w) for w in windows]:
+                raise SystemExit(f"{name}: numpy and struct paths disagree")
+        results.append(
+            {
+                "dim": dim,
+                "numpy": {
+                    name: _bench(name, codec, windows, int(args.repeat))
+                    for name, codec in fast.items()
+                },
+                "struct": {
+                    name: _bench(name, codec, windows, int(args.repeat))
+                    for name, codec in slow.items()
+                },
+            }
+        )
+
+    out = json.dumps({"windows": args.windows, "results": results}, indent=2)
+    if args.out:
+        Path(args.out).write_text(out, encoding="utf-8")
+    else:
+        print(out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
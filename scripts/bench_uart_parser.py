@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from loralink_mllc.radio.uart_framing import (
+    ParsedUartFrame,
+    UartFrameParser,
+    encode_uart_frame,
+)
+
+
+class _LegacyParser:
+    """The previous copy-and-delete parser (drops one byte per invalid LEN), for comparison."""
+
+    def __init__(self, *, max_payload_bytes: int) -> None:
+        self._max_payload_bytes = max_payload_bytes
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        self._buf.extend(data)
+
+    def pop(self) -> ParsedUartFrame | None:
+        while True:
+            if len(self._buf) < 2:
+                return None
+            length = self._buf[0]
+            if length > self._max_payload_bytes:
+                del self._buf[0]
+                continue
+            total = 2 + length
+            if len(self._buf) < total:
+                return None
+            frame = bytes(self._buf[:total])
+            del self._buf[:total]
+            return ParsedUartFrame(frame=frame, rssi_dbm=None)
+
+
+def _best_of(repeat: int, fn) -> float:  # type: ignore[no-untyped-def]
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _chunks(stream: bytes, chunk_bytes: int) -> List[bytes]:
+    return [stream[i : i + chunk_bytes] for i in range(0, len(stream), chunk_bytes)]
+
+
+def _run(parser: Any, chunks: List[bytes]) -> List[bytes]:
+    frames = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        while (parsed := parser.pop()) is not None:
+            frames.append(bytes(parsed.frame))
+    return frames
+
+
+def _make_stream(
+    rng: random.Random,
+    *,
+    size_bytes: int,
+    max_payload_bytes: int,
+    garbage_ratio: float,
+    framing_version: int,
+) -> bytes:
+    """Frames interleaved with noise; noise bytes are > max_payload_bytes so v1 cannot sync."""
+    out = bytearray()
+    while len(out) < size_bytes:
+        if rng.random() < garbage_ratio:
+            out += bytes(rng.randrange(max_payload_bytes + 1, 256) for _ in range(64))
+            continue
+        length = rng.randrange(1, max_payload_bytes + 1)
+        frame = bytes([length, rng.randrange(256)]) + rng.randbytes(length)
+        out += encode_uart_frame(frame, framing_version)
+    return bytes(out)
+
+
+def _bench(
+    name: str, stream: bytes, chunk_bytes: int, repeat: int, *, max_payload_bytes: int, **kw: Any
+) -> Dict[str, Any]:
+    chunks = _chunks(stream, chunk_bytes)
+
+    def make() -> Any:
+        if name == "legacy":
+            return _LegacyParser(max_payload_bytes=max_payload_bytes)
+        return UartFrameParser(max_payload_bytes=max_payload_bytes, **kw)
+
+    probe = make()
+    frames = _run(probe, chunks)
+    seconds = _best_of(repeat, lambda: _run(make(), chunks))
+    result: Dict[str, Any] = {
+        "mb_per_s": len(stream) / seconds / 1e6,
+        "frames": len(frames),
+    }
+    if name != "legacy":
+        result["parse_errors"] = probe.parse_errors
+        result["resync_bytes"] = probe.resync_bytes
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description=(
+            "Fuzz-benchmark the UART frame parser on garbage and mixed streams: the legacy "
+            "copy-and-delete parser vs the offset-based parser with framing v1 and v2."
+        )
+    )
+    p.add_argument("--bytes", type=int, default=1_000_000, help="Stream size (default: 1e6)")
+    p.add_argument("--chunk-bytes", type=int, default=256, help="Bytes per feed() (default: 256)")
+    p.add_argument(
+        "--max-payload-bytes", type=int, default=64, help="Parser LEN limit (default: 64)"
+    )
+    p.add_argument("--repeat", type=int, default=3, help="Best-of repeats per timing")
+    p.add_argument("--seed", type=int, default=0, help="RNG seed")
+    p.add_argument("--out", default=None, help="Write report JSON to this path (default: print)")
+    return p
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.repeat <= 0 or args.bytes <= 0 or args.chunk_bytes <= 0:
+        raise SystemExit("--repeat, --bytes and --chunk-bytes must be > 0")
+    if not 1 <= args.max_payload_bytes <= 254:
+        raise SystemExit("--max-payload-bytes must be 1..254")
+
+    max_len = int(args.max_payload_bytes)
+    results = []
+    for label, garbage_ratio in (("garbage", 1.0), ("mixed", 0.5), ("clean", 0.0)):
+        rng = random.Random(int(args.seed))
+        v1 = _make_stream(
+            rng,
+            size_bytes=args.bytes,
+            max_payload_bytes=max_len,
+            garbage_ratio=garbage_ratio,
+            framing_version=1,
+        )
+        v2 = _make_stream(
+            rng,
+            size_bytes=args.bytes,
+            max_payload_bytes=max_len,
+            garbage_ratio=garbage_ratio,
+            framing_version=2,
+        )
+        legacy = _run(_LegacyParser(max_payload_bytes=max_len), _chunks(v1, args.chunk_bytes))
+        new = _run(UartFrameParser(max_payload_bytes=max_len), _chunks(v1, args.chunk_bytes))
+        if legacy != new:
+            raise SystemExit(f"{label}: v1 parser output differs from the legacy parser")
+        common = {"max_payload_bytes": max_len}
+        results.append(
+            {
+                "stream": label,
+                "legacy_v1": _bench("legacy", v1, args.chunk_bytes, args.repeat, **common),
+                "offset_v1": _bench("offset", v1, args.chunk_bytes, args.repeat, **common),
+                "offset_v2": _bench(
+                    "offset", v2, args.chunk_bytes, args.repeat, framing_version=2, **common
+                ),
+            }
+        )
+
+    report = {"bytes": args.bytes, "chunk_bytes": args.chunk_bytes, "results": results}
+    out = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(out, encoding="utf-8")
+    else:
+        print(out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import time
+from pathlib import Path
+
+from loralink_mllc.codecs.bam import BamCodec, parse_layer_index, require_numpy, resolve_path
+from loralink_mllc.codecs.bam_artifacts import BamArtifacts
+
+
+def _load_seconds(manifest: Path) -> float:
+    t0 = time.perf_counter()
+    BamCodec.from_manifest(str(manifest), use_cache=False)
+    return time.perf_counter() - t0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description=(
+            "Convert a layer_npz_v1 BAM model to layer_npy_mmap_v1 (one float32 .npy per W/V, "
+            "memory-mapped read-only at load time)."
+        )
+    )
+    p.add_argument("--bam-manifest", required=True, help="Source layer_npz_v1 bam_manifest.json")
+    p.add_argument("--out-dir", required=True, help="Output directory for the mmap model")
+    p.add_argument("--force", action="store_true", help="Overwrite existing outputs in out-dir")
+    return p
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    src_manifest = Path(args.bam_manifest).resolve()
+    if not src_manifest.exists():
+        raise SystemExit(f"bam manifest not found: {src_manifest}")
+    artifacts = BamArtifacts.load(src_manifest)
+    if artifacts.model_format != "layer_npz_v1":
+        raise SystemExit("only model_format layer_npz_v1 can be converted to layer_npy_mmap_v1")
+
+    out_dir = Path(args.out_dir).resolve()
+    out_manifest = out_dir / "bam_manifest.json"
+    if out_manifest.exists() and not args.force:
+        raise SystemExit(f"bam manifest already exists: {out_manifest} (use --force)")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    np = require_numpy()
+    src_dir = src_manifest.parent
+    model_dir = resolve_path(src_dir, artifacts.model_path)
+    layer_files = sorted(model_dir.glob("layer_*.npz"), key=parse_layer_index)
+    if not layer_files:
+        raise SystemExit(f"no layer_*.npz files found in {model_dir}")
+
+    weight_bytes = 0
+    for layer_path in layer_files:
+        idx = parse_layer_index(layer_path)
+        with np.load(layer_path) as data:
+            for name in ("W", "V"):
+                # np.save pads the header so the C-contiguous data starts 64-byte aligned.
+                array = np.ascontiguousarray(data[name], dtype=np.float32)
+                np.save(out_dir / f"layer_{idx}_{name}.npy", array, allow_pickle=False)
+                weight_bytes += int(array.nbytes)
+
+    data = json.loads(src_manifest.read_text(encoding="utf-8"))
+    data["model_format"] = "layer_npy_mmap_v1"
+    data["model_path"] = "."
+    if artifacts.norm_path:
+        shutil.copyfile(resolve_path(src_dir, artifacts.norm_path), out_dir / "norm.json")
+        data["norm_path"] = "norm.json"
+    out_manifest.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    report = {
+        "source_bam_manifest": str(src_manifest),
+        "mmap_bam_manifest": str(out_manifest),
+        "layers": len(layer_files),
+        "weight_bytes": weight_bytes,
+        "load_s": {
+            "layer_npz_v1": _load_seconds(src_manifest),
+            "layer_npy_mmap_v1": _load_seconds(out_manifest),
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from loralink_mllc.codecs.bam import (
+    BamCodec,
+    parse_layer_index,
+    quantize_rows_int8,
+    require_numpy,
+    resolve_path,
+)
+from loralink_mllc.codecs.bam_artifacts import BamArtifacts
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _prepare_env() -> dict[str, str]:
+    env = dict(os.environ)
+    root = str(_repo_root())
+    py_path = env.get("PYTHONPATH", "")
+    if not py_path:
+        env["PYTHONPATH"] = root
+    elif root not in py_path.split(os.pathsep):
+        env["PYTHONPATH"] = os.pathsep.join([root, py_path])
+    return env
+
+
+def _eval(bam_manifest: Path, args: argparse.Namespace, env: dict[str, str]) -> Dict[str, Any]:
+    eval_args = [
+        str(_repo_root() / "scripts" / "eval_bam_dataset.py"),
+        "--dataset",
+        str(args.dataset),
+        "--bam-manifest",
+        str(bam_manifest),
+        "--subset",
+        str(args.subset),
+        "--train-ratio",
+        str(args.train_ratio),
+        "--split-seed",
+        str(args.split_seed),
+    ]
+    if args.max_samples is not None:
+        eval_args.extend(["--max-samples", str(args.max_samples)])
+    proc = subprocess.run(
+        [sys.executable, *eval_args],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return json.loads(proc.stdout)
+
+
+def _delta(q8: Dict[str, Any], ref: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        "mae": float(q8["mae"]) - float(ref["mae"]),
+        "mse": float(q8["mse"]) - float(ref["mse"]),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description=(
+            "Convert a layer_npz_v1 BAM model to layer_npz_q8 (per-row int8 weights) and "
+            "optionally report the MAE/MSE delta vs float32 on dataset_raw.jsonl."
+        )
+    )
+    p.add_argument("--bam-manifest", required=True, help="Source layer_npz_v1 bam_manifest.json")
+    p.add_argument("--out-dir", required=True, help="Output directory for the q8 model")
+    p.add_argument("--force", action="store_true", help="Overwrite existing outputs in out-dir")
+    p.add_argument("--dataset", default=None, help="dataset_raw.jsonl for the accuracy report")
+    p.add_argument(
+        "--subset",
+        default="all",
+        choices=["all", "train", "holdout"],
+        help="Dataset subset to evaluate (default: all)",
+    )
+    p.add_argument("--train-ratio", type=float, default=1.0, help="Split ratio (default: 1.0)")
+    p.add_argument("--split-seed", type=int, default=0, help="Split seed (default: 0)")
+    p.add_argument("--max-samples", type=int, default=None, help="Limit dataset windows (debug)")
+    p.add_argument(
+        "--report",
+        default="q8_report.json",
+        help="Report filename written under out-dir (default: q8_report.json)",
+    )
+    return p
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    src_manifest = Path(args.bam_manifest).resolve()
+    if not src_manifest.exists():
+        raise SystemExit(f"bam manifest not found: {src_manifest}")
+    artifacts = BamArtifacts.load(src_manifest)
+    if artifacts.model_format != "layer_npz_v1":
+        raise SystemExit("only model_format layer_npz_v1 can be converted to layer_npz_q8")
+    if args.dataset is not None and not Path(args.dataset).exists():
+        raise SystemExit(f"dataset not found: {args.dataset}")
+
+    out_dir = Path(args.out_dir).resolve()
+    out_manifest = out_dir / "bam_manifest.json"
+    if out_manifest.exists() and not args.force:
+        raise SystemExit(f"bam manifest already exists: {out_manifest} (use --force)")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    np = require_numpy()
+    src_dir = src_manifest.parent
+    model_dir = resolve_path(src_dir, artifacts.model_path)
+    layer_files = sorted(model_dir.glob("layer_*.npz"), key=parse_layer_index)
+    if not layer_files:
+        raise SystemExit(f"no layer_*.npz files found in {model_dir}")
+
+    float_bytes = 0
+    q8_bytes = 0
+    for layer_path in layer_files:
+        with np.load(layer_path) as data:
+            W = np.asarray(data["W"], dtype=np.float32)
+            V = np.asarray(data["V"], dtype=np.float32)
+        W_q8 = quantize_rows_int8(W)
+        V_q8 = quantize_rows_int8(V)
+        np.savez(
+            out_dir / layer_path.name,
+            W_q=W_q8.q,
+            W_scale=W_q8.scale,
+            V_q=V_q8.q,
+            V_scale=V_q8.scale,
+        )
+        float_bytes += int(W.nbytes + V.nbytes)
+        q8_bytes += int(W_q8.q.nbytes + W_q8.scale.nbytes + V_q8.q.nbytes + V_q8.scale.nbytes)
+
+    data = json.loads(src_manifest.read_text(encoding="utf-8"))
+    data["model_format"] = "layer_npz_q8"
+    data["model_path"] = "."
+    if artifacts.norm_path:
+        shutil.copyfile(resolve_path(src_dir, artifacts.norm_path), out_dir / "norm.json")
+        data["norm_path"] = "norm.json"
+    out_manifest.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    BamCodec.from_manifest(str(out_manifest))
+    print(f"Wrote q8 model ({len(layer_files)} layers): {out_manifest}")
+
+    report: Dict[str, Any] = {
+        "source_bam_manifest": str(src_manifest),
+        "q8_bam_manifest": str(out_manifest),
+        "weight_bytes": {
+            "float32": float_bytes,
+            "q8": q8_bytes,
+            "ratio": (float_bytes / q8_bytes) if q8_bytes else None,
+        },
+        "accuracy": None,
+    }
+    if args.dataset is not None:
+        env = _prepare_env()
+        ref = _eval(src_manifest, args, env)
+        q8 = _eval(out_manifest, args, env)
+        by_group = None
+        if ref.get("by_group") and q8.get("by_group"):
+            by_group = {
+                name: _delta(q8["by_group"][name], ref["by_group"][name])
+                for name in ref["by_group"]
+            }
+        report["accuracy"] = {
+            "dataset": str(args.dataset),
+            "subset": str(args.subset),
+            "samples": q8["samples"],
+            "float32": ref["overall"],
+            "q8": q8["overall"],
+            "delta": _delta(q8["overall"], ref["overall"]),
+            "by_group_delta": by_group,
+        }
+
+    report_path = out_dir / str(args.report)
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Wrote q8 report: {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -128,6 +128,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=0,
         help="Seed for deterministic split hashing (default: 0)",
     )
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=1024,
+        help="Windows per encode_batch/decode_batch call (default: 1024)",
+    )
     p.add_argument("--out", default=None, help="Write report JSON to this path (default: print)")
     return p
 
@@ -142,6 +148,8 @@ def main() -> int:
         raise SystemExit(f"bam manifest not found: {bam_manifest_path}")
     if not (0.0 < float(args.train_ratio) <= 1.0):
         raise SystemExit("--train-ratio must be in (0, 1]")
+    if int(args.batch_size) <= 0:
+        raise SystemExit("--batch-size must be > 0")
 
     artifacts = BamArtifacts.load(bam_manifest_path)
     input_len = artifacts.expected_input_len()
@@ -159,40 +167,56 @@ def main() -> int:
     payload_bytes_seen: int | None = None
     sat_count = 0
     sat_total = 0
-    for window in _iter_dataset_windows(
-        dataset,
-        expected_len=input_len,
-        max_samples=args.max_samples,
-        subset=str(args.subset),
-        train_ratio=float(args.train_ratio),
-        split_seed=int(args.split_seed),
-    ):
-        payload = codec.encode(window)
-        packing = artifacts.packing.lower()
+    packing = artifacts.packing.lower()
+    group_idx = (
+        {name: np.asarray(idxs, dtype=np.int64) for name, idxs in groups.items()}
+        if groups is not None
+        else None
+    )
+
+    def _flush(batch: list[list[float]]) -> None:
+        nonlocal samples, payload_bytes_seen, sat_count, sat_total
+        truth = np.asarray(batch, dtype=np.float32)
+        payloads = codec.encode_batch(truth)
         if packing in {"int8", "int16"}:
             dtype = np.int8 if packing == "int8" else np.int16
             info = np.iinfo(dtype)
-            raw = np.frombuffer(payload, dtype=dtype)
+            raw = np.frombuffer(b"".join(payloads), dtype=dtype)
             sat_count += int(((raw == info.min) | (raw == info.max)).sum())
             sat_total += int(raw.size)
-        recon = codec.decode(payload)
-        truth = np.asarray(window, dtype=np.float32)
-        recon_vec = np.asarray(recon, dtype=np.float32)
-        if truth.shape != recon_vec.shape:
+        recon = np.asarray(codec.decode_batch(payloads), dtype=np.float32)
+        if truth.shape != recon.shape:
             raise RuntimeError("reconstruction length mismatch")
 
-        diff = recon_vec - truth
+        diff = recon - truth
         abs_diff = np.abs(diff)
         sq_diff = diff**2
         overall.update(abs_diff.sum(), sq_diff.sum(), diff.size)
-        if groups is not None:
-            for name, idxs in groups.items():
-                idx = np.asarray(idxs, dtype=np.int64)
-                by_group[name].update(abs_diff[idx].sum(), sq_diff[idx].sum(), idx.size)
+        if group_idx is not None:
+            for name, idx in group_idx.items():
+                by_group[name].update(
+                    abs_diff[:, idx].sum(), sq_diff[:, idx].sum(), idx.size * len(batch)
+                )
 
-        samples += 1
+        samples += len(batch)
         if payload_bytes_seen is None:
-            payload_bytes_seen = len(payload)
+            payload_bytes_seen = len(payloads[0])
+
+    batch: list[list[float]] = []
+    for window in _iter_dataset_windows(
+        dataset,
+        expected_len=input_len,
+        max_samples=args.max_samples,
+        subset=str(args.subset),
+        train_ratio=float(args.train_ratio),
+        split_seed=int(args.split_seed),
+    ):
+        batch.append(window)
+        if len(batch) >= int(args.batch_size):
+            _flush(batch)
+            batch = []
+    if batch:
+        _flush(batch)
 
     report: Dict[str, Any] = {
         "dataset": str(dataset),
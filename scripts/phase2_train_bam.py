@@ -216,7 +216,9 @@ def _encode_latent(
     layers: Sequence[Layer],
     delta: float | None,
     encode_cycles: int,
+    cycle_tol: float | None = None,
 ):
+    np = _require_numpy()
     out = x_vec
     for layer in layers:
         y0 = layer.encode(out, delta=delta)
@@ -224,10 +226,12 @@ def _encode_latent(
             out = y0
             continue
         y_c = y0
-        x_c = out
         for _ in range(encode_cycles):
             x_c = layer.decode(y_c, delta=delta)
+            y_prev = y_c
             y_c = layer.encode(x_c, delta=delta)
+            if cycle_tol is not None and float(np.max(np.abs(y_c - y_prev))) < cycle_tol:
+                break
         out = y_c
     return out
 
@@ -242,6 +246,7 @@ def _auto_scale_for_latent(
     layers: Sequence[Layer],
     delta: float | None,
     encode_cycles: int,
+    cycle_tol: float | None,
     packing: str,
     percentile: float,
     max_samples: int,
@@ -271,6 +276,7 @@ def _auto_scale_for_latent(
             layers=layers,
             delta=delta,
             encode_cycles=int(encode_cycles),
+            cycle_tol=cycle_tol,
         )
         abs_max_values.append(float(np.max(np.abs(latent))))
 
@@ -510,6 +516,8 @@ def _write_bam_manifest(
     delta: float | None,
     encode_cycles: int,
     decode_cycles: int,
+    cycle_tol: float | None,
+    max_cycles: int | None,
     norm_path: str | None,
     notes: str | None,
     train_ratio: float,
@@ -528,6 +536,8 @@ def _write_bam_manifest(
         "delta": delta,
         "encode_cycles": int(encode_cycles),
         "decode_cycles": int(decode_cycles),
+        "cycle_tol": cycle_tol,
+        "max_cycles": max_cycles,
         "input_dims": int(input_dims),
         "window_W": int(window_W),
         "window_stride": int(window_stride),
@@ -610,6 +620,21 @@ def build_parser() -> argparse.ArgumentParser:
         default=0,
         help="Recurrent refinement cycles during decoding (default: 0)",
     )
+    parser.add_argument(
+        "--cycle-tol",
+        type=float,
+        default=None,
+        help=(
+            "Stop encode/decode cycles early once the per-cycle change falls below this "
+            "tolerance (written to bam_manifest.json; default: off)"
+        ),
+    )
+    parser.add_argument(
+        "--max-cycles",
+        type=int,
+        default=None,
+        help="Cycle budget used with --cycle-tol (default: --encode-cycles/--decode-cycles)",
+    )
     parser.add_argument("--epochs", type=int, default=1, help="Epochs per layer (default: 1)")
     parser.add_argument(
         "--min-epochs",
@@ -767,6 +792,10 @@ def main() -> int:
         raise SystemExit("--latent-dim must be > 0")
     if args.encode_cycles < 0 or args.decode_cycles < 0:
         raise SystemExit("--encode-cycles/--decode-cycles must be >= 0")
+    if args.cycle_tol is not None and args.cycle_tol <= 0:
+        raise SystemExit("--cycle-tol must be > 0")
+    if args.max_cycles is not None and (args.cycle_tol is None or args.max_cycles < 0):
+        raise SystemExit("--max-cycles must be >= 0 and requires --cycle-tol")
     if args.shuffle_buffer < 0:
         raise SystemExit("--shuffle-buffer must be >= 0")
     if args.max_payload_bytes <= 0:
@@ -874,7 +903,12 @@ def main() -> int:
             std=std,
             layers=layers,
             delta=(float(args.delta) if args.delta is not None else None),
-            encode_cycles=int(args.encode_cycles),
+            encode_cycles=(
+                int(args.max_cycles)
+                if args.max_cycles is not None and int(args.encode_cycles) > 0
+                else int(args.encode_cycles)
+            ),
+            cycle_tol=(float(args.cycle_tol) if args.cycle_tol is not None else None),
             packing=str(args.packing),
             percentile=float(args.auto_scale_percentile),
             max_samples=int(args.auto_scale_max_samples),
@@ -898,6 +932,8 @@ def main() -> int:
         delta=(float(args.delta) if args.delta is not None else None),
         encode_cycles=int(args.encode_cycles),
         decode_cycles=int(args.decode_cycles),
+        cycle_tol=(float(args.cycle_tol) if args.cycle_tol is not None else None),
+        max_cycles=(int(args.max_cycles) if args.max_cycles is not None else None),
         norm_path=str(norm_path.name),
         notes=str(args.notes) if args.notes else None,
         train_ratio=float(args.train_ratio),
@@ -940,6 +976,8 @@ def main() -> int:
             "delta": float(args.delta) if args.delta is not None else None,
             "encode_cycles": int(args.encode_cycles),
             "decode_cycles": int(args.decode_cycles),
+            "cycle_tol": float(args.cycle_tol) if args.cycle_tol is not None else None,
+            "max_cycles": int(args.max_cycles) if args.max_cycles is not None else None,
             "expected_payload_bytes": expected_payload_bytes,
             "cost": {
                 "param_count": param_count,
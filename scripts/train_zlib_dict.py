@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from loralink_mllc.codecs import payload_schema_hash
+from loralink_mllc.codecs.raw import RawCodec
+from loralink_mllc.codecs.zlib_codec import MAX_ZDICT_BYTES, ZlibCodec, train_zdict
+from loralink_mllc.config.artifacts import ArtifactsManifest
+
+
+def _split_accept(window_id: int, *, train_ratio: float, split_seed: int) -> bool:
+    if train_ratio >= 1.0:
+        return True
+    if train_ratio <= 0.0:
+        return False
+    digest = hashlib.sha256(f"{split_seed}:{window_id}".encode("utf-8")).digest()
+    bucket = int.from_bytes(digest[:8], byteorder="big", signed=False) / (2**64)
+    return bucket < train_ratio
+
+
+def _iter_dataset_windows(
+    dataset_path: Path, *, max_samples: int | None
+) -> Iterator[tuple[int, list[float]]]:
+    count = 0
+    with dataset_path.open("r", encoding="utf-8") as fh:
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"invalid JSONL at line {line_no}: {exc}") from exc
+            window = record.get("window")
+            if not isinstance(window, list):
+                raise ValueError(f"dataset line {line_no}: missing 'window' list")
+            window_id = record.get("window_id")
+            if window_id is None:
+                window_id = line_no - 1
+            yield int(window_id), [float(v) for v in window]
+            count += 1
+            if max_samples is not None and count >= max_samples:
+                return
+
+
+def _size_stats(codec: Any, windows: list[list[float]]) -> Dict[str, Any] | None:
+    if not windows:
+        return None
+    sizes = [len(codec.encode(window)) for window in windows]
+    return {
+        "mean_bytes": sum(sizes) / len(sizes),
+        "max_bytes": max(sizes),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description=(
+            "Train a deflate preset dictionary (zdict) for the zlib codec from dataset_raw.jsonl "
+            "and report payload sizes with/without it."
+        )
+    )
+    p.add_argument("--dataset", required=True, help="Path to dataset_raw.jsonl")
+    p.add_argument("--out", required=True, help="Output dictionary path (e.g. zdict.bin)")
+    p.add_argument("--force", action="store_true", help="Overwrite an existing dictionary")
+    p.add_argument(
+        "--size",
+        type=int,
+        default=1024,
+        help=f"Dictionary size in bytes, 1..{MAX_ZDICT_BYTES} (default: 1024)",
+    )
+    p.add_argument("--segment", type=int, default=4, help="Substring length (default: 4)")
+    p.add_argument("--level", type=int, default=6, help="zlib level (default: 6)")
+    p.add_argument("--scale", type=float, default=32767.0, help="Inner raw codec scale")
+    p.add_argument(
+        "--train-ratio",
+        type=float,
+        default=0.8,
+        help="Train split ratio in (0, 1]; the rest is the size-report holdout (default: 0.8)",
+    )
+    p.add_argument("--split-seed", type=int, default=0, help="Split seed (default: 0)")
+    p.add_argument("--max-samples", type=int, default=20000, help="Limit dataset windows")
+    p.add_argument(
+        "--artifacts-out",
+        default=None,
+        help="Also write an artifacts manifest (codec_id=zlib) with the zdict hash",
+    )
+    p.add_argument("--report", default=None, help="Write report JSON to this path (default: print)")
+    return p
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    dataset = Path(args.dataset)
+    if not dataset.exists():
+        raise SystemExit(f"dataset not found: {dataset}")
+    if not (0.0 < float(args.train_ratio) <= 1.0):
+        raise SystemExit("--train-ratio must be in (0, 1]")
+    out_path = Path(args.out)
+    if out_path.exists() and not args.force:
+        raise SystemExit(f"dictionary already exists: {out_path} (use --force)")
+
+    inner = RawCodec(scale=float(args.scale))
+    train: list[list[float]] = []
+    holdout: list[list[float]] = []
+    for window_id, window in _iter_dataset_windows(dataset, max_samples=args.max_samples):
+        in_train = _split_accept(
+            window_id, train_ratio=float(args.train_ratio), split_seed=int(args.split_seed)
+        )
+        (train if in_train else holdout).append(window)
+    if not train:
+        raise SystemExit("no training windows")
+
+    try:
+        zdict = train_zdict(
+            (inner.encode(window) for window in train),
+            size=int(args.size),
+            segment=int(args.segment),
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    if not zdict:
+        raise SystemExit("no repeated substrings found; dataset too small for a dictionary")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_bytes(zdict)
+
+    plain = ZlibCodec(inner=inner, level=int(args.level))
+    primed = ZlibCodec(inner=inner, level=int(args.level), zdict=zdict)
+    schema_hash = payload_schema_hash(primed.payload_schema())
+    if args.artifacts_out:
+        manifest = ArtifactsManifest.create(
+            codec_id="zlib",
+            codec_version=ZlibCodec.codec_version,
+            payload_schema_hash=schema_hash,
+            zdict_hash=primed.zdict_hash,
+        )
+        manifest.save(args.artifacts_out)
+
+    report = {
+        "dataset": str(dataset),
+        "zdict_path": str(out_path),
+        "zdict_bytes": len(zdict),
+        "zdict_hash": primed.zdict_hash,
+        "payload_schema": primed.payload_schema(),
+        "payload_schema_hash": schema_hash,
+        "train_windows": len(train),
+        "holdout_windows": len(holdout),
+        "raw_bytes": len(inner.encode(train[0])),
+        "sizes": {
+            split: {"zlib": _size_stats(plain, windows), "zlib_zdict": _size_stats(primed, windows)}
+            for split, windows in (("train", train), ("holdout", holdout))
+        },
+    }
+    out = json.dumps(report, indent=2)
+    if args.report:
+        Path(args.report).write_text(out, encoding="utf-8")
+    else:
+        print(out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
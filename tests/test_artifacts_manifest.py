@@ -126,3 +126,41 @@ def test_verify_manifest_bam_norm_hash_mismatch_raises(tmp_path: Path) -> None:
     with pytest.raises(ValueError, match="norm_params_hash does not match norm file"):
         verify_manifest(runspec, manifest, codec)
 
+
+
+def test_verify_manifest_zdict_hash(tmp_path: Path) -> None:
+    from loralink_mllc.codecs.zlib_codec import ZlibCodec
+
+    zdict_path = tmp_path / "zdict.bin"
+    zdict_path.write_bytes(b"\xff\x7f" * 16)
+    codec = ZlibCodec(zdict=zdict_path.read_bytes())
+    spec = _make_bam_runspec(tmp_path, tmp_path / "unused.json")
+    spec = RunSpec.from_dict(
+        {
+            **spec.as_dict(),
+            "codec": {"id": "zlib", "version": "1", "params": {"zdict_path": str(zdict_path)}},
+        }
+    )
+    manifest = ArtifactsManifest.create(
+        codec_id="zlib",
+        codec_version="1",
+        payload_schema_hash=payload_schema_hash(codec.payload_schema()),
+        git_commit="abc",
+        zdict_hash=hash_file(zdict_path),
+    )
+    assert manifest.as_dict()["zdict_hash"] == manifest.zdict_hash
+    assert ArtifactsManifest.from_dict(manifest.as_dict()) == manifest
+    verify_manifest(spec, manifest, codec)
+
+    mismatch = ArtifactsManifest.from_dict({**manifest.as_dict(), "zdict_hash": "00" * 32})
+    with pytest.raises(ValueError, match="zdict_hash does not match zdict file"):
+        verify_manifest(spec, mismatch, codec)
+
+    no_path = RunSpec.from_dict(
+        {**spec.as_dict(), "codec": {"id": "zlib", "version": "1", "params": {}}}
+    )
+    with pytest.raises(ValueError, match="runspec has no zdict_path"):
+        verify_manifest(no_path, manifest, codec)
+
+    legacy = ArtifactsManifest.from_dict({**manifest.as_dict(), "zdict_hash": None})
+    assert "zdict_hash" not in legacy.as_dict()
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from loralink_mllc.codecs.bam import BamCodec, _parse_layer_index, _require_numpy
+from loralink_mllc.codecs.bam import BamCodec, parse_layer_index, require_numpy
 from loralink_mllc.codecs.bam_artifacts import BamArtifacts
 from loralink_mllc.codecs.base import CodecError
 
@@ -28,6 +28,8 @@ def _artifacts(
     encode_cycles: int = 0,
     decode_cycles: int = 0,
     norm_path: str | None = None,
+    cycle_tol: float | None = None,
+    max_cycles: int | None = None,
 ) -> BamArtifacts:
     return BamArtifacts(
         manifest_version="1",
@@ -44,6 +46,8 @@ def _artifacts(
         window_stride=window_stride,
         norm_path=norm_path,
         notes=None,
+        cycle_tol=cycle_tol,
+        max_cycles=max_cycles,
     )
 
 
@@ -69,12 +73,14 @@ def test_require_numpy_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.setattr(builtins, "__import__", fake_import)
     with pytest.raises(CodecError, match="requires numpy"):
-        _require_numpy()
+        require_numpy()
 
 
 def test_parse_layer_index_invalid_filename() -> None:
+    assert parse_layer_index(Path("layer_12.npz")) == 12
+    assert parse_layer_index(Path("model/layer_3_W.npy")) == 3
     with pytest.raises(CodecError, match="invalid layer filename"):
-        _parse_layer_index(Path("not_a_layer.npz"))
+        parse_layer_index(Path("not_a_layer.npz"))
 
 
 def test_validate_dynamics_rejects_negative_cycles(tmp_path: Path) -> None:
@@ -87,6 +93,13 @@ def test_validate_dynamics_rejects_delta_ge_0_5_with_cycles(tmp_path: Path) -> N
         BamCodec(_artifacts(model_path=".", delta=0.5, encode_cycles=1), base_dir=tmp_path)
 
 
+def test_validate_dynamics_rejects_bad_cycle_tol_and_max_cycles(tmp_path: Path) -> None:
+    with pytest.raises(CodecError, match="cycle_tol must be > 0"):
+        BamCodec(_artifacts(model_path=".", cycle_tol=0.0), base_dir=tmp_path)
+    with pytest.raises(CodecError, match="max_cycles must be >= 0"):
+        BamCodec(_artifacts(model_path=".", cycle_tol=1e-3, max_cycles=-1), base_dir=tmp_path)
+
+
 def test_resolve_path_absolute(tmp_path: Path) -> None:
     model_dir = _make_identity_model(tmp_path)
     codec = BamCodec(_artifacts(model_path=model_dir.name), base_dir=tmp_path)
@@ -304,3 +317,66 @@ def test_float16_packing_roundtrip(tmp_path: Path) -> None:
     assert len(payload) == 4
     decoded = codec.decode(payload)
     assert decoded == pytest.approx([0.5, -0.25], abs=1e-3)
+
+
+def test_load_layers_q8_error_branches(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    layer = model_dir / "layer_0.npz"
+    artifacts = _artifacts(model_path=model_dir.name, model_format="layer_npz_q8")
+    q = np.ones((2, 2), dtype=np.int8)
+    scale = np.ones(2, dtype=np.float32)
+
+    np.savez(layer, W_q=q, W_scale=scale)
+    with pytest.raises(CodecError, match="missing W_q/W_scale/V_q/V_scale"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+    np.savez(layer, W_q=q.astype(np.int16), W_scale=scale, V_q=q, V_scale=scale)
+    with pytest.raises(CodecError, match="W_q must be int8"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+    np.savez(layer, W_q=q.reshape(2, 2, 1), W_scale=scale, V_q=q, V_scale=scale)
+    with pytest.raises(CodecError, match="must be 2D"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+    np.savez(layer, W_q=q, W_scale=scale, V_q=q, V_scale=np.ones(3, dtype=np.float32))
+    with pytest.raises(CodecError, match="V_scale shape mismatch"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+    (model_dir / "layer_0.npz").unlink()
+    model_dir.rmdir()
+    model_dir.write_text("x", encoding="utf-8")
+    with pytest.raises(CodecError, match="layer_npz_q8 requires model_path to be a directory"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+
+def test_quantize_rows_int8_rejects_non_2d() -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import quantize_rows_int8
+
+    with pytest.raises(CodecError, match="2D"):
+        quantize_rows_int8(np.zeros(3, dtype=np.float32))
+
+
+def test_load_layers_mmap_error_branches(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    artifacts = _artifacts(model_path=model_dir.name, model_format="layer_npy_mmap_v1")
+    with pytest.raises(CodecError, match=r"no layer_\*_W.npy files found"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+    W_path = model_dir / "layer_0_W.npy"
+    V_path = model_dir / "layer_0_V.npy"
+    np.save(W_path, np.eye(2, dtype=np.float32))
+    with pytest.raises(CodecError, match="layer file missing V"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+    np.save(V_path, np.eye(2, dtype=np.float64))
+    with pytest.raises(CodecError, match="must be float32"):
+        BamCodec(artifacts, base_dir=tmp_path)
+
+    np.save(V_path, np.zeros((2, 2, 1), dtype=np.float32))
+    with pytest.raises(CodecError, match="must be 2D"):
+        BamCodec(artifacts, base_dir=tmp_path)
@@ -179,3 +179,500 @@ def test_bam_codec_recurrent_cycles(tmp_path: Path) -> None:
         expected = (delta + 1.0) * expected - delta * (expected**3)
         expected = np.clip(expected, -1.0, 1.0)
     assert decoded == pytest.approx(expected.tolist(), abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("packing", "scale", "delta", "cycles"),
+    [
+        ("int8", 127, None, 0),
+        ("int16", 32767, None, 0),
+        ("int16", 32767, 0.1, 0),
+        ("float16", None, None, 0),
+        ("float16", None, 0.1, 2),
+        ("float32", None, 0.2, 3),
+    ],
+)
+def test_bam_codec_batch_matches_single_window(
+    tmp_path: Path, packing: str, scale: float | None, delta: float | None, cycles: int
+) -> None:
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    for idx, (out_dim, in_dim) in enumerate([(48, 80), (16, 48)]):
+        W = (rng.standard_normal((out_dim, in_dim)) / np.sqrt(in_dim)).astype(np.float32)
+        np.savez(model_dir / f"layer_{idx}.npz", W=W, V=W.T.copy())
+    (tmp_path / "norm.json").write_text(
+        json.dumps({"mean": [0.1] * 80, "std": [0.5] * 79 + [0.0]}), encoding="utf-8"
+    )
+
+    manifest = tmp_path / "bam_manifest.json"
+    _write_manifest(
+        manifest,
+        model_dir,
+        latent_dim=16,
+        packing=packing,
+        input_dims=40,
+        window_W=2,
+        window_stride=1,
+        scale=scale,
+        delta=delta,
+        encode_cycles=cycles,
+        decode_cycles=cycles,
+    )
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    data["norm_path"] = "norm.json"
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+
+    spec = CodecSpec(id="bam", version="0", params={"manifest_path": str(manifest)})
+    codec = create_codec(spec)
+
+    # Batches must be bit-identical to the per-window codec that is actually deployed.
+    windows = rng.uniform(-1.0, 1.0, size=(512, 80)).astype(np.float32)
+    payloads = codec.encode_batch(windows)
+    assert payloads == [codec.encode(window.tolist()) for window in windows]
+
+    recon = codec.decode_batch(payloads)
+    assert recon.shape == (512, 80)
+    assert np.array_equal(recon, np.asarray([codec.decode(payload) for payload in payloads]))
+    assert codec.decode_batch([]).shape == (0, 80)
+
+    with pytest.raises(ValueError, match="does not match"):
+        codec.encode_batch(windows[:, :4])
+    with pytest.raises(CodecError, match="does not match expected"):
+        codec.decode_batch([payloads[0], payloads[1][:-1]])
+
+
+@pytest.mark.parametrize(("packing", "scale"), [("int16", 32767), ("float32", None)])
+def test_bam_codec_single_window_matches_per_layer_gemv(
+    tmp_path: Path, packing: str, scale: float | None
+) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    rng = np.random.default_rng(5)
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    layers = []
+    for idx, (out_dim, in_dim) in enumerate([(24, 40), (8, 24)]):
+        W = (rng.standard_normal((out_dim, in_dim)) / np.sqrt(in_dim)).astype(np.float32)
+        V = W.T.copy()
+        layers.append((W, V))
+        np.savez(model_dir / f"layer_{idx}.npz", W=W, V=V)
+    manifest = tmp_path / "bam_manifest.json"
+    _write_manifest(
+        manifest,
+        model_dir,
+        latent_dim=8,
+        packing=packing,
+        input_dims=40,
+        window_W=1,
+        window_stride=1,
+        scale=scale,
+        delta=0.1,
+        encode_cycles=3,
+        decode_cycles=3,
+    )
+    codec = BamCodec.from_manifest(str(manifest))
+
+    def _t(x):  # type: ignore[no-untyped-def]
+        return np.clip(1.1 * x - 0.1 * (x**3), -1.0, 1.0)
+
+    dtype = np.int16 if scale else np.float32
+    for window in rng.uniform(-1.0, 1.0, size=(50, 40)).astype(np.float32):
+        x = window
+        for W, V in layers:
+            y = _t(W @ x)
+            for _ in range(3):
+                y = _t(W @ _t(V @ y))
+            x = y
+        latent = np.rint(x * scale).astype(dtype) if scale else x
+        payload = codec.encode(window.tolist())
+        assert payload == latent.tobytes()
+
+        y = np.frombuffer(payload, dtype=dtype).astype(np.float32)
+        if scale:
+            y = y / float(scale)
+        for W, V in reversed(layers):
+            x = _t(V @ y)
+            for _ in range(3):
+                x = _t(V @ _t(W @ x))
+            y = x
+        assert codec.decode(payload) == y.tolist()
+    with pytest.raises(CodecError, match="does not match expected"):
+        codec.decode(payload[:-1])
+
+
+def _write_linear_stack(  # type: ignore[no-untyped-def]
+    tmp_path: Path, np, rng, fuse_linear: bool = True, **manifest_kwargs
+) -> Path:
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    for idx, (out_dim, in_dim) in enumerate([(16, 12), (8, 16), (4, 8)]):
+        W = (rng.standard_normal((out_dim, in_dim)) / np.sqrt(in_dim)).astype(np.float32)
+        np.savez(model_dir / f"layer_{idx}.npz", W=W, V=W.T.copy())
+    (tmp_path / "norm.json").write_text(
+        json.dumps({"mean": [0.5] * 12, "std": [2.0] * 11 + [0.0]}), encoding="utf-8"
+    )
+    manifest = tmp_path / "bam_manifest.json"
+    _write_manifest(
+        manifest,
+        model_dir,
+        latent_dim=4,
+        input_dims=12,
+        window_W=1,
+        window_stride=1,
+        **manifest_kwargs,
+    )
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    data["norm_path"] = "norm.json"
+    if fuse_linear:
+        data["fuse_linear"] = True
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    return manifest
+
+
+@pytest.mark.parametrize(("packing", "scale"), [("int16", 1000.0), ("float32", None)])
+def test_bam_codec_fuses_linear_stack(tmp_path: Path, packing: str, scale: float | None) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    rng = np.random.default_rng(1)
+    manifest = _write_linear_stack(tmp_path, np, rng, packing=packing, scale=scale)
+    fused = BamCodec.from_manifest(str(manifest))
+    assert fused.payload_schema().endswith(":fused=1")
+    assert fused._fused_encoder is not None
+    assert fused._fused_encoder.A.shape == (4, 12)
+    assert fused._fused_decoder is not None
+    assert fused._fused_decoder.A.shape == (12, 4)
+
+    layered = BamCodec.from_manifest(str(manifest))
+    layered._fused_encoder = None
+    layered._fused_decoder = None
+
+    windows = rng.uniform(-3.0, 3.0, size=(32, 12)).astype(np.float32)
+    fused_payloads = fused.encode_batch(windows)
+    layered_payloads = layered.encode_batch(windows)
+    dtype = np.int16 if packing == "int16" else np.float32
+    fused_latent = np.frombuffer(b"".join(fused_payloads), dtype=dtype).astype(np.float64)
+    layered_latent = np.frombuffer(b"".join(layered_payloads), dtype=dtype).astype(np.float64)
+    assert np.abs(fused_latent - layered_latent).max() <= (1.0 if scale else 1e-5)
+
+    # The fused map is one BLAS GEMV per window, batched or not.
+    A, b = fused._fused_encoder.A, fused._fused_encoder.b
+
+    def _packed(latent):  # type: ignore[no-untyped-def]
+        if scale:
+            latent = np.clip(np.rint(latent), -32768, 32767)
+        return latent.astype(dtype).tobytes()
+
+    assert fused_payloads == [_packed(A @ w + b) for w in windows]
+    assert [fused.encode(w.tolist()) for w in windows] == fused_payloads
+
+    fused_recon = fused.decode_batch(layered_payloads)
+    layered_recon = layered.decode_batch(layered_payloads)
+    assert np.allclose(fused_recon, layered_recon, atol=1e-5)
+    A_dec, b_dec = fused._fused_decoder.A, fused._fused_decoder.b
+    codes = fused._unpack_rows(layered_payloads, unscaled=True)
+    assert np.array_equal(fused_recon, np.asarray([A_dec @ c + b_dec for c in codes]))
+    assert fused.decode(layered_payloads[0]) == fused_recon[0].tolist()
+    assert (fused_recon[:, 11] == 0.5).all()
+
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    del data["norm_path"]
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    bare = BamCodec.from_manifest(str(manifest), use_cache=False)
+    assert bare._fused_encoder is not None
+    assert np.array_equal(bare._fused_encoder.b, np.zeros(4, dtype=np.float32))
+    assert np.array_equal(bare._fused_decoder.b, np.zeros(12, dtype=np.float32))
+
+
+@pytest.mark.parametrize(("packing", "scale"), [("int16", 1000.0), ("float16", None)])
+def test_bam_codec_linear_stack_is_layered_by_default(
+    tmp_path: Path, packing: str, scale: float | None
+) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    rng = np.random.default_rng(9)
+    manifest = _write_linear_stack(
+        tmp_path, np, rng, fuse_linear=False, packing=packing, scale=scale
+    )
+    codec = BamCodec.from_manifest(str(manifest))
+    assert codec._fused_encoder is None and codec._fused_decoder is None
+    assert ":fused" not in codec.payload_schema()
+
+    # Payloads stay those of the plain layer chain, as before fusion existed.
+    layers = []
+    for idx in range(3):
+        with np.load(tmp_path / "model" / f"layer_{idx}.npz") as data:
+            layers.append((data["W"], data["V"]))
+    mean = np.full(12, 0.5, dtype=np.float32)
+    std = np.asarray([2.0] * 11 + [0.0], dtype=np.float32)
+    dtype = np.int16 if scale else np.float16
+    windows = rng.uniform(-3.0, 3.0, size=(64, 12)).astype(np.float32)
+    for window in windows:
+        x = np.where(std == 0, 0.0, (window - mean) / np.where(std == 0, 1.0, std))
+        for W, _ in layers:
+            x = W @ x
+        latent = np.clip(np.rint(x * scale), -32768, 32767) if scale else x
+        payload = codec.encode(window.tolist())
+        assert payload == latent.astype(dtype).tobytes()
+
+        y = np.frombuffer(payload, dtype=dtype).astype(np.float32)
+        if scale:
+            y = y / np.float32(scale)
+        for _, V in reversed(layers):
+            y = V @ y
+        assert codec.decode(payload) == np.where(std == 0, mean, y * std + mean).tolist()
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "encoder_fused", "decoder_fused"),
+    [
+        ({"packing": "float32", "delta": 0.1}, False, False),
+        ({"packing": "float32", "delta": 0.0, "encode_cycles": 1}, False, True),
+        ({"packing": "float32", "decode_cycles": 2}, True, False),
+        ({"packing": "int8"}, False, False),
+        ({"packing": "nope"}, False, False),
+    ],
+)
+def test_bam_codec_fusion_falls_back_to_layers(
+    tmp_path: Path, kwargs: dict, encoder_fused: bool, decoder_fused: bool
+) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    manifest = _write_linear_stack(tmp_path, np, np.random.default_rng(2), **kwargs)
+    codec = BamCodec.from_manifest(str(manifest))
+    assert (codec._fused_encoder is not None) is encoder_fused
+    assert (codec._fused_decoder is not None) is decoder_fused
+
+
+def test_bam_codec_cycle_tol_early_exit_matches_batch(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    W = (0.5 * np.eye(3)).astype(np.float32)
+    np.savez(model_dir / "layer_0.npz", W=W, V=W.copy())
+    manifest = tmp_path / "bam_manifest.json"
+    _write_manifest(
+        manifest,
+        model_dir,
+        latent_dim=3,
+        packing="float32",
+        input_dims=3,
+        window_W=1,
+        window_stride=1,
+        delta=0.1,
+        encode_cycles=16,
+        decode_cycles=16,
+    )
+    full = BamCodec.from_manifest(str(manifest))
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    data["cycle_tol"] = 1e-3
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    early = BamCodec.from_manifest(str(manifest))
+
+    windows = np.asarray([[0.9, -0.9, 0.5], [0.01, 0.0, -0.01], [0.0, 0.0, 0.0]], np.float32)
+    payloads = early.encode_batch(windows)
+    batch_cycles = list(early.last_encode_cycles)
+    assert 0 < batch_cycles[0] < 16
+    assert batch_cycles[2] == 1
+    assert batch_cycles[0] > batch_cycles[1]
+    for row, payload, cycles in zip(windows, payloads, batch_cycles, strict=True):
+        assert early.encode(row.tolist()) == payload
+        assert early.last_encode_cycles == [cycles]
+
+    full_payloads = full.encode_batch(windows)
+    assert full.last_encode_cycles == [16, 16, 16]
+    early_latent = np.frombuffer(b"".join(payloads), dtype=np.float32)
+    full_latent = np.frombuffer(b"".join(full_payloads), dtype=np.float32)
+    assert np.abs(early_latent - full_latent).max() < 1e-3
+
+    recon = early.decode_batch(payloads)
+    assert max(early.last_decode_cycles) < 16
+    assert recon[0].tolist() == early.decode(payloads[0])
+
+    data["max_cycles"] = 2
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    capped = BamCodec.from_manifest(str(manifest))
+    capped.encode_batch(windows)
+    assert capped.last_encode_cycles == [2, 2, 1]
+
+
+def test_bam_codec_reports_zero_cycles_without_refinement(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    W = np.eye(2, dtype=np.float32)
+    np.savez(model_dir / "layer_0.npz", W=W, V=W)
+    manifest = tmp_path / "bam_manifest.json"
+    _write_manifest(
+        manifest,
+        model_dir,
+        latent_dim=2,
+        packing="float32",
+        input_dims=2,
+        window_W=1,
+        window_stride=1,
+        delta=0.1,
+    )
+    codec = BamCodec.from_manifest(str(manifest))
+    codec.decode(codec.encode([0.1, 0.2]))
+    assert codec.last_encode_cycles == [0]
+    assert codec.last_decode_cycles == [0]
+
+
+def test_bam_codec_q8_tracks_float32_and_batches_bit_identically(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec, BamQ8Weight, quantize_rows_int8
+
+    rng = np.random.default_rng(4)
+    float_dir = tmp_path / "model"
+    q8_dir = tmp_path / "model_q8"
+    float_dir.mkdir()
+    q8_dir.mkdir()
+    dims = [6, 5, 3]
+    for idx in range(len(dims) - 1):
+        W = rng.standard_normal((dims[idx + 1], dims[idx])) / (2.0 * np.sqrt(dims[idx]))
+        W = W.astype(np.float32)
+        W[0] = 0.0
+        V = W.T.copy()
+        np.savez(float_dir / f"layer_{idx}.npz", W=W, V=V)
+        W_q8 = quantize_rows_int8(W)
+        V_q8 = quantize_rows_int8(V)
+        np.savez(
+            q8_dir / f"layer_{idx}.npz",
+            W_q=W_q8.q,
+            W_scale=W_q8.scale,
+            V_q=V_q8.q,
+            V_scale=V_q8.scale,
+        )
+    kwargs = dict(
+        latent_dim=3,
+        packing="float32",
+        input_dims=3,
+        window_W=2,
+        window_stride=1,
+        delta=0.1,
+        encode_cycles=1,
+        decode_cycles=1,
+    )
+    float_manifest = tmp_path / "float.json"
+    _write_manifest(float_manifest, float_dir, **kwargs)
+    q8_manifest = tmp_path / "q8.json"
+    _write_manifest(q8_manifest, q8_dir, **kwargs)
+    data = json.loads(q8_manifest.read_text(encoding="utf-8"))
+    data["model_format"] = "layer_npz_q8"
+    q8_manifest.write_text(json.dumps(data), encoding="utf-8")
+
+    reference = BamCodec.from_manifest(str(float_manifest))
+    codec = BamCodec.from_manifest(str(q8_manifest))
+    assert isinstance(codec._layers[0].W, BamQ8Weight)
+    assert codec._layers[0].W.shape == (5, 6)
+    assert codec._fused_encoder is None
+    assert codec._fused_decoder is None
+
+    windows = rng.uniform(-0.5, 0.5, size=(8, 6)).astype(np.float32)
+    payloads = codec.encode_batch(windows)
+    assert payloads == [codec.encode(row.tolist()) for row in windows]
+    recon = codec.decode_batch(payloads)
+    assert recon.tolist() == [codec.decode(payload) for payload in payloads]
+
+    expected = reference.decode_batch(reference.encode_batch(windows))
+    assert np.max(np.abs(recon - expected)) < 0.05
+
+
+def test_bam_codec_mmap_matches_npz(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+    from loralink_mllc.codecs.bam_cache import BamModelCache
+
+    rng = np.random.default_rng(6)
+    npz_dir = tmp_path / "model"
+    mmap_dir = tmp_path / "model_mmap"
+    npz_dir.mkdir()
+    mmap_dir.mkdir()
+    dims = [4, 3, 2]
+    for idx in range(len(dims) - 1):
+        W = (rng.standard_normal((dims[idx + 1], dims[idx])) * 0.5).astype(np.float32)
+        V = W.T.copy()
+        np.savez(npz_dir / f"layer_{idx}.npz", W=W, V=V)
+        np.save(mmap_dir / f"layer_{idx}_W.npy", W)
+        np.save(mmap_dir / f"layer_{idx}_V.npy", V)
+    kwargs = dict(
+        latent_dim=2,
+        packing="float32",
+        input_dims=2,
+        window_W=2,
+        window_stride=1,
+        delta=0.1,
+        encode_cycles=1,
+        decode_cycles=1,
+    )
+    npz_manifest = tmp_path / "npz.json"
+    _write_manifest(npz_manifest, npz_dir, **kwargs)
+    mmap_manifest = tmp_path / "mmap.json"
+    _write_manifest(mmap_manifest, mmap_dir, **kwargs)
+    data = json.loads(mmap_manifest.read_text(encoding="utf-8"))
+    data["model_format"] = "layer_npy_mmap_v1"
+    mmap_manifest.write_text(json.dumps(data), encoding="utf-8")
+
+    cache = BamModelCache()
+    reference = BamCodec.from_manifest(str(npz_manifest), cache=cache)
+    codec = BamCodec.from_manifest(str(mmap_manifest), cache=cache)
+    assert isinstance(codec._layers[0].W, np.memmap)
+    assert not codec._layers[0].V.flags.writeable
+    assert BamCodec.from_manifest(str(mmap_manifest), cache=cache).model is codec.model
+    assert cache.stats().hits == 1
+    # Mapped weights are page cache, not heap: they do not count against the byte bound.
+    assert codec.model.nbytes == 0 and reference.model.nbytes > 0
+    assert cache.stats().bytes == reference.model.nbytes
+    no_heap = BamModelCache(max_bytes=0)
+    mapped = BamCodec.from_manifest(str(mmap_manifest), cache=no_heap).model
+    assert BamCodec.from_manifest(str(mmap_manifest), cache=no_heap).model is mapped
+    BamCodec.from_manifest(str(npz_manifest), cache=no_heap)
+    assert (no_heap.stats().entries, no_heap.stats().bytes) == (1, 0)
+
+    windows = rng.uniform(-1.0, 1.0, size=(5, 4)).astype(np.float32)
+    payloads = codec.encode_batch(windows)
+    assert payloads == reference.encode_batch(windows)
+    assert codec.decode_batch(payloads).tolist() == reference.decode_batch(payloads).tolist()
+
+
+def test_bam_codec_mmap_load_leaves_maps_untouched(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    rng = np.random.default_rng(8)
+    npz_manifest = _write_linear_stack(tmp_path, np, rng, packing="int16", scale=1000.0)
+    mmap_dir = tmp_path / "model_mmap"
+    mmap_dir.mkdir()
+    for layer_path in sorted((tmp_path / "model").glob("layer_*.npz")):
+        with np.load(layer_path) as data:
+            for name in ("W", "V"):
+                np.save(mmap_dir / f"{layer_path.stem}_{name}.npy", data[name])
+    data = json.loads(npz_manifest.read_text(encoding="utf-8"))
+    data.update(model_format="layer_npy_mmap_v1", model_path="model_mmap")
+    mmap_manifest = tmp_path / "mmap.json"
+    mmap_manifest.write_text(json.dumps(data), encoding="utf-8")
+
+    reference = BamCodec.from_manifest(str(npz_manifest), use_cache=False)
+    assert reference._fused_encoder is not None  # a linear stack is fused from .npz ...
+    codec = BamCodec.from_manifest(str(mmap_manifest), use_cache=False)
+    # ... but mapped weights are not multiplied out at load time.
+    assert codec._fused_encoder is None and codec._fused_decoder is None
+    for layer in codec._layers:
+        assert isinstance(layer.W, np.memmap) and isinstance(layer.V, np.memmap)
+
+    windows = rng.uniform(-3.0, 3.0, size=(8, 12)).astype(np.float32)
+    reference._fused_encoder = None
+    reference._fused_decoder = None
+    payloads = codec.encode_batch(windows)
+    assert payloads == reference.encode_batch(windows)
+    assert np.array_equal(codec.decode_batch(payloads), reference.decode_batch(payloads))
@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from loralink_mllc.codecs.bam_cache import BamModelCache, default_model_cache
+from loralink_mllc.codecs.base import CodecError
+
+
+def _write_model(tmp_path: Path, *, norm: bool = True) -> Path:
+    np = pytest.importorskip("numpy")
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    W = np.array([[1.0, 0.5], [0.0, 1.0]], dtype=np.float32)
+    np.savez(model_dir / "layer_0.npz", W=W, V=W.T.copy())
+    data = {
+        "manifest_version": "1",
+        "model_format": "layer_npz_v1",
+        "model_path": "model",
+        "latent_dim": 2,
+        "packing": "float32",
+        "input_dims": 2,
+        "window_W": 1,
+        "window_stride": 1,
+        "delta": 0.1,
+    }
+    if norm:
+        (tmp_path / "norm.json").write_text(
+            json.dumps({"mean": [0.0, 1.0], "std": [1.0, 2.0]}), encoding="utf-8"
+        )
+        data["norm_path"] = "norm.json"
+    manifest = tmp_path / "bam_manifest.json"
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    return manifest
+
+
+def test_from_manifest_shares_read_only_model(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    manifest = _write_model(tmp_path)
+    cache = BamModelCache()
+    first = BamCodec.from_manifest(str(manifest), cache=cache)
+    second = BamCodec.from_manifest(str(manifest), cache=cache)
+    assert second.model is first.model
+    assert second._layers[0].W is first._layers[0].W
+    assert not first._layers[0].W.flags.writeable
+    assert not first._norm.mean.flags.writeable
+    assert first.encode([0.1, 0.2]) == second.encode([0.1, 0.2])
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.bytes == first.model.nbytes
+
+    uncached = BamCodec.from_manifest(str(manifest), use_cache=False)
+    assert uncached.model is not first.model
+    assert cache.stats().hits == 1
+    assert default_model_cache() is default_model_cache()
+
+
+def test_from_manifest_rekeys_when_layer_content_changes(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    manifest = _write_model(tmp_path, norm=False)
+    cache = BamModelCache()
+    first = BamCodec.from_manifest(str(manifest), cache=cache)
+    W = np.eye(2, dtype=np.float32) * 0.5
+    np.savez(tmp_path / "model" / "layer_0.npz", W=W, V=W)
+    second = BamCodec.from_manifest(str(manifest), cache=cache)
+    assert second.model is not first.model
+    assert cache.stats().misses == 2
+
+
+def test_from_manifest_falls_back_when_files_are_missing(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    manifest = _write_model(tmp_path)
+    (tmp_path / "norm.json").unlink()
+    cache = BamModelCache()
+    with pytest.raises(CodecError, match="norm_path does not exist"):
+        BamCodec.from_manifest(str(manifest), cache=cache)
+    assert cache.stats().misses == 0
+
+
+def test_from_manifest_concurrent_loads_share_one_model(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    from loralink_mllc.codecs.bam import BamCodec
+
+    manifest = _write_model(tmp_path)
+    cache = BamModelCache()
+    models = []
+    lock = threading.Lock()
+
+    def _worker() -> None:
+        codec = BamCodec.from_manifest(str(manifest), cache=cache)
+        with lock:
+            models.append(codec.model)
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(models) == 8
+    assert all(model is models[0] for model in models)
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 8
+    assert stats.entries == 1
+
+
+def test_cache_lru_eviction_and_size_bound() -> None:
+    cache = BamModelCache(max_bytes=10)
+    assert cache.get_or_load("a", lambda: ("A", 4)) == "A"
+    assert cache.get_or_load("b", lambda: ("B", 4)) == "B"
+    assert cache.get_or_load("a", lambda: ("A2", 4)) == "A"
+    assert cache.get_or_load("c", lambda: ("C", 4)) == "C"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries, stats.bytes) == (
+        1,
+        3,
+        1,
+        2,
+        8,
+    )
+    assert cache.get_or_load("b", lambda: ("B2", 4)) == "B2"
+
+    assert cache.get_or_load("huge", lambda: ("H", 11)) == "H"
+    assert cache.get_or_load("huge", lambda: ("H2", 11)) == "H2"
+    assert cache.stats().entries == 2
+
+    cache.set_max_bytes(4)
+    assert cache.max_bytes == 4
+    assert cache.stats().entries == 1
+    with pytest.raises(ValueError, match="max_bytes"):
+        cache.set_max_bytes(-1)
+    with pytest.raises(ValueError, match="max_bytes"):
+        BamModelCache(max_bytes=-1)
+
+    cache.clear()
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries, stats.bytes) == (
+        0,
+        0,
+        0,
+        0,
+        0,
+    )
+
+
+def test_cache_concurrent_miss_keeps_first_inserted_model() -> None:
+    cache = BamModelCache()
+
+    def _outer() -> tuple[str, int]:
+        cache.get_or_load("k", lambda: ("inner", 1))
+        return "outer", 1
+
+    assert cache.get_or_load("k", _outer) == "inner"
+    assert cache.stats().misses == 2
+
+
+def test_fingerprint_memoizes_settled_files(tmp_path: Path) -> None:
+    cache = BamModelCache()
+    path = tmp_path / "layer_0.npz"
+    path.write_bytes(b"abcd")
+    os.utime(path, ns=(10**18, 10**18 // 2))
+    first = cache.fingerprint([path])
+    st = os.stat(path)
+    path.write_bytes(b"wxyz")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert cache.fingerprint([path]) == first
+
+    path.write_bytes(b"wxyz")
+    assert cache.fingerprint([path]) != first
+
+    os.utime(path, ns=(10**18, 10**18 // 2))
+    for count in range(2, 260):
+        cache.fingerprint([path] * count)
+    assert len(cache._stat_memo) == 256
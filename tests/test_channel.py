@@ -0,0 +1,184 @@
+import math
+
+import pytest
+
+from loralink_mllc.config.runspec import PhySpec
+from loralink_mllc.radio.base import IRxRssi
+from loralink_mllc.radio.channel import (
+    LogDistancePathLoss,
+    SharedChannel,
+    create_channel_pair,
+)
+from loralink_mllc.runtime.scheduler import FakeClock
+from loralink_mllc.runtime.toa import estimate_toa_ms
+
+_PHY = PhySpec(
+    sf=7, bw_hz=125000, cr=5, preamble=8, crc_on=True, explicit_header=True, tx_power_dbm=22
+)
+_FRAME = bytes([18, 0]) + bytes(18)
+_TOA_MS = estimate_toa_ms(_PHY, len(_FRAME))
+
+
+def test_frame_is_delivered_after_its_toa_with_path_loss_rssi() -> None:
+    clock = FakeClock()
+    channel = SharedChannel(_PHY, clock=clock)
+    a = channel.add_radio("a")
+    b = channel.add_radio("b", (1000.0, 0.0))
+    a.send(_FRAME)
+    assert channel.next_delivery_ms() == math.ceil(_TOA_MS)
+    assert b.recv(timeout_ms=0) is None  # still on air
+    assert b.wait_readable(1000) is True
+    assert clock.now_ms() == math.ceil(_TOA_MS)
+    assert channel.next_delivery_ms() == clock.now_ms()
+    assert b.wait_readable(1000) is True and clock.now_ms() == math.ceil(_TOA_MS)
+    assert b.recv(timeout_ms=0) == _FRAME
+    assert a.recv(timeout_ms=0) is None  # a sender does not hear itself
+
+    rssi, snr = channel.link_budget("a", "b")
+    assert rssi == pytest.approx(22 - LogDistancePathLoss().loss_db(1000.0))
+    assert snr == pytest.approx(rssi - channel.noise_floor_dbm)
+    assert isinstance(b, IRxRssi)
+    assert b.last_rx_rssi_dbm() == round(rssi)
+    assert b.last_rx_snr_db() == pytest.approx(snr)
+    assert a.last_rx_rssi_dbm() is None and a.last_rx_snr_db() is None
+    assert channel.next_delivery_ms() is None
+    assert b.wait_readable(5) is False and a.close() is None
+    stats = channel.stats()
+    assert stats["frames_sent"] == stats["delivered"] == 1
+    assert stats["airtime_ms"] == {"a": _TOA_MS}
+
+
+def test_far_receiver_is_below_sensitivity_and_recv_times_out() -> None:
+    clock = FakeClock()
+    channel = SharedChannel(_PHY, clock=clock)
+    a = channel.add_radio("a")
+    b = channel.add_radio("b", (20000.0, 0.0))
+    assert channel.link_budget("a", "b")[1] < -7.5
+    a.send(_FRAME)
+    assert b.recv(timeout_ms=200) is None
+    assert clock.now_ms() == 200
+    assert channel.stats()["below_sensitivity"] == 1
+
+
+def test_overlapping_frames_collide_unless_captured() -> None:
+    clock = FakeClock()
+    channel = SharedChannel(_PHY, clock=clock, capture_db=6.0)
+    gw = channel.add_radio("gw")
+    near = channel.add_radio("near", (100.0, 0.0))
+    far = channel.add_radio("far", (0.0, 1500.0))
+    twin = channel.add_radio("twin", (1500.0, 0.0))
+    near.send(_FRAME)
+    clock.sleep_ms(10)
+    far.send(bytes([1, 1]) + b"f")
+    clock.sleep_ms(1000)
+    assert gw.recv(timeout_ms=0) == _FRAME  # far is >6 dB weaker: near is captured
+    assert gw.recv(timeout_ms=0) is None
+    assert channel.stats()["captured"] >= 1
+
+    far.send(_FRAME)
+    twin.send(_FRAME)  # same distance: neither wins
+    clock.sleep_ms(1000)
+    assert gw.recv(timeout_ms=0) is None
+
+    no_capture = SharedChannel(_PHY, clock=clock, capture_db=None)
+    gw2 = no_capture.add_radio("gw")
+    no_capture.add_radio("near", (100.0, 0.0)).send(_FRAME)
+    no_capture.add_radio("far", (0.0, 1500.0)).send(_FRAME)
+    clock.sleep_ms(1000)
+    assert gw2.recv(timeout_ms=0) is None
+    assert no_capture.stats()["collided"] == 2
+
+
+def test_half_duplex_receiver_misses_frames_while_sending() -> None:
+    clock = FakeClock()
+    channel = SharedChannel(_PHY, clock=clock)
+    a = channel.add_radio("a")
+    b = channel.add_radio("b", (500.0, 0.0))
+    a.send(_FRAME)
+    clock.sleep_ms(int(_TOA_MS) - 5)
+    b.send(bytes([1, 9]) + b"x")  # b keys up before a's frame ends
+    clock.sleep_ms(1000)
+    assert b.recv(timeout_ms=0) is None
+    assert a.recv(timeout_ms=0) is None  # a was still on air when b's frame started
+    assert channel.stats()["half_duplex_missed"] == 2
+
+
+def test_busy_sender_queues_frames_back_to_back() -> None:
+    clock = FakeClock()
+    channel = SharedChannel(_PHY, clock=clock)
+    a = channel.add_radio("a")
+    b = channel.add_radio("b", (500.0, 0.0))
+    a.send(_FRAME)
+    a.send(_FRAME)
+    assert channel.next_delivery_ms() == math.ceil(_TOA_MS)
+    clock.sleep_ms(math.ceil(_TOA_MS))
+    assert b.recv(timeout_ms=0) == _FRAME
+    assert channel.next_delivery_ms() == math.ceil(2 * _TOA_MS)
+    assert b.recv(timeout_ms=int(_TOA_MS) + 2) == _FRAME
+    assert channel.stats()["airtime_ms"]["a"] == pytest.approx(2 * _TOA_MS)
+
+
+def test_poisson_interferers_match_pure_aloha_over_an_hour() -> None:
+    clock = FakeClock()
+    channel = SharedChannel(_PHY, clock=clock, seed=3, capture_db=None)
+    node = channel.add_radio("node")
+    gw = channel.add_radio("gw", (800.0, 0.0))
+    offered = 0.25  # interferer airtime per unit time (G)
+    interferers = 20
+    for idx in range(interferers):
+        channel.add_interferer(
+            f"i{idx}",
+            (800.0, 200.0 + idx),
+            frame_bytes=len(_FRAME),
+            mean_interval_ms=interferers * _TOA_MS / offered,
+        )
+    sent = received = 0
+    for _ in range(3600):  # one frame per second for an hour of channel time
+        node.send(_FRAME)
+        sent += 1
+        clock.sleep_ms(1000)
+        while gw.recv(timeout_ms=0) is not None:
+            received += 1
+    stats = channel.stats()
+    measured_g = sum(v for k, v in stats["airtime_ms"].items() if k != "node") / 3_600_000
+    assert stats["interferer_frames"] > 10000
+    assert received / sent == pytest.approx(math.exp(-2 * measured_g), abs=0.04)
+
+
+def test_channel_validation_errors() -> None:
+    with pytest.raises(ValueError, match="sf must be 5..12"):
+        SharedChannel(PhySpec(4, 125000, 5, 8, True, True, 14))
+    channel = SharedChannel(_PHY, clock=FakeClock())
+    channel.add_radio("a")
+    with pytest.raises(ValueError, match="duplicate channel node"):
+        channel.add_radio("a")
+    with pytest.raises(ValueError, match="duplicate channel node"):
+        channel.add_interferer("a", (0.0, 0.0), frame_bytes=10, mean_interval_ms=100)
+    with pytest.raises(ValueError, match="mean_interval_ms must be > 0"):
+        channel.add_interferer("i", (0.0, 0.0), frame_bytes=10, mean_interval_ms=0)
+    channel.add_interferer("i", (0.0, 0.0), frame_bytes=10, mean_interval_ms=100)
+    with pytest.raises(ValueError, match="duplicate channel node"):
+        channel.add_radio("i")
+
+
+def test_create_channel_pair_from_sweep_profile() -> None:
+    clock = FakeClock()
+    spec = {
+        "distance_m": 600,
+        "capture_db": None,
+        "path_loss": {"exponent": 2.7, "shadowing_db": 4.0},
+        "interferers": [{"distance_m": 300, "frame_bytes": 30, "mean_interval_ms": 50}],
+    }
+    channel = create_channel_pair(_PHY, spec, clock=clock, seed=1)
+    a, b = channel.radio("a"), channel.radio("b")
+    assert b.position == (600.0, 0.0) and a.tx_power_dbm == 22.0
+    rssi_seen = set()
+    for _ in range(50):
+        a.send(_FRAME)
+        clock.sleep_ms(500)
+        if b.recv(timeout_ms=0) is not None:
+            rssi_seen.add(b.last_rx_rssi_dbm())
+    stats = channel.stats()
+    assert stats["collided"] > 0 and stats["delivered"] > 0
+    assert stats["interferer_frames"] > 0
+    assert len(rssi_seen) > 1  # shadowing varies the RSSI per frame
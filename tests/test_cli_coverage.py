@@ -72,7 +72,7 @@ def test_cli_tx_and_rx_with_patched_nodes(tmp_path: Path, monkeypatch: pytest.Mo
         def __init__(self, *args, **kwargs) -> None:  # pragma: no cover
             return None
 
-        def run(self, step_ms: int) -> None:  # noqa: ARG002
+        def run(self, step_ms: int, **kwargs) -> None:  # noqa: ARG002
             return None
 
     class _RxStub:
@@ -135,7 +135,7 @@ def test_cli_keyboardinterrupt_returns_zero(
         def __init__(self, *args, **kwargs) -> None:  # pragma: no cover
             return None
 
-        def run(self, step_ms: int) -> None:  # noqa: ARG002
+        def run(self, step_ms: int, **kwargs) -> None:  # noqa: ARG002
             raise KeyboardInterrupt
 
     class _RxStub:
@@ -199,7 +199,7 @@ def test_cli_load_manifest_from_runspec(tmp_path: Path, monkeypatch: pytest.Monk
         def __init__(self, *args, **kwargs) -> None:  # pragma: no cover
             return None
 
-        def run(self, step_ms: int) -> None:  # noqa: ARG002
+        def run(self, step_ms: int, **kwargs) -> None:  # noqa: ARG002
             return None
 
     monkeypatch.setattr(cli_mod, "TxNode", _TxStub)
@@ -231,7 +231,7 @@ def test_cli_load_manifest_missing_raises(tmp_path: Path, monkeypatch: pytest.Mo
         def __init__(self, *args, **kwargs) -> None:  # pragma: no cover
             return None
 
-        def run(self, step_ms: int) -> None:  # noqa: ARG002
+        def run(self, step_ms: int, **kwargs) -> None:  # noqa: ARG002
             return None
 
     monkeypatch.setattr(cli_mod, "TxNode", _TxStub)
@@ -307,7 +307,7 @@ def test_cli_tx_jsonl_and_csv_sampler_init(tmp_path: Path, monkeypatch: pytest.M
         def __init__(self, *args, **kwargs) -> None:  # pragma: no cover
             return None
 
-        def run(self, step_ms: int) -> None:  # noqa: ARG002
+        def run(self, step_ms: int, **kwargs) -> None:  # noqa: ARG002
             return None
 
     monkeypatch.setattr(cli_mod, "TxNode", _TxStub)
@@ -409,6 +409,10 @@ def test_cli_uart_requires_port_and_can_instantiate_when_patched(
                 "--uart-baud",
                 "9600",
                 "--uart-rssi-byte",
+                "--uart-reader-thread",
+                "--uart-framing",
+                "2",
+                "--uart-writer-thread",
             ]
         )
         == 0
@@ -453,7 +457,7 @@ def test_cli_tx_uart_requires_port_and_dataset_logger_close(
         def __init__(self, *args, **kwargs) -> None:  # pragma: no cover
             return None
 
-        def run(self, step_ms: int) -> None:  # noqa: ARG002
+        def run(self, step_ms: int, **kwargs) -> None:  # noqa: ARG002
             return None
 
     monkeypatch.setattr(cli_mod, "UartE22Radio", _RadioStub)
@@ -560,3 +564,39 @@ def test_cli_main_module_entrypoint_executes(
     with pytest.raises(SystemExit) as exc:
         runpy.run_module("loralink_mllc.cli", run_name="__main__")
     assert exc.value.code == 0
+
+
+def test_cli_mock_loss_model_flags(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import loralink_mllc.cli as cli_mod
+
+    manifest_path = _write_manifest(tmp_path)
+    tx_runspec = _write_runspec(tmp_path, role="tx", mode="RAW")
+    trace = tmp_path / "trace_rx.jsonl"
+    trace.write_text(json.dumps({"event": "rx_ok", "seq": 0, "rssi_dbm": -70}), encoding="utf-8")
+    radios = []
+
+    class _TxStub:
+        def __init__(self, runspec, radio, *args, **kwargs) -> None:  # noqa: ARG002
+            radios.append(radio)
+
+        def run(self, step_ms: int, **kwargs) -> None:  # noqa: ARG002
+            return None
+
+    monkeypatch.setattr(cli_mod, "TxNode", _TxStub)
+    base = ["tx", "--runspec", str(tx_runspec), "--manifest", str(manifest_path)]
+    for extra in (
+        ["--mock-loss-model", "gilbert_elliott", "--mock-ge-p-gb", "0.1", "--mock-ge-p-bg", "0.5"],
+        ["--mock-loss-model", "trace", "--mock-trace", str(trace)],
+        ["--mock-loss-model", "snr", "--mock-snr-db", "-3", "--mock-fading-db", "2"],
+        ["--mock-loss-rate", "0.1", "--mock-seed", "3"],
+    ):
+        assert main(base + extra) == 0
+    assert len(radios) == 4
+
+    for extra, message in (
+        (["--mock-loss-model", "gilbert_elliott"], "--mock-ge-p-gb and --mock-ge-p-bg"),
+        (["--mock-loss-model", "trace"], "--mock-trace is required"),
+        (["--mock-loss-model", "snr"], "--mock-snr-db is required"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            main(base + extra)
@@ -25,6 +25,68 @@ def test_raw_codec_scale_and_clamp_and_decode_errors() -> None:
         codec.decode(b"\x00")
 
 
+def test_raw_codec_numpy_and_struct_paths_match(monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    import loralink_mllc.codecs.raw as raw_mod
+
+    values = [0.5 / 40000.0, 1.5 / 40000.0, -2.5 / 40000.0, 1.2, -3.0, float("nan")]
+    values += [float("inf"), -float("inf"), True, 0]
+    window = (values * 10)[:48]
+    fast = RawCodec(scale=40000.0)
+    monkeypatch.setattr(raw_mod, "optional_numpy", lambda: None)
+    slow = RawCodec(scale=40000.0)
+    assert fast._np is not None and slow._np is None
+
+    for length in (4, 12, 48):
+        payload = fast.encode(window[:length])
+        assert payload == slow.encode(window[:length])
+        assert fast.decode(payload) == slow.decode(payload)
+
+    windows = [window, window[::-1]]
+    payloads = fast.encode_batch(windows)
+    assert payloads == [slow.encode(w) for w in windows] == slow.encode_batch(windows)
+    assert fast.encode_batch(np.asarray(windows, dtype=np.float64)) == payloads
+    assert fast.encode(np.asarray(window, dtype=np.float64)) == payloads[0]
+    assert fast.decode_batch(payloads) == [slow.decode(p) for p in payloads]
+    assert slow.decode_batch(payloads) == [slow.decode(p) for p in payloads]
+
+
+def test_raw_codec_batch_edges() -> None:
+    pytest.importorskip("numpy")
+    codec = RawCodec()
+    ragged = [[0.1] * 12, [0.2] * 24]
+    assert codec.encode_batch(ragged) == [codec.encode(w) for w in ragged]
+    assert codec.encode_batch([[], []]) == [b"", b""]
+    assert codec.encode(["0.5"] * 12) == codec.encode([0.5] * 12)
+    with pytest.raises(TypeError):
+        codec.encode([None] * 12)
+    with pytest.raises(CodecError, match="payload length must be even"):
+        codec.decode_batch([b"\x00\x00", b"\x00"])
+
+
+def test_optional_numpy_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    import builtins
+
+    import loralink_mllc.codecs.raw as raw_mod
+    import loralink_mllc.codecs.sensor12_packed as sensor12_mod
+    import loralink_mllc.runtime.toa as toa_mod
+    from loralink_mllc.codecs import numpy_compat
+
+    assert raw_mod.optional_numpy is numpy_compat.optional_numpy
+    assert sensor12_mod.optional_numpy is numpy_compat.optional_numpy
+    assert toa_mod.optional_numpy is numpy_compat.optional_numpy
+
+    real_import = builtins.__import__
+
+    def _fake_import(name, *args, **kwargs):  # type: ignore[no-untyped-def]
+        if name == "numpy":
+            raise ImportError("no numpy")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", _fake_import)
+    assert numpy_compat.optional_numpy() is None
+
+
 def test_sensor12_packed_codec_edge_cases() -> None:
     with pytest.raises(ValueError, match="scales must be > 0"):
         Sensor12PackedCodec(accel_scale=0.0)
@@ -69,6 +131,79 @@ def test_zlib_codec_invalid_level_and_decode_error() -> None:
         codec.decode(b"not-a-zlib-payload")
 
 
+def test_zlib_codec_legacy_stream_is_unchanged() -> None:
+    import zlib
+
+    codec = ZlibCodec(level=6)
+    window = [0.1, -0.2, 0.3, 0.0] * 3
+    payload = codec.encode(window)
+    assert payload == zlib.compress(RawCodec().encode(window), 6)
+    assert codec.encode(window) == payload
+    assert codec.decode(payload) == RawCodec().decode(RawCodec().encode(window))
+    assert codec.zdict_hash is None
+    assert codec.payload_schema() == "zlib(level=6)+raw:int16:le:scale=32767.0"
+
+
+def test_zlib_codec_zdict_raw_deflate() -> None:
+    import hashlib
+
+    from loralink_mllc.codecs.zlib_codec import train_zdict
+
+    inner = RawCodec()
+    windows = [[0.5, -0.25, 0.125, 0.0, 1.0, float(i % 3) / 4] * 2 for i in range(40)]
+    zdict = train_zdict([inner.encode(w) for w in windows], size=64)
+    assert 0 < len(zdict) <= 64
+    codec = ZlibCodec(inner=inner, zdict=zdict)
+    assert codec.zdict_hash == hashlib.sha256(zdict).hexdigest()
+    assert f"zdict={codec.zdict_hash}" in codec.payload_schema()
+
+    plain = ZlibCodec(inner=inner)
+    for window in windows[:5]:
+        payload = codec.encode(window)
+        assert len(payload) < len(plain.encode(window))
+        assert codec.encode(window) == payload
+        assert codec.decode(payload) == inner.decode(inner.encode(window))
+
+    payload = codec.encode(windows[0])
+    with pytest.raises(CodecError, match="could not be decompressed"):
+        codec.decode(payload[:-1])
+    with pytest.raises(CodecError, match="could not be decompressed"):
+        codec.decode(payload + b"\x00")
+    with pytest.raises(CodecError, match="could not be decompressed"):
+        codec.decode(b"\xff" * 8)
+    # Raw deflate has no dictionary id; a mismatched dictionary is caught by the schema hash.
+    assert ZlibCodec(inner=inner, zdict=b"other dictionary").payload_schema() != (
+        codec.payload_schema()
+    )
+    other = train_zdict([inner.encode(w) for w in windows], size=64)
+    assert other == zdict
+
+
+def test_zlib_zdict_validation() -> None:
+    from loralink_mllc.codecs.zlib_codec import MAX_ZDICT_BYTES, train_zdict
+
+    with pytest.raises(ValueError, match="zdict must be"):
+        ZlibCodec(zdict=b"")
+    with pytest.raises(ValueError, match="zdict must be"):
+        ZlibCodec(zdict=b"x" * (MAX_ZDICT_BYTES + 1))
+    with pytest.raises(ValueError, match="zdict size"):
+        train_zdict([], size=0)
+    with pytest.raises(ValueError, match="segment"):
+        train_zdict([], segment=0)
+    assert train_zdict([b"abcdefgh"]) == b""
+    assert train_zdict([b"aaaabbbb", b"aaaabbbb", b"bbbbxxxx"], size=4) == b"bbbb"
+
+
+def test_create_codec_zlib_with_zdict(tmp_path: Path) -> None:
+    zdict_path = tmp_path / "zdict.bin"
+    zdict_path.write_bytes(b"\xff\x7f" * 16)
+    codec = create_codec(
+        CodecSpec(id="zlib", version="1", params={"level": 9, "zdict_path": str(zdict_path)})
+    )
+    assert codec.zdict_hash is not None
+    assert codec.decode(codec.encode([1.0] * 12)) == [1.0] * 12
+
+
 def test_bam_artifacts_validation_and_payload_bytes() -> None:
     with pytest.raises(ValueError, match="missing bam_artifacts keys"):
         BamArtifacts.from_dict({"manifest_version": "1"})
@@ -102,6 +237,54 @@ def test_bam_artifacts_validation_and_payload_bytes() -> None:
     )
     assert artifacts.as_dict()["packing"] == "unknown"
     assert artifacts.expected_payload_bytes() is None
+    assert artifacts.cycle_budget(0) == 0
+    assert artifacts.cycle_budget(4) == 4
+
+
+@pytest.mark.parametrize(
+    ("extra", "match"),
+    [
+        ({"cycle_tol": 0.0}, "cycle_tol must be > 0"),
+        ({"max_cycles": 4}, "max_cycles requires cycle_tol"),
+        ({"cycle_tol": 1e-3, "max_cycles": -1}, "max_cycles must be >= 0"),
+    ],
+)
+def test_bam_artifacts_cycle_tol_validation(extra: dict, match: str) -> None:
+    data = {
+        "manifest_version": "1",
+        "model_format": "layer_npz_v1",
+        "model_path": ".",
+        "latent_dim": 2,
+        "packing": "float32",
+        "input_dims": 2,
+        "window_W": 1,
+        "window_stride": 1,
+        "encode_cycles": 8,
+    }
+    data.update(extra)
+    with pytest.raises(ValueError, match=match):
+        BamArtifacts.from_dict(data)
+
+
+def test_bam_artifacts_cycle_budget_with_max_cycles() -> None:
+    artifacts = BamArtifacts.from_dict(
+        {
+            "manifest_version": "1",
+            "model_format": "layer_npz_v1",
+            "model_path": ".",
+            "latent_dim": 2,
+            "packing": "float32",
+            "input_dims": 2,
+            "window_W": 1,
+            "window_stride": 1,
+            "encode_cycles": 8,
+            "cycle_tol": 1e-3,
+            "max_cycles": 3,
+        }
+    )
+    assert artifacts.as_dict()["cycle_tol"] == 1e-3
+    assert artifacts.cycle_budget(8) == 3
+    assert artifacts.cycle_budget(0) == 0
 
 
 def test_codec_factory_error_paths_and_placeholder() -> None:
@@ -92,3 +92,228 @@ def test_end_to_end_mock(tmp_path: Path) -> None:
     tx_seqs = {e["seq"] for e in events if e.get("event") == "tx_sent"}
     ack_seqs = {e["ack_seq"] for e in events if e.get("event") == "ack_received"}
     assert ack_seqs.issubset(tx_seqs)
+
+
+def _run_mock_pair(
+    tmp_path: Path,
+    run_id: str,
+    tx_overrides: dict,
+    link_kwargs: dict | None = None,
+    spec_overrides: dict | None = None,
+    step_ms: int = 1,
+    event_driven: bool = False,
+) -> dict:
+    specs = {}
+    for role in ("tx", "rx"):
+        data = _make_runspec(tmp_path, role, run_id).as_dict()
+        data.update(spec_overrides or {})
+        data["tx"].update({"max_windows": 8, **tx_overrides})
+        specs[role] = RunSpec.from_dict(data)
+        specs[role].validate()
+    codec = RawCodec()
+    clock = FakeClock()
+    link = create_mock_link(clock=clock, **(link_kwargs or {}))
+    loggers = {
+        role: JsonlLogger(
+            spec.logging.out_dir, spec.run_id, spec.role, spec.mode, spec.phy_id(), clock=clock
+        )
+        for role, spec in specs.items()
+    }
+    tx_node = TxNode(specs["tx"], link.a, codec, loggers["tx"], DummySampler(12), clock=clock)
+    rx_node = RxNode(specs["rx"], link.b, codec, loggers["rx"], clock=clock)
+    run_pair(
+        tx_node,
+        rx_node,
+        clock,
+        step_ms=step_ms,
+        max_steps=20000,
+        link=link if event_driven else None,
+    )
+    for logger in loggers.values():
+        logger.close()
+    events = load_events(tmp_path / f"{run_id}_tx.jsonl")
+    events += load_events(tmp_path / f"{run_id}_rx.jsonl")
+    return compute_metrics(events)
+
+
+def test_end_to_end_mock_aggregation_saves_airtime_per_window(tmp_path: Path) -> None:
+    single = _run_mock_pair(tmp_path, "single", {})
+    aggregated = _run_mock_pair(
+        tmp_path,
+        "agg",
+        {"aggregate_max_windows": 4, "aggregate_delay_ms": 1000},
+    )
+    assert single["delivered_windows"] == aggregated["delivered_windows"] == 8
+    assert aggregated["sent_count"] == aggregated["rx_frame_count"] == 2
+    assert aggregated["rx_ok_count"] == 8
+    assert aggregated["pdr"] == 1.0
+    assert aggregated["windows_per_frame"]["mean"] == 4.0
+    assert aggregated["toa_ms_per_delivered_window"] < single["toa_ms_per_delivered_window"]
+
+
+def test_end_to_end_mock_bitmap_acks_avoid_spurious_retries(tmp_path: Path) -> None:
+    tx = {"max_windows": 16, "max_inflight": 4, "max_retries": 3, "ack_timeout_ms": 600}
+    lossy_acks = {"drop_pattern_ba": [False, True]}  # every second ACK frame is lost
+    single = _run_mock_pair(tmp_path, "single", tx, lossy_acks)
+    bitmap = _run_mock_pair(tmp_path, "bitmap", {**tx, "ack_mode": "bitmap"}, lossy_acks)
+    batched = _run_mock_pair(
+        tmp_path,
+        "batched",
+        {**tx, "ack_mode": "bitmap", "ack_every": 2, "ack_delay_ms": 100},
+        lossy_acks,
+    )
+    for report in (single, bitmap, batched):
+        assert report["delivered_windows"] == 16
+        assert report["failed_count"] == 0
+    assert bitmap["acked_via_bitmap"] > 0
+    assert bitmap["retries"] < single["retries"] / 4
+    assert bitmap["total_toa_ms"] < single["total_toa_ms"]
+    assert batched["ack_sent_count"] < bitmap["ack_sent_count"] / 1.5
+    assert batched["ack_frames_per_rx_frame"] < bitmap["ack_frames_per_rx_frame"] * 0.7
+
+
+def test_end_to_end_mock_fragmentation_streams_large_windows(tmp_path: Path) -> None:
+    single = _run_mock_pair(tmp_path, "whole", {})
+    small_frames = {"max_payload_bytes": 10}  # 24 B RAW windows -> 3 fragments of <= 9 B
+    fragmented = _run_mock_pair(tmp_path, "frag", {"max_fragments": 4}, None, small_frames)
+    assert fragmented["delivered_windows"] == 8
+    assert fragmented["sent_count"] == fragmented["rx_frame_count"] == 24
+    assert fragmented["rx_reassembled_count"] == 8
+    assert fragmented["fragments_per_window"]["mean"] == 3.0
+    # Every fragment repeats preamble + header: fragmenting costs airtime per window.
+    assert fragmented["toa_ms_per_delivered_window"] > single["toa_ms_per_delivered_window"]
+
+    lossy = _run_mock_pair(
+        tmp_path,
+        "frag_lossy",
+        {"max_fragments": 4, "max_retries": 3},
+        {"drop_pattern_ab": [False, False, True]},  # every third fragment needs a retry
+        small_frames,
+    )
+    assert lossy["delivered_windows"] == 8
+    assert lossy["rx_reassembled_count"] == 8
+    assert lossy["rx_reassembly_fail_count"] == 0
+    assert lossy["retries"] > 0
+
+
+def test_end_to_end_mock_fec_groups_close_between_fragmented_windows(tmp_path: Path) -> None:
+    # 24 B RAW windows -> 3 fragments of <= 9 B (12 B frames minus FEC and fragment headers).
+    small_frames = {"max_payload_bytes": 12}
+    tx = {"max_fragments": 4, "max_inflight": 4, "max_retries": 3, "ack_timeout_ms": 600}
+    clean = _run_mock_pair(tmp_path, "fec_frag", {**tx, "fec_group": 2}, None, small_frames)
+    assert clean["rx_reassembled_count"] == 8
+    # A group never closes inside a window, so it stretches to all 3 fragments.
+    assert clean["fec_parity_sent"] == 8
+
+    lossy = _run_mock_pair(
+        tmp_path,
+        "fec_frag_lossy",
+        {**tx, "fec_group": 2},
+        {"drop_pattern_ab": [False, True, False, False]},  # every middle fragment is lost
+        small_frames,
+    )
+    assert lossy["rx_reassembled_count"] == 8
+    assert lossy["rx_reassembly_fail_count"] == 0
+    assert lossy["fec_recovered_count"] == 8
+    assert lossy["retries"] == 0
+
+    # A window that would push a group past 16 frames opens the next group instead.
+    capped = _run_mock_pair(tmp_path, "fec_frag_cap", {**tx, "fec_group": 16}, None, small_frames)
+    assert capped["rx_reassembled_count"] == 8
+    assert capped["fec_parity_sent"] == 2  # 5 windows (15 frames), then 3 windows
+
+
+def test_end_to_end_mock_fec_recovers_losses_without_retransmission(tmp_path: Path) -> None:
+    tx = {"max_windows": 16, "max_inflight": 4, "max_retries": 3, "ack_timeout_ms": 600}
+    lossy = {"drop_pattern_ab": [False, True, False, False]}
+    arq = _run_mock_pair(tmp_path, "arq", tx, lossy)
+    fec = _run_mock_pair(tmp_path, "fec", {**tx, "fec_group": 3}, lossy)
+    for report in (arq, fec):
+        assert report["delivered_windows"] == 16
+        assert report["failed_count"] == 0
+    # One XOR parity per 3 data frames rebuilds every lost data frame: no ACK timeout waits,
+    # paid for with parity airtime.
+    assert arq["retries"] > 0 and fec["retries"] == 0
+    assert fec["fec_recovered_count"] > 0
+    assert fec["fec_parity_sent"] == 6  # 16 windows -> groups of 3, 3, 3, 3, 3, 1
+    assert fec["fec_parity_toa_ms"] > 0
+    assert fec["e2e_ms"]["max"] < arq["e2e_ms"]["max"]
+    # Parity inflates the plain ETX; the data-only ETX shows no frame was sent twice.
+    assert fec["etx"] > fec["etx_data"] == 1.0 < arq["etx_data"]
+    assert fec["e2e_ms_fec_recovered"]["count"] == fec["fec_recovered_count"]
+    assert fec["e2e_ms_retransmitted"] is None and arq["e2e_ms_fec_recovered"] is None
+    assert fec["e2e_ms_fec_recovered"]["max"] < arq["e2e_ms_retransmitted"]["max"]
+
+
+def test_end_to_end_mock_event_driven_loop_removes_polling_latency(tmp_path: Path) -> None:
+    link_kwargs = {"latency_ms": 7}
+    polled = _run_mock_pair(tmp_path / "poll", "poll", {}, link_kwargs, step_ms=5)
+    event = _run_mock_pair(tmp_path / "event", "event", {}, link_kwargs, event_driven=True)
+    again = _run_mock_pair(tmp_path / "again", "event", {}, link_kwargs, event_driven=True)
+
+    assert event["delivered_windows"] == polled["delivered_windows"] == 8
+    # Samples follow sample_hz and each ACK is handled the moment it is delivered: the
+    # end-to-end latency is exactly the two link latencies, with no step rounding or backlog.
+    assert event["e2e_ms"]["max"] == 2 * 7
+    assert polled["e2e_ms"]["max"] > 2 * 7
+    # FakeClock runs stay deterministic (only the wall-clock codec timing differs).
+    assert {k: v for k, v in event.items() if k != "codec_encode_ms"} == {
+        k: v for k, v in again.items() if k != "codec_encode_ms"
+    }
+
+
+def test_end_to_end_mock_adaptive_ack_timeout_avoids_spurious_retries(tmp_path: Path) -> None:
+    # 300 ms RTT on a link whose ToA-based estimate is far shorter (UART/air-speed latency).
+    link_kwargs = {"latency_ms": 150}
+    static = _run_mock_pair(
+        tmp_path / "auto",
+        "auto",
+        {"ack_timeout_ms": "auto", "max_retries": 4},
+        link_kwargs,
+        event_driven=True,
+    )
+    adaptive = _run_mock_pair(
+        tmp_path / "adaptive",
+        "adaptive",
+        {"ack_timeout_ms": "adaptive", "max_retries": 4},
+        link_kwargs,
+        event_driven=True,
+    )
+    assert static["delivered_windows"] == adaptive["delivered_windows"] == 8
+    assert static["etx"] == 3.0  # every window retransmitted twice before its ACK lands
+    assert adaptive["retries"] == 2  # only while backing off towards the measured RTT
+    assert adaptive["etx"] < static["etx"]
+    assert adaptive["ack_timeout_ms"]["max"] > static["ack_timeout_ms"]["max"]
+
+
+def test_end_to_end_mock_duty_cycle_defers_frames_within_airtime_budget(tmp_path: Path) -> None:
+    tx = {"fec_group": 2, "duty_cycle_window_ms": 10_000}
+    free = _run_mock_pair(tmp_path, "free", tx, event_driven=True)
+    capped = _run_mock_pair(tmp_path, "capped", {**tx, "duty_cycle": 0.04}, event_driven=True)
+    assert free["airtime_headroom_ms"] is None and free["tx_age_ms"]["max"] == 0.0
+    assert capped["delivered_windows"] == free["delivered_windows"] == 8
+    assert capped["fec_parity_sent"] == free["fec_parity_sent"] == 4
+    assert capped["airtime_headroom_ms"]["count"] == capped["sent_count"] == 12
+    assert capped["airtime_headroom_ms"]["min"] >= 0.0  # 400 ms per 10 s never exceeded
+    assert capped["tx_age_ms"]["max"] > 1000  # windows waited for airtime to leave the window
+
+
+def test_end_to_end_mock_bounded_queue_trades_stale_windows_for_freshness(tmp_path: Path) -> None:
+    # A 2.4 s RTT link with one frame inflight cannot keep up with 1 Hz windows.
+    tx = {"ack_timeout_ms": 5000}
+    slow = {"latency_ms": 1200}
+    backlog = _run_mock_pair(tmp_path, "backlog", tx, slow, event_driven=True)
+    latest = _run_mock_pair(
+        tmp_path, "latest", {**tx, "pending_policy": "keep_latest"}, slow, event_driven=True
+    )
+    stale = _run_mock_pair(
+        tmp_path, "stale", {**tx, "pending_max_age_ms": 2500}, slow, event_driven=True
+    )
+    assert backlog["dropped_count"] == 0 and backlog["delivered_windows"] == 8
+    for report, reason in ((latest, "queue_full"), (stale, "stale")):
+        assert report["dropped_by_reason"] == {reason: report["dropped_count"]}
+        assert report["delivered_windows"] + report["dropped_count"] == 8
+        assert report["tx_age_ms"]["max"] < backlog["tx_age_ms"]["max"]
+        assert report["e2e_ms"]["max"] < backlog["e2e_ms"]["max"]
+    assert latest["dropped_age_ms"]["max"] == 1000.0
+    assert stale["dropped_age_ms"]["min"] > 2500
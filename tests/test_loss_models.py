@@ -0,0 +1,184 @@
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from loralink_mllc.config.runspec import PhySpec
+from loralink_mllc.radio.base import IRxRssi
+from loralink_mllc.radio.loss import (
+    BernoulliLoss,
+    GilbertElliottLoss,
+    PatternLoss,
+    SnrThresholdLoss,
+    TraceReplayLoss,
+    create_loss_model,
+)
+from loralink_mllc.radio.mock import MockLink, create_mock_link
+from loralink_mllc.runtime.scheduler import FakeClock
+
+_PHY = PhySpec(
+    sf=7, bw_hz=125000, cr=5, preamble=8, crc_on=True, explicit_header=True, tx_power_dbm=14
+)
+
+
+def _write_rx_log(path: Path, events: list[dict]) -> Path:
+    lines = [json.dumps(event) for event in events]
+    path.write_text("\n".join(lines[:2] + [""] + lines[2:]) + "\n", encoding="utf-8")
+    return path
+
+
+def test_bernoulli_and_pattern_losses() -> None:
+    assert [BernoulliLoss(1.0).should_drop() for _ in range(3)] == [True] * 3
+    assert BernoulliLoss(0.0).rssi_dbm() is None
+    pattern = PatternLoss([False, True])
+    assert [pattern.should_drop() for _ in range(4)] == [False, True, False, True]
+    assert pattern.rssi_dbm() is None
+    with pytest.raises(ValueError, match="loss_rate must be in"):
+        BernoulliLoss(1.5)
+    with pytest.raises(ValueError, match="drop pattern must not be empty"):
+        PatternLoss([])
+
+
+def test_gilbert_elliott_matches_stationary_rate_and_burst_length() -> None:
+    model = GilbertElliottLoss(p_gb=0.05, p_bg=0.25, seed=7)
+    assert model.bad_fraction == pytest.approx(1 / 6)
+    assert model.stationary_loss_rate == pytest.approx(1 / 6)
+    drops = [model.should_drop() for _ in range(200_000)]
+    assert sum(drops) / len(drops) == pytest.approx(1 / 6, abs=0.01)
+    bursts = []
+    run = 0
+    for drop in drops:
+        if drop:
+            run += 1
+        elif run:
+            bursts.append(run)
+            run = 0
+    assert sum(bursts) / len(bursts) == pytest.approx(1 / 0.25, rel=0.05)  # bursty, not i.i.d.
+    assert model.rssi_dbm() is None
+
+    partial = GilbertElliottLoss(p_gb=0.1, p_bg=0.1, loss_good=0.1, loss_bad=0.5)
+    assert partial.stationary_loss_rate == pytest.approx(0.3)
+    with pytest.raises(ValueError, match="p_gb must be in"):
+        GilbertElliottLoss(p_gb=1.2, p_bg=0.1)
+    with pytest.raises(ValueError, match="loss_bad must be in"):
+        GilbertElliottLoss(p_gb=0.1, p_bg=0.1, loss_bad=-0.1)
+    with pytest.raises(ValueError, match="p_gb \\+ p_bg must be > 0"):
+        GilbertElliottLoss(p_gb=0.0, p_bg=0.0)
+
+
+def test_trace_replay_rebuilds_losses_from_rx_log_seq_gaps(tmp_path: Path) -> None:
+    path = _write_rx_log(
+        tmp_path / "rx.jsonl",
+        [
+            {"event": "run_start"},
+            {"event": "rx_ok", "seq": 254, "rssi_dbm": -80},
+            {"event": "ack_sent", "ack_seq": 254},
+            {"event": "rx_ok", "seq": 1, "rssi_dbm": -90},  # 255 and 0 lost across the wrap
+            {"event": "rx_ok", "seq": 1, "sub_index": 1, "rssi_dbm": -90},
+            {"event": "rx_dup", "seq": 1},  # retransmission after a lost ACK
+            {"event": "rx_fec_recovered", "seq": 2},
+            {"event": "rx_fec_parity", "seq": 3},
+        ],
+    )
+    model = TraceReplayLoss.from_rx_log(path)
+    assert model.loss_rate == pytest.approx(3 / 7)
+    outcomes = [(model.should_drop(), model.rssi_dbm()) for _ in range(8)]
+    assert outcomes == [
+        (False, -80),
+        (True, None),
+        (True, None),
+        (False, -90),
+        (False, None),
+        (True, None),  # seq 2 was rebuilt by FEC, not received
+        (False, None),
+        (False, -80),  # wraps around
+    ]
+    shifted = TraceReplayLoss.from_rx_log(path, offset=10)
+    assert shifted.should_drop() is False and shifted.rssi_dbm() == -90
+
+    empty = _write_rx_log(tmp_path / "empty.jsonl", [{"event": "run_start"}])
+    with pytest.raises(ValueError, match="no received frames in trace"):
+        TraceReplayLoss.from_rx_log(empty)
+    with pytest.raises(ValueError, match="loss trace is empty"):
+        TraceReplayLoss([], [])
+    with pytest.raises(ValueError, match="lengths differ"):
+        TraceReplayLoss([True], [])
+
+
+def test_snr_threshold_uses_sf_floor_and_reports_rssi() -> None:
+    clear = SnrThresholdLoss(_PHY, snr_db=-5.0)
+    assert clear.loss_rate == 0.0
+    assert clear.rssi_dbm() is None
+    assert clear.should_drop() is False
+    noise_floor = -174.0 + 10.0 * math.log10(125000) + 6.0
+    assert clear.rssi_dbm() == round(noise_floor - 5.0)
+
+    below = SnrThresholdLoss(_PHY, snr_db=-8.0)  # SF7 floor is -7.5 dB
+    assert below.loss_rate == 1.0 and below.should_drop() is True
+    sf12 = PhySpec(12, 125000, 5, 8, True, True, 14)
+    assert SnrThresholdLoss(sf12, snr_db=-8.0).should_drop() is False
+
+    fading = SnrThresholdLoss(_PHY, snr_db=-7.5, fading_db=4.0, seed=3)
+    assert fading.loss_rate == pytest.approx(0.5)
+    drops = sum(fading.should_drop() for _ in range(20_000))
+    assert drops / 20_000 == pytest.approx(0.5, abs=0.02)
+
+    with pytest.raises(ValueError, match="sf must be 5..12"):
+        SnrThresholdLoss(PhySpec(4, 125000, 5, 8, True, True, 14), snr_db=0.0)
+    with pytest.raises(ValueError, match="fading_db must be >= 0"):
+        SnrThresholdLoss(_PHY, snr_db=0.0, fading_db=-1.0)
+
+
+def test_create_loss_model_from_specs(tmp_path: Path) -> None:
+    path = _write_rx_log(tmp_path / "rx.jsonl", [{"event": "rx_ok", "seq": 0}])
+    assert isinstance(create_loss_model({"loss_rate": 0.2}), BernoulliLoss)
+    assert isinstance(create_loss_model({"model": "pattern", "pattern": [True]}), PatternLoss)
+    ge = create_loss_model({"model": "gilbert_elliott", "p_gb": 0.1, "p_bg": 0.5})
+    assert isinstance(ge, GilbertElliottLoss)
+    trace = create_loss_model({"model": "trace", "path": str(path)})
+    assert isinstance(trace, TraceReplayLoss)
+    snr = create_loss_model({"model": "snr", "snr_db": 0.0}, phy=_PHY)
+    assert isinstance(snr, SnrThresholdLoss)
+
+    seeded = {"model": "gilbert_elliott", "p_gb": 0.3, "p_bg": 0.3, "seed": 5}
+    a = create_loss_model(seeded, seed=1)
+    b = create_loss_model(seeded, seed=2)
+    assert [a.should_drop() for _ in range(50)] == [b.should_drop() for _ in range(50)]
+
+    with pytest.raises(ValueError, match="snr loss model needs the PHY profile"):
+        create_loss_model({"model": "snr", "snr_db": 0.0})
+    with pytest.raises(ValueError, match="unknown loss model: rayleigh"):
+        create_loss_model({"model": "rayleigh"})
+
+
+def test_mock_link_applies_loss_models_per_direction(tmp_path: Path) -> None:
+    path = _write_rx_log(
+        tmp_path / "rx.jsonl",
+        [{"event": "rx_ok", "seq": 0, "rssi_dbm": -70}, {"event": "rx_ok", "seq": 2}],
+    )
+    clock = FakeClock()
+    link = create_mock_link(
+        clock=clock,
+        loss_rate=1.0,
+        loss_model_ab={"model": "trace", "path": str(path)},
+        phy=_PHY,
+    )
+    assert isinstance(link.b, IRxRssi)
+    received = []
+    for idx in range(3):
+        link.a.send(bytes([1, idx, idx]))
+        frame = link.b.recv(timeout_ms=0)
+        received.append((frame, link.b.last_rx_rssi_dbm()))
+    assert received == [(bytes([1, 0, 0]), -70), (None, -70), (bytes([1, 2, 2]), None)]
+    link.b.send(b"ack")
+    assert link.a.recv(timeout_ms=0) is None  # b -> a keeps loss_rate=1.0
+
+    both = create_mock_link(clock=clock, loss_model={"model": "snr", "snr_db": -9.0}, phy=_PHY)
+    both.a.send(b"x")
+    both.b.send(b"y")
+    assert both.b.recv(timeout_ms=0) is None and both.a.recv(timeout_ms=0) is None
+
+    direct = MockLink(clock=clock, loss_rate=1.0, loss_model_ba=PatternLoss([False]))
+    direct.b.send(b"z")
+    assert direct.a.recv(timeout_ms=0) == b"z"
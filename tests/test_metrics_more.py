@@ -33,7 +33,14 @@ def test_load_events_skips_blank_lines(tmp_path: Path) -> None:
 
 def test_compute_metrics_branches() -> None:
     events = [
-        {"event": "tx_sent", "attempt": 1, "window_id": 1, "toa_ms_est": 1.0, "payload_bytes": 1},
+        {
+            "event": "tx_sent",
+            "attempt": 1,
+            "window_id": 1,
+            "toa_ms_est": 1.0,
+            "payload_bytes": 1,
+            "codec_cycles": 4,
+        },
         {"event": "tx_sent", "attempt": 2, "window_id": 1, "toa_ms_est": 2.0, "payload_bytes": 1},
         {"event": "rx_ok", "window_id": 1, "rssi_dbm": -120},
         {"event": "ack_received", "window_id": 1, "rtt_ms": 5, "queue_ms": 1, "e2e_ms": 6},
@@ -50,3 +57,123 @@ def test_compute_metrics_branches() -> None:
     assert report["pdr"] == 0.5  # rx_ok / tx_sent
     assert report["recon_mae"]["count"] == 1
     assert report["rssi_dbm"]["count"] == 1
+    assert report["codec_cycles"]["max"] == 4.0
+
+
+def test_compute_metrics_counts_duplicates_for_link_pdr_only() -> None:
+    events = [
+        {"event": "tx_sent", "attempt": 1, "window_id": 0},
+        {"event": "tx_sent", "attempt": 2, "window_id": 0},
+        {"event": "rx_ok", "seq": 0},
+        {"event": "rx_dup", "seq": 0},
+        {"event": "ack_sent", "ack_seq": 0},
+        {"event": "ack_sent", "ack_seq": 0},
+        {"event": "ack_received", "window_id": 0},
+    ]
+    report = compute_metrics(events)
+    assert report["rx_ok_count"] == 1
+    assert report["rx_dup_count"] == 1
+    assert report["pdr"] == 1.0
+    assert report["ack_frames_per_rx_frame"] == 1.0
+    assert report["delivered_windows"] == 1
+
+
+def test_compute_metrics_counts_fragmented_window_once_all_fragments_acked() -> None:
+    events = [
+        {"event": "tx_sent", "attempt": 1, "window_id": 0, "frag_index": 0, "frag_count": 2},
+        {"event": "tx_sent", "attempt": 1, "window_id": 0, "frag_index": 1, "frag_count": 2},
+        {"event": "tx_sent", "attempt": 1, "window_id": 1, "frag_index": 0, "frag_count": 2},
+        {"event": "tx_sent", "attempt": 1, "window_id": 1, "frag_index": 1, "frag_count": 2},
+        {"event": "ack_received", "window_id": 0, "frag_index": 0, "frag_count": 2},
+        {"event": "ack_received", "window_id": 0, "frag_index": 1, "frag_count": 2},
+        {"event": "ack_received", "window_id": 1, "frag_index": 1, "frag_count": 2},
+        {"event": "rx_reassembled", "seq": 0},
+        {"event": "rx_reassembly_fail", "seq": 2, "reason": "timeout"},
+    ]
+    report = compute_metrics(events)
+    assert report["unique_windows_sent"] == 2
+    assert report["delivered_windows"] == 1
+    assert report["fragments_per_window"]["count"] == 2
+    assert report["fragments_per_window"]["mean"] == 2.0
+    assert report["rx_reassembled_count"] == 1
+    assert report["rx_reassembly_fail_count"] == 1
+
+
+def test_compute_metrics_counts_fec_parity_and_recovered_windows_separately() -> None:
+    events = [
+        {"event": "tx_sent", "attempt": 1, "window_id": 0, "toa_ms_est": 30.0},
+        {"event": "tx_sent", "attempt": 1, "window_id": 1, "toa_ms_est": 30.0},
+        {"event": "tx_sent", "attempt": 1, "fec_parity": True, "toa_ms_est": 31.0},
+        {"event": "rx_ok", "seq": 0},
+        {"event": "rx_fec_parity", "seq": 2},
+        {"event": "rx_fec_recovered", "seq": 1},
+        {"event": "ack_received", "window_id": 0},
+        {"event": "ack_received", "window_id": 1},
+    ]
+    report = compute_metrics(events)
+    assert report["rx_ok_count"] == 1
+    assert report["fec_recovered_count"] == 1
+    assert report["fec_parity_sent"] == report["fec_parity_received"] == 1
+    assert report["fec_parity_toa_ms"] == 31.0
+    assert report["pdr"] == 2 / 3  # data frame + parity frame arrived, the rebuilt one did not
+    assert report["windows_per_frame"]["count"] == 2
+    assert report["delivered_windows"] == 2
+
+
+def test_compute_metrics_compares_fec_against_pure_arq() -> None:
+    arq = compute_metrics(
+        [
+            {"event": "tx_sent", "seq": 0, "attempt": 1, "window_id": 0, "toa_ms_est": 30.0},
+            {"event": "tx_sent", "seq": 1, "attempt": 1, "window_id": 1, "toa_ms_est": 30.0},
+            {"event": "tx_sent", "seq": 1, "attempt": 2, "window_id": 1, "toa_ms_est": 30.0},
+            {"event": "rx_ok", "seq": 0},
+            {"event": "rx_ok", "seq": 1},
+            {"event": "ack_received", "ack_seq": 0, "window_id": 0, "attempts": 1, "e2e_ms": 100},
+            {"event": "ack_received", "ack_seq": 1, "window_id": 1, "attempts": 2, "e2e_ms": 700},
+        ]
+    )
+    assert arq["etx"] == arq["etx_data"] == 1.5
+    assert arq["fec_parity_toa_ms_per_delivered_window"] == 0.0
+    assert arq["e2e_ms_first_attempt"]["max"] == 100.0
+    assert arq["e2e_ms_retransmitted"]["max"] == 700.0
+    assert arq["e2e_ms_fec_recovered"] is None
+
+    # 258 data frames in groups of 2 (parity after each pair); SEQs wrap past 255. Only the
+    # second use of SEQ 0 is rebuilt by FEC; its first use (window 0) arrived.
+    tx: list[dict] = []
+    rx: list[dict] = []
+    seq = 0
+    for window_id in range(258):
+        tx.append({"event": "tx_sent", "seq": seq, "attempt": 1, "window_id": window_id})
+        rebuilt = window_id == 171  # 171 data + 85 parity frames before it: SEQ 256 -> 0
+        rx.append({"event": "rx_fec_recovered" if rebuilt else "rx_ok", "seq": seq})
+        tx.append({"event": "ack_received", "ack_seq": seq, "window_id": window_id,
+                   "attempts": 1, "e2e_ms": 400 if rebuilt else 100})
+        seq = (seq + 1) % 256
+        if window_id % 2:
+            tx.append({"event": "tx_sent", "seq": seq, "attempt": 1, "fec_parity": True,
+                       "toa_ms_est": 2.0})
+            rx.append({"event": "rx_fec_parity", "seq": seq})
+            seq = (seq + 1) % 256
+    fec = compute_metrics(tx + rx)
+    assert fec["etx"] == (258 + 129) / 258
+    assert fec["etx_data"] == 1.0
+    assert fec["fec_parity_toa_ms_per_delivered_window"] == 129 * 2.0 / 258
+    assert fec["e2e_ms_fec_recovered"]["count"] == 1
+    assert fec["e2e_ms_fec_recovered"]["max"] == 400.0
+    assert fec["e2e_ms_first_attempt"]["count"] == 257
+    assert fec["e2e_ms_first_attempt"]["max"] == 100.0
+    assert fec["e2e_ms_retransmitted"] is None
+
+
+def test_compute_metrics_summarizes_uart_drain_apart_from_tx_sent() -> None:
+    events = [
+        {"event": "tx_sent", "attempt": 1, "window_id": 0, "toa_ms_est": 30.0},
+        {"event": "uart_tx_drain", "seq": 0, "queue_ms": 0, "drain_ms": 9},
+        {"event": "uart_tx_drain", "seq": 1, "queue_ms": 9, "drain_ms": 15},
+        {"event": "uart_tx_drain", "seq": 2},
+    ]
+    report = compute_metrics(events)
+    assert report["uart_drain_ms"]["count"] == 2
+    assert report["uart_drain_ms"]["max"] == 15.0
+    assert compute_metrics([])["uart_drain_ms"] is None
@@ -71,3 +71,115 @@ def test_phase0_phase1_smoke(tmp_path: Path) -> None:
     assert report["latent"]["sent_count"] > 0
 
 
+
+
+def test_phase0_phase1_shared_channel_profile(tmp_path: Path) -> None:
+    phy = {
+        "sf": 7,
+        "bw_hz": 125000,
+        "cr": 5,
+        "preamble": 8,
+        "crc_on": True,
+        "explicit_header": True,
+        "tx_power_dbm": 14,
+    }
+    base_runspec = {
+        "run_id": "chan",
+        "role": "tx",
+        "mode": "RAW",
+        "phy": phy,
+        "window": {"dims": 12, "W": 1, "sample_hz": 5.0},
+        "codec": {"id": "raw", "version": "1", "params": {}},
+        "tx": {"guard_ms": 0, "ack_timeout_ms": 200, "max_retries": 0, "max_inflight": 1},
+        "logging": {"out_dir": str(tmp_path)},
+    }
+    channel = {
+        "distance_m": 800,
+        "interferers": [{"distance_m": 50, "frame_bytes": 40, "mean_interval_ms": 150}],
+    }
+    sweep = {
+        "base_runspec": base_runspec,
+        "profiles": [{"profile_id": "busy", "phy": phy, "channel": channel, "seed": 2}],
+        "packets_per_profile": 20,
+        "target_pdr_low": 0.0,
+        "target_pdr_high": 1.0,
+        "out_dir": str(tmp_path),
+    }
+    sweep_path = tmp_path / "sweep.json"
+    c50_path = tmp_path / "c50.json"
+    sweep_path.write_text(json.dumps(sweep), encoding="utf-8")
+
+    selected = find_c50(sweep_path, out_path=c50_path)["selected"]
+    assert selected["channel"] == channel
+    stats = selected["channel_stats"]
+    assert stats["frames_sent"] >= 20 and stats["interferer_frames"] > 0
+    assert stats["collided"] > 0
+    assert 0.0 < selected["metrics"]["pdr"] < 1.0
+
+    runspec_paths = []
+    for mode, codec in (("RAW", "raw"), ("LATENT", "zlib")):
+        spec = json.loads(json.dumps(base_runspec))
+        spec.update({"run_id": codec, "mode": mode})
+        spec["codec"] = {"id": codec, "version": "1", "params": {}}
+        spec["tx"]["max_windows"] = 20
+        path = tmp_path / f"{codec}.json"
+        path.write_text(json.dumps(spec), encoding="utf-8")
+        runspec_paths.append(path)
+    report = run_ab(c50_path, *runspec_paths)
+    assert report["raw"]["channel_stats"]["frames_sent"] >= 20
+    assert report["latent"]["channel_stats"]["interferer_frames"] > 0
+
+
+def test_phase0_phase1_bursty_loss_model_profile(tmp_path: Path) -> None:
+    phy = {
+        "sf": 7,
+        "bw_hz": 125000,
+        "cr": 5,
+        "preamble": 8,
+        "crc_on": True,
+        "explicit_header": True,
+        "tx_power_dbm": 14,
+    }
+    base_runspec = {
+        "run_id": "ge",
+        "role": "tx",
+        "mode": "RAW",
+        "phy": phy,
+        "window": {"dims": 12, "W": 1, "sample_hz": 1.0},
+        "codec": {"id": "raw", "version": "1", "params": {}},
+        "tx": {"guard_ms": 0, "ack_timeout_ms": 10, "max_retries": 0, "max_inflight": 1},
+        "logging": {"out_dir": str(tmp_path)},
+    }
+    # Stuck in the bad state: every frame a -> b is lost, ACKs are untouched.
+    loss_model = {"model": "gilbert_elliott", "p_gb": 1.0, "p_bg": 0.0}
+    sweep = {
+        "base_runspec": base_runspec,
+        "profiles": [
+            {"profile_id": "ge", "phy": phy, "loss_model_ab": loss_model, "seed": 4},
+        ],
+        "packets_per_profile": 10,
+        "target_pdr_low": 0.0,
+        "target_pdr_high": 1.0,
+        "out_dir": str(tmp_path),
+    }
+    sweep_path = tmp_path / "sweep.json"
+    c50_path = tmp_path / "c50.json"
+    sweep_path.write_text(json.dumps(sweep), encoding="utf-8")
+
+    selected = find_c50(sweep_path, out_path=c50_path)["selected"]
+    assert selected["loss_model_ab"] == loss_model
+    assert selected["loss_model"] is None and selected["loss_model_ba"] is None
+    assert selected["metrics"]["sent_count"] > 0 and selected["metrics"]["pdr"] == 0.0
+
+    raw = json.loads(json.dumps(base_runspec))
+    raw["tx"]["max_windows"] = 10
+    latent = json.loads(json.dumps(raw))
+    latent["mode"] = "LATENT"
+    latent["codec"] = {"id": "zlib", "version": "1", "params": {}}
+    raw_path = tmp_path / "raw.json"
+    latent_path = tmp_path / "latent.json"
+    raw_path.write_text(json.dumps(raw), encoding="utf-8")
+    latent_path.write_text(json.dumps(latent), encoding="utf-8")
+    report = run_ab(c50_path, raw_path, latent_path)
+    assert report["raw"]["sent_count"] > 0 and report["raw"]["pdr"] == 0.0
+    assert report["latent"]["sent_count"] > 0 and report["latent"]["pdr"] == 0.0
@@ -0,0 +1,38 @@
+import pytest
+
+from loralink_mllc.protocol import AggregateError, PacketError, pack_windows, unpack_windows
+
+
+def test_aggregate_roundtrip_and_layout() -> None:
+    payloads = [b"\x01\x02", b"", b"\x03"]
+    packed = pack_windows(payloads)
+    assert packed == bytes([3, 2, 0, 1, 1, 2, 3])
+    assert unpack_windows(packed) == payloads
+
+
+@pytest.mark.parametrize(
+    "payloads,match",
+    [
+        ([], "count must be 1..255"),
+        ([b""] * 256, "count must be 1..255"),
+        ([b"\x00" * 256], "exceeds 255"),
+    ],
+)
+def test_pack_windows_errors(payloads: list[bytes], match: str) -> None:
+    with pytest.raises(AggregateError, match=match):
+        pack_windows(payloads)
+
+
+@pytest.mark.parametrize(
+    "payload,match",
+    [
+        (b"", "empty"),
+        (b"\x00", "count must be > 0"),
+        (b"\x03\x01", "header truncated"),
+        (b"\x01\x02\x00", "does not match sub-header"),
+        (b"\x01\x01\x00\x00", "does not match sub-header"),
+    ],
+)
+def test_unpack_windows_errors(payload: bytes, match: str) -> None:
+    with pytest.raises(PacketError, match=match):
+        unpack_windows(payload)
@@ -0,0 +1,52 @@
+import pytest
+
+from loralink_mllc.protocol.fec import (
+    FecError,
+    fec_data_payload,
+    fec_max_body_bytes,
+    parse_fec_payload,
+    recover_missing,
+    xor_parity,
+)
+
+
+def test_fec_parity_rebuilds_any_single_missing_body() -> None:
+    bodies = [b"\x01\x02\x03", b"\x10", b""]
+    parity = xor_parity(bodies)
+    assert parity == bytes([0x83, 3 ^ 1 ^ 0, 0x01 ^ 0x10, 0x02, 0x03])
+    assert parse_fec_payload(parity) == (True, 3, parity[1:])
+    for missing in range(len(bodies)):
+        others = [b for i, b in enumerate(bodies) if i != missing]
+        assert recover_missing(parity[1:], others) == bodies[missing]
+    assert parse_fec_payload(fec_data_payload(2, b"ab")) == (False, 2, b"ab")
+    assert fec_max_body_bytes(238) == 236
+
+
+def test_fec_builders_reject_bad_input() -> None:
+    with pytest.raises(FecError, match="fec index"):
+        fec_data_payload(16, b"")
+    with pytest.raises(FecError, match="1..16 frames"):
+        xor_parity([])
+    with pytest.raises(FecError, match="exceeds 255"):
+        xor_parity([b"\x00" * 256])
+
+
+@pytest.mark.parametrize(
+    "payload,match",
+    [
+        (b"", "header missing"),
+        (b"\x80\x00", "invalid fec parity header"),
+        (b"\x82", "invalid fec parity header"),
+        (b"\x10", "fec index 16 out of range"),
+    ],
+)
+def test_parse_fec_payload_errors(payload: bytes, match: str) -> None:
+    with pytest.raises(FecError, match=match):
+        parse_fec_payload(payload)
+
+
+def test_recover_missing_rejects_inconsistent_group() -> None:
+    with pytest.raises(FecError, match="longer than parity"):
+        recover_missing(b"\x01\x00", [b"\x00\x00"])
+    with pytest.raises(FecError, match="recovered length"):
+        recover_missing(b"\x05\x00", [])
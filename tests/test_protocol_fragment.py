@@ -0,0 +1,40 @@
+import pytest
+
+from loralink_mllc.protocol import (
+    MAX_FRAGMENTS,
+    FragmentError,
+    PacketError,
+    parse_fragment,
+    split_fragments,
+)
+
+
+def test_fragment_roundtrip_and_header_layout() -> None:
+    fragments = split_fragments(b"abcdefg", max_body_bytes=3)
+    assert fragments == [b"\x02abc", b"\x12def", b"\x22g"]
+    assert [parse_fragment(f) for f in fragments] == [
+        (0, 3, b"abc"),
+        (1, 3, b"def"),
+        (2, 3, b"g"),
+    ]
+    assert split_fragments(b"", max_body_bytes=3) == [b"\x00"]
+
+
+def test_split_fragments_errors() -> None:
+    with pytest.raises(FragmentError, match="max_body_bytes"):
+        split_fragments(b"a", max_body_bytes=0)
+    split_fragments(b"\x00" * MAX_FRAGMENTS, max_body_bytes=1)
+    with pytest.raises(FragmentError, match="needs 17 fragments"):
+        split_fragments(b"\x00" * (MAX_FRAGMENTS + 1), max_body_bytes=1)
+
+
+@pytest.mark.parametrize(
+    "payload,match",
+    [
+        (b"", "header missing"),
+        (b"\x10", "index 1 out of range for count 1"),
+    ],
+)
+def test_parse_fragment_errors(payload: bytes, match: str) -> None:
+    with pytest.raises(PacketError, match=match):
+        parse_fragment(payload)
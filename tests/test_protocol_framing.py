@@ -1,7 +1,13 @@
 import pytest
 
-from loralink_mllc.protocol.framing import make_ack_packet
-from loralink_mllc.protocol.packet import Packet
+from loralink_mllc.protocol.framing import (
+    ACK_VERSION_BITMAP,
+    AckWindow,
+    make_ack_packet,
+    make_bitmap_ack_packet,
+    parse_ack_payload,
+)
+from loralink_mllc.protocol.packet import Packet, PacketError
 
 
 def test_make_ack_packet_ok() -> None:
@@ -20,3 +26,51 @@ def test_make_ack_packet_invalid_seq(seq: int) -> None:
     with pytest.raises(ValueError, match="seq must be 0..255"):
         make_ack_packet(ack_seq=0, seq=seq)
 
+
+
+def test_bitmap_ack_roundtrip_and_wrap() -> None:
+    pkt = make_bitmap_ack_packet(base_seq=1, bitmap=0b101, seq=4, bitmap_bits=16)
+    assert pkt.payload == bytes([ACK_VERSION_BITMAP, 1, 0b101, 0])
+    assert parse_ack_payload(pkt.payload) == [1, 0, 254]
+    assert parse_ack_payload(b"\x07") == [7]
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"base_seq": 256}, "base_seq must be"),
+        ({"seq": -1}, "seq must be"),
+        ({"bitmap_bits": 12}, "multiple of 8"),
+        ({"bitmap": 1 << 8}, "must fit 8 bits"),
+    ],
+)
+def test_make_bitmap_ack_packet_invalid(kwargs: dict, match: str) -> None:
+    args = {"base_seq": 0, "bitmap": 0, "seq": 0, "bitmap_bits": 8, **kwargs}
+    with pytest.raises(ValueError, match=match):
+        make_bitmap_ack_packet(**args)
+
+
+@pytest.mark.parametrize(
+    "payload,match",
+    [(b"", "version: None"), (b"\x09\x01\x00", "version: 9"), (b"\x01\x05", "at least 3")],
+)
+def test_parse_ack_payload_errors(payload: bytes, match: str) -> None:
+    with pytest.raises(PacketError, match=match):
+        parse_ack_payload(payload)
+
+
+def test_ack_window_tracks_recent_seqs_across_wrap() -> None:
+    with pytest.raises(ValueError, match="bitmap_bits"):
+        AckWindow(0)
+    window = AckWindow(8)
+    for seq in (250, 252, 255, 0):
+        window.record(seq)
+    assert window.bitmap(0) == 0b101001  # 255, 252, 250 are 1, 4 and 6 back
+    window.record(253)  # late retransmission behind the newest SEQ
+    assert window.bitmap(0) == 0b101101
+    assert window.bitmap(251) == 0b1
+    for seq in range(1, 10):
+        window.record(seq)
+    assert window.bitmap(10) == 0b11111111  # older entries fall out of the 8-SEQ window
+    window.record(0)  # old SEQ more than 128 behind is not treated as newer
+    assert window.bitmap(1) == 0b1
@@ -0,0 +1,50 @@
+import pytest
+
+from loralink_mllc.runtime.rtt import RttEstimator
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"alpha": 0.0}, {"beta": 1.0}, {"k": 0}, {"granularity_ms": 0}, {"max_backoff": 0}],
+)
+def test_rtt_estimator_validation(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        RttEstimator(**kwargs)
+
+
+def test_rtt_estimator_jacobson_karels_updates() -> None:
+    est = RttEstimator()
+    assert est.rto_ms(initial_ms=120) == 120  # no sample yet: caller's static estimate
+    with pytest.raises(ValueError, match="rtt_ms must be >= 0"):
+        est.observe(-1)
+    est.observe(100)
+    assert (est.srtt_ms, est.rttvar_ms) == (100.0, 50.0)
+    assert est.rto_ms(initial_ms=120) == 300.0
+    est.observe(60)
+    assert est.rttvar_ms == pytest.approx(0.75 * 50 + 0.25 * 40)
+    assert est.srtt_ms == pytest.approx(100 + 0.125 * (60 - 100))
+    for _ in range(200):
+        est.observe(60)
+    assert est.rto_ms(initial_ms=120) == pytest.approx(61.0, abs=0.01)  # granularity floor
+    assert est.samples == 202
+
+
+def test_rtt_estimator_backoff_and_clamping() -> None:
+    est = RttEstimator(max_backoff=4)
+    assert est.timeout_ms(100, min_ms=10, max_ms=1000) == 100
+    est.on_timeout()
+    est.on_timeout()
+    est.on_timeout()
+    assert est.backoff == 4
+    assert est.timeout_ms(100, min_ms=10, max_ms=1000) == 400
+    assert est.timeout_ms(100, min_ms=10, max_ms=250) == 250
+    est.observe(0)  # a valid sample resets the backoff
+    assert est.backoff == 1
+    assert est.timeout_ms(100, min_ms=30, max_ms=250) == 30
+    assert est.state(100) == {
+        "srtt_ms": 0.0,
+        "rttvar_ms": 0.0,
+        "rto_ms": 1.0,
+        "rto_backoff": 1,
+        "rtt_samples": 1,
+    }
@@ -0,0 +1,70 @@
+from loralink_mllc.radio.mock import create_mock_link
+from loralink_mllc.runtime.loop import LoopStats, log_tx_drains, tx_drain_source
+from loralink_mllc.runtime.scheduler import FakeClock
+
+
+class _PlainRadio:
+    def send(self, frame: bytes) -> None:  # pragma: no cover
+        return None
+
+    def recv(self, timeout_ms: int) -> bytes | None:  # pragma: no cover
+        return None
+
+    def close(self) -> None:  # pragma: no cover
+        return None
+
+
+def test_loop_stats_wait_sleeps_until_timer_capped_by_max_idle() -> None:
+    clock = FakeClock()
+    stats = LoopStats("event", clock.now_ms())
+    assert stats.fields(0)["idle_ratio"] is None
+    radio = _PlainRadio()
+    stats.wait(clock, radio, wake_ms=40, max_idle_ms=1000)
+    stats.wait(clock, radio, wake_ms=None, max_idle_ms=1000)
+    stats.wait(clock, radio, wake_ms=10, max_idle_ms=1000)  # already due: no sleep
+    assert clock.now_ms() == 1040
+    clock.sleep_ms(60)  # busy time outside the waits
+    assert stats.fields(clock.now_ms()) == {
+        "loop": "event",
+        "wakeups": 3,
+        "idle_ms": 1040,
+        "elapsed_ms": 1100,
+        "idle_ratio": 1040 / 1100,
+    }
+
+
+def test_loop_stats_wait_returns_when_mock_frame_is_delivered() -> None:
+    clock = FakeClock()
+    link = create_mock_link(clock=clock, latency_ms=25)
+    stats = LoopStats("event", clock.now_ms())
+    link.a.send(b"\x01\x00\x07")
+    assert link.next_delivery_ms() == 25
+    stats.wait(clock, link.b, wake_ms=None, max_idle_ms=1000)
+    assert clock.now_ms() == 25 and stats.idle_ms == 25
+    assert link.b.wait_readable(1000) is True  # readable frames return at once
+    assert link.b.recv(timeout_ms=0) == b"\x01\x00\x07"
+    assert link.next_delivery_ms() is None
+    assert link.b.wait_readable(5) is False
+    assert clock.now_ms() == 30
+
+
+class _DrainRadio(_PlainRadio):
+    def pop_tx_drains(self) -> list[dict[str, int]]:
+        return [{"seq": 3, "drain_ms": 12}]
+
+
+class _ListLogger:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, object]]] = []
+
+    def log_event(self, event: str, payload: dict[str, object]) -> None:
+        self.events.append((event, payload))
+
+
+def test_log_tx_drains_only_for_radios_with_a_writer() -> None:
+    logger = _ListLogger()
+    assert tx_drain_source(_PlainRadio()) is None
+    log_tx_drains(None, logger)  # type: ignore[arg-type]
+    radio = _DrainRadio()
+    log_tx_drains(tx_drain_source(radio), logger)  # type: ignore[arg-type]
+    assert logger.events == [("uart_tx_drain", {"seq": 3, "drain_ms": 12})]
@@ -1,5 +1,6 @@
 import builtins
 import json
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -66,6 +67,44 @@ def test_runspec_require_keys_raises(tmp_path: Path) -> None:
         (lambda d: d["tx"].update(max_inflight=0), "retries/inflight"),
         (lambda d: d.update(max_payload_bytes=0), "max_payload_bytes"),
         (lambda d: d.update(max_payload_bytes=256), "max_payload_bytes"),
+        (lambda d: d["tx"].update(aggregate_max_windows=0), "aggregate_max_windows"),
+        (lambda d: d["tx"].update(aggregate_max_windows=256), "aggregate_max_windows"),
+        (lambda d: d["tx"].update(aggregate_delay_ms=-1), "aggregate_delay_ms"),
+        (lambda d: d["tx"].update(aggregate_max_bytes=1), "aggregate_max_bytes"),
+        (lambda d: d["tx"].update(aggregate_max_bytes=1000), "aggregate_max_bytes"),
+        (lambda d: d["tx"].update(ack_mode="nack"), "invalid tx ack_mode"),
+        (lambda d: d["tx"].update(ack_bitmap_bits=12), "ack_bitmap_bits"),
+        (lambda d: d["tx"].update(ack_bitmap_bits=72), "ack_bitmap_bits"),
+        (lambda d: d["tx"].update(ack_every=0), "ack_every"),
+        (lambda d: d["tx"].update(ack_delay_ms=-1), "ack_delay_ms"),
+        (lambda d: d.update(rx={"dedup_entries": -1}), "dedup_entries"),
+        (lambda d: d.update(rx={"dedup_window_ms": 0}), "dedup_window_ms"),
+        (lambda d: d["tx"].update(max_fragments=0), "max_fragments"),
+        (lambda d: d["tx"].update(max_fragments=17), "max_fragments"),
+        (
+            lambda d: d["tx"].update(max_fragments=2, aggregate_max_windows=2),
+            "cannot be combined",
+        ),
+        (
+            lambda d: (d["tx"].update(max_fragments=2), d.update(max_payload_bytes=1)),
+            "must exceed the fragment/FEC header bytes",
+        ),
+        (lambda d: d["tx"].update(fec_group=1), "fec_group"),
+        (lambda d: d["tx"].update(fec_group=17), "fec_group"),
+        (
+            lambda d: (d["tx"].update(fec_group=2, max_fragments=2), d.update(max_payload_bytes=2)),
+            "must exceed the fragment/FEC header bytes",
+        ),
+        (lambda d: d.update(rx={"fec_max_groups": 0}), "fec_max_groups"),
+        (lambda d: d.update(rx={"reassembly_timeout_ms": 0}), "reassembly_timeout_ms"),
+        (lambda d: d.update(rx={"reassembly_max_bytes": 0}), "reassembly_max_bytes"),
+        (lambda d: d["tx"].update(duty_cycle=0), "tx duty_cycle must be in"),
+        (lambda d: d["tx"].update(duty_cycle=1.5), "tx duty_cycle must be in"),
+        (lambda d: d["tx"].update(duty_cycle_window_ms=0), "duty_cycle_window_ms"),
+        (lambda d: d["tx"].update(duty_cycle_priority="oldest"), "duty_cycle_priority"),
+        (lambda d: d["tx"].update(max_pending=0), "max_pending"),
+        (lambda d: d["tx"].update(pending_policy="fifo"), "invalid tx pending_policy"),
+        (lambda d: d["tx"].update(pending_max_age_ms=0), "pending_max_age_ms"),
     ],
 )
 def test_runspec_validate_error_branches(
@@ -168,6 +207,18 @@ def test_runspec_tx_ack_timeout_parsing(tmp_path: Path) -> None:
     data_float["tx"]["ack_timeout_ms"] = 12.7
     assert RunSpec.from_dict(data_float).tx.ack_timeout_ms == 12
 
+    data_adaptive = _base_runspec_dict(tmp_path)
+    data_adaptive["tx"]["ack_timeout_ms"] = " Adaptive"
+    spec_adaptive = RunSpec.from_dict(data_adaptive)
+    assert spec_adaptive.tx.ack_timeout_ms is None and spec_adaptive.tx.ack_timeout_adaptive
+    spec_adaptive.validate()
+    assert spec_adaptive.as_dict()["tx"]["ack_timeout_ms"] == "adaptive"
+    assert RunSpec.from_dict(spec_adaptive.as_dict()) == spec_adaptive
+    conflicting = replace(spec_adaptive, tx=replace(spec_adaptive.tx, ack_timeout_ms=50))
+    with pytest.raises(ValueError, match="must be null when adaptive"):
+        conflicting.validate()
+    assert not spec_auto.tx.ack_timeout_adaptive
+
     data_bad = _base_runspec_dict(tmp_path)
     data_bad["tx"]["ack_timeout_ms"] = True
     with pytest.raises(ValueError, match="invalid int value"):
@@ -0,0 +1,46 @@
+import pytest
+
+from loralink_mllc.runtime.dedup import RxDedupCache, payload_digest
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"max_entries": 0}, "max_entries"),
+        ({"window_ms": 0}, "window_ms"),
+        ({"seq_window": 256}, "seq_window"),
+    ],
+)
+def test_rx_dedup_cache_validation(kwargs: dict, match: str) -> None:
+    args = {"max_entries": 4, "window_ms": 100, **kwargs}
+    with pytest.raises(ValueError, match=match):
+        RxDedupCache(**args)
+
+
+def test_rx_dedup_cache_hits_on_same_seq_and_payload_only() -> None:
+    cache = RxDedupCache(max_entries=4, window_ms=100)
+    assert payload_digest(b"a") != payload_digest(b"b")
+    assert cache.check_and_add(1, b"a", now_ms=0) is False
+    assert cache.check_and_add(1, b"a", now_ms=50) is True
+    assert cache.check_and_add(1, b"b", now_ms=50) is False  # reused SEQ, new payload
+    assert cache.check_and_add(2, b"a", now_ms=50) is False
+    assert (cache.hits, len(cache)) == (1, 3)
+
+
+def test_rx_dedup_cache_evicts_by_time_size_and_seq_window() -> None:
+    cache = RxDedupCache(max_entries=2, window_ms=100, seq_window=4)
+    cache.check_and_add(1, b"a", now_ms=0)
+    assert cache.check_and_add(1, b"a", now_ms=101) is False  # expired, re-recorded
+    cache.check_and_add(2, b"a", now_ms=101)
+    cache.check_and_add(3, b"a", now_ms=101)  # over max_entries: oldest (1) dropped
+    assert len(cache) == 2
+    assert cache.check_and_add(2, b"a", now_ms=102) is True
+
+    cache = RxDedupCache(max_entries=8, window_ms=10_000, seq_window=4)
+    cache.check_and_add(254, b"x", now_ms=0)
+    cache.check_and_add(255, b"x", now_ms=0)
+    cache.check_and_add(2, b"x", now_ms=0)  # wraps: 254 is now 4 behind, 255 is 3 behind
+    assert cache.check_and_add(255, b"x", now_ms=0) is True
+    cache.check_and_add(3, b"x", now_ms=0)  # 254 falls out of the SEQ window
+    assert cache.check_and_add(254, b"x", now_ms=0) is False
+    assert cache.evictions == 1
@@ -0,0 +1,51 @@
+import pytest
+
+from loralink_mllc.protocol.fec import xor_parity
+from loralink_mllc.runtime.fec import FecGroupBuffer
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"max_groups": 0}, "max_groups"),
+        ({"seq_window": 0}, "seq_window"),
+    ],
+)
+def test_fec_group_buffer_validation(kwargs: dict, match: str) -> None:
+    args = {"max_groups": 4, **kwargs}
+    with pytest.raises(ValueError, match=match):
+        FecGroupBuffer(**args)
+
+
+def test_fec_group_buffer_recovers_after_parity_or_last_data_frame() -> None:
+    bodies = [b"aa", b"b", b"ccc"]
+    parity = xor_parity(bodies)[1:]
+    buf = FecGroupBuffer(max_groups=4)
+    # Group at SEQ 254..0 (wraps), parity at SEQ 1: the middle frame is lost.
+    assert buf.add_data(254, 0, bodies[0]) == []
+    assert buf.add_data(0, 2, bodies[2]) == []
+    assert buf.add_parity(1, 3, parity) == [(255, 1, b"b")]
+    assert len(buf) == 0 and buf.recovered == 1
+
+    # Parity first, then all but one data frame.
+    assert buf.add_parity(5, 3, parity) == []
+    assert buf.add_data(2, 0, bodies[0]) == []
+    assert buf.add_data(3, 1, bodies[1]) == [(4, 2, b"ccc")]
+
+    # Nothing missing: the group is just dropped; two missing: nothing to rebuild.
+    for index, body in enumerate(bodies):
+        buf.add_data(10 + index, index, body)
+    assert buf.add_parity(13, 3, parity) == [] and len(buf) == 0
+    assert buf.add_parity(23, 3, parity) == [] and len(buf) == 1
+
+
+def test_fec_group_buffer_evicts_oldest_and_stale_groups() -> None:
+    buf = FecGroupBuffer(max_groups=2, seq_window=8)
+    buf.add_data(0, 0, b"x")
+    buf.add_data(3, 0, b"x")
+    buf.add_data(6, 0, b"x")  # third group: oldest (SEQ 0) dropped
+    assert len(buf) == 2
+    buf.add_data(20, 0, b"x")  # 3 and 6 are now more than 8 SEQs behind
+    assert len(buf) == 1
+    buf.add_data(19, 1, b"y")  # older SEQ joins group 18 without moving the window
+    assert len(buf) == 2
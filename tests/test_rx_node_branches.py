@@ -2,8 +2,13 @@ import pytest
 
 from loralink_mllc.codecs.base import CodecError
 from loralink_mllc.config.runspec import RunSpec
+from loralink_mllc.protocol.aggregate import pack_windows
+from loralink_mllc.protocol.fec import fec_data_payload, xor_parity
+from loralink_mllc.protocol.fragment import split_fragments
+from loralink_mllc.protocol.framing import parse_ack_payload
 from loralink_mllc.protocol.packet import Packet
 from loralink_mllc.runtime.rx_node import RxNode
+from loralink_mllc.runtime.scheduler import FakeClock
 
 
 class _MemLogger:
@@ -62,7 +67,9 @@ class _Codec:
         return "test"
 
 
-def _runspec(*, mode: str) -> RunSpec:
+def _runspec(
+    *, mode: str, aggregate_max_windows: int = 1, dedup_entries: int = 0, **tx_overrides: object
+) -> RunSpec:
     data = {
         "run_id": "rx",
         "role": "rx",
@@ -78,7 +85,15 @@ def _runspec(*, mode: str) -> RunSpec:
         },
         "window": {"dims": 1, "W": 1, "sample_hz": 1.0},
         "codec": {"id": "raw", "version": "1", "params": {}},
-        "tx": {"guard_ms": 0, "ack_timeout_ms": 10, "max_retries": 0, "max_inflight": 1},
+        "tx": {
+            "guard_ms": 0,
+            "ack_timeout_ms": 10,
+            "max_retries": 0,
+            "max_inflight": 1,
+            "aggregate_max_windows": aggregate_max_windows,
+            **tx_overrides,
+        },
+        "rx": {"dedup_entries": dedup_entries},
         "logging": {"out_dir": "out"},
         "max_payload_bytes": 238,
     }
@@ -219,3 +234,388 @@ def test_rx_node_run_stops_at_max_seconds_and_rejects_negative() -> None:
 
     node2 = RxNode(_runspec(mode="RAW"), radio, _Codec("ok"), logger, clock=_Clock())
     node2.run(step_ms=5, max_seconds=0.01)
+
+
+def test_rx_node_splits_aggregated_frame_into_window_events() -> None:
+    frame = Packet(payload=pack_windows([b"\x02", b"\x04\x00"]), seq=9).to_bytes()
+    logger = _MemLogger()
+    radio = _RadioWithRssi([frame], rssi_dbm=-70)
+    truths: list[tuple[int, int]] = []
+
+    def window_truth(seq: int, sub_index: int) -> list[float]:
+        truths.append((seq, sub_index))
+        return [2.0]
+
+    node = RxNode(
+        _runspec(mode="LATENT", aggregate_max_windows=4),
+        radio,
+        _Codec("ok"),
+        logger,
+        window_truth_provider=window_truth,
+    )
+    node.process_once()
+    rx_ok = [p for e, p in logger.events if e == "rx_ok"]
+    assert [(p["sub_index"], p["sub_count"], p["payload_bytes"]) for p in rx_ok] == [
+        (0, 2, 1),
+        (1, 2, 2),
+    ]
+    assert all(p["frame_bytes"] == len(frame) and p["rssi_dbm"] == -70 for p in rx_ok)
+    recon = [p for e, p in logger.events if e == "recon_done"]
+    assert [(p["sub_index"], p["mae"]) for p in recon] == [(0, 0.0), (1, 2.0)]
+    assert truths == [(9, 0), (9, 1)]
+    assert [e for e, _ in logger.events].count("ack_sent") == 1
+    assert Packet.from_bytes(radio.sent[0]).payload == b"\x09"
+
+
+def test_rx_node_aggregated_without_window_truth_and_bad_sub_header() -> None:
+    good = Packet(payload=pack_windows([b"\x01"]), seq=1).to_bytes()
+    bad = Packet(payload=b"\x02\x01", seq=2).to_bytes()
+    logger = _MemLogger()
+    radio = _ScriptedRadio([good, bad])
+    node = RxNode(
+        _runspec(mode="LATENT", aggregate_max_windows=2),
+        radio,
+        _Codec("ok"),
+        logger,
+        truth_provider=lambda s: [1.0],  # per-frame truth does not apply to sub-windows
+    )
+    node.process_once()
+    node.process_once()
+    events = [e for e, _ in logger.events]
+    assert events == ["rx_ok", "ack_sent", "rx_parse_fail"]
+    assert logger.events[-1][1]["seq"] == 2
+    assert len(radio.sent) == 1
+
+
+def test_rx_node_bitmap_ack_every_and_delay() -> None:
+    frames = [Packet(payload=b"\x01", seq=seq).to_bytes() for seq in (0, 1, 2)]
+    logger = _MemLogger()
+    radio = _ScriptedRadio(frames)
+    clock = FakeClock()
+    node = RxNode(
+        _runspec(mode="RAW", ack_mode="bitmap", ack_every=2, ack_delay_ms=50),
+        radio,
+        _Codec("ok"),
+        logger,
+        clock=clock,
+    )
+    node.process_once()
+    assert radio.sent == []
+    node.process_once()  # second frame reaches ack_every
+    node.process_once()
+    clock.sleep_ms(49)
+    node.process_once()
+    assert len(radio.sent) == 1
+    clock.sleep_ms(1)
+    node.process_once()  # ack_delay_ms elapsed for the third frame
+    acks = [Packet.from_bytes(frame) for frame in radio.sent]
+    assert [parse_ack_payload(p.payload) for p in acks] == [[1, 0], [2, 1, 0]]
+    assert [p.seq for p in acks] == [0, 1]
+    sent = [p for e, p in logger.events if e == "ack_sent"]
+    assert [(p["ack_seq"], p["ack_bitmap"], p["acked_frames"]) for p in sent] == [
+        (1, 0b1, 2),
+        (2, 0b11, 1),
+    ]
+    assert sent[0]["frame_bytes"] == 2 + 2 + 2
+    node.process_once()  # nothing new to acknowledge
+    assert len(radio.sent) == 2
+
+
+class _CountingCodec(_Codec):
+    def __init__(self) -> None:
+        super().__init__("ok")
+        self.decodes = 0
+
+    def decode(self, payload: bytes):
+        self.decodes += 1
+        return super().decode(payload)
+
+
+def test_rx_node_reacks_duplicates_without_decoding() -> None:
+    frame = Packet(payload=b"\x05", seq=3).to_bytes()
+    other = Packet(payload=b"\x06", seq=3).to_bytes()  # same SEQ, new payload
+    logger = _MemLogger()
+    radio = _ScriptedRadio([frame, frame, other])
+    codec = _CountingCodec()
+    truths: list[int] = []
+    node = RxNode(
+        _runspec(mode="LATENT", dedup_entries=64),
+        radio,
+        codec,
+        logger,
+        clock=FakeClock(),
+        truth_provider=lambda s: truths.append(s) or [5.0],
+    )
+    for _ in range(3):
+        node.process_once()
+    events = [e for e, _ in logger.events]
+    assert events == [
+        "rx_ok",
+        "recon_done",
+        "ack_sent",
+        "rx_dup",
+        "ack_sent",
+        "rx_ok",
+        "recon_done",
+        "ack_sent",
+    ]
+    assert codec.decodes == 2 and truths == [3, 3]
+    assert logger.events[3][1] == {"seq": 3, "payload_bytes": 1, "frame_bytes": 3}
+    assert [Packet.from_bytes(f).payload for f in radio.sent] == [b"\x03"] * 3
+
+
+def test_rx_node_duplicate_forces_immediate_bitmap_ack_and_dedup_is_off_by_default() -> None:
+    frame = Packet(payload=b"\x05", seq=3).to_bytes()
+    logger = _MemLogger()
+    radio = _ScriptedRadio([frame, frame])
+    node = RxNode(
+        _runspec(
+            mode="RAW", dedup_entries=64, ack_mode="bitmap", ack_every=4, ack_delay_ms=1000
+        ),
+        radio,
+        _Codec("ok"),
+        logger,
+        clock=FakeClock(),
+    )
+    node.process_once()
+    assert radio.sent == []
+    node.process_once()
+    assert [e for e, _ in logger.events] == ["rx_ok", "rx_dup", "ack_sent"]
+    assert parse_ack_payload(Packet.from_bytes(radio.sent[0]).payload) == [3]
+
+    data = _runspec(mode="RAW").as_dict()
+    del data["rx"]
+    spec = RunSpec.from_dict(data)
+    spec.validate()
+    assert spec.rx.dedup_entries == 0
+    logger = _MemLogger()
+    node = RxNode(spec, _ScriptedRadio([frame, frame]), _Codec("ok"), logger)
+    node.process_once()
+    node.process_once()
+    assert [e for e, _ in logger.events].count("rx_ok") == 2
+
+
+def test_rx_node_reassembles_fragments_and_acks_each_one() -> None:
+    fragments = split_fragments(b"\x07\x08\x09\x0a\x0b", max_body_bytes=2)
+    frames = [
+        Packet(payload=fragments[1], seq=0).to_bytes(),  # out of order, SEQ wraps 255 -> 0
+        b"\x01",  # malformed frame in between
+        Packet(payload=b"\x10", seq=9).to_bytes(),  # index 1 of a 1-fragment window
+        Packet(payload=fragments[0], seq=255).to_bytes(),
+        Packet(payload=fragments[2], seq=1).to_bytes(),
+    ]
+    logger = _MemLogger()
+    radio = _ScriptedRadio(frames)
+    truths: list[int] = []
+    node = RxNode(
+        _runspec(mode="LATENT", max_fragments=4),
+        radio,
+        _Codec("ok"),
+        logger,
+        clock=FakeClock(),
+        truth_provider=lambda s: truths.append(s) or [7.0],
+    )
+    for _ in range(5):
+        node.process_once()
+    events = [e for e, _ in logger.events]
+    assert events == [
+        "rx_ok",
+        "ack_sent",
+        "rx_parse_fail",
+        "rx_parse_fail",
+        "rx_ok",
+        "ack_sent",
+        "rx_ok",
+        "rx_reassembled",
+        "recon_done",
+        "ack_sent",
+    ]
+    assert logger.events[0][1] == {
+        "seq": 0,
+        "payload_bytes": 3,
+        "frame_bytes": 5,
+        "frag_index": 1,
+        "frag_count": 3,
+    }
+    assert "out of range" in str(logger.events[3][1]["reason"])
+    assert logger.events[7][1] == {"seq": 255, "frag_count": 3, "payload_bytes": 5}
+    assert truths == [255]
+    assert [Packet.from_bytes(f).payload for f in radio.sent] == [b"\x00", b"\xff", b"\x01"]
+
+
+def test_rx_node_reassembly_timeout_and_memory_limit() -> None:
+    data = _runspec(mode="RAW", max_fragments=4).as_dict()
+    data["rx"] = {"reassembly_timeout_ms": 100, "reassembly_max_bytes": 4}
+    spec = RunSpec.from_dict(data)
+    spec.validate()
+    frames = [
+        Packet(payload=bytes([0x01, 1, 2]), seq=10).to_bytes(),  # fragment 0 of 2
+        None,
+        Packet(payload=bytes([0x02, 1, 2, 3]), seq=20).to_bytes(),  # fragment 0 of 3
+        Packet(payload=bytes([0x12, 4, 5]), seq=21).to_bytes(),  # over 4 B: evicts itself
+    ]
+    logger = _MemLogger()
+    clock = FakeClock()
+    node = RxNode(spec, _ScriptedRadio(frames), _Codec("ok"), logger, clock=clock)
+    node.process_once()
+    clock.sleep_ms(101)
+    node.process_once()
+    node.process_once()
+    node.process_once()
+    fails = [p for e, p in logger.events if e == "rx_reassembly_fail"]
+    assert fails == [
+        {
+            "seq": 10,
+            "reason": "timeout",
+            "frag_count": 2,
+            "frags_received": 1,
+            "buffered_bytes": 2,
+        },
+        {
+            "seq": 20,
+            "reason": "memory_limit",
+            "frag_count": 3,
+            "frags_received": 2,
+            "buffered_bytes": 5,
+        },
+    ]
+
+
+def test_rx_node_fec_rebuilds_lost_frame_and_acks_it() -> None:
+    group = [b"\x05", b"\x06"]
+    frames = [
+        Packet(payload=fec_data_payload(0, group[0]), seq=0).to_bytes(),
+        Packet(payload=xor_parity(group), seq=2).to_bytes(),  # SEQ 1 was lost
+        Packet(payload=fec_data_payload(1, group[1]), seq=1).to_bytes(),  # late retransmission
+        Packet(payload=b"\x20", seq=3).to_bytes(),  # bad FEC header
+        Packet(payload=bytes([0x81, 5]), seq=5).to_bytes(),  # rebuilt length exceeds parity
+        Packet(payload=bytes([0x82, 0]), seq=8).to_bytes(),  # parity shorter than ...
+        Packet(payload=fec_data_payload(0, b"\x01\x02"), seq=6).to_bytes(),  # ... its data
+    ]
+    logger = _MemLogger()
+    radio = _ScriptedRadio(frames)
+    truths: list[int] = []
+    node = RxNode(
+        _runspec(mode="LATENT", dedup_entries=64, fec_group=2),
+        radio,
+        _Codec("ok"),
+        logger,
+        clock=FakeClock(),
+        truth_provider=lambda s: truths.append(s) or [6.0],
+    )
+    for _ in range(7):
+        node.process_once()
+    assert [e for e, _ in logger.events] == [
+        "rx_ok",
+        "recon_done",
+        "ack_sent",
+        "rx_fec_parity",
+        "rx_fec_recovered",
+        "recon_done",
+        "ack_sent",
+        "rx_dup",
+        "ack_sent",
+        "rx_parse_fail",
+        "rx_fec_parity",
+        "rx_parse_fail",
+        "rx_fec_parity",
+        "rx_ok",
+        "recon_done",
+        "ack_sent",
+        "rx_parse_fail",
+    ]
+    assert logger.events[0][1] == {"seq": 0, "payload_bytes": 1, "frame_bytes": 4}
+    assert logger.events[3][1] == {
+        "seq": 2,
+        "fec_group_count": 2,
+        "payload_bytes": 3,
+        "frame_bytes": 5,
+    }
+    assert logger.events[4][1] == {"seq": 1, "payload_bytes": 1, "frame_bytes": 4}
+    assert "recovered length" in str(logger.events[11][1]["reason"])
+    assert "longer than parity" in str(logger.events[16][1]["reason"])
+    assert truths == [0, 1, 6]
+    acked = [Packet.from_bytes(f).payload[0] for f in radio.sent]
+    assert acked == [0, 1, 1, 6]
+
+
+def test_rx_node_fec_recovery_without_dedup_cache() -> None:
+    spec = _runspec(mode="RAW", fec_group=2)
+    frames = [
+        Packet(payload=xor_parity([b"\x05", b"\x06"]), seq=2).to_bytes(),
+        Packet(payload=fec_data_payload(1, b"\x06"), seq=1).to_bytes(),
+    ]
+    logger = _MemLogger()
+    node = RxNode(spec, _ScriptedRadio(frames), _Codec("ok"), logger)
+    node.process_once()
+    node.process_once()
+    assert [e for e, _ in logger.events] == [
+        "rx_fec_parity",
+        "rx_ok",
+        "ack_sent",
+        "rx_fec_recovered",
+        "ack_sent",
+    ]
+    assert logger.events[3][1]["seq"] == 0
+
+
+def test_rx_node_next_wakeup_covers_bitmap_ack_delay_and_reassembly_timeout() -> None:
+    clock = FakeClock()
+    bitmap = RxNode(
+        _runspec(mode="RAW", ack_mode="bitmap", ack_every=4, ack_delay_ms=50),
+        _ScriptedRadio([Packet(payload=b"\x01", seq=0).to_bytes()]),
+        _Codec("ok"),
+        _MemLogger(),
+        clock=clock,
+    )
+    assert bitmap.next_wakeup_ms() is None
+    bitmap.process_once()
+    assert bitmap.next_wakeup_ms() == 50
+
+    data = _runspec(mode="RAW", max_fragments=4).as_dict()
+    data["rx"] = {"reassembly_timeout_ms": 100}
+    reassembly = RxNode(
+        RunSpec.from_dict(data),
+        _ScriptedRadio([Packet(payload=bytes([0x01, 1]), seq=3).to_bytes()]),
+        _Codec("ok"),
+        _MemLogger(),
+        clock=clock,
+    )
+    assert reassembly.next_wakeup_ms() is None
+    reassembly.process_once()  # fragment 0 of 2 at t=0 expires once 100 ms have passed
+    assert reassembly.next_wakeup_ms() == 101
+
+
+class _WaitableRadio(_ScriptedRadio):
+    def __init__(self, frames: list[bytes | None], clock: FakeClock) -> None:
+        super().__init__(frames)
+        self._clock = clock
+        self.waits: list[int] = []
+
+    def wait_readable(self, timeout_ms: int) -> bool:
+        self.waits.append(timeout_ms)
+        if self._frames:
+            return True
+        self._clock.sleep_ms(timeout_ms)
+        return False
+
+
+def test_rx_node_event_driven_run_sleeps_until_frame_timer_or_deadline() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    frames = [Packet(payload=b"\x01", seq=seq).to_bytes() for seq in (0, 1)]
+    radio = _WaitableRadio(frames, clock)
+    node = RxNode(
+        _runspec(mode="RAW", ack_mode="bitmap", ack_every=8, ack_delay_ms=30),
+        radio,
+        _Codec("ok"),
+        logger,
+        clock=clock,
+    )
+    node.run(event_driven=True, max_seconds=2.5, max_idle_ms=1000)
+    assert radio.waits == [30, 30, 1000, 1000, 470]  # ACK delay, then idle until the deadline
+    assert [e for e, _ in logger.events].count("ack_sent") == 1
+    assert logger.events[-1] == (
+        "run_loop",
+        {"loop": "event", "wakeups": 5, "idle_ms": 2500, "elapsed_ms": 2500, "idle_ratio": 1.0},
+    )
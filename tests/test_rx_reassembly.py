@@ -0,0 +1,43 @@
+import pytest
+
+from loralink_mllc.runtime.reassembly import ReassemblyBuffer
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"timeout_ms": 0}, "timeout_ms"),
+        ({"max_bytes": 0}, "max_bytes"),
+    ],
+)
+def test_reassembly_buffer_validation(kwargs: dict, match: str) -> None:
+    args = {"timeout_ms": 100, "max_bytes": 64, **kwargs}
+    with pytest.raises(ValueError, match=match):
+        ReassemblyBuffer(**args)
+
+
+def test_reassembly_buffer_completes_in_any_order() -> None:
+    buf = ReassemblyBuffer(timeout_ms=100, max_bytes=64)
+    assert buf.add(6, 1, 3, b"cd", now_ms=0) == (None, [])
+    assert buf.add(6, 1, 3, b"CD", now_ms=1) == (None, [])  # repeated index overwrites
+    assert (len(buf), buf.nbytes) == (1, 2)
+    assert buf.add(7, 2, 3, b"e", now_ms=2) == (None, [])
+    assert buf.add(5, 0, 3, b"ab", now_ms=3) == (b"abCDe", [])
+    assert (len(buf), buf.nbytes) == (0, 0)
+
+
+def test_reassembly_buffer_drops_on_timeout_count_mismatch_and_memory_limit() -> None:
+    buf = ReassemblyBuffer(timeout_ms=100, max_bytes=4)
+    buf.add(0, 0, 2, b"a", now_ms=0)
+    buf.add(10, 0, 2, b"b", now_ms=50)
+    expired = buf.expire(now_ms=101)
+    assert [p.base_seq for p in expired] == [0]
+
+    payload, dropped = buf.add(11, 1, 3, b"c", now_ms=102)  # base 10, but count 3 != 2
+    assert payload is None
+    assert [(p.base_seq, p.count, reason) for p, reason in dropped] == [(10, 2, "count_mismatch")]
+
+    payload, dropped = buf.add(20, 0, 2, b"dddd", now_ms=103)
+    assert payload is None
+    assert [(p.base_seq, reason) for p, reason in dropped] == [(10, "memory_limit")]
+    assert (len(buf), buf.nbytes) == (1, 4)
@@ -73,3 +73,95 @@ def test_txgate_record_send_rejects_nonpositive_timeout_override() -> None:
         gate.record_send(seq=1, toa_ms_est=1, ack_timeout_ms=0)
 
 
+
+
+def test_txgate_mark_acked_many_clears_covered_entries() -> None:
+    clock = FakeClock()
+    gate = TxGate(clock=clock, guard_ms=0, ack_timeout_ms=100, max_retries=0, max_inflight=4)
+    for seq in (1, 2, 3):
+        gate.record_send(seq=seq, toa_ms_est=0.0)
+    cleared = gate.mark_acked_many([3, 1, 9])
+    assert [inflight.seq for inflight in cleared] == [3, 1]
+    assert list(gate.inflight()) == [2]
+    assert gate.acked_count == 2
+
+
+def test_txgate_deadline_heap_lazy_invalidation_and_next_deadline() -> None:
+    clock = FakeClock()
+    gate = TxGate(clock=clock, guard_ms=0, ack_timeout_ms=100, max_retries=1, max_inflight=4)
+    assert gate.next_deadline_ms() is None
+    gate.record_send(seq=1, toa_ms_est=0.0)
+    clock.sleep_ms(10)
+    gate.record_send(seq=2, toa_ms_est=0.0, ack_timeout_ms=50)
+    assert gate.next_deadline_ms() == 60
+    gate.mark_acked(2)  # its heap entry goes stale
+    assert gate.next_deadline_ms() == 100
+
+    clock.sleep_ms(95)  # now = 105
+    assert list(gate.expired_sequences()) == [1]
+    assert list(gate.expired_sequences()) == [1]  # stays due until resent/acked
+    assert gate.next_deadline_ms() == 100
+    gate.record_send(seq=1, toa_ms_est=0.0)  # resend: new deadline, old entry stale
+    assert list(gate.expired_sequences()) == []
+    assert gate.next_deadline_ms() == 205
+
+    # SEQ reuse after an ACK must not inherit the old (earlier) deadline.
+    gate.mark_acked(1)
+    clock.sleep_ms(50)
+    gate.record_send(seq=1, toa_ms_est=0.0)  # deadline 255
+    clock.sleep_ms(50)  # now = 205: only the stale entry is due
+    assert list(gate.expired_sequences()) == []
+    clock.sleep_ms(50)
+    assert list(gate.expired_sequences()) == [1]
+    gate.record_send(seq=1, toa_ms_est=0.0)
+    clock.sleep_ms(100)
+    assert [i.seq for i in gate.expired_failures()] == [1]
+    assert gate.inflight() == {} and gate.next_deadline_ms() is None
+
+
+def test_txgate_duty_cycle_validation() -> None:
+    clock = FakeClock()
+    with pytest.raises(ValueError, match="duty_cycle must be in"):
+        TxGate(clock=clock, guard_ms=0, ack_timeout_ms=10, max_retries=0, duty_cycle=0.0)
+    with pytest.raises(ValueError, match="duty_cycle_window_ms must be > 0"):
+        TxGate(clock=clock, guard_ms=0, ack_timeout_ms=10, max_retries=0, duty_cycle_window_ms=0)
+    gate = TxGate(clock=clock, guard_ms=0, ack_timeout_ms=10, max_retries=0)
+    assert gate.airtime_budget_ms() is None and gate.airtime_headroom_ms() is None
+    assert gate.airtime_allows(1e9) and gate.airtime_free_ms(1e9) is None
+    gate.record_send(seq=1, toa_ms_est=5.0)
+    assert gate.airtime_used_ms() == 0.0
+    assert "airtime_headroom_ms" not in gate.metrics()
+
+
+def test_txgate_duty_cycle_sliding_window() -> None:
+    clock = FakeClock()
+    gate = TxGate(
+        clock=clock,
+        guard_ms=0,
+        ack_timeout_ms=1000,
+        max_retries=0,
+        max_inflight=4,
+        duty_cycle=0.1,
+        duty_cycle_window_ms=1000,
+    )
+    assert gate.airtime_budget_ms() == 100.0
+    gate.record_send(seq=1, toa_ms_est=40.0)  # ends at 40
+    clock.sleep_ms(100)
+    gate.record_unacked_send(40.0)  # ends at 140
+    assert gate.airtime_used_ms() == 80.0
+    assert gate.airtime_headroom_ms() == 20.0
+    assert gate.airtime_allows(20.0) and not gate.airtime_allows(30.0)
+    assert gate.airtime_free_ms(20.0) == 100
+    assert gate.airtime_free_ms(30.0) == 1040  # once the first frame leaves the window
+    assert gate.airtime_free_ms(70.0) == 1140
+    with pytest.raises(ValueError, match="exceeds the duty-cycle budget"):
+        gate.airtime_free_ms(101.0)
+
+    metrics = gate.metrics()
+    assert metrics["duty_cycle"] == 0.1 and metrics["airtime_window_ms"] == 1000
+    assert metrics["airtime_used_ms"] == 80.0 and metrics["airtime_headroom_ms"] == 20.0
+
+    clock.sleep_ms(940)  # now = 1040
+    assert gate.airtime_used_ms() == 40.0 and gate.airtime_allows(60.0)
+    clock.sleep_ms(100)
+    assert gate.airtime_used_ms() == 0.0 and gate.airtime_headroom_ms() == 100.0
@@ -63,3 +63,74 @@ def test_sensor12_packed_decode_length_mismatch() -> None:
     codec = create_codec(spec)
     with pytest.raises(CodecError):
         codec.decode(b"\x00")
+
+
+def _window(steps: int) -> list[float]:
+    step = [37.1, 127.2, 31.2, 0.0005, -0.0015, 40.0, 0.25, -0.35, 1e9, 0.05, -0.05, -4000.0]
+    return [value + 0.001 * i for i in range(steps) for value in step]
+
+
+def test_sensor12_packed_numpy_and_struct_paths_match(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    import loralink_mllc.codecs.sensor12_packed as mod
+
+    fast = mod.Sensor12PackedCodec()
+    monkeypatch.setattr(mod, "optional_numpy", lambda: None)
+    slow = mod.Sensor12PackedCodec()
+    assert slow._np is None and fast._np is not None
+
+    for steps in (1, 8):
+        window = _window(steps)
+        payload = fast.encode(window)
+        assert payload == slow.encode(window)
+        assert fast.decode(payload) == slow.decode(payload)
+
+    windows = [_window(8), _window(8)[::-1]]
+    payloads = fast.encode_batch(windows)
+    assert payloads == [slow.encode(w) for w in windows] == slow.encode_batch(windows)
+    assert fast.decode_batch(payloads) == [slow.decode(p) for p in payloads]
+    assert slow.decode_batch(payloads) == [slow.decode(p) for p in payloads]
+
+
+def test_sensor12_packed_numpy_path_defers_errors_to_struct() -> None:
+    np = pytest.importorskip("numpy")
+    codec = create_codec(CodecSpec(id="sensor12_packed", version="1", params={}))
+
+    bad_imu = _window(8)
+    bad_imu[3] = float("nan")
+    with pytest.raises(ValueError):
+        codec.encode(bad_imu)
+    with pytest.raises(ValueError):
+        codec.encode(np.asarray(bad_imu))
+    with pytest.raises(ValueError):
+        codec.encode_batch(np.asarray([bad_imu]))
+
+    overflow = _window(8)
+    overflow[0] = 1e39
+    with pytest.raises(OverflowError):
+        codec.encode(overflow)
+
+    infinite = _window(8)
+    infinite[1] = float("inf")
+    assert codec.decode(codec.encode(infinite))[1] == float("inf")
+    assert codec.encode(np.asarray(_window(8))) == codec.encode(_window(8))
+    assert codec.encode(["1.0"] * 48) == codec.encode([1.0] * 48)
+    with pytest.raises(TypeError):
+        codec.encode([None] * 48)
+    with pytest.raises(TypeError):
+        codec.encode([None] * 3 + [0.0] * 45)
+
+
+def test_sensor12_packed_batch_edges() -> None:
+    pytest.importorskip("numpy")
+    codec = create_codec(CodecSpec(id="sensor12_packed", version="1", params={}))
+    ragged = [_window(1), _window(2)]
+    assert codec.encode_batch(ragged) == [codec.encode(w) for w in ragged]
+    assert codec.encode_batch([[], []]) == [b"", b""]
+    with pytest.raises(ValueError, match="multiple of 12"):
+        codec.encode_batch([[0.0] * 5])
+    payloads = codec.encode_batch(ragged)
+    assert codec.decode_batch(payloads) == [codec.decode(p) for p in payloads]
+    with pytest.raises(CodecError):
+        codec.decode_batch([b"\x00"])
+
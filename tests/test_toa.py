@@ -3,7 +3,14 @@ import math
 import pytest
 
 from loralink_mllc.config.runspec import PhySpec
-from loralink_mllc.runtime.toa import estimate_ack_timeout_ms, estimate_toa_ms
+from loralink_mllc.runtime import toa
+from loralink_mllc.runtime.toa import (
+    ack_timeout_table_ms,
+    estimate_ack_timeout_ms,
+    estimate_toa_ms,
+    estimate_toa_ms_array,
+    toa_table_ms,
+)
 
 
 def test_toa_monotonic_payload() -> None:
@@ -237,3 +244,91 @@ def test_estimate_ack_timeout_ms() -> None:
         estimate_ack_timeout_ms(phy, data_frame_bytes=10, margin_ms=-1)
 
 
+
+
+def _phy_grid() -> list[PhySpec]:
+    return [
+        PhySpec(
+            sf=sf,
+            bw_hz=bw_hz,
+            cr=cr,
+            preamble=8,
+            crc_on=crc_on,
+            explicit_header=explicit_header,
+            tx_power_dbm=14,
+            ldro=ldro,
+        )
+        for sf in range(5, 13)
+        for bw_hz in (125000, 500000)
+        for cr in (1, 8)
+        for crc_on in (False, True)
+        for explicit_header in (False, True)
+        for ldro in (None, False, True)
+    ]
+
+
+def test_toa_tables_are_identical_to_the_scalar_formula() -> None:
+    margins = (0, 40)
+    for phy in _phy_grid():
+        table = toa_table_ms(phy)
+        assert len(table) == 256
+        assert table is toa_table_ms(phy)  # cached per PhySpec
+        formula = [toa._toa_ms(phy, length) for length in range(256)]
+        assert list(table) == formula
+        assert [estimate_toa_ms(phy, length) for length in range(256)] == formula
+        for margin_ms in margins:
+            expected = [int(math.ceil(t + formula[3] + margin_ms)) for t in formula]
+            assert list(ack_timeout_table_ms(phy, margin_ms=margin_ms)) == expected
+            assert estimate_ack_timeout_ms(phy, 200, margin_ms=margin_ms) == expected[200]
+
+
+
+def test_estimate_toa_ms_accepts_integral_float_lengths() -> None:
+    np = pytest.importorskip("numpy")
+    phy = _phy_grid()[0]
+    # Pre-table call shape: lengths computed as floats (e.g. byte counts from a ratio).
+    assert estimate_toa_ms(phy, 10.0) == estimate_toa_ms(phy, 10) == toa._toa_ms(phy, 10)
+    assert estimate_toa_ms(phy, np.int64(10)) == estimate_toa_ms(phy, 10)
+    assert estimate_ack_timeout_ms(phy, 200.0, ack_frame_bytes=3.0) == (
+        estimate_ack_timeout_ms(phy, 200)
+    )
+    with pytest.raises(ValueError, match="whole number of bytes"):
+        estimate_toa_ms(phy, 10.5)
+    with pytest.raises(ValueError, match="payload_len_bytes must be 0..255"):
+        estimate_toa_ms(phy, float("nan"))
+
+def test_estimate_ack_timeout_ms_validates_frame_lengths() -> None:
+    phy = _phy_grid()[0]
+    with pytest.raises(ValueError, match="payload_len_bytes must be 0..255"):
+        estimate_ack_timeout_ms(phy, data_frame_bytes=256)
+    with pytest.raises(ValueError, match="payload_len_bytes must be 0..255"):
+        estimate_ack_timeout_ms(phy, data_frame_bytes=-1)
+    with pytest.raises(ValueError, match="payload_len_bytes must be 0..255"):
+        estimate_ack_timeout_ms(phy, data_frame_bytes=10, ack_frame_bytes=300)
+
+
+def test_estimate_toa_ms_array_matches_scalar() -> None:
+    np = pytest.importorskip("numpy")
+    phy = _phy_grid()[-1]
+    lengths = np.array([[0, 3, 255], [17, 17, 128]], dtype=np.uint8)
+    out = estimate_toa_ms_array(phy, lengths)
+    assert out.shape == (2, 3) and out.dtype == np.float64
+    assert out.tolist() == [[estimate_toa_ms(phy, int(n)) for n in row] for row in lengths]
+    assert estimate_toa_ms_array(phy, range(256)).tolist() == list(toa_table_ms(phy))
+    assert estimate_toa_ms_array(phy, []).shape == (0,)
+    with pytest.raises(ValueError, match="payload_len_bytes must be 0..255"):
+        estimate_toa_ms_array(phy, [1, 256])
+    with pytest.raises(ValueError, match="payload_len_bytes must be 0..255"):
+        estimate_toa_ms_array(phy, [-1])
+    with pytest.raises(ValueError, match="lengths must be integers"):
+        estimate_toa_ms_array(phy, [1.5])
+
+
+def test_estimate_toa_ms_array_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(toa, "optional_numpy", lambda: None)
+    phy = _phy_grid()[0]
+    expected = [estimate_toa_ms(phy, 0), estimate_toa_ms(phy, 10)]
+    assert estimate_toa_ms_array(phy, [0, 10]) == expected
+    with pytest.raises(ValueError, match="payload_len_bytes must be 0..255"):
+        estimate_toa_ms_array(phy, [256])
+
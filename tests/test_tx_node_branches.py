@@ -6,8 +6,12 @@ from pathlib import Path
 import pytest
 
 from loralink_mllc.config.runspec import RunSpec
+from loralink_mllc.protocol.aggregate import pack_windows, unpack_windows
+from loralink_mllc.protocol.fragment import parse_fragment
+from loralink_mllc.protocol.framing import make_bitmap_ack_packet
 from loralink_mllc.protocol.packet import Packet
 from loralink_mllc.runtime.scheduler import FakeClock
+from loralink_mllc.runtime.toa import estimate_ack_timeout_ms
 from loralink_mllc.runtime.tx_node import (
     NormParams,
     PendingWindow,
@@ -116,9 +120,22 @@ def _runspec(
     max_windows: int | None,
     max_inflight: int = 1,
     max_retries: int = 1,
-    ack_timeout_ms: int | None = 10,
+    ack_timeout_ms: int | str | None = 10,
     max_payload_bytes: int = 238,
     W: int = 1,
+    aggregate_max_windows: int = 1,
+    aggregate_delay_ms: int = 0,
+    aggregate_max_bytes: int | None = None,
+    ack_mode: str = "single",
+    ack_delay_ms: int = 0,
+    max_fragments: int = 1,
+    fec_group: int = 0,
+    duty_cycle: float | None = None,
+    duty_cycle_window_ms: int = 3_600_000,
+    duty_cycle_priority: str = "retries",
+    max_pending: int | None = None,
+    pending_policy: str = "drop_oldest",
+    pending_max_age_ms: int | None = None,
 ) -> RunSpec:
     data = {
         "run_id": "tx",
@@ -141,6 +158,19 @@ def _runspec(
             "max_retries": max_retries,
             "max_inflight": max_inflight,
             "max_windows": max_windows,
+            "aggregate_max_windows": aggregate_max_windows,
+            "aggregate_delay_ms": aggregate_delay_ms,
+            "aggregate_max_bytes": aggregate_max_bytes,
+            "ack_mode": ack_mode,
+            "ack_delay_ms": ack_delay_ms,
+            "max_fragments": max_fragments,
+            "fec_group": fec_group,
+            "duty_cycle": duty_cycle,
+            "duty_cycle_window_ms": duty_cycle_window_ms,
+            "duty_cycle_priority": duty_cycle_priority,
+            "max_pending": max_pending,
+            "pending_policy": pending_policy,
+            "pending_max_age_ms": pending_max_age_ms,
         },
         "logging": {"out_dir": "out"},
         "max_payload_bytes": max_payload_bytes,
@@ -259,6 +289,26 @@ def test_tx_node_retry_expired_computes_auto_ack_timeout(tmp_path: Path) -> None
     assert sent and int(sent[0]["ack_timeout_ms"]) > 1
 
 
+class _CyclingCodec(_Codec):
+    last_encode_cycles = [3]
+
+
+def test_tx_node_logs_codec_cycles_when_codec_reports_them(tmp_path: Path) -> None:
+    for codec, expected in ((_Codec(b"\x00"), None), (_CyclingCodec(b"\x00"), 3)):
+        logger = _MemLogger()
+        node = TxNode(
+            _runspec(max_windows=1),
+            _LoopbackRadio(max_payload_bytes=238),
+            codec,
+            logger,
+            _Sampler([[1.0]]),
+            clock=FakeClock(),
+        )
+        node.run(step_ms=0)
+        sent = [p for e, p in logger.events if e == "tx_sent"]
+        assert sent and sent[0]["codec_cycles"] == expected
+
+
 def test_tx_node_payload_too_large_raises(tmp_path: Path) -> None:
     clock = FakeClock()
     logger = _MemLogger()
@@ -380,9 +430,10 @@ def test_tx_node_retry_expired_branches(tmp_path: Path) -> None:
         sensor_ts_ms=None,
         codec_encode_ms=0.0,
     )
-    node2._gate.record_send(1, toa_ms_est=0.0)
+    node2._gate.record_send(1, toa_ms_est=50.0)
     clock2.sleep_ms(11)
-    node2._retry_expired()
+    node2._retry_expired()  # ack timed out but the frame is still on air
+    assert not any(e == "tx_sent" for e, _ in logger2.events)
 
     clock3 = FakeClock()
     logger3 = _MemLogger()
@@ -406,3 +457,711 @@ def test_tx_node_retry_expired_branches(tmp_path: Path) -> None:
     clock3.sleep_ms(11)
     node3._retry_expired()
     assert any(e == "tx_sent" for e, _ in logger3.events)
+
+
+def test_tx_node_aggregates_until_full_then_flushes_after_delay() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    radio = _LoopbackRadio(max_payload_bytes=238)
+    node = TxNode(
+        _runspec(max_windows=None, aggregate_max_windows=3, aggregate_delay_ms=100),
+        radio,
+        _Codec(b"\x07\x08"),
+        logger,
+        _Sampler([[float(i)] for i in range(5)]),
+        clock=clock,
+    )
+    node.process_once()
+    node.process_once()
+    assert radio.sent == []  # frame can still grow and the oldest window is fresh
+    node.process_once()
+    first = Packet.from_bytes(radio.sent[0].frame)
+    assert first.payload == pack_windows([b"\x07\x08"] * 3)
+
+    node.process_once()  # ack for the first frame; window 3 waits for the delay
+    assert len(radio.sent) == 1
+    clock.sleep_ms(100)
+    node.process_once()
+    assert unpack_windows(Packet.from_bytes(radio.sent[1].frame).payload) == [b"\x07\x08"] * 2
+    node.run(step_ms=1)
+    assert node.is_done()
+
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    assert [p["window_ids"] for p in sent] == [[0, 1, 2], [3, 4]]
+    assert [p["window_count"] for p in sent] == [3, 2]
+    assert sent[0]["payload_bytes"] == 1 + 3 * 3
+    acks = [p for e, p in logger.events if e == "ack_received"]
+    assert [p["window_ids"] for p in acks] == [[0, 1, 2], [3, 4]]
+    assert acks[0]["window_id"] == 0
+
+
+def test_tx_node_aggregate_respects_byte_limit_and_flushes_when_exhausted() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    radio = _ScriptedRecvRadio([])
+    node = TxNode(
+        _runspec(
+            max_windows=3,
+            max_inflight=2,
+            aggregate_max_windows=8,
+            aggregate_delay_ms=10_000,
+            aggregate_max_bytes=7,
+        ),
+        radio,
+        _Codec(b"\x07\x08"),
+        logger,
+        _Sampler([[float(i)] for i in range(3)]),
+        clock=clock,
+    )
+    for _ in range(3):
+        node._queue_window()
+    node._send_pending()  # 1 + 2 * (1 + 2) = 7 bytes: the third window does not fit
+    clock.sleep_ms(100)
+    node._send_pending()  # max_windows reached, so the remainder is not held back
+    sizes = [len(unpack_windows(Packet.from_bytes(s.frame).payload)) for s in radio.sent]
+    assert sizes == [2, 1]
+
+    radio = _ScriptedRecvRadio([])
+    node = TxNode(
+        _runspec(max_windows=None, aggregate_max_windows=2, aggregate_delay_ms=10_000),
+        radio,
+        _Codec(b"\x07\x08"),
+        _MemLogger(),
+        _Sampler([[float(i)] for i in range(3)]),
+        clock=FakeClock(),
+    )
+    for _ in range(3):
+        node._queue_window()
+    node._send_pending()
+    assert len(unpack_windows(Packet.from_bytes(radio.sent[0].frame).payload)) == 2
+
+
+def test_tx_node_aggregate_payload_too_large_raises() -> None:
+    node = TxNode(
+        _runspec(max_windows=None, aggregate_max_windows=2, aggregate_max_bytes=2),
+        _LoopbackRadio(max_payload_bytes=238),
+        _Codec(b"xx"),
+        _MemLogger(),
+        _Sampler([[1.0]]),
+        clock=FakeClock(),
+    )
+    with pytest.raises(ValueError, match="exceeds aggregate_max_bytes"):
+        node._queue_window()
+
+
+def test_tx_node_aggregate_retry_and_failure_carry_window_ids() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    node = TxNode(
+        _runspec(
+            max_windows=2,
+            max_inflight=2,
+            max_retries=1,
+            aggregate_max_windows=2,
+            aggregate_delay_ms=50,
+        ),
+        _ScriptedRecvRadio([]),
+        _CyclingCodec(b"\x00"),
+        logger,
+        _Sampler([[1.0], [2.0]]),
+        clock=clock,
+    )
+    node.process_once()
+    node.process_once()
+    for _ in range(3):
+        clock.sleep_ms(100)  # past both the ack timeout and the frame's airtime
+        node.process_once()
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    assert [p["attempt"] for p in sent] == [1, 2]
+    assert sent[1]["window_ids"] == [0, 1]
+    assert sent[0]["codec_cycles"] == 3
+    failed = [p for e, p in logger.events if e == "tx_failed"]
+    assert failed and failed[0]["window_ids"] == [0, 1]
+    assert node.is_done()
+
+
+def test_tx_node_bitmap_ack_clears_every_covered_inflight_entry() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    frames = [
+        Packet(payload=b"\x09\x00\x00", seq=0).to_bytes(),  # unknown ack version
+        make_bitmap_ack_packet(base_seq=2, bitmap=0b11, seq=1, bitmap_bits=16).to_bytes(),
+    ]
+    node = TxNode(
+        _runspec(max_windows=None, max_inflight=3, ack_mode="bitmap"),
+        _ScriptedRecvRadio(frames),
+        _Codec(b"\x00"),
+        logger,
+        _Sampler([]),
+        clock=clock,
+    )
+    for seq in (0, 1, 2):
+        node._inflight_payloads[seq] = PendingWindow(
+            window_id=10 + seq, payload=b"\x00", built_ms=0, sensor_ts_ms=None, codec_encode_ms=0.0
+        )
+        node._gate.record_send(seq, toa_ms_est=0.0)
+    node._handle_incoming()
+    assert logger.events[0][0] == "rx_parse_fail"
+    acks = [p for e, p in logger.events if e == "ack_received"]
+    assert [(p["ack_seq"], p["window_id"], p["ack_bitmap"]) for p in acks] == [
+        (2, 12, False),
+        (1, 11, True),
+        (0, 10, True),
+    ]
+    assert not node._gate.inflight() and not node._inflight_payloads
+
+
+def test_tx_node_bitmap_mode_auto_ack_timeout_covers_ack_delay() -> None:
+    def first_timeout(**kwargs: object) -> int:
+        logger = _MemLogger()
+        node = TxNode(
+            _runspec(max_windows=1, ack_timeout_ms=None, **kwargs),  # type: ignore[arg-type]
+            _LoopbackRadio(max_payload_bytes=238),
+            _Codec(b"\x00"),
+            logger,
+            _Sampler([[1.0]]),
+            clock=FakeClock(),
+        )
+        node.process_once()
+        return int([p for e, p in logger.events if e == "tx_sent"][0]["ack_timeout_ms"])
+
+    single = first_timeout()
+    bitmap = first_timeout(ack_mode="bitmap", ack_delay_ms=200)
+    assert bitmap >= single + 200
+
+
+def test_tx_node_fragments_large_window_with_per_fragment_toa() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    radio = _LoopbackRadio(max_payload_bytes=4)
+    node = TxNode(
+        _runspec(max_windows=1, max_payload_bytes=4, max_fragments=4),
+        radio,
+        _Codec(b"abcdefghij"),
+        logger,
+        _Sampler([[1.0]]),
+        clock=clock,
+    )
+    while not node.is_done():
+        node.process_once()
+        clock.sleep_ms(100)  # past each fragment's airtime
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    assert [p["seq"] for p in sent] == [0, 1, 2, 3]
+    assert [(p["frag_index"], p["frag_count"]) for p in sent] == [(i, 4) for i in range(4)]
+    assert {p["window_id"] for p in sent} == {0}
+    assert [p["payload_bytes"] for p in sent] == [4, 4, 4, 2]
+    assert sent[3]["toa_ms_est"] < sent[0]["toa_ms_est"]
+    bodies = [
+        parse_fragment(Packet.from_bytes(s.frame, max_payload_bytes=4).payload)[2]
+        for s in radio.sent
+    ]
+    assert b"".join(bodies) == b"abcdefghij"
+    acks = [p for e, p in logger.events if e == "ack_received"]
+    assert [p["frag_index"] for p in acks] == [0, 1, 2, 3]
+
+
+def test_tx_node_fragment_capacity_exceeded_raises() -> None:
+    node = TxNode(
+        _runspec(max_windows=None, max_payload_bytes=4, max_fragments=2),
+        _LoopbackRadio(max_payload_bytes=4),
+        _Codec(b"abcdefghij"),
+        _MemLogger(),
+        _Sampler([[1.0]]),
+        clock=FakeClock(),
+    )
+    with pytest.raises(ValueError, match="exceeds fragmented capacity 6"):
+        node._queue_window()
+
+
+def test_tx_node_failed_fragment_drops_rest_of_window() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    node = TxNode(
+        _runspec(max_windows=1, max_retries=0, max_payload_bytes=4, max_fragments=4),
+        _ScriptedRecvRadio([]),
+        _Codec(b"abcdefghij"),
+        logger,
+        _Sampler([[1.0]]),
+        clock=clock,
+    )
+    node.process_once()
+    clock.sleep_ms(100)
+    node.process_once()
+    failed = [p for e, p in logger.events if e == "tx_failed"]
+    assert failed == [
+        {
+            "seq": 0,
+            "reason": "max_retries_exceeded",
+            "attempts": 1,
+            "window_id": 0,
+            "frag_index": 0,
+            "frag_count": 4,
+            "fragments_dropped": 3,
+        }
+    ]
+    assert node.is_done()
+
+
+def test_tx_node_fec_sends_parity_after_each_group_and_closes_last_group() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    radio = _LoopbackRadio(max_payload_bytes=238)
+    node = TxNode(
+        _runspec(max_windows=3, fec_group=2),
+        radio,
+        _Codec(b"\x05\x06"),
+        logger,
+        _Sampler([[1.0], [2.0], [3.0]]),
+        clock=clock,
+    )
+    node.process_once()
+    node.process_once()  # data frame 0 still on air: waits
+    while not node.is_done():
+        clock.sleep_ms(100)
+        node.process_once()
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    assert [(p["seq"], p.get("fec_parity", False)) for p in sent] == [
+        (0, False),
+        (1, False),
+        (2, True),
+        (3, False),
+        (4, True),
+    ]
+    assert [p.get("fec_group_count") for p in sent if p.get("fec_parity")] == [2, 1]
+    payloads = [Packet.from_bytes(s.frame).payload for s in radio.sent]
+    assert payloads[:3] == [b"\x00\x05\x06", b"\x01\x05\x06", bytes([0x82, 0, 0, 0])]
+    assert payloads[4] == bytes([0x81, 2, 5, 6])
+    assert node.metrics()["sent_count"] == 5
+
+
+def test_tx_node_fec_reserves_payload_bytes() -> None:
+    node = TxNode(
+        _runspec(max_windows=None, max_payload_bytes=3, fec_group=2),
+        _LoopbackRadio(max_payload_bytes=3),
+        _Codec(b"xx"),
+        _MemLogger(),
+        _Sampler([[1.0]]),
+        clock=FakeClock(),
+    )
+    with pytest.raises(ValueError, match="exceeds max_payload_bytes 3 less 2 B FEC overhead"):
+        node._queue_window()
+
+
+class _WaitableLoopbackRadio(_LoopbackRadio):
+    def __init__(self, clock: FakeClock) -> None:
+        super().__init__(max_payload_bytes=238)
+        self._clock = clock
+        self.waits: list[int] = []
+
+    def wait_readable(self, timeout_ms: int) -> bool:
+        self.waits.append(timeout_ms)
+        if self._queue:
+            return True
+        self._clock.sleep_ms(timeout_ms)
+        return False
+
+
+def test_tx_node_next_wakeup_tracks_samples_deadlines_and_gated_sends() -> None:
+    clock = FakeClock()
+    radio = _ScriptedRecvRadio([])
+    node = TxNode(
+        _runspec(max_windows=2, max_inflight=1, ack_timeout_ms=500),
+        radio,
+        _Codec(b"\x01"),
+        _MemLogger(),
+        _Sampler([[1.0], [2.0]]),
+        clock=clock,
+    )
+    assert node.next_wakeup_ms() is None  # polled: nothing queued, no timers
+    node.pace_samples()
+    assert node.next_wakeup_ms() == 0
+    node.process_once()
+    node.process_once()  # same instant: no second sample yet
+    assert len(radio.sent) == 1
+    assert node.next_wakeup_ms() == 500  # ACK deadline before the next sample at 1000
+
+    clock.sleep_ms(1000)
+    node.process_once()  # retry of seq 0 plus the second window, which waits for a slot
+    assert len(radio.sent) == 2
+    assert node.next_wakeup_ms() == 1500  # samples exhausted; full slot hides the pending send
+
+
+def test_tx_node_next_wakeup_waits_for_airtime_aggregate_delay_and_parity() -> None:
+    clock = FakeClock()
+    node = TxNode(
+        _runspec(
+            max_windows=None,
+            max_inflight=4,
+            ack_timeout_ms=1000,
+            aggregate_max_windows=3,
+            aggregate_delay_ms=80,
+        ),
+        _ScriptedRecvRadio([]),
+        _Codec(b"\x01"),
+        _MemLogger(),
+        _Sampler([[1.0]] * 4),
+        clock=clock,
+    )
+    node.process_once()
+    assert node.next_wakeup_ms() == 80  # aggregate may still grow until the delay expires
+    clock.sleep_ms(80)
+    node.process_once()  # window 1 joins and the pair is flushed
+    node._queue_window()
+    free_ms = node._gate.channel_free_ms()
+    assert free_ms is not None and 80 < free_ms < 160
+    assert node.next_wakeup_ms() == 160  # window 2 built at 80 waits out the delay
+    clock.sleep_ms(80)
+    node._queue_window()
+    node._queue_window()  # sampler exhausted: flush as soon as the channel is free
+    assert node.next_wakeup_ms() == free_ms
+
+    fec = TxNode(
+        _runspec(max_windows=1, fec_group=2),
+        _ScriptedRecvRadio([]),
+        _Codec(b"\x01"),
+        _MemLogger(),
+        _Sampler([[1.0]]),
+        clock=clock,
+    )
+    fec.process_once()  # data frame sent, short group must close with parity
+    assert fec.next_wakeup_ms() == fec._gate.channel_free_ms()
+
+
+def test_tx_node_event_driven_run_paces_samples_and_logs_loop_stats() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    radio = _WaitableLoopbackRadio(clock)
+    node = TxNode(
+        _runspec(max_windows=3, ack_timeout_ms=500),
+        radio,
+        _Codec(b"\x01"),
+        logger,
+        _Sampler([[1.0], [2.0], [3.0]]),
+        clock=clock,
+    )
+    node.run(event_driven=True)
+    assert node.is_done()
+    assert clock.now_ms() == 2000  # windows at 0, 1000 and 2000 ms; ACKs handled on arrival
+    acks = [p for e, p in logger.events if e == "ack_received"]
+    assert [p["rtt_ms"] for p in acks] == [0, 0, 0]
+    event, stats = logger.events[-1]
+    assert event == "run_loop"
+    assert stats == {
+        "loop": "event",
+        "wakeups": 5,
+        "idle_ms": 2000,
+        "elapsed_ms": 2000,
+        "idle_ratio": 1.0,
+    }
+    # Waits bounded by the ACK deadline return at once because the ACK is already readable.
+    assert radio.waits == [500, 1000, 500, 1000, 500]
+
+    polled_logger = _MemLogger()
+    polled = TxNode(
+        _runspec(max_windows=1),
+        _LoopbackRadio(max_payload_bytes=238),
+        _Codec(b"\x01"),
+        polled_logger,
+        _Sampler([[1.0]]),
+        clock=FakeClock(),
+    )
+    polled.run(step_ms=5)
+    assert polled_logger.events[-1] == (
+        "run_loop",
+        {"loop": "poll", "wakeups": 1, "idle_ms": 5, "elapsed_ms": 5, "idle_ratio": 1.0},
+    )
+
+
+def test_tx_node_adaptive_ack_timeout_backs_off_and_clamps_to_toa_bounds() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    spec = _runspec(max_windows=1, max_retries=3, ack_timeout_ms="adaptive")
+    estimate_ms = estimate_ack_timeout_ms(spec.phy, data_frame_bytes=3)
+    node = TxNode(
+        spec, _ScriptedRecvRadio([]), _Codec(b"\x01"), logger, _Sampler([[1.0]]), clock=clock
+    )
+    while not node.is_done():
+        node.process_once()
+        clock.sleep_ms(1)
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    # Doubling per timeout, capped at 4x the static estimate; no RTT sample was ever taken.
+    assert [p["ack_timeout_ms"] for p in sent] == [
+        estimate_ms,
+        2 * estimate_ms,
+        4 * estimate_ms,
+        4 * estimate_ms,
+    ]
+    assert [p["rto_backoff"] for p in sent] == [1, 2, 4, 8]
+    assert sent[0]["srtt_ms"] is None and sent[0]["rto_ms"] == estimate_ms
+    assert sent[0]["rtt_samples"] == 0
+
+
+def test_tx_node_adaptive_ack_timeout_learns_rtt_with_karns_rule() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    spec = _runspec(max_windows=None, max_retries=2, ack_timeout_ms="adaptive")
+    radio = _ScriptedRecvRadio([])
+    node = TxNode(spec, radio, _Codec(b"\x01"), logger, _Sampler([[1.0]] * 3), clock=clock)
+    estimate_ms = estimate_ack_timeout_ms(spec.phy, data_frame_bytes=3)
+
+    node.process_once()  # seq 0, attempt 1
+    clock.sleep_ms(estimate_ms)
+    node.process_once()  # timeout: retransmitted with a doubled RTO
+    radio._frames.append(Packet(payload=b"\x00", seq=0).to_bytes())
+    clock.sleep_ms(30)
+    node.process_once()  # ACK of a retransmitted frame is ambiguous; seq 1 goes out
+    assert node._rtt is not None and node._rtt.samples == 0 and node._rtt.backoff == 2
+
+    radio._frames.append(Packet(payload=b"\x01", seq=0).to_bytes())
+    clock.sleep_ms(40)
+    node.process_once()  # clean ACK after 40 ms: first sample, backoff reset; seq 2 goes out
+    assert (node._rtt.srtt_ms, node._rtt.rttvar_ms, node._rtt.backoff) == (40.0, 20.0, 1)
+
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    assert [p["ack_timeout_ms"] for p in sent] == [
+        estimate_ms,
+        2 * estimate_ms,
+        2 * estimate_ms,
+        120,  # SRTT + 4 * RTTVAR, inside [data + ACK ToA, 4x estimate]
+    ]
+    assert sent[-1]["rtt_samples"] == 1 and sent[-1]["rto_ms"] == 120.0
+
+
+def _pending_window(window_id: int) -> PendingWindow:
+    return PendingWindow(
+        window_id=window_id,
+        payload=b"\x00",
+        built_ms=0,
+        sensor_ts_ms=None,
+        codec_encode_ms=0.0,
+    )
+
+
+def test_tx_node_duty_cycle_budget_below_one_max_frame_raises() -> None:
+    spec = _runspec(max_windows=None, duty_cycle=0.01, duty_cycle_window_ms=1000)
+    with pytest.raises(ValueError, match="below the ToA of one max-size frame"):
+        TxNode(spec, _ScriptedRecvRadio([]), _Codec(b"\x00"), _MemLogger(), _Sampler([]))
+
+
+def test_tx_node_duty_cycle_defers_sends_until_airtime_leaves_window() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    # Budget 80 ms per 10 s: two 31 ms frames fit, the third waits for the first to expire.
+    node = TxNode(
+        _runspec(
+            max_windows=None,
+            max_inflight=4,
+            ack_timeout_ms=100_000,
+            max_payload_bytes=4,
+            duty_cycle=0.008,
+            duty_cycle_window_ms=10_000,
+        ),
+        _ScriptedRecvRadio([]),
+        _Codec(b"\x00"),
+        logger,
+        _Sampler([]),
+        clock=clock,
+    )
+    node._pending.extend(_pending_window(i) for i in range(3))
+    node.process_once()
+    clock.sleep_ms(31)
+    node.process_once()
+    clock.sleep_ms(31)
+    node.process_once()
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    assert [p["window_id"] for p in sent] == [0, 1]
+    assert [p["airtime_used_ms"] for p in sent] == [30.976, 61.952]
+    assert sent[1]["airtime_headroom_ms"] == pytest.approx(80 - 61.952)
+    assert len(node._pending) == 1
+    assert node.next_wakeup_ms() == 10_031
+
+    clock.sleep_ms(10_031 - 62)
+    node.process_once()
+    sent = [p for e, p in logger.events if e == "tx_sent"]
+    assert [p["window_id"] for p in sent] == [0, 1, 2]
+    assert node._gate.metrics()["airtime_headroom_ms"] == pytest.approx(80 - 61.952)
+
+
+def test_tx_node_duty_cycle_priority_orders_retries_and_fresh_windows() -> None:
+    for priority, expected in (("retries", (0, 2)), ("fresh", (1, 1))):
+        clock = FakeClock()
+        logger = _MemLogger()
+        # Budget 40 ms per 10 s: exactly one 31 ms frame fits at a time.
+        node = TxNode(
+            _runspec(
+                max_windows=None,
+                max_inflight=2,
+                ack_timeout_ms=100,
+                max_payload_bytes=4,
+                duty_cycle=0.004,
+                duty_cycle_window_ms=10_000,
+                duty_cycle_priority=priority,
+            ),
+            _ScriptedRecvRadio([]),
+            _Codec(b"\x00"),
+            logger,
+            _Sampler([]),
+            clock=clock,
+        )
+        node._pending.append(_pending_window(0))
+        node.process_once()
+        node._pending.append(_pending_window(1))
+        clock.sleep_ms(200)  # the first frame is due for a retry; no budget left
+        node.process_once()
+        assert len([e for e, _ in logger.events if e == "tx_sent"]) == 1
+
+        clock.sleep_ms(10_031 - 200)
+        node.process_once()
+        last = [p for e, p in logger.events if e == "tx_sent"][-1]
+        assert (last["window_id"], last["attempt"]) == expected
+
+
+@pytest.mark.parametrize(
+    ("policy", "dropped", "kept"),
+    [
+        ("drop_oldest", [1, 2], [3, 4]),
+        ("drop_newest", [3, 4], [1, 2]),
+        ("keep_latest", [1, 2, 3], [4]),
+    ],
+)
+def test_tx_node_bounded_pending_queue_drop_policies(
+    policy: str, dropped: list[int], kept: list[int]
+) -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    node = TxNode(
+        _runspec(max_windows=None, ack_timeout_ms=100_000, max_pending=2, pending_policy=policy),
+        _ScriptedRecvRadio([]),
+        _Codec(b"\x00"),
+        logger,
+        _Sampler([[float(i)] for i in range(5)]),
+        clock=clock,
+    )
+    for _ in range(5):  # window 0 goes inflight; the rest queue behind it
+        node.process_once()
+        clock.sleep_ms(10)
+    events = [p for e, p in logger.events if e == "tx_dropped"]
+    assert [p["window_id"] for p in events] == dropped
+    assert {p["reason"] for p in events} == {"queue_full"}
+    assert all(p["policy"] == policy for p in events)
+    assert [w.window_id for w in node._pending] == kept
+    if policy == "drop_oldest":
+        assert [p["age_ms"] for p in events] == [20, 20]
+    assert node.metrics()["windows_dropped"] == len(dropped)
+
+
+def test_tx_node_drops_windows_older_than_pending_max_age() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    node = TxNode(
+        _runspec(max_windows=4, ack_timeout_ms=100_000, pending_max_age_ms=15),
+        _ScriptedRecvRadio([]),
+        _Codec(b"\x00"),
+        logger,
+        _Sampler([[float(i)] for i in range(4)]),
+        clock=clock,
+    )
+    for _ in range(4):
+        node.process_once()
+        clock.sleep_ms(10)
+    dropped = [p for e, p in logger.events if e == "tx_dropped"]
+    assert [(p["window_id"], p["reason"], p["age_ms"]) for p in dropped] == [(1, "stale", 20)]
+    assert [w.window_id for w in node._pending] == [2, 3]
+
+
+def test_tx_node_pending_bound_never_drops_a_partially_sent_window() -> None:
+    logger = _MemLogger()
+    node = TxNode(
+        _runspec(
+            max_windows=None,
+            ack_timeout_ms=100_000,
+            max_payload_bytes=4,
+            max_fragments=2,
+            max_pending=1,
+        ),
+        _ScriptedRecvRadio([]),
+        _Codec(b"\x01\x02\x03\x04\x05"),
+        logger,
+        _Sampler([[0.0], [1.0], [2.0]]),
+        clock=FakeClock(),
+    )
+    for _ in range(3):
+        node.process_once()
+    assert [p["window_id"] for e, p in logger.events if e == "tx_dropped"] == [1]
+    assert [(w.window_id, w.frag_index) for w in node._pending] == [(0, 1), (2, 0), (2, 1)]
+
+
+class _StampedRecvRadio(_ScriptedRecvRadio):
+    def __init__(self, frames: list[bytes | None], arrivals: list[int | None]) -> None:
+        super().__init__(frames)
+        self._arrivals = list(arrivals)
+        self._arrival_ms: int | None = None
+
+    def recv(self, timeout_ms: int) -> bytes | None:
+        frame = super().recv(timeout_ms)
+        if frame is not None:
+            self._arrival_ms = self._arrivals.pop(0)
+        return frame
+
+    def last_rx_arrival_ms(self) -> int | None:
+        return self._arrival_ms
+
+
+def test_tx_node_rtt_uses_radio_arrival_time_when_stamped() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    ack = Packet(payload=b"\x00", seq=0).to_bytes(max_payload_bytes=238)
+    ack1 = Packet(payload=b"\x01", seq=0).to_bytes(max_payload_bytes=238)
+    radio = _StampedRecvRadio([], [130, None])
+    node = TxNode(
+        _runspec(max_windows=None, max_inflight=2, ack_timeout_ms=1000),
+        radio,
+        _Codec(b"\x00"),
+        logger,
+        _Sampler([[0.0], [1.0]]),
+        clock=clock,
+    )
+    node.process_once()  # window 0, seq 0 at t=0
+    clock.sleep_ms(100)
+    node.process_once()  # window 1, seq 1 at t=100
+    clock.sleep_ms(100)
+    radio._frames.extend([ack, ack1])  # the loop sees both at t=200
+    node._handle_incoming()
+    acks = [p for e, p in logger.events if e == "ack_received"]
+    assert (acks[0]["rtt_ms"], acks[0]["e2e_ms"], acks[0]["ack_lag_ms"]) == (130, 130, 70)
+    assert (acks[1]["rtt_ms"], acks[1]["e2e_ms"]) == (100, 100)  # no stamp: loop time
+    assert "ack_lag_ms" not in acks[1]
+
+
+class _DrainingLoopbackRadio(_LoopbackRadio):
+    """Reports every sent frame as drained by a background writer one call later."""
+
+    def __init__(self, *, max_payload_bytes: int) -> None:
+        super().__init__(max_payload_bytes=max_payload_bytes)
+        self._drains: list[dict[str, int]] = []
+
+    def send(self, frame: bytes) -> None:
+        super().send(frame)
+        self._drains.append({"seq": frame[1], "frame_bytes": len(frame), "drain_ms": 4})
+
+    def pop_tx_drains(self) -> list[dict[str, int]]:
+        drains, self._drains = self._drains, []
+        return drains
+
+
+def test_tx_node_logs_uart_drains_apart_from_tx_sent() -> None:
+    clock = FakeClock()
+    logger = _MemLogger()
+    radio = _DrainingLoopbackRadio(max_payload_bytes=238)
+    node = TxNode(
+        _runspec(max_windows=2), radio, _Codec(b"\x00"), logger, _Sampler([[1.0], [2.0]]),
+        clock=clock,
+    )
+    node.run(step_ms=1)
+    names = [name for name, _ in logger.events]
+    drains = [payload for name, payload in logger.events if name == "uart_tx_drain"]
+    assert [d["seq"] for d in drains] == [0, 1]
+    # Each drain is logged on the loop pass after its send, not folded into tx_sent.
+    assert names.index("uart_tx_drain") > names.index("tx_sent")
+    assert names[-1] == "run_loop"
+    assert all("drain_ms" not in p for name, p in logger.events if name == "tx_sent")
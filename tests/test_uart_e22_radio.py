@@ -1,9 +1,12 @@
+import os
 import sys
+import time
 from types import SimpleNamespace
 
 import pytest
 
 from loralink_mllc.radio.uart_e22 import UartE22Radio
+from loralink_mllc.radio.uart_framing import encode_uart_frame
 
 
 class _FakeSerial:
@@ -153,3 +156,252 @@ def test_uart_e22_close_ignores_serial_close_errors(monkeypatch: pytest.MonkeyPa
     monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
     radio = UartE22Radio(port="COM1", baudrate=9600)
     assert radio.close() is None
+
+
+def test_uart_e22_wait_readable_selects_on_serial_fd(monkeypatch: pytest.MonkeyPatch) -> None:
+    read_fd, write_fd = os.pipe()
+
+    class _SelectableSerial(_FakeSerial):
+        def fileno(self) -> int:
+            return read_fd
+
+    two_frames = bytes([1, 0]) + b"a" + bytes([1, 1]) + b"b"
+
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        return _SelectableSerial(**kwargs, read_buffer=two_frames)
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    radio = UartE22Radio(port="/dev/ttyS0", baudrate=9600)
+    try:
+        assert radio.fileno() == read_fd
+        assert radio.wait_readable(0) is True  # bytes waiting in the driver
+        assert radio.recv(timeout_ms=0) == bytes([1, 0]) + b"a"
+        assert radio.wait_readable(0) is True  # second frame already parsed from the chunk
+        assert radio.recv(timeout_ms=0) == bytes([1, 1]) + b"b"
+        assert radio.wait_readable(1) is False
+        os.write(write_fd, b"x")
+        assert radio.wait_readable(1000) is True
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_uart_e22_wait_readable_polls_without_fd(monkeypatch: pytest.MonkeyPatch) -> None:
+    import loralink_mllc.radio.uart_e22 as uart_mod
+
+    serials: list[_FakeSerial] = []
+
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        serials.append(_FakeSerial(**kwargs))
+        return serials[-1]
+
+    now = [0.0]
+
+    def fake_sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    monkeypatch.setattr(uart_mod.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(uart_mod.time, "sleep", fake_sleep)
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    radio = UartE22Radio(port="COM1", baudrate=9600)
+    assert radio.fileno() is None
+    assert radio.wait_readable(3) is False
+    assert now[0] == pytest.approx(0.003)
+
+    def arriving_sleep(seconds: float) -> None:
+        fake_sleep(seconds)
+        serials[0]._read_buffer.extend(b"\x01")
+
+    monkeypatch.setattr(uart_mod.time, "sleep", arriving_sleep)
+    assert radio.wait_readable(50) is True
+
+
+def test_uart_e22_recv_stamps_arrival_time_without_reader_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import loralink_mllc.radio.uart_e22 as uart_mod
+
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        return _FakeSerial(**kwargs, read_buffer=bytes([1, 0]) + b"a")
+
+    monkeypatch.setattr(uart_mod.time, "monotonic", lambda: 12.3456)
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    radio = UartE22Radio(port="COM1", baudrate=9600)
+    assert radio.last_rx_arrival_ms() is None and radio.ring() is None
+    assert radio.recv(timeout_ms=0) == bytes([1, 0]) + b"a"
+    assert radio.last_rx_arrival_ms() == 12345
+
+
+def test_uart_e22_reader_thread_polls_port_without_fd(monkeypatch: pytest.MonkeyPatch) -> None:
+    frames = bytes([1, 0]) + b"a" + bytes([1, 1]) + b"b"
+
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        return _FakeSerial(**kwargs, read_buffer=frames)
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    radio = UartE22Radio(port="COM1", baudrate=9600, reader_thread=True)
+    try:
+        assert radio.recv(timeout_ms=2000) == bytes([1, 0]) + b"a"
+        arrival_ms = radio.last_rx_arrival_ms()
+        assert arrival_ms is not None
+        assert radio.wait_readable(0) is True  # second frame parsed from the same chunk
+        assert radio.recv(timeout_ms=0) == bytes([1, 1]) + b"b"
+        assert radio.last_rx_arrival_ms() == arrival_ms
+        assert radio.recv(timeout_ms=0) is None
+        assert radio.recv(timeout_ms=5) is None
+        ring = radio.ring()
+        assert ring is not None and ring.pushed_bytes == len(frames)
+    finally:
+        radio.close()
+    assert radio._reader is not None and not radio._reader.is_alive()
+
+
+def test_uart_e22_reader_thread_blocks_on_fd(monkeypatch: pytest.MonkeyPatch) -> None:
+    import fcntl
+    import struct
+    import termios
+    import threading
+
+    read_fd, write_fd = os.pipe()
+
+    class _PipeSerial(_FakeSerial):
+        @property
+        def in_waiting(self) -> int:
+            raw = fcntl.ioctl(read_fd, termios.FIONREAD, struct.pack("i", 0))
+            return struct.unpack("i", raw)[0]
+
+        def read(self, n: int) -> bytes:
+            return os.read(read_fd, n)
+
+        def fileno(self) -> int:
+            return read_fd
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=_PipeSerial))
+    radio = UartE22Radio(port="/dev/ttyS0", baudrate=9600, reader_thread=True)
+    try:
+        assert radio.wait_readable(1) is False
+        os.write(write_fd, bytes([2, 7]) + b"x")  # incomplete frame: waits for the last byte
+        writer = threading.Timer(0.02, os.write, args=(write_fd, b"y"))
+        writer.start()
+        assert radio.recv(timeout_ms=2000) == bytes([2, 7]) + b"xy"
+        writer.join()
+    finally:
+        radio.close()
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_uart_e22_reader_thread_error_surfaces_in_recv(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _BrokenSerial(_FakeSerial):
+        def read(self, n: int) -> bytes:
+            raise OSError("device unplugged")
+
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        return _BrokenSerial(**kwargs, read_buffer=b"\x01")
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    radio = UartE22Radio(port="COM1", baudrate=9600, reader_thread=True)
+    assert radio._reader is not None
+    radio._reader.join(timeout=2.0)
+    with pytest.raises(RuntimeError, match="UART reader thread failed"):
+        radio.recv(timeout_ms=0)
+    with pytest.raises(RuntimeError, match="UART reader thread failed"):
+        radio.wait_readable(10)
+    radio.close()
+
+
+def test_uart_e22_framing_v2_wraps_sends_and_rejects_noise(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frame = bytes([2, 4]) + b"ok"
+    wire = encode_uart_frame(frame, framing_version=2)
+
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        return _FakeSerial(**kwargs, read_buffer=b"+++garbage" + wire)
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    with pytest.raises(ValueError, match="framing_version"):
+        UartE22Radio(port="COM1", baudrate=9600, framing_version=5)
+    radio = UartE22Radio(port="COM1", baudrate=9600, framing_version=2)
+    radio.send(frame)
+    assert b"".join(radio._serial.writes) == wire  # type: ignore[attr-defined]
+    assert radio.recv(timeout_ms=0) == frame
+    stats = radio.uart_stats()
+    assert stats["parse_errors"] == 1 and stats["resync_bytes"] == 10
+    assert stats["ring_overflow_bytes"] == 0 and stats["tx_queued_bytes"] == 0
+
+
+def test_uart_e22_stats_report_ring_overflow(monkeypatch: pytest.MonkeyPatch) -> None:
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        return _FakeSerial(**kwargs, read_buffer=bytes([1, 0]) + b"a")
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    radio = UartE22Radio(port="COM1", baudrate=9600, reader_thread=True, ring_capacity_bytes=1)
+    try:
+        deadline = time.monotonic() + 2.0
+        while radio.uart_stats()["ring_overflow_bytes"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert radio.uart_stats()["ring_overflow_bytes"] == 3
+        assert radio.recv(timeout_ms=0) is None
+    finally:
+        radio.close()
+
+
+def test_uart_e22_writer_thread_queues_sends_and_reports_drains(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+
+    release = threading.Event()
+
+    class _SlowFlushSerial(_FakeSerial):
+        def flush(self) -> None:
+            release.wait(2.0)  # the OS is still draining the UART
+            self.flush_called = True
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=_SlowFlushSerial))
+    radio = UartE22Radio(port="COM1", baudrate=9600, writer_thread=True, framing_version=2)
+    try:
+        radio.send(bytes([1, 7]) + b"a")  # returns while the writer blocks in flush
+        radio.send(bytes([1, 8]) + b"b")
+        radio.send(bytes([1, 9]) + b"c")
+        assert radio.pop_tx_drains() == []
+        release.set()
+        deadline = time.monotonic() + 2.0
+        drains: list[dict[str, int]] = []
+        while len(drains) < 3 and time.monotonic() < deadline:
+            drains += radio.pop_tx_drains()
+            time.sleep(0.001)
+        assert [d["seq"] for d in drains] == [7, 8, 9]
+        assert all(d["frame_bytes"] == 6 and d["drain_ms"] >= d["queue_ms"] >= 0 for d in drains)
+        # Frames queued while the writer was busy go out in one write and one flush.
+        assert drains[1]["batch_frames"] == drains[2]["batch_frames"] >= 2
+        assert radio.uart_stats()["tx_queued_bytes"] == 0
+        radio.send(bytes([0, 10]))
+    finally:
+        radio.close()
+    serial = radio._serial  # type: ignore[attr-defined]
+    assert b"".join(serial.writes) == b"".join(
+        encode_uart_frame(f, 2)
+        for f in (bytes([1, 7]) + b"a", bytes([1, 8]) + b"b", bytes([1, 9]) + b"c", bytes([0, 10]))
+    )
+    assert radio._writer is not None and not radio._writer.is_alive()
+
+
+def test_uart_e22_writer_thread_errors_and_full_queue(monkeypatch: pytest.MonkeyPatch) -> None:
+    def serial_factory(**kwargs):  # type: ignore[no-untyped-def]
+        return _FakeSerial(**kwargs, write_returns_zero=True)
+
+    monkeypatch.setitem(sys.modules, "serial", SimpleNamespace(Serial=serial_factory))
+    radio = UartE22Radio(port="COM1", baudrate=9600, writer_thread=True, ring_capacity_bytes=4)
+    try:
+        with pytest.raises(RuntimeError, match="UART write queue full"):
+            radio.send(bytes([3, 0]) + b"abc")
+        radio.send(bytes([1, 0]) + b"x")
+        deadline = time.monotonic() + 2.0
+        while radio._writer_error is None and time.monotonic() < deadline:
+            time.sleep(0.001)
+        with pytest.raises(RuntimeError, match="UART writer thread failed"):
+            radio.send(bytes([1, 1]) + b"y")
+    finally:
+        radio.close()
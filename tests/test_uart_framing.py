@@ -1,6 +1,13 @@
+import random
+
 import pytest
 
-from loralink_mllc.radio.uart_framing import UartFrameParser
+from loralink_mllc.radio.uart_framing import (
+    UART_V2_MAGIC,
+    UART_V2_OVERHEAD_BYTES,
+    UartFrameParser,
+    encode_uart_frame,
+)
 
 
 def test_uart_frame_parser_no_rssi() -> None:
@@ -65,3 +72,172 @@ def test_uart_frame_parser_incomplete_buffer_and_buffered_bytes() -> None:
     parsed = parser.pop()
     assert parsed is not None
     assert parsed.frame == bytes([3, 7]) + b"abc"
+
+
+def test_parser_has_frame_matches_pop_and_skips_invalid_len() -> None:
+    parser = UartFrameParser(max_payload_bytes=4, rssi_byte_enabled=True)
+    assert not parser.has_frame()
+    parser.feed(bytes([200, 1, 0, 9]))  # invalid LEN byte, then LEN=1 SEQ=0 PAYLOAD
+    assert not parser.has_frame()  # RSSI byte still missing
+    parser.feed(bytes([150]))
+    assert parser.has_frame()
+    assert parser.pop() is not None
+    assert not parser.has_frame()
+
+
+def _legacy_pop(buf: bytearray, max_payload_bytes: int, rssi_len: int) -> bytes | None:
+    """The original copy-and-delete parser: drop one byte per invalid LEN."""
+    while True:
+        if len(buf) < 2:
+            return None
+        length = buf[0]
+        if length > max_payload_bytes:
+            del buf[0]
+            continue
+        total = 2 + length + rssi_len
+        if len(buf) < total:
+            return None
+        frame = bytes(buf[: 2 + length])
+        del buf[:total]
+        return frame
+
+
+def test_pop_returns_view_valid_until_next_feed() -> None:
+    parser = UartFrameParser(max_payload_bytes=238)
+    parser.feed(bytes([1, 5]) + b"z")
+    parsed = parser.pop()
+    assert parsed is not None
+    assert isinstance(parsed.frame, memoryview)
+    assert bytes(parsed.frame) == bytes([1, 5, ord("z")])
+    assert parser.buffered_bytes() == 0
+
+
+def test_bulk_resync_counts_errors_and_skipped_bytes() -> None:
+    parser = UartFrameParser(max_payload_bytes=10)
+    parser.feed(bytes([200]) * 1000 + bytes([1, 9]) + b"x")
+    parsed = parser.pop()
+    assert parsed is not None
+    assert parsed.frame == bytes([1, 9]) + b"x"
+    assert parser.parse_errors == 1
+    assert parser.resync_bytes == 1000
+
+    parser.feed(bytes([250, 251]))
+    assert parser.pop() is None
+    assert parser.parse_errors == 2
+    assert parser.resync_bytes == 1002
+    assert parser.buffered_bytes() == 0
+
+
+def test_feed_compacts_then_grows_buffer() -> None:
+    parser = UartFrameParser(max_payload_bytes=238, initial_capacity=16)
+    frame = bytes([10, 1]) + b"0123456789"
+    for _ in range(5):  # partial frame left behind each time forces compaction
+        parser.feed(frame + frame[:4])
+        parsed = parser.pop()
+        assert parsed is not None and parsed.frame == frame
+        parser.feed(frame[4:])
+        parsed = parser.pop()
+        assert parsed is not None and parsed.frame == frame
+    assert len(parser._buf) == 16
+
+    big = bytes([200, 2]) + bytes(200)
+    parser.feed(big[:1])
+    parser.feed(big[1:])
+    parsed = parser.pop()
+    assert parsed is not None and parsed.frame == big
+    assert len(parser._buf) >= len(big)
+    parser.feed(b"")
+    assert parser.buffered_bytes() == 0
+
+
+def test_matches_legacy_parser_on_random_streams() -> None:
+    rng = random.Random(22)
+    for rssi in (False, True):
+        stream = bytearray()
+        for _ in range(300):
+            if rng.random() < 0.3:
+                stream += bytes(rng.randrange(256) for _ in range(rng.randrange(1, 20)))
+            length = rng.randrange(0, 41)
+            stream += bytes([length, rng.randrange(256)]) + rng.randbytes(length)
+            if rssi:
+                stream.append(rng.randrange(256))
+        legacy_buf = bytearray(stream)
+        expected = []
+        while (frame := _legacy_pop(legacy_buf, 40, 1 if rssi else 0)) is not None:
+            expected.append(frame)
+
+        parser = UartFrameParser(max_payload_bytes=40, rssi_byte_enabled=rssi, initial_capacity=64)
+        got = []
+        pos = 0
+        while pos < len(stream):
+            step = rng.randrange(1, 50)
+            parser.feed(stream[pos : pos + step])
+            pos += step
+            while (parsed := parser.pop()) is not None:
+                got.append(bytes(parsed.frame))
+        assert got == expected
+        assert parser.buffered_bytes() == len(legacy_buf)
+
+
+def test_v2_round_trip_with_rssi() -> None:
+    parser = UartFrameParser(max_payload_bytes=238, rssi_byte_enabled=True, framing_version=2)
+    frame = bytes([3, 7]) + b"abc"
+    wire = encode_uart_frame(frame, framing_version=2)
+    assert len(wire) == len(frame) + UART_V2_OVERHEAD_BYTES
+    assert wire[0] == UART_V2_MAGIC
+    parser.feed(wire + bytes([156]))
+    parsed = parser.pop()
+    assert parsed is not None
+    assert parsed.frame == frame
+    assert parsed.rssi_dbm == -100
+    assert parser.parse_errors == 0
+
+
+def test_v2_rejects_bad_crc_bad_magic_and_bad_len() -> None:
+    parser = UartFrameParser(max_payload_bytes=10, framing_version=2)
+    good = encode_uart_frame(bytes([1, 2]) + b"k", framing_version=2)
+    corrupt = bytearray(encode_uart_frame(bytes([2, 1]) + b"xy", framing_version=2))
+    corrupt[-1] ^= 0xFF
+    too_long = bytes([UART_V2_MAGIC, 200, 0])
+    parser.feed(b"boot\r\n" + bytes(corrupt) + too_long + good)
+    parsed = parser.pop()
+    assert parsed is not None
+    assert parsed.frame == bytes([1, 2]) + b"k"
+    assert parser.pop() is None
+    assert parser.parse_errors == 3
+    assert parser.resync_bytes == 6 + len(corrupt) + len(too_long)
+
+
+def test_v2_recovers_frames_from_noise() -> None:
+    rng = random.Random(7)
+    frames = [bytes([n % 30, n % 256]) + rng.randbytes(n % 30) for n in range(200)]
+    stream = bytearray()
+    for frame in frames:
+        stream += rng.randbytes(rng.randrange(0, 30))
+        stream += encode_uart_frame(frame, framing_version=2)
+    parser = UartFrameParser(max_payload_bytes=238, framing_version=2)
+    parser.feed(stream)
+    got = []
+    while (parsed := parser.pop()) is not None:
+        got.append(bytes(parsed.frame))
+    assert got == frames
+
+
+def test_invalid_framing_version_raises() -> None:
+    with pytest.raises(ValueError, match="framing_version"):
+        UartFrameParser(max_payload_bytes=10, framing_version=3)
+    with pytest.raises(ValueError, match="framing_version"):
+        encode_uart_frame(b"\x00\x00", framing_version=0)
+    assert encode_uart_frame(b"\x00\x01", framing_version=1) == b"\x00\x01"
+
+
+def test_v2_short_garbage_and_cached_has_frame() -> None:
+    parser = UartFrameParser(max_payload_bytes=10, framing_version=2)
+    parser.feed(b"\x00")
+    assert not parser.has_frame()
+    assert parser.parse_errors == 1 and parser.buffered_bytes() == 0
+    parser.feed(encode_uart_frame(bytes([0, 3]), framing_version=2))
+    assert parser.has_frame()
+    assert parser.has_frame()  # validated once, then cached until pop
+    parsed = parser.pop()
+    assert parsed is not None and parsed.frame == bytes([0, 3])
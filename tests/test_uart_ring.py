@@ -0,0 +1,38 @@
+import threading
+
+import pytest
+
+from loralink_mllc.radio.uart_ring import ChunkRing
+
+
+def test_chunk_ring_push_drain_and_overflow() -> None:
+    with pytest.raises(ValueError, match="capacity_bytes must be > 0"):
+        ChunkRing(0)
+    ring = ChunkRing(capacity_bytes=4)
+    assert ring.push(1, b"ab") and ring.push(2, b"cd")
+    assert not ring.push(3, b"e")  # full: dropped, not queued
+    assert ring.buffered_bytes() == 4 and ring.overflow_bytes == 1
+    assert ring.drain() == [(1, b"ab"), (2, b"cd")]
+    assert ring.drain() == []
+    assert ring.buffered_bytes() == 0 and ring.pushed_bytes == ring.popped_bytes == 4
+    assert ring.push(4, b"efgh")
+
+
+def test_chunk_ring_wait_wakes_on_push_and_close() -> None:
+    ring = ChunkRing()
+    assert ring.wait(0.0) is False
+    ring.push(1, b"x")
+    assert ring.wait(5.0) is True  # already queued: no sleep
+    ring.drain()
+
+    pusher = threading.Timer(0.01, ring.push, args=(2, b"y"))
+    pusher.start()
+    assert ring.wait(5.0) is True
+    pusher.join()
+    ring.drain()
+
+    closer = threading.Timer(0.01, ring.close)
+    closer.start()
+    assert ring.wait(5.0) is False
+    closer.join()
+    assert ring.wait(5.0) is False  # closed: returns at once